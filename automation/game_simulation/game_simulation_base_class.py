@@ -1,21 +1,75 @@
-"""Module for defining how simulations of noughts and crosses can be run."""
+"""
+Module for defining how simulations of noughts and crosses can be run.
+
+The games can be shared between several worker processes, each of which simulates a contiguous batch of the games and
+sends back its records, which are merged in order. Every worker's random generators are seeded from its own child of
+the simulation's seed sequence, so the workers never play the same random games as each other, and a simulation with a
+given random seed (and number of workers) plays the same games every time it is run - provided no searches are limited
+by wall time.
+"""
 
 # Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List
+import random
+from time import sleep
+from typing import Dict, List, Tuple
 
 # Third party imports
 import numpy as np
 import pandas as pd
 
 # Local application imports
-from automation.game_simulation.game_simulation_constants import SimulationColumnName, PlayerOptions
+from automation.game_simulation.game_simulation_constants import PlayerOptions
+from automation.game_simulation.simulation_records import SimulationRecords
+from automation.mcts.mcts_ai import NoughtsAndCrossesMCTS
+from automation.mcts.mcts_limits import MCTSLimits
+from automation.minimax.evaluate_non_terminal_board import evaluate_boards
 from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+from automation.minimax.search_limits import SearchLimits
+from automation.opening_book.opening_book import OpeningBook
+from automation.tablebase.endgame_tablebase import EndgameTablebase
 from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
 from game.constants.game_constants import StartingPlayer, BoardMarking
 from root_directory import ROOT_PATH
-from utils import np_array_to_tuple
+
+
+@dataclass(frozen=True)
+class SimulationWorkerTask:
+    """
+    Dataclass storing everything a worker process needs to simulate its batch of the games, which are the parameters of
+    the GameSimulator sharing out the games (see its docstring), apart from the number of games and the seed sequence.
+    """
+    setup_parameters: NoughtsAndCrossesEssentialParameters
+    number_of_simulations: int
+    player_x_as: PlayerOptions
+    player_o_as: PlayerOptions
+    print_game_outcomes: bool
+    save_game_outcome_summary: bool
+    save_all_game_data: bool
+    search_limits: SearchLimits
+    ponder_seconds: float
+    mcts_limits: MCTSLimits
+    record_board_statuses: bool
+    seed_sequence: np.random.SeedSequence
+
+
+def _run_simulation_worker(task: SimulationWorkerTask) -> Tuple[SimulationRecords | None, List[Dict]]:
+    """
+    Function run in a worker process to simulate a batch of the games. Nothing is printed or saved by the worker - its
+    records are sent back to be merged with those of the other workers.
+    Returns: The simulation records (None if data is not being collected) and search stats records of the batch
+    """
+    game_simulator = GameSimulator(
+        setup_parameters=task.setup_parameters, number_of_simulations=task.number_of_simulations,
+        player_x_as=task.player_x_as, player_o_as=task.player_o_as, print_game_outcomes=task.print_game_outcomes,
+        save_game_outcome_summary=task.save_game_outcome_summary, save_all_game_data=task.save_all_game_data,
+        search_limits=task.search_limits, ponder_seconds=task.ponder_seconds, mcts_limits=task.mcts_limits,
+        record_board_statuses=task.record_board_statuses, random_seed=task.seed_sequence)
+    game_simulator.play_simulations()
+    return game_simulator.simulation_records, game_simulator.search_stats_records
 
 
 class GameSimulator(NoughtsAndCrossesMinimax):
@@ -32,7 +86,22 @@ class GameSimulator(NoughtsAndCrossesMinimax):
     collect_data: True/False depending on whether we want to store the simulated games
     collect_data_path: The path where the collected data will be saved (plus an additional /date)
     collect_data_file_suffix: The suffix to the file where the data is being saved (plus an m_n_k prefix)
-    simulation_dataframe: The dataframe used to store the moves, board status and outcomes of individual games
+    record_board_statuses: Whether the board after every move is recorded (and saved) as well as the moves. The boards
+    take up far more memory than the moves, and can be replayed from them, so are not recorded by default.
+    workers: The number of processes the games are shared between (with the default of 1, the games are all simulated
+    in the calling process)
+    random_seed: The seed of the random starting players and moves of the simulated games, and of the MCTS player (None
+    for an unpredictable seed, in which case the random generators are only seeded for the worker processes)
+    search_limits: The limits on each search made by a simulated minimax player (defaults to SearchLimits()). If the
+    endgame tablebase of the game has been generated, minimax plays from it instead of searching, and likewise from the
+    opening book of the game if it has been built.
+    mcts_limits: The time and playout budgets of each search made by a simulated MCTS player (defaults to MCTSLimits())
+    ponder_seconds: The thinking time given to the opponent after each minimax move, during which minimax ponders
+    (with the default of 0, minimax does not ponder). This simulates playing against an opponent who takes time to
+    move, such as a human player.
+    mcts_engine: The Monte Carlo tree search engine that finds the moves of a simulated MCTS player
+    simulation_records: The moves, outcomes (and optionally boards) of the individual games, if collecting data
+    search_stats_records: The statistics of every search made by a simulated minimax player (one dict per move)
     """
 
     def __init__(self,
@@ -44,8 +113,23 @@ class GameSimulator(NoughtsAndCrossesMinimax):
                  save_game_outcome_summary: bool,
                  save_all_game_data: bool,
                  output_data_path: Path = ROOT_PATH / "research" / "game_simulation_data",
-                 output_data_file_suffix: str = None):
-        super().__init__(setup_parameters)
+                 output_data_file_suffix: str = None,
+                 search_limits: SearchLimits = None,
+                 ponder_seconds: float = 0,
+                 mcts_limits: MCTSLimits = None,
+                 record_board_statuses: bool = False,
+                 workers: int = 1,
+                 random_seed: int | np.random.SeedSequence | None = None):
+        endgame_tablebase = EndgameTablebase.load_if_generated(
+            game_rows_m=setup_parameters.game_rows_m, game_cols_n=setup_parameters.game_cols_n,
+            win_length_k=setup_parameters.win_length_k)
+        opening_book = OpeningBook.load_if_generated(
+            game_rows_m=setup_parameters.game_rows_m, game_cols_n=setup_parameters.game_cols_n,
+            win_length_k=setup_parameters.win_length_k)
+        super().__init__(setup_parameters=setup_parameters, search_limits=search_limits,
+                         endgame_tablebase=endgame_tablebase, opening_book=opening_book)
+        self.ponder_seconds = ponder_seconds
+        self.mcts_engine = NoughtsAndCrossesMCTS(setup_parameters=setup_parameters, mcts_limits=mcts_limits)
         self.number_of_simulations = number_of_simulations
         self.player_x_as = player_x_as
         self.player_o_as = player_o_as
@@ -55,62 +139,116 @@ class GameSimulator(NoughtsAndCrossesMinimax):
         self.collect_data = print_game_outcomes or save_game_outcome_summary or save_all_game_data
         self.output_data_path = output_data_path
         self.output_data_file_suffix = output_data_file_suffix
-        self.simulation_dataframe: pd.DataFrame = self._construct_empty_simulation_dataframe()
+        self.record_board_statuses = record_board_statuses
+        self.workers = workers
+        self.random_seed = random_seed
+        self.simulation_records: SimulationRecords | None = SimulationRecords.preallocate(
+            number_of_games=number_of_simulations, board_shape=(self.game_rows_m, self.game_cols_n),
+            record_board_statuses=record_board_statuses) if self.collect_data else None
+        self.search_stats_records: List[Dict] = []
 
     def run_simulations(self):
-        """Method that gets called to run the simulations of the game play"""
+        """Method that gets called to run the simulations of the game play, and then report on them"""
+        if self.workers > 1:
+            self._play_simulations_in_worker_processes()
+        else:
+            self.play_simulations()
+
+        if self.save_all_game_data:
+            self._save_simulation_dataframe_to_file()
+        if self.save_game_outcome_summary:
+            self._save_simulation_outcome_summary_to_file()
+        if self.print_game_outcomes:
+            self._print_simulation_outcome_to_terminal()
+
+    def play_simulations(self):
+        """Method to simulate every game in the calling process, recording each game if collecting data"""
+        if self.random_seed is not None:
+            self._seed_random_generators(seed_sequence=self._get_seed_sequence())
 
-        # Potentially some setup methods
         for simulation_number in range(0, self.number_of_simulations):
             # Determine a random starting player and store this
             self.set_starting_player(starting_player_value=StartingPlayer.RANDOM.value)
             if self.collect_data:
-                self.simulation_dataframe.loc[
-                    simulation_number, SimulationColumnName.STARTING_PLAYER.name] = StartingPlayer(
-                    self.starting_player_value).name
+                self.simulation_records.starting_player_values[simulation_number] = self.starting_player_value
 
-            moves_made = 0
             while True:  # player o and player x successively makes moves until the game is won or drawn
                 if self.get_player_turn() == BoardMarking.X.value:
                     marking_index = self._get_player_x_move()
                 else:
                     marking_index = self._get_player_o_move()
                 self.mark_board(marking_index=marking_index)
-                moves_made += 1
 
                 if self.collect_data:
-                    self._add_board_status_to_simulation_dataframe(
-                        last_move=marking_index, moves_made=moves_made, simulation_number=simulation_number)
+                    self.simulation_records.record_move(game_number=simulation_number, marking_index=marking_index,
+                                                        playing_grid=self.playing_grid)
 
                 # If there has been a draw or a win, store this information and simulated the next game
                 win, _ = self.win_check_and_location_search(last_played_index=marking_index, get_win_location=False)
                 if win:
-                    if self.collect_data:
-                        self._add_winning_player_to_simulation_dataframe(simulation_number=simulation_number)
+                    if self.collect_data:  # The winner is the player who made the last move
+                        self.simulation_records.winning_player_values[simulation_number] = -self.get_player_turn()
                     self.reset_game_board()
                     break
-                elif self.check_for_draw():
-                    if self.collect_data:
-                        self.simulation_dataframe.loc[
-                            simulation_number, SimulationColumnName.WINNING_PLAYER.name] = "DRAW"
+                elif self.check_for_draw():  # A draw is recorded as no winning player
                     self.reset_game_board()
                     break
+                elif self.ponder_seconds > 0 and self._last_move_was_made_by_minimax():
+                    self.start_pondering()
+                    sleep(self.ponder_seconds)  # The opponent's thinking time
 
-        if self.save_all_game_data:
-            self._save_simulation_dataframe_to_file()
-        if self.save_game_outcome_summary:
-            self._save_simulation_outcome_summary_to_file()
-        if self.print_game_outcomes:
-            self._print_simulation_outcome_to_terminal()
+    def _play_simulations_in_worker_processes(self) -> None:
+        """
+        Method to share the games between the worker processes, as contiguous batches, and merge the records each worker
+        sends back, in the order of the batches. Every worker is seeded from its own child of the seed sequence.
+        """
+        batch_sizes = [len(batch) for batch in np.array_split(np.arange(self.number_of_simulations), self.workers)]
+        seed_sequences = self._get_seed_sequence().spawn(self.workers)
+        tasks = [SimulationWorkerTask(
+            setup_parameters=self.get_essential_parameters(), number_of_simulations=batch_size,
+            player_x_as=self.player_x_as, player_o_as=self.player_o_as, print_game_outcomes=self.print_game_outcomes,
+            save_game_outcome_summary=self.save_game_outcome_summary, save_all_game_data=self.save_all_game_data,
+            search_limits=self.search_limits, ponder_seconds=self.ponder_seconds,
+            mcts_limits=self.mcts_engine.mcts_limits, record_board_statuses=self.record_board_statuses,
+            seed_sequence=seed_sequence) for batch_size, seed_sequence in zip(batch_sizes, seed_sequences)
+            if batch_size > 0]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            worker_results = list(executor.map(_run_simulation_worker, tasks))
+        if self.collect_data:
+            self.simulation_records = SimulationRecords.concatenate(
+                records=[simulation_records for simulation_records, _ in worker_results])
+        self.search_stats_records = [search_stats_record for _, search_stats_records in worker_results
+                                     for search_stats_record in search_stats_records]
+
+    def _get_seed_sequence(self) -> np.random.SeedSequence:
+        """Method to get the seed sequence of the simulation, which the seeds of all its random generators come from."""
+        if isinstance(self.random_seed, np.random.SeedSequence):
+            return self.random_seed
+        return np.random.SeedSequence(self.random_seed)
+
+    def _seed_random_generators(self, seed_sequence: np.random.SeedSequence) -> None:
+        """
+        Method to seed every random generator the simulated games use - numpy's global generator (the starting
+        players), python's global generator (the random moves, and the minimax move ordering) and the MCTS engine's.
+        """
+        global_seed_sequence, mcts_seed_sequence = seed_sequence.spawn(2)
+        numpy_seed, python_seed = global_seed_sequence.generate_state(2)
+        np.random.seed(numpy_seed)
+        random.seed(int(python_seed))
+        self.mcts_engine = NoughtsAndCrossesMCTS(setup_parameters=self.get_essential_parameters(),
+                                                 mcts_limits=self.mcts_engine.mcts_limits,
+                                                 random_seed=mcts_seed_sequence)
 
     # Methods used to generate the player moves when running the simulations
     def _get_player_x_move(self) -> np.ndarray:
         """Method to get the moved played by player x on their turn"""
         if self.player_x_as == PlayerOptions.MINIMAX:
-            _, move = self.get_minimax_move_iterative_deepening()
-            return move
+            return self._get_minimax_move_and_record_search_stats()
         elif self.player_x_as == PlayerOptions.RANDOM:
             return self._get_random_move()
+        elif self.player_x_as == PlayerOptions.MCTS:
+            return self._get_mcts_move()
         else:
             raise ValueError(f"player_x_as simulation player's moves are not defined."
                              f"self.player_x_as: {self.player_x_as}")
@@ -118,60 +256,55 @@ class GameSimulator(NoughtsAndCrossesMinimax):
     def _get_player_o_move(self) -> np.ndarray:
         """Method to get the moved played by player o on their turn"""
         if self.player_o_as == PlayerOptions.MINIMAX:
-            _, move = self.get_minimax_move_iterative_deepening()
-            return move
+            return self._get_minimax_move_and_record_search_stats()
         elif self.player_o_as == PlayerOptions.RANDOM:
             return self._get_random_move()
+        elif self.player_o_as == PlayerOptions.MCTS:
+            return self._get_mcts_move()
         else:
             raise ValueError(f"player_o_as simulation player's moves are not defined."
                              f"self.player_o_as: {self.player_o_as}")
 
+    def _get_minimax_move_and_record_search_stats(self) -> np.ndarray:
+        """Method to get the move played by a minimax player, and keep the statistics of the search that found it"""
+        _, move, search_stats = self.get_minimax_move_and_search_stats()
+        search_stats_record = {"player": BoardMarking(self.get_player_turn()).name,
+                               "empty_cells": int(np.count_nonzero(self.playing_grid == BoardMarking.EMPTY.value))}
+        search_stats_record.update(search_stats.to_dict())
+        self.search_stats_records.append(search_stats_record)
+        return move
+
+    def _get_mcts_move(self) -> np.ndarray:
+        """Method to get the move played by an MCTS player, searching from the current state of the simulated game"""
+        self.mcts_engine.sync_game_state(game=self)
+        _, move = self.mcts_engine.get_mcts_move()
+        return move
+
+    def _last_move_was_made_by_minimax(self) -> bool:
+        """Method to determine whether the player who made the last move is simulated as minimax"""
+        if self.get_player_turn() == BoardMarking.X.value:  # i.e. player O made the last move
+            return self.player_o_as == PlayerOptions.MINIMAX
+        else:
+            return self.player_x_as == PlayerOptions.MINIMAX
+
     def _get_random_move(self) -> np.ndarray:
         """
-        Method to generate a random move on the playing grid.
-        Note that the _get_available_cell_indices method already includes a random shuffle, so we can just index out
-        the first element in this list.
-        Note also that despite it returning a sliced list, because it is randomly sliced, this does not matter
+        Method to generate a random move on the playing grid, chosen uniformly from every empty cell.
+        Note that the minimax _get_available_cell_indices is not used, since it only includes the cells near a mark.
         """
-        random_options: List[np.ndarray] = self._get_available_cell_indices(
-            playing_grid=self.playing_grid, search_depth=0)
-        return random_options[0]
+        empty_cell_indices = np.argwhere(self.playing_grid == BoardMarking.EMPTY.value)
+        return empty_cell_indices[random.randrange(len(empty_cell_indices))]
 
-    # Methods relating to creating, populating and saving the data structure for collecting simulation data
-    def _construct_empty_simulation_dataframe(self) -> pd.DataFrame:
-        """Method to initialise an empty pandas DataFrame in the relevant structure for collecting game data."""
-        if self.collect_data:
-            possible_moves = self.game_rows_m * self.game_cols_n
-            columns = [SimulationColumnName.STARTING_PLAYER.name, SimulationColumnName.WINNING_PLAYER.name] + \
-                      [f"{SimulationColumnName.BOARD_STATUS.name}_{move_number + 1}" for move_number in
-                       range(0, possible_moves)] + \
-                      [f"{SimulationColumnName.MOVE.name}_{move_number + 1}" for move_number in
-                       range(0, possible_moves)]
-            index = pd.RangeIndex(0, self.number_of_simulations)
-            simulation_dataframe = pd.DataFrame(columns=columns, index=index, dtype=str)
-            return simulation_dataframe
-
-    def _add_board_status_to_simulation_dataframe(self, last_move: np.ndarray, moves_made: int,
-                                                  simulation_number: int) -> None:
-        """
-        Method to add the current status and previous move of the board to the simulation dataframe,
-        in the relevant row and column.
-        """
-        board_status_col_index = f"{SimulationColumnName.BOARD_STATUS.name}_{moves_made}"
-        self.simulation_dataframe.loc[simulation_number, board_status_col_index] = np_array_to_tuple(self.playing_grid)
-
-        last_move_col_index = f"{SimulationColumnName.MOVE.name}_{moves_made}"
-        self.simulation_dataframe.loc[simulation_number, last_move_col_index] = np_array_to_tuple(last_move)
-
-    def _add_winning_player_to_simulation_dataframe(self, simulation_number: int) -> None:
-        """Method to add the winning player to the dataframe, in the case that we know there is a winner."""
-        last_played_value = - self.get_player_turn()
-        if BoardMarking(last_played_value) == BoardMarking.X:
-            self.simulation_dataframe.loc[
-                simulation_number, SimulationColumnName.WINNING_PLAYER.name] = self.player_x.name
-        else:
-            self.simulation_dataframe.loc[
-                simulation_number, SimulationColumnName.WINNING_PLAYER.name] = self.player_o.name
+    # Methods relating to laying out and saving the data collected during the simulations
+    def get_simulation_dataframe(self) -> pd.DataFrame:
+        """
+        Method to lay out the simulation records as a dataframe, with one row per game (see SimulationRecords).
+        Note that the dataframe is built from the records on each call, so should be kept rather than called again.
+        """
+        if not self.collect_data:
+            raise ValueError("The simulation dataframe is only available when the simulation data is collected.")
+        return self.simulation_records.to_dataframe(player_x_name=self.player_x.name,
+                                                    player_o_name=self.player_o.name)
 
     def _save_simulation_dataframe_to_file(self) -> None:
         """Method to save the simulation file in the given path."""
@@ -181,7 +314,7 @@ class GameSimulator(NoughtsAndCrossesMinimax):
             file_path.mkdir(parents=True)
 
         file_name = self.get_output_file_prefix() + self.output_data_file_suffix + ".csv"
-        self.simulation_dataframe.to_csv(file_path / file_name, index=False, na_rep="GAME_WON")
+        self.get_simulation_dataframe().to_csv(file_path / file_name, index=False, na_rep="GAME_WON")
 
     def _save_simulation_outcome_summary_to_file(self) -> None:
         """
@@ -210,11 +343,71 @@ class GameSimulator(NoughtsAndCrossesMinimax):
         aggregated outcomes of all the games (i.e. either player's win counts).
         """
         overview_text = self.get_string_detailing_simulation_parameters()
-        win_counts = self.simulation_dataframe[SimulationColumnName.WINNING_PLAYER.name].value_counts(ascending=False)
+        win_counts = self.simulation_records.get_winning_player_names(
+            player_x_name=self.player_x.name, player_o_name=self.player_o.name).value_counts(ascending=False)
         win_counts_text = f"Summary of games won by each player during the simulations:\n{win_counts}"
         full_text = overview_text + "\n" + win_counts_text
+        if len(self.search_stats_records) > 0:
+            full_text += "\n\n" + self.get_search_stats_summary_text()
         return full_text
 
+    # Methods analysing the positions reached during the simulations
+    def get_position_scores(self) -> pd.DataFrame:
+        """
+        Method to score every position reached during the simulated games with the static evaluation of the minimax
+        search, from player X's perspective. The positions are scored in bulk, with a single call to evaluate_boards.
+        Note that the final position of each game is also scored statically, even though the game is over.
+
+        Returns: A dataframe with one row per position, holding the simulation number, the number of moves made to
+        reach the position and its score
+        """
+        if not self.collect_data:
+            raise ValueError("Positions can only be scored when the simulation data is collected.")
+        played_games = np.flatnonzero(self.simulation_records.move_counts)
+        move_counts = self.simulation_records.move_counts[played_games].astype(int)
+        board_statuses = np.concatenate([self.simulation_records.get_board_statuses(game_number=game_number) for
+                                         game_number in played_games])
+        simulation_numbers = np.repeat(played_games, move_counts)
+        moves_made = np.concatenate([np.arange(1, move_count + 1) for move_count in move_counts])
+        starting_player_values = self.simulation_records.starting_player_values[simulation_numbers]
+        # The starting player is to move after an even number of moves
+        next_player_values = np.where(moves_made % 2 == 0, starting_player_values, -starting_player_values)
+
+        playing_grids = np.where(board_statuses == 0, BoardMarking.EMPTY.value, board_statuses)
+        scores = evaluate_boards(
+            playing_grids=playing_grids.reshape(-1, self.game_rows_m, self.game_cols_n),
+            win_length_k=self.win_length_k, maximiser_mark_values=BoardMarking.X.value,
+            maximiser_has_next_turn_flags=next_player_values == BoardMarking.X.value)
+        return pd.DataFrame({"simulation_number": simulation_numbers, "moves_made": moves_made, "score": scores})
+
+    # Methods aggregating the statistics of the minimax searches made during the simulations
+    def get_search_stats_dataframe(self) -> pd.DataFrame:
+        """Method to get the statistics of every minimax search made during the simulations, with one row per move"""
+        return pd.DataFrame(self.search_stats_records)
+
+    def get_search_stats_summary_text(self) -> str:
+        """
+        Method producing a summary of the minimax searches made during the simulations - the totals and averages of
+        the search statistics, and how often each reason for stopping the search occurred.
+        """
+        search_stats_dataframe = self.get_search_stats_dataframe()
+        if len(search_stats_dataframe) == 0:
+            return "No minimax searches were made during the simulations."
+        total_nodes = search_stats_dataframe["nodes_visited"].sum()
+        total_seconds = search_stats_dataframe["search_seconds"].sum()
+        average_columns = ["nodes_visited", "leaves_evaluated", "terminal_hits", "cutoffs", "depth_completed",
+                           "search_seconds", "effective_branching_factor", "transposition_hit_rate",
+                           "evaluation_cache_hit_rate", "win_check_cache_hit_rate"]
+        averages = search_stats_dataframe[average_columns].mean()
+        stop_reason_counts = search_stats_dataframe["stop_reason"].value_counts()
+        text = f"Summary of the {len(search_stats_dataframe)} minimax searches made during the simulations:\n" \
+               f"Total nodes visited: {total_nodes}\n" \
+               f"Total search time (s): {total_seconds:.2f}\n" \
+               f"Nodes per second: {total_nodes / total_seconds if total_seconds > 0 else 0:.0f}\n\n" \
+               f"Average per search:\n{averages.to_string()}\n\n" \
+               f"Reasons the searches stopped:\n{stop_reason_counts.to_string()}"
+        return text
+
     # Methods producing strings detailing metadata related to simulation
     def get_output_file_prefix(self) -> str:
         """Method to create a string of the form: 3_3_3_MINIMAX_RANDOM as a prefix for saved data files"""
@@ -8,6 +8,7 @@ class PlayerOptions(Enum):
     """Enumeration of the different player options the simulated players can be."""
     MINIMAX = auto()
     RANDOM = auto()
+    MCTS = auto()
 
 
 class SimulationColumnName(Enum):
@@ -0,0 +1,133 @@
+"""
+Module defining how the games played by a GameSimulator are recorded.
+
+Every game is recorded into numpy arrays that are allocated once, up front, for the number of games to be simulated -
+each move as the flat index of its cell (always), and the board after each move (optionally, since a game's boards take
+as many bytes as there are cells squared, and can instead be replayed from its moves). The records are only laid out
+as a pandas DataFrame when one is asked for, e.g. to save them.
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+# Local application imports
+from automation.game_simulation.game_simulation_constants import SimulationColumnName
+from game.constants.game_constants import BoardMarking, StartingPlayer
+from utils import np_array_to_tuple
+
+# The move recorded for each ply after the end of a game
+NO_MOVE = np.iinfo(np.uint16).max
+
+
+@dataclass
+class SimulationRecords:
+    """
+    The moves and outcomes of a number of simulated games, along with the boards reached if they are being recorded.
+
+    Attributes:
+    __________
+    board_shape: The shape (m, n) of the playing grid the games were played on
+    starting_player_values: The BoardMarking value of the player who started each game (0 for a game not yet played)
+    winning_player_values: The BoardMarking value of the winner of each game (0 for a draw, or a game not yet played)
+    move_counts: The number of moves made in each game
+    moves: The flat index of the cell marked at each ply of each game, with NO_MOVE for every ply after the end of the
+    game, as a (number of games, m * n) array
+    board_statuses: The marks on the board after each ply of each game (1 for X, -1 for O and 0 for an empty cell), as a
+    (number of games, m * n, m * n) array, or None if the boards are not being recorded
+    """
+    board_shape: Tuple[int, int]
+    starting_player_values: np.ndarray
+    winning_player_values: np.ndarray
+    move_counts: np.ndarray
+    moves: np.ndarray
+    board_statuses: np.ndarray | None
+
+    @classmethod
+    def preallocate(cls, number_of_games: int, board_shape: Tuple[int, int],
+                    record_board_statuses: bool) -> "SimulationRecords":
+        """Method to allocate the records of the given number of games, before any of them are played."""
+        number_of_cells = board_shape[0] * board_shape[1]
+        board_statuses = np.zeros((number_of_games, number_of_cells, number_of_cells), dtype=np.int8) \
+            if record_board_statuses else None
+        return cls(board_shape=board_shape,
+                   starting_player_values=np.zeros(number_of_games, dtype=np.int8),
+                   winning_player_values=np.zeros(number_of_games, dtype=np.int8),
+                   move_counts=np.zeros(number_of_games, dtype=np.uint16),
+                   moves=np.full((number_of_games, number_of_cells), fill_value=NO_MOVE, dtype=np.uint16),
+                   board_statuses=board_statuses)
+
+    @classmethod
+    def concatenate(cls, records: List["SimulationRecords"]) -> "SimulationRecords":
+        """Method to merge the records of separate batches of games (e.g. played by separate processes), in order."""
+        board_statuses = None if records[0].board_statuses is None else \
+            np.concatenate([batch.board_statuses for batch in records])
+        return cls(board_shape=records[0].board_shape,
+                   starting_player_values=np.concatenate([batch.starting_player_values for batch in records]),
+                   winning_player_values=np.concatenate([batch.winning_player_values for batch in records]),
+                   move_counts=np.concatenate([batch.move_counts for batch in records]),
+                   moves=np.concatenate([batch.moves for batch in records]),
+                   board_statuses=board_statuses)
+
+    def record_move(self, game_number: int, marking_index: np.ndarray, playing_grid: np.ndarray) -> None:
+        """Method to record the move just made in a game, and the playing grid after the move if boards are recorded."""
+        ply = self.move_counts[game_number]
+        self.moves[game_number, ply] = marking_index[0] * self.board_shape[1] + marking_index[1]
+        if self.board_statuses is not None:
+            self.board_statuses[game_number, ply] = playing_grid.real.ravel()  # The EMPTY value has no real part
+        self.move_counts[game_number] = ply + 1
+
+    def get_board_statuses(self, game_number: int) -> np.ndarray:
+        """
+        Method to get the marks on the board after each move of a game, replaying the game's moves if the boards were
+        not recorded.
+        Returns: A (number of moves made, m * n) array, with marks as for board_statuses
+        """
+        move_count = self.move_counts[game_number]
+        if self.board_statuses is not None:
+            return self.board_statuses[game_number, :move_count]
+        mover_values = np.where(np.arange(move_count) % 2 == 0, 1, -1) * self.starting_player_values[game_number]
+        board_statuses = np.zeros((move_count, self.moves.shape[1]), dtype=np.int8)
+        board_statuses[np.arange(move_count), self.moves[game_number, :move_count]] = mover_values
+        return np.cumsum(board_statuses, axis=0, dtype=np.int8)
+
+    def get_winning_player_names(self, player_x_name: str, player_o_name: str) -> pd.Series:
+        """Method to get the name of the winner of each game played, or DRAW if the game was drawn."""
+        played_games = self.move_counts > 0
+        winning_player_names = np.select(
+            [self.winning_player_values == BoardMarking.X.value, self.winning_player_values == BoardMarking.O.value],
+            [player_x_name, player_o_name], default="DRAW")
+        return pd.Series(winning_player_names[played_games], index=np.flatnonzero(played_games),
+                         name=SimulationColumnName.WINNING_PLAYER.name)
+
+    def to_dataframe(self, player_x_name: str, player_o_name: str) -> pd.DataFrame:
+        """
+        Method to lay out the records with one row per game - the starting and winning player, then the board after
+        each move (if recorded) and the move itself, with each board and move as a tuple. The entries of a game that
+        has not been played, and of every ply after the end of a game, are missing.
+        """
+        number_of_games, number_of_cells = self.moves.shape
+        dataframe = pd.DataFrame(index=pd.RangeIndex(0, number_of_games))
+        played_games = self.move_counts > 0
+        dataframe[SimulationColumnName.STARTING_PLAYER.name] = pd.Series(
+            [StartingPlayer(value).name for value in self.starting_player_values[played_games]],
+            index=np.flatnonzero(played_games), dtype=object)
+        dataframe[SimulationColumnName.WINNING_PLAYER.name] = self.get_winning_player_names(
+            player_x_name=player_x_name, player_o_name=player_o_name).astype(object)
+
+        record_columns = {}
+        if self.board_statuses is not None:
+            for ply in range(number_of_cells):
+                record_columns[f"{SimulationColumnName.BOARD_STATUS.name}_{ply + 1}"] = [
+                    np_array_to_tuple(np.where(board == 0, BoardMarking.EMPTY.value, board).reshape(self.board_shape))
+                    if ply < move_count else np.nan
+                    for board, move_count in zip(self.board_statuses[:, ply], self.move_counts)]
+        for ply in range(number_of_cells):
+            record_columns[f"{SimulationColumnName.MOVE.name}_{ply + 1}"] = [
+                tuple(int(index) for index in divmod(int(move), self.board_shape[1])) if move != NO_MOVE else np.nan
+                for move in self.moves[:, ply]]
+        return pd.concat([dataframe, pd.DataFrame(record_columns, index=dataframe.index)], axis=1)
@@ -0,0 +1,15 @@
+"""Module to define the constants used by the Monte Carlo tree search engine."""
+
+# Standard library imports
+from enum import Enum
+
+
+class MCTSParameters(Enum):
+    """
+    Enum defining the default parameters of the Monte Carlo tree search.
+    These values are only the defaults for an MCTSLimits object, which is what the search actually reads.
+    """
+    exploration_constant = 2 ** 0.5  # The UCT exploration constant, c in: win rate + c * sqrt(ln(N) / n)
+    max_search_seconds = 2
+    max_playouts = 200_000  # The playout budget of a single move
+    playouts_per_expansion = 32  # The random playouts run together (as one numpy batch) from each new node
@@ -0,0 +1,289 @@
+"""
+Subclass of the noughts and crosses game that implements Monte Carlo tree search (MCTS) for automating game play.
+
+Unlike minimax, MCTS does not need a heuristic evaluation of non-terminal boards, or a branch factor to make larger
+boards tractable. Instead, each iteration of the search walks down the tree choosing moves by the UCT rule (upper
+confidence bound applied to trees), adds one new node, estimates the value of the new node by a batch of random
+playouts, and then updates the win counts of every node on the path back to the root. The move played is the most
+visited move at the root of the tree.
+
+The search can also be split across several processes (root parallelisation) - each process grows its own tree from
+the same position with an independent random generator, and the root visit and win counts of the trees are summed.
+"""
+
+# Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Dict, List, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.mcts.mcts_limits import MCTSLimits
+from automation.mcts.random_playouts import get_random_playout_winners
+from automation.minimax.constants.forced_move_constants import ForcedMoveType
+from automation.minimax.forced_moves import get_forced_move
+from game.app.board_windows import get_window_indices
+from game.app.game_base_class import NoughtsAndCrosses, NoughtsAndCrossesEssentialParameters
+from game.constants.game_constants import BoardMarking
+
+
+@dataclass(eq=False)
+class MCTSNode:
+    """
+    Dataclass for a node of the search tree, which is the position reached by playing move_index.
+
+    Attributes:
+    __________
+    move_index: The flat index of the move leading to the node (None at the root)
+    player_just_moved: The BoardMarking value of the player who made the move leading to the node
+    parent: The node the move was made from (None at the root)
+    untried_moves: The flat indices of the moves from the node that have not yet been added to the tree
+    children: The nodes that have been added to the tree below this node
+    visits: The number of playouts made through the node
+    wins: The number of those playouts won by player_just_moved, with a draw counting as half a win
+    terminal_winner: The winner of the game at the node (0 for a draw), or None if the game is still in progress
+    """
+    move_index: int | None
+    player_just_moved: int
+    parent: "MCTSNode | None" = None
+    untried_moves: List[int] = field(default_factory=list)
+    children: List["MCTSNode"] = field(default_factory=list)
+    visits: int = 0
+    wins: float = 0
+    terminal_winner: int | None = None
+
+    def get_uct_score(self, exploration_constant: float, log_parent_visits: float) -> float:
+        """Method to get the UCT score the parent node uses to decide whether to search this node next."""
+        return self.wins / self.visits + exploration_constant * math.sqrt(log_parent_visits / self.visits)
+
+
+@dataclass(frozen=True)
+class MCTSWorkerTask:
+    """Dataclass storing everything a worker process needs to grow its own search tree from the root position"""
+    setup_parameters: NoughtsAndCrossesEssentialParameters
+    marks: np.ndarray
+    player_to_move_value: int
+    mcts_limits: MCTSLimits
+    seed_sequence: np.random.SeedSequence
+
+
+def _run_mcts_worker_search(task: MCTSWorkerTask) -> Dict[int, Tuple[int, float]]:
+    """
+    Function run in a worker process, growing a search tree from the root position.
+    Returns: The visit and win counts of each move at the root of the worker's tree, keyed by the move's flat index.
+    """
+    engine = NoughtsAndCrossesMCTS(setup_parameters=task.setup_parameters, mcts_limits=task.mcts_limits,
+                                   random_seed=task.seed_sequence)
+    root = engine.search_tree(marks=task.marks, player_to_move_value=task.player_to_move_value,
+                              mcts_limits=task.mcts_limits)
+    return {child.move_index: (child.visits, child.wins) for child in root.children}
+
+
+class NoughtsAndCrossesMCTS(NoughtsAndCrosses):
+    def __init__(self,
+                 setup_parameters: NoughtsAndCrossesEssentialParameters,
+                 mcts_limits: MCTSLimits = None,
+                 parallel_processes: int = 1,
+                 check_forced_moves: bool = True,
+                 random_seed: int | np.random.SeedSequence | None = None):
+        """
+        Parameters:
+        __________
+        setup_parameters - the structure of the game that is being played.
+
+        mcts_limits - the default time and playout budgets of each search for a move in this game. These can also be
+        overridden on individual calls to get_mcts_move.
+
+        parallel_processes - the number of processes that each grow a search tree from the root position, sharing the
+        playout budget between them. With the default of 1, the search is made entirely in the calling process.
+
+        check_forced_moves - whether to play immediate wins and mandatory blocks straight away, without searching.
+        Random playouts are a poor judge of positions that hinge on a single move, so this is recommended.
+
+        random_seed - the seed of the random generator used to order the moves and play out the games (None for an
+        unpredictable seed).
+        """
+        super().__init__(setup_parameters)
+        if mcts_limits is None:
+            mcts_limits = MCTSLimits()
+        self.mcts_limits = mcts_limits
+        self.parallel_processes = parallel_processes
+        self.check_forced_moves = check_forced_moves
+        self.random_seed = random_seed
+        self._random_generator = np.random.default_rng(random_seed)
+        window_indices = get_window_indices(self.game_rows_m, self.game_cols_n, self.win_length_k)
+        self._cell_window_indices: List[np.ndarray] = [
+            window_indices[np.any(window_indices == flat_index, axis=1)]
+            for flat_index in range(0, self.game_rows_m * self.game_cols_n)]
+
+    def get_mcts_move(self, mcts_limits: MCTSLimits = None) -> Tuple[float | None, np.ndarray]:
+        """
+        Method to search for the best move for the player whose turn it is on the playing grid.
+
+        Parameters:
+        __________
+        mcts_limits - the limits on this search, overriding the instance's default limits
+
+        Returns:
+        __________
+        win_rate - the proportion of the playouts through the chosen move that were won by the player to move (with
+        draws counting as half a win). A forced move is played without searching, so is given a win rate of 1 for a
+        win, 0 for a losing block and None for a block.
+        move - the index of the chosen move on the playing grid
+        """
+        if mcts_limits is None:
+            mcts_limits = self.mcts_limits
+        player_to_move_value = self.get_player_turn()
+        if self.check_forced_moves:
+            forced_move = get_forced_move(playing_grid=self.playing_grid, win_length_k=self.win_length_k,
+                                          player_mark_value=player_to_move_value)
+            if forced_move is not None:
+                forced_win_rate = {ForcedMoveType.WIN: 1.0, ForcedMoveType.LOSING_BLOCK: 0.0}.get(
+                    forced_move.forced_move_type)
+                return forced_win_rate, forced_move.move
+
+        marks = self._get_marks(playing_grid=self.playing_grid)
+        if not np.any(marks == 0):
+            raise ValueError("get_mcts_move was called on a full playing grid.")
+        if self.parallel_processes > 1:
+            root_move_counts = self._get_parallel_root_move_counts(
+                marks=marks, player_to_move_value=player_to_move_value, mcts_limits=mcts_limits)
+        else:
+            root = self.search_tree(marks=marks, player_to_move_value=player_to_move_value, mcts_limits=mcts_limits)
+            root_move_counts = {child.move_index: (child.visits, child.wins) for child in root.children}
+
+        best_move_index = max(root_move_counts, key=lambda move_index: root_move_counts[move_index][0])
+        visits, wins = root_move_counts[best_move_index]
+        return wins / visits, np.array(np.unravel_index(best_move_index, self.playing_grid.shape))
+
+    def sync_game_state(self, game: NoughtsAndCrosses) -> None:
+        """
+        Method to copy the state of a game being played elsewhere (e.g. by a simulator or the GUI) onto this engine,
+        so that get_mcts_move searches for the next move in that game.
+        """
+        self.starting_player_value = game.starting_player_value
+        self.playing_grid = game.playing_grid.copy()
+        self.previous_mark_index = game.previous_mark_index
+
+    def search_tree(self, marks: np.ndarray, player_to_move_value: int, mcts_limits: MCTSLimits) -> MCTSNode:
+        """
+        Method to grow a search tree from the given position, until either of the search's budgets is used up. At
+        least one batch of playouts is always made.
+
+        Parameters:
+        __________
+        marks - the flat board being searched from, as 1 for X, -1 for O and 0 for an empty cell
+        player_to_move_value - the BoardMarking value of the player to move
+        mcts_limits - the limits on the search
+
+        Returns:
+        __________
+        The root node of the search tree
+        """
+        deadline = None if mcts_limits.max_search_seconds is None else \
+            time.perf_counter() + mcts_limits.max_search_seconds
+        playouts_per_expansion = mcts_limits.playouts_per_expansion
+        root = MCTSNode(move_index=None, player_just_moved=-player_to_move_value,
+                        untried_moves=self._get_shuffled_empty_cells(marks=marks))
+        playouts_made = 0
+        while True:
+            # Selection - follow the UCT rule down to a node which has not been fully expanded
+            node = root
+            node_marks = marks.copy()
+            while not node.untried_moves and node.children:
+                log_visits = math.log(node.visits)
+                node = max(node.children, key=lambda child: child.get_uct_score(
+                    exploration_constant=mcts_limits.exploration_constant, log_parent_visits=log_visits))
+                node_marks[node.move_index] = node.player_just_moved
+
+            # Expansion - add one of the node's untried moves to the tree
+            if node.terminal_winner is None and node.untried_moves:
+                move_index = node.untried_moves.pop()
+                player_value = -node.player_just_moved
+                node_marks[move_index] = player_value
+                child = MCTSNode(move_index=move_index, player_just_moved=player_value, parent=node)
+                child.terminal_winner = self._get_terminal_winner(
+                    marks=node_marks, last_move_index=move_index, player_value=player_value)
+                if child.terminal_winner is None:
+                    child.untried_moves = self._get_shuffled_empty_cells(marks=node_marks)
+                node.children.append(child)
+                node = child
+
+            # Simulation - play a batch of random games out from the new node
+            if node.terminal_winner is not None:
+                winners = np.full(playouts_per_expansion, node.terminal_winner, dtype=np.int8)
+            else:
+                winners = get_random_playout_winners(
+                    marks=node_marks, board_shape=self.playing_grid.shape, win_length_k=self.win_length_k,
+                    player_to_move_value=-node.player_just_moved, number_of_playouts=playouts_per_expansion,
+                    random_generator=self._random_generator)
+
+            # Backpropagation - update the counts of every node on the path back up to the root
+            win_counts = {BoardMarking.X.value: np.count_nonzero(winners == BoardMarking.X.value),
+                          BoardMarking.O.value: np.count_nonzero(winners == BoardMarking.O.value)}
+            draw_count = np.count_nonzero(winners == 0)
+            while node is not None:
+                node.visits += playouts_per_expansion
+                node.wins += win_counts[node.player_just_moved] + draw_count / 2
+                node = node.parent
+
+            playouts_made += playouts_per_expansion
+            if mcts_limits.max_playouts is not None and playouts_made >= mcts_limits.max_playouts:
+                return root
+            if deadline is not None and time.perf_counter() >= deadline:
+                return root
+
+    def _get_parallel_root_move_counts(self, marks: np.ndarray, player_to_move_value: int,
+                                       mcts_limits: MCTSLimits) -> Dict[int, Tuple[int, float]]:
+        """
+        Method to grow a separate search tree in each of the parallel processes, sharing the playout budget between
+        them, and sum the visit and win counts of the root moves of the trees.
+        """
+        if mcts_limits.max_playouts is not None:
+            worker_playouts = math.ceil(mcts_limits.max_playouts / self.parallel_processes)
+            worker_limits = MCTSLimits(
+                max_search_seconds=mcts_limits.max_search_seconds, max_playouts=worker_playouts,
+                playouts_per_expansion=mcts_limits.playouts_per_expansion,
+                exploration_constant=mcts_limits.exploration_constant)
+        else:
+            worker_limits = mcts_limits
+        seed_sequences = np.random.SeedSequence(self._random_generator.integers(2 ** 63)).spawn(
+            self.parallel_processes)
+        tasks = [MCTSWorkerTask(setup_parameters=self.get_essential_parameters(), marks=marks,
+                                player_to_move_value=player_to_move_value, mcts_limits=worker_limits,
+                                seed_sequence=seed_sequence) for seed_sequence in seed_sequences]
+
+        root_move_counts: Dict[int, Tuple[int, float]] = {}
+        with ProcessPoolExecutor(max_workers=self.parallel_processes) as executor:
+            for worker_move_counts in executor.map(_run_mcts_worker_search, tasks):
+                for move_index, (visits, wins) in worker_move_counts.items():
+                    total_visits, total_wins = root_move_counts.get(move_index, (0, 0))
+                    root_move_counts[move_index] = (total_visits + visits, total_wins + wins)
+        return root_move_counts
+
+    def _get_terminal_winner(self, marks: np.ndarray, last_move_index: int, player_value: int) -> int | None:
+        """
+        Method to determine whether the last move ended the game, only looking at the windows through the last move.
+        Returns: The BoardMarking value of the player who made the last move if it won, 0 if it filled the board
+        without winning, or None if the game continues.
+        """
+        window_sums = marks[self._cell_window_indices[last_move_index]].sum(axis=1)
+        if np.any(window_sums == self.win_length_k * player_value):
+            return player_value
+        elif not np.any(marks == 0):
+            return 0
+        return None
+
+    def _get_shuffled_empty_cells(self, marks: np.ndarray) -> List[int]:
+        """Method to get the flat indices of the empty cells in a random order, so that they are expanded randomly."""
+        return self._random_generator.permutation(np.flatnonzero(marks == 0)).tolist()
+
+    @staticmethod
+    def _get_marks(playing_grid: np.ndarray) -> np.ndarray:
+        """Method to flatten a playing grid into 1 for X, -1 for O and 0 for an empty cell, as the search uses."""
+        flat_grid = playing_grid.ravel()
+        return np.where(flat_grid == BoardMarking.EMPTY.value, 0, flat_grid.real).astype(np.int8)
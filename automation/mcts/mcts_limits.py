@@ -0,0 +1,31 @@
+"""Module defining the limits that a single call to the Monte Carlo tree search is subject to."""
+
+# Standard library imports
+from dataclasses import dataclass
+
+# Local application imports
+from automation.mcts.constants.mcts_constants import MCTSParameters
+
+
+@dataclass(frozen=True)
+class MCTSLimits:
+    """
+    Dataclass storing the limits on a Monte Carlo tree search for a single move.
+    The search stops as soon as either budget is used up.
+
+    Attributes:
+    __________
+    max_search_seconds: The wall time that may be spent on a single move (None for no wall time limit)
+    max_playouts: The number of random playouts that may be run for a single move (None for no playout limit)
+    playouts_per_expansion: The number of random playouts run from each node added to the tree. Larger batches make
+    better use of numpy, at the cost of growing the tree more slowly.
+    exploration_constant: The UCT exploration constant - larger values spread the playouts across more moves
+    """
+    max_search_seconds: float | None = MCTSParameters.max_search_seconds.value
+    max_playouts: int | None = MCTSParameters.max_playouts.value
+    playouts_per_expansion: int = MCTSParameters.playouts_per_expansion.value
+    exploration_constant: float = MCTSParameters.exploration_constant.value
+
+    def __post_init__(self):
+        if self.max_search_seconds is None and self.max_playouts is None:
+            raise ValueError("An MCTSLimits must limit either the search time or the number of playouts.")
@@ -0,0 +1,68 @@
+"""
+Module defining the random playouts used by the Monte Carlo tree search to estimate the value of a position.
+
+Rather than playing out one game at a time, a whole batch of games is played out at once with numpy. Each playout
+fills every empty cell in a random order (alternating between the players), and the winner is the player who completed
+a window first - i.e. the player whose completed window has the earliest final cell. Playing out to a full board and
+then looking back for the first win gives the same winner as stopping at the first win, but means the whole batch is
+a handful of array operations.
+"""
+
+# Standard library imports
+from typing import Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_windows import get_window_indices
+from game.constants.game_constants import BoardMarking
+
+_NOT_COMPLETED = np.iinfo(np.int16).max
+
+
+def get_random_playout_winners(marks: np.ndarray,
+                               board_shape: Tuple[int, int],
+                               win_length_k: int,
+                               player_to_move_value: int,
+                               number_of_playouts: int,
+                               random_generator: np.random.Generator) -> np.ndarray:
+    """
+    Function to play out a batch of random games from the same position.
+
+    Parameters:
+    __________
+    marks: The flat (m * n) board being played out from, as 1 for X, -1 for O and 0 for an empty cell. The board
+    must not already be won.
+    board_shape: The shape (m, n) of the playing grid
+    win_length_k: The length of streak needed to win
+    player_to_move_value: The BoardMarking value of the player making the first move of each playout
+    number_of_playouts: The number of games to play out
+    random_generator: The source of the random move orders
+
+    Returns:
+    __________
+    A (number_of_playouts,) array of the winner of each playout - the BoardMarking value of the winning player, or 0
+    for a draw.
+    """
+    empty_cells = np.flatnonzero(marks == 0)
+    # A random permutation of the plies at which the empty cells get filled, for each playout
+    fill_plies = random_generator.random((number_of_playouts, len(empty_cells))).argsort(axis=1).astype(np.int16)
+
+    final_marks = np.tile(marks.astype(np.int8), (number_of_playouts, 1))
+    final_marks[:, empty_cells] = np.where(fill_plies % 2 == 0, player_to_move_value, -player_to_move_value)
+    plies = np.full((number_of_playouts, len(marks)), -1, dtype=np.int16)
+    plies[:, empty_cells] = fill_plies
+
+    window_indices = get_window_indices(*board_shape, win_length_k)
+    window_sums = final_marks[:, window_indices].sum(axis=2, dtype=np.int16)
+    window_completion_plies = plies[:, window_indices].max(axis=2)
+    x_win_plies = np.where(window_sums == win_length_k * BoardMarking.X.value, window_completion_plies,
+                           _NOT_COMPLETED).min(axis=1)
+    o_win_plies = np.where(window_sums == win_length_k * BoardMarking.O.value, window_completion_plies,
+                           _NOT_COMPLETED).min(axis=1)
+
+    winners = np.zeros(number_of_playouts, dtype=np.int8)
+    winners[x_win_plies < o_win_plies] = BoardMarking.X.value
+    winners[o_win_plies < x_win_plies] = BoardMarking.O.value
+    return winners
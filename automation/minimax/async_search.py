@@ -0,0 +1,109 @@
+"""
+Module defining an asyncio interface to the minimax search, so that a single event loop can drive many concurrent
+games without blocking on any of their searches.
+
+The search itself still runs synchronously, in a thread of an executor, and hands the result of each iteration of the
+iterative deepening back to the event loop as soon as it has finished. Cancelling the search sets the stop event of its
+SearchTimer, so the search finishes at its next look at the clock, with the best move found so far (the iteration at the
+minimum search depth always runs to completion, so there is always a move).
+
+Note that the engine must not be used for anything else (e.g. marking its playing grid) until the search has finished.
+"""
+
+# Standard library imports
+import asyncio
+from concurrent.futures import Executor
+import threading
+from typing import AsyncIterator, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+from automation.minimax.search_limits import SearchLimits
+from automation.minimax.search_results import IterationResult, SearchStats
+
+
+class AsyncMinimaxSearch:
+    """
+    Class for a single minimax search for a move, running in an executor and driven from an asyncio event loop.
+
+    Instance attributes:
+    __________
+    engine: The minimax engine whose current playing grid is searched
+    search_limits: The limits of the search (defaults to the engine's search_limits)
+    executor: The executor the search runs in (defaults to the event loop's default executor)
+    """
+
+    def __init__(self,
+                 engine: NoughtsAndCrossesMinimax,
+                 search_limits: SearchLimits = None,
+                 executor: Executor = None):
+        self.engine = engine
+        self.search_limits = search_limits
+        self.executor = executor
+        self._stop_event = threading.Event()
+        self._iteration_results: asyncio.Queue[IterationResult | None] | None = None
+        self._search_future: asyncio.Future | None = None
+
+    def start(self) -> None:
+        """Method to start the search in the executor, which must be called from within the running event loop."""
+        if self._search_future is not None:
+            raise RuntimeError("The search has already been started.")
+        event_loop = asyncio.get_running_loop()
+        self._iteration_results = asyncio.Queue()
+
+        def publish_iteration_result(iteration_result: IterationResult) -> None:  # Called in the executor's thread
+            event_loop.call_soon_threadsafe(self._iteration_results.put_nowait, iteration_result)
+
+        self._search_future = event_loop.run_in_executor(
+            self.executor, lambda: self.engine.get_minimax_move_and_search_stats(
+                search_limits=self.search_limits, stop_event=self._stop_event,
+                iteration_callback=publish_iteration_result))
+        # The end of the search is queued after the results of every iteration
+        self._search_future.add_done_callback(lambda _: self._iteration_results.put_nowait(None))
+
+    def cancel(self) -> None:
+        """
+        Method to stop the search early (e.g. because the opponent has moved, or the client has disconnected). This does
+        not wait for the search to notice - await result() for the best move found before it stopped.
+        """
+        self._stop_event.set()
+
+    async def iteration_results(self) -> AsyncIterator[IterationResult]:
+        """
+        Method to iterate over the result of each iteration of the iterative deepening, as each one finishes, which ends
+        when the search has finished.
+        """
+        self._ensure_started()
+        while (iteration_result := await self._iteration_results.get()) is not None:
+            yield iteration_result
+
+    async def result(self) -> Tuple[int, np.ndarray | None, SearchStats]:
+        """
+        Method to wait for the search to finish.
+        Returns: As for NoughtsAndCrossesMinimax.get_minimax_move_and_search_stats
+        """
+        self._ensure_started()
+        try:
+            return await asyncio.shield(self._search_future)
+        except asyncio.CancelledError:  # The awaiting task was cancelled, so there is no-one to search for any more
+            self.cancel()
+            raise
+
+    def _ensure_started(self) -> None:
+        if self._search_future is None:
+            self.start()
+
+
+async def get_minimax_move_async(engine: NoughtsAndCrossesMinimax,
+                                 search_limits: SearchLimits = None,
+                                 executor: Executor = None) -> Tuple[int, np.ndarray | None, SearchStats]:
+    """
+    Function to search for a move without blocking the event loop. Cancelling the task awaiting this function also
+    cancels the search.
+    Returns: As for NoughtsAndCrossesMinimax.get_minimax_move_and_search_stats
+    """
+    async_search = AsyncMinimaxSearch(engine=engine, search_limits=search_limits, executor=executor)
+    return await async_search.result()
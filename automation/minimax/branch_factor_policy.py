@@ -0,0 +1,139 @@
+"""
+Module defining the branch factor policy of a minimax search - how many moves are searched at each search depth, and
+which of them are searched to a reduced depth.
+
+The policy is set at the start of each search, from the shape of the board, the search budget and how fast the engine
+searches, so that small boards are searched in full while large boards are narrowed just enough to reach a useful
+depth in the same wall time. Within the branch limit, the moves at each node are searched in order of distance from the
+last move (see _get_available_cell_indices), and the later moves are less likely to be best, so after the first few
+they are searched with a reduced depth (late move reductions). A reduced move that turns out to improve the score is
+searched again at the full depth, so reductions save time on the moves that don't matter without changing the result
+on those that do. In forcing positions (where either player has threats on the board) more moves are searched to the
+full depth, since the best move is less likely to be one of the closest.
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+from typing import Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.iterative_deepening_constants import BranchFactor, IterativeDeepening
+from game.app.board_windows import get_window_values
+from game.constants.game_constants import BoardMarking
+
+
+@dataclass(frozen=True)
+class BranchFactorPolicy:
+    """
+    Dataclass storing the branch factor policy of a single search.
+
+    Attributes:
+    __________
+    branch_limits: The maximum number of moves searched at each search depth, where the last limit applies to every
+    deeper search depth too
+    full_depth_moves: The number of moves at each node that are searched to the full depth, before later moves are
+    searched with a reduced depth
+    max_reduction: The most plies that the search of a late move is reduced by
+    """
+    branch_limits: Tuple[int, ...]
+    full_depth_moves: int
+    max_reduction: int = BranchFactor.max_reduction.value
+
+    @classmethod
+    def get_default(cls, cell_count: int) -> "BranchFactorPolicy":
+        """
+        Method to get the policy used before any search budget is known - every move is searched at the untruncated
+        search depths, and the minimum number of moves beyond them, without reductions.
+        """
+        untruncated_limits = (cell_count,) * BranchFactor.untruncated_search_depths.value
+        return cls(branch_limits=untruncated_limits + (BranchFactor.minimum_branch_factor.value,),
+                   full_depth_moves=cell_count)
+
+    @classmethod
+    def for_search(cls,
+                   playing_grid: np.ndarray,
+                   win_length_k: int,
+                   max_search_depth: int,
+                   move_budget_seconds: float | None,
+                   max_nodes: int | None,
+                   nodes_per_second: float | None) -> "BranchFactorPolicy":
+        """
+        Method to set the policy of a search from the position and the search budget.
+
+        The search is modelled as visiting (E ** u * b ** (d - u)) ** alpha_beta_exponent nodes to reach depth d, where
+        E is the number of empty cells, u the number of untruncated search depths and b the branch limit beyond them.
+        The branch limit is then the largest that lets the search reach the deepest useful depth (the max search depth,
+        or the end of the game if sooner) within the node budget, and is never below the minimum branch factor.
+
+        Parameters:
+        __________
+        playing_grid: The playing grid the search starts from
+        win_length_k: The length of streak needed to win
+        max_search_depth: The deepest iteration of the iterative deepening that may be started
+        move_budget_seconds/max_nodes: The time and node budgets of the search (None if unlimited)
+        nodes_per_second: How fast the engine has been measured to search (None if it has not been measured yet)
+        """
+        empty_cell_count = int(np.count_nonzero(playing_grid == BoardMarking.EMPTY.value))
+        untruncated_depths = BranchFactor.untruncated_search_depths.value
+        useful_depth = min(max_search_depth, empty_cell_count)
+        if nodes_per_second is None:
+            nodes_per_second = BranchFactor.default_nodes_per_second.value
+        if move_budget_seconds is None:  # e.g. when pondering, which has no budget of its own
+            move_budget_seconds = IterativeDeepening.max_search_seconds.value
+        node_budget = nodes_per_second * move_budget_seconds
+        if max_nodes is not None:
+            node_budget = min(node_budget, max_nodes)
+
+        if useful_depth <= untruncated_depths:
+            branch_limit = empty_cell_count
+        else:
+            log_untruncated_nodes = untruncated_depths * np.log(max(empty_cell_count, 1))
+            log_branch_limit = (np.log(max(node_budget, 1)) / BranchFactor.alpha_beta_exponent.value -
+                                log_untruncated_nodes) / (useful_depth - untruncated_depths)
+            branch_limit = int(np.clip(np.exp(log_branch_limit), BranchFactor.minimum_branch_factor.value,
+                                       max(empty_cell_count, 1)))
+
+        threat_count = cls._get_threat_count(playing_grid=playing_grid, win_length_k=win_length_k)
+        full_depth_moves = min(BranchFactor.full_depth_moves.value + threat_count, branch_limit)
+        return cls(branch_limits=(empty_cell_count,) * untruncated_depths + (branch_limit,),
+                   full_depth_moves=full_depth_moves)
+
+    def get_max_branch_factor(self, search_depth: int) -> int:
+        """Method to get the maximum number of moves searched at the given search depth."""
+        return self.branch_limits[min(search_depth, len(self.branch_limits) - 1)]
+
+    def get_reduction(self, search_depth: int, move_number: int, remaining_depth: int) -> int:
+        """
+        Method to get the number of plies the search of a move is reduced by.
+
+        Parameters:
+        __________
+        search_depth: The search depth of the node the move is made from (moves from the root are never reduced)
+        move_number: The position of the move in the order the moves of the node are searched in (starting from 0)
+        remaining_depth: The number of plies between the node and the horizon of the search
+
+        Returns: The reduction, which always leaves the move itself inside the search
+        """
+        if search_depth == 0 or move_number < self.full_depth_moves:
+            return 0
+        reduction = 1 if move_number < 2 * self.full_depth_moves else self.max_reduction
+        return max(min(reduction, remaining_depth - 1), 0)
+
+    @staticmethod
+    def _get_threat_count(playing_grid: np.ndarray, win_length_k: int) -> int:
+        """
+        Method to measure how forcing a position is, as the number of windows where one player has a threat - at least
+        win_length_k - 2 (and at least 2) of their marks, with the rest of the window empty.
+        """
+        threat_marks = min(max(win_length_k - 2, 2), win_length_k - 1)
+        window_values = get_window_values(playing_grid=playing_grid, win_length_k=win_length_k)
+        empty_counts = np.count_nonzero(window_values == BoardMarking.EMPTY.value, axis=1)
+        threat_windows = 0
+        for player_mark_value in (BoardMarking.X.value, BoardMarking.O.value):
+            player_counts = np.count_nonzero(window_values == player_mark_value, axis=1)
+            threat_windows += np.count_nonzero((player_counts >= threat_marks) &
+                                               (player_counts + empty_counts == win_length_k))
+        return int(threat_windows)
@@ -0,0 +1,11 @@
+"""Module to define the constants used when checking for forced moves before the minimax search."""
+
+# Standard library imports
+from enum import Enum, auto
+
+
+class ForcedMoveType(Enum):
+    """Enum for the reasons a move can be forced"""
+    WIN = auto()  # The move wins the game immediately
+    BLOCK = auto()  # The move blocks the opponent's only immediate win
+    LOSING_BLOCK = auto()  # The opponent has several immediate wins, so the move (blocking one) cannot avoid a loss
@@ -7,26 +7,77 @@ from enum import Enum
 class IterativeDeepening(Enum):
     """
     Enum defining the parameters necessary to implement iterative deepening.
-    Note that the max_branch_factor is included because otherwise in larger games we just run out of time searching
-    every cell at search depth 1, 2, ... and n
+    Note that how many moves are searched at each depth is set separately (see BranchFactor), because otherwise in
+    larger games we just run out of time searching every cell at search depth 1, 2, ... and n
+
+    These values are only the defaults for a SearchLimits object, which is what the minimax search actually reads, so
+    that different games in the same process can search with different budgets.
     """
     minimum_search_depth = 2  # Corresponds to one maximiser move (depth 0) and one minimiser move (depth 1)
     max_search_depth = 10  # Note 0 is counted as the first search depth
     max_search_seconds = 2
+    deadline_check_interval_nodes = 64  # How many nodes are searched between each look at the clock
+
+
+class BranchFactor(Enum):
+    """
+    Enum defining the parameters of the branch factor policy (see branch_factor_policy), which sets how many moves are
+    searched at each search depth from the board size and search budget, and reduces the depth of late moves.
+    """
+    untruncated_search_depths = 2  # Every move is searched at depths 0 and 1, so no immediate loss is ever overlooked
+    minimum_branch_factor = 8  # The fewest moves searched at deeper search depths, however tight the budget
+    full_depth_moves = 4  # Moves searched to the full depth at each node, before late move reductions (plus threats)
+    max_reduction = 3  # The most plies a late move's search is reduced by (moves after 2 * full_depth_moves)
+    alpha_beta_exponent = 0.75  # Nodes visited by the pruned search ~ nodes of the full tree ** alpha_beta_exponent
+    default_nodes_per_second = 2000  # Assumed search speed, before the engine has measured its own
+
+
+class MoveGeneration(Enum):
+    """
+    Enum defining which moves the search generates - only the empty cells within the neighbourhood radius (in rows and
+    columns) of a mark already on the board, since a move far from every mark can neither make nor block a threat.
+    """
+    neighbourhood_radius = 2
+
+
+class Quiescence(Enum):
+    """
+    Enum defining the parameters of the quiescence extension made at the horizon of the search (when the max search
+    depth is reached or the search runs out of time), which only plays out immediate wins and forced blocks before the
+    board is statically evaluated.
+    """
+    max_extension_plies = 6  # Forced blocks beyond this many plies past the horizon are left to the static evaluation
+
+
+class ParallelSearch(Enum):
+    """
+    Enum defining how the main process of a parallel search (see parallel_search) keeps in touch with its workers while
+    they search.
+    """
+    worker_poll_interval_seconds = 0.01  # How often a stop request is passed on, and completed iterations collected
+
+
+class TimeManagement(Enum):
+    """
+    Enum defining the parameters used to turn a remaining game clock into a budget for an individual move, and to
+    decide whether a new iteration of the iterative deepening is worth starting.
+    """
+    minimum_moves_to_go = 5  # Floor on the number of moves the remaining clock is shared between
+    clock_safety_margin_seconds = 0.05  # Never plan to use the last fraction of a second on the clock
+    increment_fraction_used = 0.8  # Proportion of the per-move increment that is spent on the current move
+    default_iteration_growth_factor = 3  # Assumed ratio of successive iteration times before two have been measured
+    solver_budget_fraction = 0.5  # Proportion of the move's time and node budgets the proof-number search may spend
+
 
-    @staticmethod
-    def get_max_branch_factor(search_depth: int):
-        """
-        Method that returns a maximum branch factor when minimax is searching at different depths.
-        A max branch factor is included so that in larger games minimax doesn't just run out of time searching every
-        cell at search depth 1, 2, ... and never reaching greater depth.
-
-        There is effectively no max branch factor at search depth 0, so that minimax never leaves the board in a state
-        where the other play can win immediately.
-        At search depths greater than 0, we just search the 3x3 square around the last played index, as this is the
-        only part of the board that has changed since moving on from search_depth 0
-        """
-        if search_depth <= 1:
-            return 961
-        else:
-            return 8
+class SearchStopReason(Enum):
+    """Enum for why the iterative deepening stopped searching for a move (recorded in the SearchStats)"""
+    SEARCH_CUT_OFF_SCORE_EXCEEDED = "A move scoring above the search cut off score was found"
+    SEARCH_LIMIT_REACHED = "The time or node limit of the search was reached"
+    SEARCH_CANCELLED = "The search was cancelled before its limits were reached, so the best move so far was taken"
+    ITERATION_PREDICTED_TO_OVERRUN = "The next iteration was predicted to overrun the move's time budget"
+    MAX_SEARCH_DEPTH_REACHED = "The max search depth was completed"
+    FORCED_MOVE = "The move was forced (an immediate win or block), so no search was needed"
+    THREAT_SPACE_WIN = "The threat-space search found a forced win, so no main search was needed"
+    POSITION_SOLVED = "The proof-number search solved the position, so no main search was needed"
+    TABLEBASE_HIT = "The position was found in the endgame tablebase, so no search was needed"
+    OPENING_BOOK_HIT = "The position was found in the opening book, so no search was needed"
@@ -0,0 +1,17 @@
+"""Module to define the constants used by the threat-space search for forced wins."""
+
+# Standard library imports
+from enum import Enum
+
+
+class ThreatSpaceSearchParameters(Enum):
+    """
+    Enum defining the parameters of the threat-space search.
+    Note that a 'four' is a move leaving a single cell the attacker can win on (whatever k is), and a 'three' is a move
+    leaving a cell that would give the attacker two winning cells at once.
+    """
+    minimum_win_length = 4  # For k < 4 the forcing sequences are short enough for the main search to find
+    max_attacker_moves = 12  # The longest forcing sequence searched, in attacker moves
+    max_three_moves = 2  # The number of attacker moves in a sequence that may be threes rather than fours
+    max_nodes = 5000  # The node budget of the whole threat-space search
+    max_fraction_of_move_budget = 0.25  # The threat-space search never takes more than this fraction of the move's time
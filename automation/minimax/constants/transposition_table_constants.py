@@ -0,0 +1,24 @@
+"""Module to define the constants used by the transposition table of the minimax search."""
+
+# Standard library imports
+from enum import Enum
+
+
+class TranspositionEntryFlag(Enum):
+    """
+    Enum for what the score stored in a transposition table entry represents, which depends on whether the score
+    was found within the alpha-beta window of the search that stored it.
+    """
+    EXACT = 0  # The score is the true minimax score at the stored remaining depth
+    LOWER_BOUND = 1  # The search was cut off by beta, so the true score is at least the stored score
+    UPPER_BOUND = 2  # No move beat alpha, so the true score is at most the stored score
+
+
+class TranspositionTableParameters(Enum):
+    """
+    Enum defining the parameters of the transposition table.
+    Note that the number of entries is rounded up to a power of 2 so that the table can be indexed with a bit mask.
+    """
+    default_number_of_entries = 2 ** 18  # Each entry takes up 16 bytes
+    zobrist_seed = 543  # Fixed so that every process derives the same zobrist keys for a given board shape
+    lazy_smp_seed = 1000  # Worker n of a lazy SMP search breaks move order ties with seed lazy_smp_seed + n
@@ -3,25 +3,23 @@ Module to define how the board should be scored from the maximiser's perspective
 With the introduction of iterative deepening and a time out, the majority of calls end in an evaluation of a non-
 terminal board, and so a scoring system is needed that indicates how favourable a non-terminal board is.
 
-This could use a transposition table derived from previous games, for opening moves, but is calculated on the fly for
-now.
+The opening moves of a game can instead be played from an opening book derived from previous games (see
+automation/opening_book), in which case no board needs evaluating.
 """
 
 # Standard library imports
 from functools import lru_cache
-from typing import List
+from typing import Tuple
 
 # Third party imports
 import numpy as np
 
 # Local application imports
 from automation.minimax.constants.terminal_board_scores import BoardScore
-from game.app.game_base_class import NoughtsAndCrosses
+from game.app.board_windows import get_window_indices, get_window_values
 from game.constants.game_constants import BoardMarking
-from utils import lru_cache_hashable
 
 
-@lru_cache_hashable(maxsize=1000000)
 def evaluate_non_terminal_board(playing_grid: np.ndarray,
                                 win_length_k: int,
                                 search_depth: int,
@@ -30,9 +28,12 @@ def evaluate_non_terminal_board(playing_grid: np.ndarray,
     """
     Method to determine the streak that should be assigned to a board, from the perspective of the maximising player.
     The overarching idea is to identify any streaks of significant length and assign a streak to these.
-    We extract all rows, columns and diagonals form the playing_grid, convolve with a ones array of length win_length_k,
-    score each resulting streak represented by a complex number under different scenarios, and add up the total for
-    the entire playing_grid.
+    We gather every window of win_length_k cells (along the rows, columns and diagonals) from the playing_grid in one
+    go, find the streak in each window that could still be completed, look up the score of each streak under the
+    scenario the board is in, and add up the total for the entire playing_grid.
+    The total only depends on the position (and whose perspective and turn it is), so is cached without the search
+    depth, and the same position reached at different search depths shares a cache entry. The search depth penalty is
+    then applied to the cached total.
 
     Parameters:
     ----------
@@ -49,36 +50,189 @@ def evaluate_non_terminal_board(playing_grid: np.ndarray,
 
     maximiser_has_next_turn - T/F depending on whether the maximiser would get to make the next move on the grid.
     """
-    # Get a list of the streaks (convolutions of each part of the board of length win_length_k with a ones array)
-    array_list = NoughtsAndCrosses.get_non_empty_array_list(playing_grid=playing_grid, win_length_k=win_length_k)
-    streak_list: List[np.ndarray[complex]] = [_get_convolved_array(array=array, win_length_k=win_length_k,
-                                                                   maximiser_mark_value=maximiser_mark_value) for array
-                                              in
-                                              array_list]
-    all_streaks: np.ndarray[complex] = np.hstack(streak_list)
-
-    # Get rid of closed streaks where there are insufficient empty cells to complete the streak
-    winnable_streaks: np.ndarray[complex] = all_streaks[abs(all_streaks.real) + abs(all_streaks.imag) == win_length_k]
-    relevant_streaks: np.ndarray[complex] = winnable_streaks[abs(winnable_streaks.imag) != win_length_k]
+    game_rows_m, game_cols_n = playing_grid.shape
+    total_score = _get_total_score(
+        position_key=playing_grid.astype(complex, copy=False).tobytes(), game_rows_m=game_rows_m,
+        game_cols_n=game_cols_n, win_length_k=win_length_k, maximiser_mark_value=maximiser_mark_value,
+        maximiser_has_next_turn=maximiser_has_next_turn)
+    return get_depth_penalised_score(total_score=total_score, search_depth=search_depth)
+
+
+@lru_cache(maxsize=1000000)
+def _get_total_score(position_key: bytes,
+                     game_rows_m: int,
+                     game_cols_n: int,
+                     win_length_k: int,
+                     maximiser_mark_value: BoardMarking,
+                     maximiser_has_next_turn: bool) -> float:
+    """
+    Method to add up the scores of the streaks on a board, before any search depth penalty, which is cached by the
+    position (as the bytes of its complex playing grid) and whose perspective and turn it is.
+    Parameters: position_key - the bytes of the playing grid, with everything else as for evaluate_non_terminal_board
+    """
+    playing_grid = np.frombuffer(position_key, dtype=complex).reshape(game_rows_m, game_cols_n)
+    maximiser_counts, minimiser_counts = _get_window_counts(
+        playing_grid=playing_grid, win_length_k=win_length_k, maximiser_mark_value=maximiser_mark_value)
+    relevant_streaks = _get_relevant_streaks(maximiser_counts=maximiser_counts, minimiser_counts=minimiser_counts)
     if len(relevant_streaks) == 0:
         return 0  # Game is guaranteed to be a draw
 
     # Check who currently has a longer streak - this informs the scoring strategy
-    real_streaks: np.ndarray[int] = np.real(relevant_streaks)
-    max_player_max_streak = abs(max(real_streaks))  # because maximiser streaks are positive
-    min_player_max_streak = abs(min(real_streaks))  # because minimiser streaks are negative
-    leading_player_indicator = max_player_max_streak - min_player_max_streak
-
-    # Add up the scores of each individual streak and penalise total with search depth
-    total_score = sum(_score_individual_streak(
-        streak=streak, win_length_k=win_length_k, maximiser_has_next_turn=maximiser_has_next_turn,
-        leading_player_indicator=leading_player_indicator) for streak in relevant_streaks)
+    max_player_max_streak = abs(int(relevant_streaks.max()))  # because maximiser streaks are positive
+    min_player_max_streak = abs(int(relevant_streaks.min()))  # because minimiser streaks are negative
+    leading_player_sign = int(np.sign(max_player_max_streak - min_player_max_streak))
+
+    # Add up the scores of each window, looked up from the number of each player's marks in the window
+    window_scores = get_window_score_table(win_length_k=win_length_k, maximiser_has_next_turn=maximiser_has_next_turn,
+                                           leading_player_sign=leading_player_sign)
+    return window_scores[maximiser_counts, minimiser_counts].sum()
+
+
+def evaluate_boards(playing_grids: np.ndarray,
+                    win_length_k: int,
+                    maximiser_mark_values: np.ndarray | int,
+                    maximiser_has_next_turn_flags: np.ndarray | bool,
+                    search_depths: np.ndarray | int = 0) -> np.ndarray:
+    """
+    Method to score a whole stack of boards at once, exactly as evaluate_non_terminal_board scores each of them, but
+    with one gather of the windows of every board and no Python work per board. This is intended for scoring many
+    boards in bulk, e.g. every position in the data from a set of simulated games.
+
+    Parameters:
+    ----------
+    playing_grids - an (N, m, n) stack of the boards we are scoring
+
+    win_length_k - as for evaluate_non_terminal_board
+
+    maximiser_mark_values/maximiser_has_next_turn_flags/search_depths - the corresponding parameters of
+    evaluate_non_terminal_board for each board, either as arrays of length N or as a single value for every board
+
+    Returns: A float array of length N, holding the score of each board
+    """
+    board_count, game_rows_m, game_cols_n = playing_grids.shape
+    window_indices = get_window_indices(game_rows_m, game_cols_n, win_length_k)
+    window_values = playing_grids.reshape(board_count, -1)[:, window_indices]
+    maximiser_mark_values = np.broadcast_to(maximiser_mark_values, (board_count,))[:, np.newaxis, np.newaxis]
+    maximiser_counts = np.count_nonzero(window_values == maximiser_mark_values, axis=2)
+    minimiser_counts = np.count_nonzero(window_values == -maximiser_mark_values, axis=2)
+    relevant_windows = (maximiser_counts == 0) ^ (minimiser_counts == 0)
+    streaks = maximiser_counts - minimiser_counts
+
+    # Who currently has a longer streak, as in evaluate_non_terminal_board (where the maximum and minimum streak are
+    # both of the maximiser's streaks if the minimiser has none, and vice versa)
+    has_relevant_windows = relevant_windows.any(axis=1)
+    max_player_max_streak = np.abs(np.where(relevant_windows, streaks, -win_length_k).max(axis=1))
+    min_player_max_streak = np.abs(np.where(relevant_windows, streaks, win_length_k).min(axis=1))
+    leading_player_signs = np.sign(max_player_max_streak - min_player_max_streak)
+
+    window_score_tables = _get_window_score_tables(win_length_k=win_length_k)
+    next_turn_indices = np.broadcast_to(maximiser_has_next_turn_flags, (board_count,)).astype(int)[:, np.newaxis]
+    total_scores = window_score_tables[next_turn_indices, leading_player_signs[:, np.newaxis] + 1,
+                                       maximiser_counts, minimiser_counts].sum(axis=1)
+
+    search_depths = np.broadcast_to(search_depths, (board_count,))
+    penalised_scores = np.where(total_scores > 0, np.maximum(total_scores - search_depths, 0),
+                                np.minimum(total_scores + search_depths, 0))
+    return np.where(has_relevant_windows, penalised_scores, 0).astype(np.float64)
+
+
+def get_depth_penalised_score(total_score: float, search_depth: int) -> float:
+    """
+    Method to penalise the total score of a board with the search depth it was found at, so that favourable boards are
+    reached sooner and unfavourable boards later. The penalty never changes the sign of the score.
+    """
     if total_score > 0:
         return max(total_score - search_depth, 0)
     else:
         return min(total_score + search_depth, 0)
 
 
+def get_evaluation_cache_info():
+    """Method to get the hits and misses (etc.) of the cache of board totals used by evaluate_non_terminal_board."""
+    return _get_total_score.cache_info()
+
+
+def clear_evaluation_cache() -> None:
+    """Method to empty the cache of board totals used by evaluate_non_terminal_board, e.g. before timing it."""
+    _get_total_score.cache_clear()
+
+
+def _get_window_counts(playing_grid: np.ndarray, win_length_k: int,
+                       maximiser_mark_value: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Method to count the marks of each player in every window of the playing grid.
+    Returns: The maximiser's and then the minimiser's count in each window, in the order of get_window_indices
+    """
+    window_values = get_window_values(playing_grid=playing_grid, win_length_k=win_length_k)
+    maximiser_counts = np.count_nonzero(window_values == maximiser_mark_value, axis=1)
+    minimiser_counts = np.count_nonzero(window_values == -maximiser_mark_value, axis=1)
+    return maximiser_counts, minimiser_counts
+
+
+def _get_relevant_streaks(maximiser_counts: np.ndarray, minimiser_counts: np.ndarray) -> np.ndarray:
+    """
+    Method to find the streak in every window that could still be completed - i.e. every window holding the marks of
+    only one of the players (and at least one mark).
+
+    Parameters: maximiser_counts/minimiser_counts - the number of each player's marks in each window
+
+    Returns: An int array of the length of each such streak, which is positive for the maximiser's streaks and negative
+    for the minimiser's, in the order of the windows
+    """
+    relevant_windows = (maximiser_counts == 0) ^ (minimiser_counts == 0)
+    return maximiser_counts[relevant_windows] - minimiser_counts[relevant_windows]
+
+
+@lru_cache(maxsize=None)  # There are only 6 tables for each win length
+def get_streak_score_table(win_length_k: int, maximiser_has_next_turn: bool, leading_player_sign: int) -> np.ndarray:
+    """
+    Method to tabulate the score of every possible streak (of length -win_length_k to win_length_k) under a given
+    scenario (where the scenario only depends on the sign of the leading player indicator - see
+    _score_individual_streak), so that streaks can be scored with a lookup rather than by branching.
+    Returns: A read only array where the score of a streak of length s is at index s + win_length_k
+    """
+    streak_scores = np.array([_score_individual_streak(
+        streak=complex(streak_length, win_length_k - abs(streak_length)), win_length_k=win_length_k,
+        maximiser_has_next_turn=maximiser_has_next_turn, leading_player_indicator=leading_player_sign)
+        for streak_length in range(-win_length_k, win_length_k + 1)], dtype=np.float64)
+    streak_scores.flags.writeable = False
+    return streak_scores
+
+
+@lru_cache(maxsize=None)
+def get_window_score_table(win_length_k: int, maximiser_has_next_turn: bool, leading_player_sign: int) -> np.ndarray:
+    """
+    Method to tabulate the score of a window under a given scenario, for every number of the maximiser's and
+    minimiser's marks that it could hold, so that the windows of a board can be scored by integer indexing alone.
+    Returns: A read only (win_length_k + 1, win_length_k + 1) array, indexed by the maximiser's count and then the
+    minimiser's count. Windows which can't be won (holding the marks of both players, or no marks) score 0.
+    """
+    maximiser_counts, minimiser_counts = np.indices((win_length_k + 1, win_length_k + 1))
+    streak_scores = get_streak_score_table(win_length_k=win_length_k, maximiser_has_next_turn=maximiser_has_next_turn,
+                                           leading_player_sign=leading_player_sign)
+    window_scores = np.where((maximiser_counts == 0) ^ (minimiser_counts == 0),
+                             streak_scores[maximiser_counts - minimiser_counts + win_length_k], 0)
+    window_scores.flags.writeable = False
+    return window_scores
+
+
+@lru_cache(maxsize=None)
+def _get_window_score_tables(win_length_k: int) -> np.ndarray:
+    """
+    Method to stack the window score tables of every scenario, so that the windows of many boards (in different
+    scenarios) can be scored with a single lookup.
+    Returns: A read only (2, 3, win_length_k + 1, win_length_k + 1) array, indexed by whether the maximiser has the next
+    turn, the leading player sign + 1 and then as for get_window_score_table
+    """
+    window_score_tables = np.array([[get_window_score_table(
+        win_length_k=win_length_k, maximiser_has_next_turn=maximiser_has_next_turn,
+        leading_player_sign=leading_player_sign)
+        for leading_player_sign in (-1, 0, 1)]
+        for maximiser_has_next_turn in (False, True)])
+    window_score_tables.flags.writeable = False
+    return window_score_tables
+
+
 @lru_cache(maxsize=1000)  # Note there are not many possibilities so can use a small cache
 def _score_individual_streak(streak: complex, win_length_k: int,
                              maximiser_has_next_turn: bool, leading_player_indicator: int) -> float:
@@ -87,8 +241,8 @@ def _score_individual_streak(streak: complex, win_length_k: int,
 
     Parameters:
     ----------
-    streak: The result of convoluting a win_length_k section of the playing_grid with a ones array of length
-    win_length_k. Streaks are represented by complex numbers (real for the played part, imaginary for the empty part)
+    streak: The streak in a window of win_length_k cells of the playing_grid. Streaks are represented by complex
+    numbers (real for the played part, positive for the maximiser's marks, and imaginary for the empty part)
     Note that closed streaks which cannot be won (real + imag < win_length), as well as entirely empty streaks, are
     filtered out rather than being passed to this function.
 
@@ -172,35 +326,3 @@ def _score_individual_streak(streak: complex, win_length_k: int,
         # Streak does not fall into any of the above scenarios, so just cube it (which retains the sign)
         score_return = streak_length ** 3
     return score_return
-
-
-def _get_convolved_array(array: np.ndarray, win_length_k: int,
-                         maximiser_mark_value: BoardMarking) -> np.ndarray:
-    """
-    Method to determine the streak complex number to be associated with an individual array.
-    We convolve with a ones array of length win_length_k - this tells us whether an incomplete streak could be
-    completed.
-    We also multiply by the player turn value, so that a positive streak is good for the maximiser, and a negative
-    streak is bad, noting that for a streak = -3, this is good for player represented by -1, and bad for player
-    represented by 1, so multiplying -1 * -3 tells us that this is a good streak for the maximiser_mark_value.
-
-    Parameters:
-    __________
-    array - the individual array that we are scoring (a row, column, diagonal etc. of the playing grid)
-    win_length_k/maximiser_mark_value - as above.
-
-    Returns:
-    ----------
-    A numpy array containing the complex numbers that represent the streaks.
-    The length of the output array will be: len(array) - win_length_k + 1
-
-    Examples:
-    (1, 1, 1) . (1, 1, j) = 2 + j  ---> This streak could be completed as real + imag part equal win_length (of 3)
-    (1, 1, 1) . (1, 1, -1) = 1     ---> This streak would get filtered out (i.e. not scored) as it can't be won
-    (1, -1, j) . (1, 1, 1) = j     ---> This streak would get filtered out (i.e. not scored) as it can't be won
-    """
-    convolved_array = np.convolve(array, np.ones(win_length_k, dtype=int), mode="valid")
-    convolved_array_active_player = convolved_array * maximiser_mark_value  # Now a +ve streak is good for the maximiser
-    # and a -ve streak is bad, because player turn value is 1 or -1
-
-    return convolved_array_active_player
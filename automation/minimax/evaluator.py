@@ -0,0 +1,36 @@
+"""
+Module defining the interface of the static evaluation used by the minimax search, so that the evaluation can be
+swapped (e.g. for a faster implementation) without changing the search.
+
+The reference evaluator is evaluate_non_terminal_board. Any other evaluator should agree with its scores (or play no
+worse for any disagreement), which can be checked with the benchmark in automation/minimax/evaluator_benchmark.py.
+"""
+
+# Standard library imports
+from typing import Protocol
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.evaluate_non_terminal_board import evaluate_non_terminal_board
+
+
+class Evaluator(Protocol):
+    """
+    Protocol for the static evaluation of the non-terminal boards at the horizon of a minimax search.
+    Any function with the signature of evaluate_non_terminal_board satisfies the protocol, including the parameter
+    names, since evaluators are always called with keyword arguments. Evaluators used by a parallel search must also be
+    picklable (e.g. functions defined at module level), since they are sent to the worker processes.
+    """
+
+    def __call__(self,
+                 playing_grid: np.ndarray,
+                 win_length_k: int,
+                 search_depth: int,
+                 maximiser_mark_value: int,
+                 maximiser_has_next_turn: bool) -> float:
+        ...
+
+
+REFERENCE_EVALUATOR: Evaluator = evaluate_non_terminal_board
@@ -0,0 +1,148 @@
+"""
+Module to benchmark evaluators (see automation/minimax/evaluator) against the reference evaluator, for speed and for
+accuracy.
+
+Each evaluator scores the same fixed corpus of non-terminal positions, and is timed in nanoseconds per evaluation. Its
+scores are compared with the reference evaluator's scores for the same positions, so that a faster evaluator can be
+shown not to change the scores the search is based on (and so not to change the engine's play) before it is used.
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+import time
+from typing import Dict, List
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.evaluate_non_terminal_board import clear_evaluation_cache
+from automation.minimax.evaluator import Evaluator, REFERENCE_EVALUATOR
+from game.app.board_windows import get_window_values
+from game.constants.game_constants import BoardMarking
+
+
+@dataclass(frozen=True)
+class BenchmarkPosition:
+    """
+    A non-terminal position in the benchmark corpus, along with the arguments each evaluator is called with.
+
+    Attributes:
+    __________
+    playing_grid: The position being evaluated
+    win_length_k/search_depth/maximiser_mark_value/maximiser_has_next_turn: As for evaluate_non_terminal_board
+    """
+    playing_grid: np.ndarray
+    win_length_k: int
+    search_depth: int
+    maximiser_mark_value: int
+    maximiser_has_next_turn: bool
+
+
+@dataclass(frozen=True)
+class EvaluatorBenchmarkResult:
+    """
+    The outcome of benchmarking one evaluator.
+
+    Attributes:
+    __________
+    name: The name the evaluator was benchmarked under
+    ns_per_evaluation: The mean time taken per evaluation, in nanoseconds, from the fastest pass over the corpus
+    agreement_rate: The proportion of positions given the same score as by the reference evaluator
+    max_score_difference: The largest absolute difference from the reference evaluator's score over the corpus
+    """
+    name: str
+    ns_per_evaluation: float
+    agreement_rate: float
+    max_score_difference: float
+
+
+def get_benchmark_positions(game_rows_m: int,
+                            game_cols_n: int,
+                            win_length_k: int,
+                            number_of_positions: int,
+                            max_search_depth: int = 10,
+                            random_seed: int = 0) -> List[BenchmarkPosition]:
+    """
+    Function to generate a fixed corpus of non-terminal positions, which is always the same for the same arguments.
+    Each position is a random board with X having started the game, reached after a random number of moves, with any
+    board that already has a completed window discarded. The maximiser and search depth are also chosen at random.
+
+    Parameters:
+    __________
+    game_rows_m/game_cols_n/win_length_k: The game the positions are drawn from
+    number_of_positions: The number of positions in the corpus
+    max_search_depth: The largest search depth the positions are evaluated at
+    random_seed: The seed of the random generator the corpus is drawn with
+    """
+    random_generator = np.random.default_rng(random_seed)
+    number_of_cells = game_rows_m * game_cols_n
+    positions = []
+    while len(positions) < number_of_positions:
+        moves_made = random_generator.integers(number_of_cells)  # So the board is never full
+        marked_cells = random_generator.permutation(number_of_cells)[:moves_made]
+        playing_grid = np.full(shape=number_of_cells, fill_value=BoardMarking.EMPTY.value)
+        playing_grid[marked_cells[::2]] = BoardMarking.X.value
+        playing_grid[marked_cells[1::2]] = BoardMarking.O.value
+        playing_grid = playing_grid.reshape(game_rows_m, game_cols_n)
+
+        window_sums = get_window_values(playing_grid=playing_grid, win_length_k=win_length_k).sum(axis=1)
+        if np.any(np.abs(window_sums) == win_length_k):
+            continue  # The game has already been won
+
+        maximiser_mark_value = int(random_generator.choice([BoardMarking.X.value, BoardMarking.O.value]))
+        next_player_mark_value = BoardMarking.X.value if moves_made % 2 == 0 else BoardMarking.O.value
+        positions.append(BenchmarkPosition(
+            playing_grid=playing_grid, win_length_k=win_length_k,
+            search_depth=int(random_generator.integers(max_search_depth + 1)),
+            maximiser_mark_value=maximiser_mark_value,
+            maximiser_has_next_turn=maximiser_mark_value == next_player_mark_value))
+    return positions
+
+
+def benchmark_evaluators(evaluators: Dict[str, Evaluator],
+                         positions: List[BenchmarkPosition],
+                         reference_evaluator: Evaluator = REFERENCE_EVALUATOR,
+                         number_of_passes: int = 3) -> List[EvaluatorBenchmarkResult]:
+    """
+    Function to time each evaluator on the corpus of positions, and compare its scores with the reference scores.
+    The cache of evaluate_non_terminal_board is cleared before every pass over the corpus, so that evaluators using it
+    are timed on positions they have not seen before (as most positions reached by a search are).
+
+    Parameters:
+    __________
+    evaluators: The evaluators to benchmark, keyed by the name to report them under
+    positions: The corpus of positions, e.g. from get_benchmark_positions
+    reference_evaluator: The evaluator whose scores the evaluators should agree with
+    number_of_passes: The number of timed passes over the corpus of each evaluator, of which the fastest is reported
+
+    Returns:
+    __________
+    A result for each evaluator, in the order of the evaluators
+    """
+    reference_scores = _get_scores(evaluator=reference_evaluator, positions=positions)
+    benchmark_results = []
+    for name, evaluator in evaluators.items():
+        fastest_pass_ns = None
+        for _ in range(number_of_passes):
+            clear_evaluation_cache()
+            start_ns = time.perf_counter_ns()
+            scores = _get_scores(evaluator=evaluator, positions=positions)
+            pass_ns = time.perf_counter_ns() - start_ns
+            fastest_pass_ns = pass_ns if fastest_pass_ns is None else min(fastest_pass_ns, pass_ns)
+
+        score_differences = np.abs(scores - reference_scores)
+        benchmark_results.append(EvaluatorBenchmarkResult(
+            name=name, ns_per_evaluation=fastest_pass_ns / len(positions),
+            agreement_rate=float(np.mean(np.isclose(scores, reference_scores))),
+            max_score_difference=float(score_differences.max())))
+    return benchmark_results
+
+
+def _get_scores(evaluator: Evaluator, positions: List[BenchmarkPosition]) -> np.ndarray:
+    """Function to score every position in the corpus with the evaluator."""
+    return np.array([evaluator(playing_grid=position.playing_grid, win_length_k=position.win_length_k,
+                               search_depth=position.search_depth,
+                               maximiser_mark_value=position.maximiser_mark_value,
+                               maximiser_has_next_turn=position.maximiser_has_next_turn) for position in positions],
+                    dtype=np.float64)
@@ -0,0 +1,83 @@
+"""
+Module defining the pass over the threat structure of the board that is made before the minimax search.
+Some positions have a move that is forced - the player to move can win immediately, or must block the only cell their
+opponent could win on next turn. In these positions the search cannot find a better move than the forced one, so it is
+played straight away rather than spending the search budget confirming it.
+"""
+
+# Standard library imports
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.forced_move_constants import ForcedMoveType
+from game.app.board_windows import get_window_indices
+from game.app.live_windows import LiveWindows
+from game.constants.game_constants import BoardMarking
+
+
+class ForcedMove(NamedTuple):
+    """A forced move for the player to move, and why it is forced"""
+    move: np.ndarray
+    forced_move_type: ForcedMoveType
+
+
+def get_immediate_winning_cells(playing_grid: np.ndarray, win_length_k: int, player_mark_value: int) -> np.ndarray:
+    """
+    Function to find every empty cell that would win the game for the given player if they marked it next.
+    These are the empty cells of windows that contain win_length_k - 1 of the player's marks and no other marks.
+
+    Returns: A (number of cells, 2) array of the indices of the winning cells, in flat index order, without repeats.
+    """
+    window_indices = get_window_indices(*playing_grid.shape, win_length_k)
+    window_values = playing_grid.ravel()[window_indices]
+    player_counts = np.count_nonzero(window_values == player_mark_value, axis=1)
+    empty_cells = window_values == BoardMarking.EMPTY.value
+    empty_counts = np.count_nonzero(empty_cells, axis=1)
+    winning_windows = (player_counts == win_length_k - 1) & (empty_counts == 1)
+    winning_flat_indices = np.unique(window_indices[winning_windows][empty_cells[winning_windows]])
+    return np.column_stack(np.unravel_index(winning_flat_indices, playing_grid.shape))
+
+
+def get_forced_move(playing_grid: np.ndarray, win_length_k: int, player_mark_value: int,
+                    live_windows: LiveWindows | None = None) -> ForcedMove | None:
+    """
+    Function to find the forced move for the player to move, if there is one.
+
+    Parameters:
+    __________
+    playing_grid: The board the player is about to move on
+    win_length_k: The length of streak needed to win
+    player_mark_value: The BoardMarking value of the player to move
+    live_windows: The mark counts of the windows of the playing grid, if they are being kept in step with it (e.g. by
+    the search), in which case the immediate wins are found from the counts rather than by looking in every window
+
+    Returns: ForcedMove | None
+    __________
+    - A winning move, if the player can win immediately
+    - A losing block, if the opponent has two or more immediate wins, since only one of them can be blocked
+    - A block, if the opponent has exactly one immediate win, since any other move loses on the next turn
+    - None otherwise, in which case the position needs to be searched
+    """
+    if live_windows is None:
+        own_winning_cells = get_immediate_winning_cells(
+            playing_grid=playing_grid, win_length_k=win_length_k, player_mark_value=player_mark_value)
+    else:
+        own_winning_cells = live_windows.get_immediate_winning_cells(
+            playing_grid=playing_grid, player_mark_value=player_mark_value)
+    if len(own_winning_cells) > 0:
+        return ForcedMove(move=own_winning_cells[0], forced_move_type=ForcedMoveType.WIN)
+
+    if live_windows is None:
+        opponent_winning_cells = get_immediate_winning_cells(
+            playing_grid=playing_grid, win_length_k=win_length_k, player_mark_value=-player_mark_value)
+    else:
+        opponent_winning_cells = live_windows.get_immediate_winning_cells(
+            playing_grid=playing_grid, player_mark_value=-player_mark_value)
+    if len(opponent_winning_cells) >= 2:
+        return ForcedMove(move=opponent_winning_cells[0], forced_move_type=ForcedMoveType.LOSING_BLOCK)
+    elif len(opponent_winning_cells) == 1:
+        return ForcedMove(move=opponent_winning_cells[0], forced_move_type=ForcedMoveType.BLOCK)
+    return None
@@ -0,0 +1,102 @@
+"""
+Module defining the incremental evaluation of the boards visited by a search - the static evaluation of
+evaluate_non_terminal_board, maintained move by move rather than recalculated from scratch at every leaf.
+
+A child position only differs from its parent by a single mark, which only changes the windows through the marked cell
+(at most 4 * win_length_k of them). So the number of each player's marks in every window is kept, along with the number
+of windows holding each streak, and making a move only updates the windows through its cell (unmaking the move reverses
+the update). The evaluation of a board then only needs the streak counts: the longest streak of each player (which
+decides the scoring scenario) is the furthest streak with a non-zero count from the middle, and the total score is the
+streak counts weighted by the score of each streak. A leaf therefore costs time proportional to win_length_k, rather
+than to the area of the board, and gets exactly the same score as from evaluate_non_terminal_board.
+
+The mark counts are those of LiveWindows, which this extends, so the search can also see straight away when neither
+player can win any more (and stop searching the moves left, which are all filler).
+"""
+
+# Standard library imports
+from functools import lru_cache
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.evaluate_non_terminal_board import get_depth_penalised_score, get_streak_score_table
+from game.app.live_windows import LiveWindows
+from game.constants.game_constants import BoardMarking
+
+
+class IncrementalEvaluation(LiveWindows):
+    """
+    Class keeping the streaks in the windows of a playing grid in step with the moves made and unmade on it.
+
+    Instance attributes (in addition to those of LiveWindows):
+    __________
+    window_streak_indices: The index in streak_counts of the streak in each window
+    streak_counts: The number of windows holding each streak. The count of streaks of length s (positive for X,
+    negative for O) is at index s + win_length_k, followed by the count of empty windows and then of blocked windows
+    (holding marks of both players, so which neither can win)
+    """
+
+    def __init__(self, playing_grid: np.ndarray, win_length_k: int):
+        super().__init__(playing_grid=playing_grid, win_length_k=win_length_k)
+        self._streak_index_table = _get_streak_index_table(win_length_k=win_length_k)
+        self.window_streak_indices = self._streak_index_table[self.x_counts, self.o_counts]
+        self.streak_counts = np.bincount(self.window_streak_indices, minlength=2 * win_length_k + 3)
+
+    def evaluate(self, search_depth: int, maximiser_mark_value: int, maximiser_has_next_turn: bool) -> int:
+        """
+        Method to score the playing grid in its current state.
+        Parameters and returns: As for evaluate_non_terminal_board
+        """
+        streak_counts = self.streak_counts[:2 * self.win_length_k + 1]
+        if maximiser_mark_value == BoardMarking.O.value:  # So that the maximiser's streaks are positive
+            streak_counts = streak_counts[::-1]
+        present_streak_indices = np.flatnonzero(streak_counts)
+        if len(present_streak_indices) == 0:
+            return 0  # Game is guaranteed to be a draw
+
+        # The longest streak of each player (the longest minimiser streak is the most negative)
+        max_player_max_streak = abs(int(present_streak_indices[-1]) - self.win_length_k)
+        min_player_max_streak = abs(int(present_streak_indices[0]) - self.win_length_k)
+        leading_player_sign = int(np.sign(max_player_max_streak - min_player_max_streak))
+
+        streak_scores = get_streak_score_table(
+            win_length_k=self.win_length_k, maximiser_has_next_turn=maximiser_has_next_turn,
+            leading_player_sign=leading_player_sign)
+        total_score = streak_counts @ streak_scores
+        return get_depth_penalised_score(total_score=total_score, search_depth=search_depth)
+
+    def get_immediate_winning_cells(self, playing_grid: np.ndarray, player_mark_value: int) -> np.ndarray:
+        """
+        Method extending the search for the player's immediate wins to first look at the streak counts, which say
+        whether the player has any window they can win in, without looking at every window's mark counts.
+        """
+        near_win_streak = (self.win_length_k - 1) * player_mark_value  # Since X streaks are positive and O negative
+        if self.streak_counts[near_win_streak + self.win_length_k] == 0:
+            return np.empty(shape=(0, 2), dtype=np.int64)
+        return super().get_immediate_winning_cells(playing_grid=playing_grid, player_mark_value=player_mark_value)
+
+    def _update_windows(self, window_indices: np.ndarray, mark_value: int, mark_change: int) -> None:
+        """Method to add (or remove) a mark to the counts of the given windows, and recount their streaks."""
+        count_bins = len(self.streak_counts)
+        self.streak_counts -= np.bincount(self.window_streak_indices[window_indices], minlength=count_bins)
+        super()._update_windows(window_indices=window_indices, mark_value=mark_value, mark_change=mark_change)
+        new_streak_indices = self._streak_index_table[self.x_counts[window_indices], self.o_counts[window_indices]]
+        self.window_streak_indices[window_indices] = new_streak_indices
+        self.streak_counts += np.bincount(new_streak_indices, minlength=count_bins)
+
+
+@lru_cache(maxsize=None)
+def _get_streak_index_table(win_length_k: int) -> np.ndarray:
+    """
+    Function to tabulate the index in IncrementalEvaluation.streak_counts of the streak in a window, for every number of
+    X and O marks the window could hold.
+    Returns: A read only (win_length_k + 1, win_length_k + 1) array, indexed by the X count then the O count
+    """
+    x_counts, o_counts = np.indices((win_length_k + 1, win_length_k + 1))
+    streak_indices = x_counts - o_counts + win_length_k
+    streak_indices[(x_counts == 0) & (o_counts == 0)] = 2 * win_length_k + 1
+    streak_indices[(x_counts > 0) & (o_counts > 0)] = 2 * win_length_k + 2
+    streak_indices.flags.writeable = False
+    return streak_indices
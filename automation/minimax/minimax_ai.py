@@ -1,9 +1,10 @@
 """"Subclass of the noughts and crosses game that implements the minimax algorithm for automating game play."""
 
 # Standard library imports
-import functools
+from contextlib import nullcontext
+import threading
 import time
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 from random import shuffle
 import math
 
@@ -11,60 +12,446 @@ import math
 import numpy as np
 
 # Local application imports
-from automation.minimax.evaluate_non_terminal_board import evaluate_non_terminal_board
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.evaluator import Evaluator, REFERENCE_EVALUATOR
+from automation.minimax.forced_moves import get_forced_move
+from automation.minimax.incremental_evaluation import IncrementalEvaluation
+from automation.minimax.constants.forced_move_constants import ForcedMoveType
+from automation.minimax.constants.threat_space_search_constants import ThreatSpaceSearchParameters
 from automation.minimax.constants.terminal_board_scores import BoardScore
-from automation.minimax.constants.iterative_deepening_constants import IterativeDeepening
+from automation.minimax.constants.iterative_deepening_constants import MoveGeneration, SearchStopReason, \
+    TimeManagement
+from automation.minimax.constants.transposition_table_constants import TranspositionEntryFlag
+from automation.minimax.parallel_search import LazySMPSearch, ParallelRootSearch
+from automation.minimax.pondering import Ponderer
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+from automation.minimax.search_results import IterationResult, SearchStats
+from automation.minimax.threat_space_search import ThreatSpaceSearch
+from automation.minimax.transposition_table import TranspositionEntry, TranspositionTable, get_zobrist_hash
+from automation.opening_book.opening_book import OpeningBook
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from automation.solver.proof_number_search import ProofNumberSearch, SolvedPosition
+from automation.tablebase.endgame_tablebase import EndgameTablebase
+from game.app.board_neighbourhoods import get_distance_orderings, get_neighbourhood_masks, get_position_neighbourhood
 from game.app.game_base_class import NoughtsAndCrosses, NoughtsAndCrossesEssentialParameters
+from game.app.live_windows import LiveWindows
 from game.app.player_base_class import Player
 from game.constants.game_constants import BoardMarking
-from utils import lru_cache_hashable
 
 
 class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
     def __init__(self,
-                 setup_parameters: NoughtsAndCrossesEssentialParameters):
+                 setup_parameters: NoughtsAndCrossesEssentialParameters,
+                 search_limits: SearchLimits = None,
+                 root_search_processes: int = 1,
+                 lazy_smp_processes: int = 1,
+                 transposition_table: TranspositionTable = None,
+                 check_forced_moves: bool = True,
+                 proof_number_search: ProofNumberSearch = None,
+                 endgame_tablebase: EndgameTablebase = None,
+                 opening_book: OpeningBook = None,
+                 move_ordering_seed: int = None,
+                 evaluator: Evaluator = None):
         """
         Parameters:
         __________
         setup_parameters - the structure of the game that is being played.
 
+        search_limits - the default limits on each search for a move in this game (wall time, nodes, depth, clock).
+        These can also be overridden on individual calls to get_minimax_move_iterative_deepening.
+
+        root_search_processes - the number of processes the moves at search depth 0 are split across. With the default
+        of 1, the search is made entirely in the calling process.
+
+        lazy_smp_processes - the number of processes that each run the full iterative deepening search, with perturbed
+        move orders and a transposition table shared between them (lazy SMP). Takes precedence over
+        root_search_processes. Any iterations completed while pondering are given to every process, which continue on
+        from them.
+
+        transposition_table - a table the search probes and stores the outcome of searching each position in. With the
+        default of None, no transposition table is used (except by the workers of a lazy SMP search).
+
+        check_forced_moves - whether to play immediate wins and mandatory blocks straight away, without searching, and
+        (for win lengths of 4 or more) to look for a forced win with a threat-space search before the main search.
+
+        proof_number_search - a solver for the game being played, which is asked to solve each position before it is
+        searched (within the solver's own limits, and a share of the move budget). Solved positions are played
+        perfectly, and remembered by the solver, so this is only worthwhile on boards small enough to solve (e.g. 3x3,
+        4x4).
+
+        endgame_tablebase - the tablebase of the game being played, which is looked in before anything else. Positions
+        in the tablebase are played perfectly at the cost of a few reads of the (memory mapped) tablebase file.
+
+        opening_book - the opening book of the game being played, which is looked in for the first few moves of a game
+        (after checking for a forced move). Book moves are played without searching.
+
+        move_ordering_seed - the seed of the order that moves at the same distance from the last move are searched in.
+        With the default of None, they are searched in row by row order.
+
+        evaluator - the static evaluation of the boards at the horizon of the search (see automation/minimax/evaluator).
+        With the default of None, boards are evaluated incrementally as the search moves through the game tree (see
+        IncrementalEvaluation), which gives the same scores as the reference evaluator, evaluate_non_terminal_board.
+
         Note that there is no reason to specify the maximising player here, because the method get_minimax_move...
         is called to get the best next move in a game, with the player's turn implied by the board status.
         """
         super().__init__(setup_parameters)
-
-    def get_minimax_move_iterative_deepening(self) -> Tuple[int, np.ndarray | None]:
+        if search_limits is None:
+            search_limits = SearchLimits()
+        self.search_limits = search_limits
+        self.root_search_processes = root_search_processes
+        self.lazy_smp_processes = lazy_smp_processes
+        self.transposition_table = transposition_table
+        self.check_forced_moves = check_forced_moves
+        self.proof_number_search = proof_number_search
+        self.endgame_tablebase = endgame_tablebase
+        self.opening_book = opening_book
+        self.move_ordering_seed = move_ordering_seed
+        self.evaluator = evaluator
+        self.branch_factor_policy = BranchFactorPolicy.get_default(cell_count=self.game_rows_m * self.game_cols_n)
+        self._nodes_per_second: float | None = None  # Measured over the engine's last search
+        self._ponderer: Ponderer | None = None
+
+    def get_minimax_move_iterative_deepening(self,
+                                             search_limits: SearchLimits = None) -> Tuple[int, np.ndarray | None]:
         """
         Method that calls get_minimax_move_at_max_search_depth at iteratively deeper maximum search depths, until
-        the maximum search time has elapsed or the maximum search depth has been reached.
+        the search limits have been exhausted, or the next iteration is predicted to overrun the move's time budget.
+
+        Parameters: search_limits - the limits to apply to this search only (defaults to the instance search_limits)
+
         Returns: as for get_minimax_move_at_max_search_depth
         """
-        search_start_time = time.perf_counter()
+        score, move, _ = self.get_minimax_move_and_search_stats(search_limits=search_limits)
+        return score, move
+
+    def get_minimax_move_and_search_stats(self,
+                                          search_limits: SearchLimits = None,
+                                          stop_event: threading.Event = None,
+                                          iteration_callback: Callable[[IterationResult], None] = None
+                                          ) -> Tuple[int, np.ndarray | None, SearchStats]:
+        """
+        Method to make the same search as get_minimax_move_iterative_deepening, but also return the statistics of the
+        search (e.g. how deep it got and why it stopped).
+
+        Parameters:
+        __________
+        search_limits - the limits to apply to this search only (defaults to the instance search_limits)
+        stop_event - an event that cancels the search when set (e.g. from another thread), in which case the best move
+        found so far is returned
+        iteration_callback - a function called with the result of each iteration of the iterative deepening, as soon as
+        the iteration has finished
+
+        Returns: the score and move as for get_minimax_move_at_max_search_depth, and the SearchStats of the search
+        """
+        pondered_iteration_results = self._get_pondered_iteration_results()
+        search_timer = self._get_search_timer(search_limits=search_limits, stop_event=stop_event)
+        if self.endgame_tablebase is not None:
+            tablebase_move = self.endgame_tablebase.get_best_move(
+                playing_grid=self.playing_grid, player_to_move_value=self.get_player_turn())
+            if tablebase_move is not None:
+                tablebase_entry, move = tablebase_move
+                search_stats = search_timer.get_search_stats()
+                search_stats.stop_reason = SearchStopReason.TABLEBASE_HIT
+                score = self._get_game_theoretic_score(value=tablebase_entry.value,
+                                                       plies_to_end=tablebase_entry.plies_to_end)
+                return score, move, search_stats
+
+        if self.check_forced_moves:
+            forced_score, forced_move = self._get_forced_score_and_move()
+            if forced_move is not None:
+                search_stats = search_timer.get_search_stats()
+                search_stats.stop_reason = SearchStopReason.FORCED_MOVE
+                return forced_score, forced_move, search_stats
+
+        if self.opening_book is not None:
+            book_entry = self.opening_book.probe(playing_grid=self.playing_grid,
+                                                 player_to_move_value=self.get_player_turn())
+            if book_entry is not None:
+                search_stats = search_timer.get_search_stats()
+                search_stats.stop_reason = SearchStopReason.OPENING_BOOK_HIT
+                book_move = np.array(np.unravel_index(book_entry.move_index, self.playing_grid.shape))
+                return round(book_entry.score), book_move, search_stats
+
+        if self.check_forced_moves:
+            if self.win_length_k >= ThreatSpaceSearchParameters.minimum_win_length.value:
+                threat_space_win = ThreatSpaceSearch(
+                    playing_grid=self.playing_grid, win_length_k=self.win_length_k,
+                    attacker_mark_value=self.get_player_turn(), search_timer=search_timer).find_winning_move()
+                if threat_space_win is not None:
+                    winning_move, plies_to_win = threat_space_win
+                    search_stats = search_timer.get_search_stats()
+                    search_stats.stop_reason = SearchStopReason.THREAT_SPACE_WIN
+                    return BoardScore.GUARANTEED_MAX_WIN.value - plies_to_win, winning_move, search_stats
+
+        if self.proof_number_search is not None:
+            solved_position = self._solve_position(search_timer=search_timer)
+            if solved_position is not None:
+                search_stats = search_timer.get_search_stats()
+                search_stats.stop_reason = SearchStopReason.POSITION_SOLVED
+                # The solver does not say how long the game lasts, so the longest it could last is assumed
+                score = self._get_game_theoretic_score(
+                    value=solved_position.value,
+                    plies_to_end=int(np.count_nonzero(self.playing_grid == BoardMarking.EMPTY.value)))
+                return score, solved_position.move, search_stats
+
+        if self.lazy_smp_processes > 1:
+            self.branch_factor_policy = self._get_branch_factor_policy(search_timer=search_timer)
+            with LazySMPSearch(number_of_processes=self.lazy_smp_processes) as lazy_smp_search:
+                deepest_result = lazy_smp_search.get_deepest_iteration_result(
+                    engine=self, search_timer=search_timer, previous_iteration_results=pondered_iteration_results,
+                    iteration_callback=iteration_callback)
+            if search_timer.node_count > 0 and search_timer.elapsed_seconds() > 0:  # The speed of each process
+                self._nodes_per_second = \
+                    search_timer.node_count / search_timer.elapsed_seconds() / self.lazy_smp_processes
+            search_stats = search_timer.get_search_stats()
+            if deepest_result is None:
+                return -math.inf, None, search_stats
+            search_stats.depth_completed = deepest_result.search_depth
+            return deepest_result.score, deepest_result.move, search_stats
+
+        iteration_results = self.get_iteration_results(
+            search_timer=search_timer, previous_iteration_results=pondered_iteration_results,
+            iteration_callback=iteration_callback)
+        score, move = self._select_score_and_move_from_iteration_results(iteration_results=iteration_results)
+        search_stats = search_timer.get_search_stats()
+        search_stats.depth_completed = max(
+            [result.search_depth for result in iteration_results if result.completed], default=0)
+        return score, move, search_stats
+
+    def get_iteration_results(self,
+                              search_timer: SearchTimer,
+                              previous_iteration_results: List[IterationResult] | None = None,
+                              iteration_callback: Callable[[IterationResult], None] | None = None,
+                              branch_factor_policy: BranchFactorPolicy | None = None
+                              ) -> List[IterationResult]:
+        """
+        Method running the iterative deepening itself, returning the outcome of each iteration.
+        The search stops once a move scoring above the cut off score has been found, or the next iteration is predicted
+        to overrun the search limits.
+
+        Parameters:
+        __________
+        search_timer: The timer the search is subject to
+        previous_iteration_results: Completed iterations of a search of the same position (e.g. made while pondering),
+        which the iterative deepening continues on from, rather than repeating them
+        iteration_callback: A function called with the result of each new iteration, as soon as it has finished
+        branch_factor_policy: The policy to search with, e.g. that of the search a worker process is searching on behalf
+        of (if None, the policy is set from the search limits and the engine's measured speed)
+        """
+        search_limits = search_timer.search_limits
+        if branch_factor_policy is None:
+            branch_factor_policy = self._get_branch_factor_policy(search_timer=search_timer)
+        self.branch_factor_policy = branch_factor_policy
+        iteration_results: List[IterationResult] = list(previous_iteration_results or [])
+        current_max_score = max([result.score for result in iteration_results], default=-math.inf)
+        first_search_depth = max([result.search_depth + 1 for result in iteration_results],
+                                 default=search_limits.minimum_search_depth)
+        search_timer.search_stats.stop_reason = SearchStopReason.MAX_SEARCH_DEPTH_REACHED
+        if current_max_score > BoardScore.SEARCH_CUT_OFF_SCORE.value:
+            search_timer.search_stats.stop_reason = SearchStopReason.SEARCH_CUT_OFF_SCORE_EXCEEDED
+            return iteration_results
+        with self._get_parallel_root_search() as parallel_root_search:
+            for iterative_search_depth in range(first_search_depth, search_limits.max_search_depth + 1):
+                iteration_start_time = time.perf_counter()
+                if parallel_root_search is None:
+                    max_score, best_move = self.get_minimax_move_at_max_search_depth(
+                        search_timer=search_timer, max_search_depth=iterative_search_depth)
+                else:
+                    root_moves = self._get_available_cell_indices(playing_grid=self.playing_grid, search_depth=0)
+                    max_score, best_move = parallel_root_search.get_root_score_and_move(
+                        engine=self, root_moves=root_moves, max_search_depth=iterative_search_depth,
+                        search_timer=search_timer)
+                # The first iteration is complete even if the limits were hit, since it stops at the minimum depth
+                iteration_completed = not search_timer.search_limit_reached() or \
+                    iterative_search_depth <= search_limits.minimum_search_depth
+                search_timer.record_completed_iteration(iteration_start_time=iteration_start_time)
+                iteration_results.append(IterationResult(
+                    search_depth=iterative_search_depth, score=max_score, move=best_move,
+                    completed=iteration_completed, duration_seconds=search_timer.iteration_durations[-1]))
+                current_max_score = max(current_max_score, max_score)
+                if iteration_callback is not None:
+                    iteration_callback(iteration_results[-1])
+
+                # Checks to see if the algorithm should stop searching
+                if current_max_score > BoardScore.SEARCH_CUT_OFF_SCORE.value:
+                    search_timer.search_stats.stop_reason = SearchStopReason.SEARCH_CUT_OFF_SCORE_EXCEEDED
+                    break
+                if search_timer.stop_requested():
+                    search_timer.search_stats.stop_reason = SearchStopReason.SEARCH_CANCELLED
+                    break
+                if search_timer.search_limit_reached():
+                    search_timer.search_stats.stop_reason = SearchStopReason.SEARCH_LIMIT_REACHED
+                    break
+                if search_timer.next_iteration_predicted_to_overrun():
+                    search_timer.search_stats.stop_reason = SearchStopReason.ITERATION_PREDICTED_TO_OVERRUN
+                    break
+        if search_timer.node_count > 0 and search_timer.elapsed_seconds() > 0:
+            self._nodes_per_second = search_timer.node_count / search_timer.elapsed_seconds()
+        return iteration_results
+
+    @staticmethod
+    def _select_score_and_move_from_iteration_results(
+            iteration_results: List[IterationResult]) -> Tuple[int, np.ndarray | None]:
+        """
+        Method to choose the move to play from the iterations of the iterative deepening. The move from a deeper
+        iteration only replaces the current best move if it has a strictly higher score.
+        """
         current_max_score = - math.inf
         current_best_move = None
-        for iterative_search_depth in range(IterativeDeepening.minimum_search_depth.value,
-                                            IterativeDeepening.max_search_depth.value + 1):
-            max_score, best_move = self.get_minimax_move_at_max_search_depth(
-                search_start_time=search_start_time, max_search_depth=iterative_search_depth)
-            if max_score > current_max_score:
-                current_max_score = max_score
-                current_best_move = best_move
-            # Checks to see if the algorithm should stop searching
-            if time.perf_counter() - search_start_time > IterativeDeepening.max_search_seconds.value:
-                return current_max_score, current_best_move
-            if current_max_score > BoardScore.SEARCH_CUT_OFF_SCORE.value:
-                return current_max_score, current_best_move
+        for iteration_result in iteration_results:
+            if iteration_result.score > current_max_score:
+                current_max_score = iteration_result.score
+                current_best_move = iteration_result.move
         return current_max_score, current_best_move
 
+    def _get_forced_score_and_move(self) -> Tuple[int, np.ndarray | None]:
+        """
+        Method to check the current playing grid for a forced move, and score it as the search would have done:
+        - An immediate win scores as a win at search depth 1
+        - A block when the opponent has two or more immediate wins scores as a loss at search depth 2
+        - A block of the opponent's only immediate win gets the static evaluation of the board following the block,
+        since the outcome of the game beyond the block is unknown
+
+        Returns: The score and forced move, or (-inf, None) if no move is forced and the position needs searching.
+        """
+        forced_move = get_forced_move(playing_grid=self.playing_grid, win_length_k=self.win_length_k,
+                                      player_mark_value=self.get_player_turn())
+        if forced_move is None:
+            return -math.inf, None
+        elif forced_move.forced_move_type == ForcedMoveType.WIN:
+            return BoardScore.GUARANTEED_MAX_WIN.value - 1, forced_move.move
+        elif forced_move.forced_move_type == ForcedMoveType.LOSING_BLOCK:
+            return BoardScore.GUARANTEED_MAX_LOSS.value + 2, forced_move.move
+        else:
+            playing_grid_copy = self.playing_grid.copy()
+            self.mark_board(marking_index=forced_move.move, playing_grid=playing_grid_copy)
+            score = self._evaluate_non_terminal_board_to_maximising_player(
+                playing_grid=playing_grid_copy, search_depth=1, maximiser_has_next_turn=False)
+            return score, forced_move.move
+
+    def _solve_position(self, search_timer: SearchTimer) -> SolvedPosition | None:
+        """
+        Method to ask the proof-number search to solve the current playing grid, within a share of the move's time and
+        node budgets (so that the main search still has some of each if the solver fails) and subject to the search's
+        stop event. The nodes and time the solver takes are counted in the search statistics.
+        """
+        solver_budget_fraction = TimeManagement.solver_budget_fraction.value
+        deadline = None if search_timer.move_budget_seconds is None else \
+            search_timer.start_time + search_timer.move_budget_seconds * solver_budget_fraction
+        max_nodes = search_timer.search_limits.max_nodes
+        solver_max_nodes = None if max_nodes is None else max(int(max_nodes * solver_budget_fraction), 1)
+        nodes_searched_before = self.proof_number_search.nodes_searched
+        solve_start_time = time.perf_counter()
+        solved_position = self.proof_number_search.solve(
+            playing_grid=self.playing_grid, player_to_move_value=self.get_player_turn(), deadline=deadline,
+            max_nodes=solver_max_nodes, stop_event=search_timer.stop_event)
+        search_timer.search_stats.solver_seconds += time.perf_counter() - solve_start_time
+        search_timer.search_stats.solver_nodes += self.proof_number_search.nodes_searched - nodes_searched_before
+        return solved_position
+
+    @staticmethod
+    def _get_game_theoretic_score(value: GameTheoreticValue, plies_to_end: int) -> int:
+        """
+        Method to score a position whose value under perfect play is known, as the search would have done - a win or
+        loss in n plies scores as a terminal board at search depth n.
+        """
+        if value == GameTheoreticValue.WIN:
+            return BoardScore.GUARANTEED_MAX_WIN.value - plies_to_end
+        elif value == GameTheoreticValue.LOSS:
+            return BoardScore.GUARANTEED_MAX_LOSS.value + plies_to_end
+        return BoardScore.DRAW.value
+
+    def _get_search_timer(self, search_limits: SearchLimits = None, stop_event: threading.Event = None) -> SearchTimer:
+        """Method to start the timer for a new search for a move from the current playing grid."""
+        if search_limits is None:
+            search_limits = self.search_limits
+        empty_cell_count = np.count_nonzero(self.playing_grid == BoardMarking.EMPTY.value)
+        return SearchTimer(search_limits=search_limits,
+                           move_budget_seconds=search_limits.get_move_budget_seconds(empty_cell_count),
+                           stop_event=stop_event)
+
+    def _get_branch_factor_policy(self, search_timer: SearchTimer) -> BranchFactorPolicy:
+        """Method to set the branch factor policy of a new search from the current playing grid, given its timer."""
+        search_limits = search_timer.search_limits
+        return BranchFactorPolicy.for_search(
+            playing_grid=self.playing_grid, win_length_k=self.win_length_k,
+            max_search_depth=search_limits.max_search_depth, move_budget_seconds=search_timer.move_budget_seconds,
+            max_nodes=search_limits.max_nodes, nodes_per_second=self._nodes_per_second)
+
+    def _get_parallel_root_search(self) -> ParallelRootSearch | nullcontext:
+        """
+        Method to get the context in which the root moves of a search are searched - either a ParallelRootSearch
+        owning a pool of worker processes, or a null context (giving None) when the search is single process.
+        """
+        if self.root_search_processes > 1:
+            return ParallelRootSearch(number_of_processes=self.root_search_processes)
+        else:
+            return nullcontext()
+
+    # Methods relating to pondering
+    def start_pondering(self) -> None:
+        """
+        Method to start searching in the background while the opponent decides on their move, which should be called
+        once the engine's move has been made. The pondering is stopped, and any results for the position the opponent's
+        move leads to are reused, at the next call to get_minimax_move_iterative_deepening.
+        Note that pondering requires a transposition table (to reuse the subtrees searched), so a table is created for
+        the instance if it does not already have one.
+        """
+        self.stop_pondering()
+        if self.transposition_table is None:
+            self.transposition_table = TranspositionTable()
+        if self.check_for_draw():
+            return
+
+        replies = self._get_available_cell_indices(playing_grid=self.playing_grid, search_depth=0)
+        transposition_entry = self.transposition_table.probe(position_hash=get_zobrist_hash(self.playing_grid))
+        if transposition_entry is not None and transposition_entry.best_move_index is not None:
+            # The opponent's best move found by the engine's own search is the reply that is most worth pondering
+            replies = self._prioritise_move(
+                available_cell_list=replies, playing_grid=self.playing_grid,
+                move=self._get_move_from_flat_index(transposition_entry.best_move_index))
+        self._ponderer = Ponderer(setup_parameters=self.get_essential_parameters(), playing_grid=self.playing_grid,
+                                  replies=replies, search_limits=self.search_limits,
+                                  transposition_table=self.transposition_table, evaluator=self.evaluator,
+                                  nodes_per_second=self._nodes_per_second)
+        self._ponderer.start()
+
+    def stop_pondering(self) -> None:
+        """Method to stop any pondering in progress (the results found so far are kept until the next search)."""
+        if self._ponderer is not None:
+            self._ponderer.stop()
+
+    def reset_game_board(self) -> None:
+        """Method extending the board reset to also discard any pondering on the previous game."""
+        self.stop_pondering()
+        self._ponderer = None
+        super().reset_game_board()
+
+    def _get_pondered_iteration_results(self) -> List[IterationResult]:
+        """
+        Method to stop pondering and get the iterations that were completed for the current playing grid while
+        pondering (an empty list if the opponent played a reply that was not pondered, or there was no pondering).
+        """
+        if self._ponderer is None:
+            return []
+        self._ponderer.stop()
+        pondered_iteration_results = self._ponderer.get_iteration_results(playing_grid=self.playing_grid)
+        self._ponderer = None
+        return pondered_iteration_results
+
     def get_minimax_move_at_max_search_depth(self,
                                              max_search_depth: int,
-                                             search_start_time: float,
+                                             search_timer: SearchTimer,
                                              last_played_index: None | np.ndarray = None,
                                              playing_grid: None | np.ndarray = None,
                                              search_depth: int = 0,
                                              maximisers_move: bool = True,
                                              alpha: float | int = -math.inf,
-                                             beta: float | int = math.inf) -> Tuple[int, np.ndarray | None]:
+                                             beta: float | int = math.inf,
+                                             neighbourhood: np.ndarray | None = None,
+                                             live_windows: LiveWindows | None = None
+                                             ) -> Tuple[int, np.ndarray | None]:
         """
         Method to determine the move that should be played next on the given playing_grid, based on the terminal or
         non-terminal board that receives the highest streak, at the max_search_depth.
@@ -75,8 +462,8 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         max_search_depth: The search depth at which the call to this method must stop searching any further and return
         the best move already found.
 
-        search_start_time: The time when the call to get_minimax_move_iterative_deepening() was first made - this is
-        passed so the search stops if max time has elapsed. This is checked both within each depth (by this method)
+        search_timer: The timer created by the call to get_minimax_move_iterative_deepening() - this is passed so the
+        search stops if the time or node budget is exhausted. This is checked both within each depth (by this method)
         and when changing depth (the iterative_deepening call to this method, above)
 
         last_played_index: The index of of the last board marking. This is included so that the win search algorithm
@@ -103,6 +490,16 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         is pruned if the maximiser can guarantee a higher value (alpha >= beta).
         Default of +inf (first call) so it can only be improved on.
 
+        neighbourhood: The flat mask of the cells near a mark on the playing_grid, which the moves searched are taken
+        from. This is maintained by the recursive calls (as the parent's neighbourhood plus that of the move made), and
+        only calculated from scratch when None is passed (in primary calls).
+
+        live_windows: The mark counts of the windows of the playing_grid, which show when neither player can win any
+        more, and where each player can win immediately. Like the neighbourhood, these are maintained by the recursive
+        calls (by making and unmaking each move searched), and only calculated from scratch when None is passed (in
+        primary calls). Unless the engine has its own evaluator, this is an IncrementalEvaluation, which the boards at
+        the horizon of the search are also evaluated from.
+
         Returns: Tuple[int, np.ndarray | None]
         __________
         int -  In this case the recursion has reached a board of terminal state or the algorithm has run out of
@@ -117,6 +514,9 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         # None parameter for playing_grid is only passed in primary (non-recursive) calls
         if playing_grid is None:
             playing_grid = self.playing_grid
+        if live_windows is None:
+            live_windows = self._get_live_windows_for_search(playing_grid=playing_grid)
+        search_timer.register_node()
 
         # Checks for a terminal state (win or draw)
         if last_played_index is not None:
@@ -129,57 +529,97 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
 
         # Evaluate the board in a terminal state from the perspective of the maximising player
         if game_has_been_won:
+            search_timer.search_stats.terminal_hits += 1
             winning_player = self.get_winning_player(winning_game=game_has_been_won, playing_grid=playing_grid)
             score = self._evaluate_terminal_board_to_maximising_player(
                 search_depth=search_depth, winning_player=winning_player)
             return score, None
-        elif self.check_for_draw(playing_grid=playing_grid):
+        elif self._search_reached_draw(playing_grid=playing_grid, search_depth=search_depth,
+                                       live_windows=live_windows):
+            search_timer.search_stats.terminal_hits += 1
             score = self._evaluate_terminal_board_to_maximising_player(
                 search_depth=search_depth, draw=True)
             return score, None
 
         # Check whether our iterative deepening criteria have been exhausted:
-        elif (time.perf_counter() - search_start_time > IterativeDeepening.max_search_seconds.value) and \
-                (search_depth >= IterativeDeepening.minimum_search_depth.value):
+        elif search_timer.search_limit_reached() and \
+                (search_depth >= search_timer.search_limits.minimum_search_depth):
             # Although this exit criteria is also included in the iterative loop, a given depth may also take too long
             # We only exit if the minimum search depth has been achieved
-            score = self._evaluate_non_terminal_board_to_maximising_player(
-                playing_grid=playing_grid, search_depth=search_depth, maximiser_has_next_turn=maximisers_move)
+            score = self._get_quiescence_score(
+                playing_grid=playing_grid, search_depth=search_depth, maximisers_move=maximisers_move,
+                search_timer=search_timer, quiescence_plies_left=search_timer.search_limits.quiescence_plies,
+                live_windows=live_windows)
             return score, None
 
         elif search_depth == max_search_depth:
-            score = self._evaluate_non_terminal_board_to_maximising_player(
-                playing_grid=playing_grid, search_depth=search_depth, maximiser_has_next_turn=maximisers_move)
+            score = self._get_quiescence_score(
+                playing_grid=playing_grid, search_depth=search_depth, maximisers_move=maximisers_move,
+                search_timer=search_timer, quiescence_plies_left=search_timer.search_limits.quiescence_plies,
+                live_windows=live_windows)
             return score, None
 
         # Otherwise, we need to evaluate the max/min streak attainable and associated move
-        elif maximisers_move:
-            available_cell_list = self._get_available_cell_indices(
-                playing_grid=playing_grid, search_depth=search_depth, last_played_index=last_played_index)
-            max_score, best_move = self._get_maximiser_score_and_move(
+        if search_timer.root_alpha_floor > alpha:  # Another worker of a parallel root search found a better root move
+            alpha = search_timer.root_alpha_floor
+        position_hash = None
+        transposition_move_index = None
+        if self.transposition_table is not None:
+            position_hash = get_zobrist_hash(playing_grid=playing_grid)
+            transposition_entry = self.transposition_table.probe(position_hash=position_hash)
+            search_timer.search_stats.transposition_probes += 1
+            if transposition_entry is not None:
+                search_timer.search_stats.transposition_hits += 1
+                transposition_move_index = transposition_entry.best_move_index
+                if self._transposition_entry_gives_cut_off(
+                        transposition_entry=transposition_entry, search_depth=search_depth,
+                        max_search_depth=max_search_depth, alpha=alpha, beta=beta):
+                    search_timer.search_stats.transposition_cut_offs += 1
+                    return transposition_entry.score, self._get_move_from_flat_index(transposition_move_index)
+
+        if neighbourhood is None:
+            neighbourhood = get_position_neighbourhood(
+                playing_grid=playing_grid, radius=MoveGeneration.neighbourhood_radius.value)
+        available_cell_list = self._get_available_cell_indices(
+            playing_grid=playing_grid, search_depth=search_depth, last_played_index=last_played_index,
+            neighbourhood=neighbourhood)
+        if transposition_move_index is not None:
+            available_cell_list = self._prioritise_move(
+                available_cell_list=available_cell_list, playing_grid=playing_grid,
+                move=self._get_move_from_flat_index(transposition_move_index))
+
+        if maximisers_move:
+            score, best_move = self._get_maximiser_score_and_move(
                 available_cell_list=available_cell_list, max_search_depth=max_search_depth,
-                search_start_time=search_start_time, last_played_index=last_played_index, playing_grid=playing_grid,
-                search_depth=search_depth, alpha=alpha, beta=beta)
-            return max_score, best_move
-
+                search_timer=search_timer, last_played_index=last_played_index, playing_grid=playing_grid,
+                search_depth=search_depth, alpha=alpha, beta=beta, neighbourhood=neighbourhood,
+                live_windows=live_windows)
         else:  # minimisers move - they want to pick the game tree that minimises the streak to the maximiser
-            available_cell_list = self._get_available_cell_indices(
-                playing_grid=playing_grid, search_depth=search_depth, last_played_index=last_played_index)
-            max_score, best_move = self._get_minimiser_score_and_move(
+            score, best_move = self._get_minimiser_score_and_move(
                 available_cell_list=available_cell_list, max_search_depth=max_search_depth,
-                search_start_time=search_start_time, last_played_index=last_played_index, playing_grid=playing_grid,
-                search_depth=search_depth, alpha=alpha, beta=beta)
-            return max_score, best_move
+                search_timer=search_timer, last_played_index=last_played_index, playing_grid=playing_grid,
+                search_depth=search_depth, alpha=alpha, beta=beta, neighbourhood=neighbourhood,
+                live_windows=live_windows)
+
+        # Results found after the search limits were hit may be based on truncated game trees, so are not stored
+        if position_hash is not None and best_move is not None and not search_timer.search_limit_reached():
+            self._store_in_transposition_table(
+                position_hash=position_hash, score=score, best_move=best_move, search_depth=search_depth,
+                max_search_depth=max_search_depth, alpha=alpha, beta=beta)
+        return score, best_move
 
     def _get_maximiser_score_and_move(self,
                                       available_cell_list: List[np.ndarray],
                                       max_search_depth: int,
-                                      search_start_time: float,
+                                      search_timer: SearchTimer,
                                       last_played_index: np.ndarray,
                                       playing_grid: np.ndarray,
                                       search_depth: int,
                                       alpha: float | int,
-                                      beta: float | int) -> Tuple[int, np.ndarray | None]:
+                                      beta: float | int,
+                                      neighbourhood: np.ndarray,
+                                      live_windows: LiveWindows
+                                      ) -> Tuple[int, np.ndarray | None]:
         """
         Method to get the maximum board streak and thus best move from the maximiser's perspective, amongst the
         options in the available_cell_list.
@@ -190,30 +630,50 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         """
         max_score = -math.inf  # Initialise as -inf so that the streak can only be improved upon
         best_move = None
-        for move_option in available_cell_list:
+        neighbourhood_masks = get_neighbourhood_masks(
+            self.game_rows_m, self.game_cols_n, MoveGeneration.neighbourhood_radius.value)
+        mark_value = self.get_player_turn(playing_grid=playing_grid)
+        for move_number, move_option in enumerate(available_cell_list):
             playing_grid_copy = playing_grid.copy()
             self.mark_board(marking_index=move_option, playing_grid=playing_grid_copy)
+            live_windows.make_move(marking_index=move_option, mark_value=mark_value)
+            child_neighbourhood = neighbourhood | neighbourhood_masks[
+                move_option[0] * self.game_cols_n + move_option[1]]
+            reduction = self.branch_factor_policy.get_reduction(
+                search_depth=search_depth, move_number=move_number, remaining_depth=max_search_depth - search_depth)
             potential_new_max, _ = self.get_minimax_move_at_max_search_depth(  # call minimax recursively
-                search_start_time=search_start_time, max_search_depth=max_search_depth,
+                search_timer=search_timer, max_search_depth=max_search_depth - reduction,
                 last_played_index=move_option, playing_grid=playing_grid_copy, search_depth=search_depth + 1,
-                maximisers_move=False, alpha=alpha, beta=beta)
+                maximisers_move=False, alpha=alpha, beta=beta, neighbourhood=child_neighbourhood,
+                live_windows=live_windows)
+            if reduction > 0 and potential_new_max > alpha:  # The late move looks good, so is searched again in full
+                potential_new_max, _ = self.get_minimax_move_at_max_search_depth(
+                    search_timer=search_timer, max_search_depth=max_search_depth,
+                    last_played_index=move_option, playing_grid=playing_grid_copy, search_depth=search_depth + 1,
+                    maximisers_move=False, alpha=alpha, beta=beta, neighbourhood=child_neighbourhood,
+                    live_windows=live_windows)
+            live_windows.unmake_move(marking_index=move_option, mark_value=mark_value)
             if potential_new_max > max_score:
                 max_score = potential_new_max
                 best_move = move_option
             alpha = max(alpha, potential_new_max)
             if beta <= alpha:
+                search_timer.search_stats.record_cutoff(search_depth=search_depth)
                 break  # No need to consider this game branch any further, as minimiser will avoid it
         return max_score, best_move
 
     def _get_minimiser_score_and_move(self,
                                       available_cell_list: List[np.ndarray],
                                       max_search_depth: int,
-                                      search_start_time: float,
+                                      search_timer: SearchTimer,
                                       last_played_index: np.ndarray,
                                       playing_grid: np.ndarray,
                                       search_depth: int,
                                       alpha: float | int,
-                                      beta: float | int) -> Tuple[int, np.ndarray | None]:
+                                      beta: float | int,
+                                      neighbourhood: np.ndarray,
+                                      live_windows: LiveWindows
+                                      ) -> Tuple[int, np.ndarray | None]:
         """
         Method to get the minimum board streak and thus best move from the minimiser's perspective, amongst the
         options in the available_cell_list.
@@ -224,21 +684,192 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         """
         min_score = math.inf  # Initialise as +inf so that streak can only be improved upon
         best_move = None
-        for move_option in available_cell_list:
+        neighbourhood_masks = get_neighbourhood_masks(
+            self.game_rows_m, self.game_cols_n, MoveGeneration.neighbourhood_radius.value)
+        mark_value = self.get_player_turn(playing_grid=playing_grid)
+        for move_number, move_option in enumerate(available_cell_list):
             playing_grid_copy = playing_grid.copy()
             self.mark_board(marking_index=move_option, playing_grid=playing_grid_copy)
+            live_windows.make_move(marking_index=move_option, mark_value=mark_value)
+            child_neighbourhood = neighbourhood | neighbourhood_masks[
+                move_option[0] * self.game_cols_n + move_option[1]]
+            reduction = self.branch_factor_policy.get_reduction(
+                search_depth=search_depth, move_number=move_number, remaining_depth=max_search_depth - search_depth)
             potential_new_min, _ = self.get_minimax_move_at_max_search_depth(  # call minimax recursively
-                search_start_time=search_start_time, max_search_depth=max_search_depth,
+                search_timer=search_timer, max_search_depth=max_search_depth - reduction,
                 last_played_index=move_option, playing_grid=playing_grid_copy, search_depth=search_depth + 1,
-                maximisers_move=True, alpha=alpha, beta=beta)
+                maximisers_move=True, alpha=alpha, beta=beta, neighbourhood=child_neighbourhood,
+                live_windows=live_windows)
+            if reduction > 0 and potential_new_min < beta:  # The late move looks good, so is searched again in full
+                potential_new_min, _ = self.get_minimax_move_at_max_search_depth(
+                    search_timer=search_timer, max_search_depth=max_search_depth,
+                    last_played_index=move_option, playing_grid=playing_grid_copy, search_depth=search_depth + 1,
+                    maximisers_move=True, alpha=alpha, beta=beta, neighbourhood=child_neighbourhood,
+                    live_windows=live_windows)
+            live_windows.unmake_move(marking_index=move_option, mark_value=mark_value)
             if potential_new_min < min_score:
                 min_score = potential_new_min
                 best_move = move_option
             beta = min(beta, potential_new_min)
             if beta <= alpha:
+                search_timer.search_stats.record_cutoff(search_depth=search_depth)
                 break  # No need to consider game branch any further, maximiser will just avoid it
         return min_score, best_move
 
+    # Methods relating to the transposition table
+    def _transposition_entry_gives_cut_off(self,
+                                           transposition_entry: TranspositionEntry,
+                                           search_depth: int,
+                                           max_search_depth: int,
+                                           alpha: float | int,
+                                           beta: float | int) -> bool:
+        """
+        Method to determine whether a transposition table entry can be used in place of searching a position.
+        The entry must have been stored at the same search depth and for the same maximising player (so that its score
+        is on the same scale), from a search at least as deep as the one required, and its score must either be exact
+        or be a bound that falls outside the alpha-beta window.
+        """
+        if transposition_entry.search_depth != search_depth or \
+                transposition_entry.maximiser_mark_value != self.get_player_turn() or \
+                transposition_entry.remaining_depth < max_search_depth - search_depth or \
+                transposition_entry.best_move_index is None:
+            return False
+        elif transposition_entry.flag == TranspositionEntryFlag.EXACT:
+            return True
+        elif transposition_entry.flag == TranspositionEntryFlag.LOWER_BOUND:
+            return transposition_entry.score >= beta
+        else:
+            return transposition_entry.score <= alpha
+
+    def _store_in_transposition_table(self,
+                                      position_hash: int,
+                                      score: int | float,
+                                      best_move: np.ndarray,
+                                      search_depth: int,
+                                      max_search_depth: int,
+                                      alpha: float | int,
+                                      beta: float | int) -> None:
+        """
+        Method to store the outcome of searching a position in the transposition table, with the score flagged as a
+        bound if it fell outside the alpha-beta window the position was searched with.
+        """
+        if not math.isfinite(score):
+            return
+        if score <= alpha:
+            flag = TranspositionEntryFlag.UPPER_BOUND
+        elif score >= beta:
+            flag = TranspositionEntryFlag.LOWER_BOUND
+        else:
+            flag = TranspositionEntryFlag.EXACT
+        best_move_index = int(np.ravel_multi_index(tuple(best_move), self.playing_grid.shape))
+        self.transposition_table.store(
+            position_hash=position_hash, score=score, best_move_index=best_move_index, search_depth=search_depth,
+            remaining_depth=max_search_depth - search_depth, flag=flag, maximiser_mark_value=self.get_player_turn())
+
+    def _get_move_from_flat_index(self, flat_index: int | None) -> np.ndarray | None:
+        """Method to convert the flat index of a cell on the playing grid into its index as a numpy array."""
+        if flat_index is None:
+            return None
+        return np.array(np.unravel_index(flat_index, self.playing_grid.shape))
+
+    @staticmethod
+    def _prioritise_move(available_cell_list: List[np.ndarray], playing_grid: np.ndarray,
+                         move: np.ndarray) -> List[np.ndarray]:
+        """
+        Method to move a given move (e.g. the best move stored in the transposition table) to the front of the list of
+        moves to search, so that it gets searched first.
+        """
+        if playing_grid[tuple(move)] != BoardMarking.EMPTY.value:
+            return available_cell_list
+        other_moves = [available_cell for available_cell in available_cell_list if not np.all(available_cell == move)]
+        return [move] + other_moves
+
+    def _get_quiescence_score(self,
+                              playing_grid: np.ndarray,
+                              search_depth: int,
+                              maximisers_move: bool,
+                              search_timer: SearchTimer,
+                              quiescence_plies_left: int,
+                              live_windows: LiveWindows | None = None) -> int:
+        """
+        Method to score a non-terminal board at the horizon of the search, resolving any immediate wins and forced
+        blocks before the board is statically evaluated. This avoids the static evaluation having to guess the value of
+        boards where the player to move can win, or must block, and so removes blunders caused by the horizon effect
+        without searching the whole tree any deeper.
+        Note that this is a recursive method, which only ever follows a single line (the forced block).
+
+        Parameters:
+        __________
+        playing_grid/search_depth/maximisers_move/search_timer: As for get_minimax_move_at_max_search_depth
+        quiescence_plies_left: The number of further forced blocks that may be played out
+        live_windows: As for get_minimax_move_at_max_search_depth (if None, the forced moves are found and the board
+        is evaluated from scratch)
+
+        Returns: The score of the board from the maximiser's perspective
+        """
+        search_timer.search_stats.quiescence_nodes += 1
+        player_to_move_value = self.get_player_turn() if maximisers_move else -self.get_player_turn()
+        forced_move = get_forced_move(
+            playing_grid=playing_grid, win_length_k=self.win_length_k, player_mark_value=player_to_move_value,
+            live_windows=live_windows) if quiescence_plies_left > 0 else None
+
+        if forced_move is None:
+            search_timer.search_stats.leaves_evaluated += 1
+            return self._evaluate_non_terminal_board_to_maximising_player(
+                playing_grid=playing_grid, search_depth=search_depth, maximiser_has_next_turn=maximisers_move,
+                live_windows=live_windows)
+        elif forced_move.forced_move_type == ForcedMoveType.WIN:  # The player to move wins on the next ply
+            if maximisers_move:
+                return BoardScore.GUARANTEED_MAX_WIN.value - (search_depth + 1)
+            else:
+                return BoardScore.GUARANTEED_MAX_LOSS.value + (search_depth + 1)
+        elif forced_move.forced_move_type == ForcedMoveType.LOSING_BLOCK:  # The opponent wins on the ply after next
+            if maximisers_move:
+                return BoardScore.GUARANTEED_MAX_LOSS.value + (search_depth + 2)
+            else:
+                return BoardScore.GUARANTEED_MAX_WIN.value - (search_depth + 2)
+
+        playing_grid_copy = playing_grid.copy()
+        self.mark_board(marking_index=forced_move.move, playing_grid=playing_grid_copy)
+        if live_windows is not None:
+            live_windows.make_move(marking_index=forced_move.move, mark_value=player_to_move_value)
+        if self._search_reached_draw(playing_grid=playing_grid_copy, search_depth=search_depth + 1,
+                                     live_windows=live_windows):
+            search_timer.search_stats.terminal_hits += 1
+            score = self._evaluate_terminal_board_to_maximising_player(search_depth=search_depth + 1, draw=True)
+        else:
+            score = self._get_quiescence_score(
+                playing_grid=playing_grid_copy, search_depth=search_depth + 1, maximisers_move=not maximisers_move,
+                search_timer=search_timer, quiescence_plies_left=quiescence_plies_left - 1,
+                live_windows=live_windows)
+        if live_windows is not None:
+            live_windows.unmake_move(marking_index=forced_move.move, mark_value=player_to_move_value)
+        return score
+
+    def _get_live_windows_for_search(self, playing_grid: np.ndarray) -> LiveWindows:
+        """
+        Method to count the marks in the windows of the playing grid at the root of a search, along with their streaks
+        if the boards at the horizon are to be evaluated incrementally (i.e. the engine has no evaluator of its own).
+        """
+        if self.evaluator is None:
+            return IncrementalEvaluation(playing_grid=playing_grid, win_length_k=self.win_length_k)
+        return LiveWindows(playing_grid=playing_grid, win_length_k=self.win_length_k)
+
+    def _search_reached_draw(self, playing_grid: np.ndarray, search_depth: int,
+                             live_windows: LiveWindows | None) -> bool:
+        """
+        Method to check whether a board reached by the search is drawn, because neither player can win any more. Below
+        the root, this saves searching the filler moves left on a dead drawn board, however at the root a move is still
+        needed, so the root board only counts as drawn once it is full.
+        Parameters: playing_grid/search_depth/live_windows - as for get_minimax_move_at_max_search_depth
+        """
+        if search_depth == 0:
+            return not np.any(playing_grid == BoardMarking.EMPTY.value)
+        elif live_windows is not None:
+            return live_windows.neither_player_can_win()
+        else:
+            return self.check_for_draw(playing_grid=playing_grid)
+
     def _evaluate_terminal_board_to_maximising_player(self,
                                                       search_depth: int,
                                                       winning_player: Player | None = None,
@@ -273,17 +904,23 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         else:
             raise ValueError("Attempted to evaluate a game scenario that was not terminal.")
 
-    def _evaluate_non_terminal_board_to_maximising_player(self, playing_grid: np.ndarray, search_depth: int,
-                                                          maximiser_has_next_turn: bool) -> int:
+    def _evaluate_non_terminal_board_to_maximising_player(
+            self, playing_grid: np.ndarray, search_depth: int, maximiser_has_next_turn: bool,
+            live_windows: LiveWindows | None = None) -> int:
         """
         Method to evaluate the playing board from the maximiser's perspective, when the algorithm has been forced
         to end because the maximum search depth is reached, or the maximum search time has elapsed.
-        Note that this uses the function evaluate_non_terminal_board which is defined externally (so that it can be
-        cached and optimised more easily).
-        Parameters: playing_grid/search_depth - as above.
+        Note that this uses the engine's evaluator, which is defined externally (so that it can be cached and optimised
+        more easily), or the reference evaluator if the engine has none - in which case the live windows of the search
+        are an incremental evaluation, which gives the same score without looking at the whole board.
+        Parameters: playing_grid/search_depth/live_windows - as above.
         """
         maximiser_mark_value = self.get_player_turn()
-        score = evaluate_non_terminal_board(
+        if self.evaluator is None and live_windows is not None:  # So the live windows are an IncrementalEvaluation
+            return live_windows.evaluate(search_depth=search_depth, maximiser_mark_value=maximiser_mark_value,
+                                         maximiser_has_next_turn=maximiser_has_next_turn)
+        evaluator = REFERENCE_EVALUATOR if self.evaluator is None else self.evaluator
+        score = evaluator(
             playing_grid=playing_grid, win_length_k=self.win_length_k, search_depth=search_depth,
             maximiser_mark_value=maximiser_mark_value, maximiser_has_next_turn=maximiser_has_next_turn
         )
@@ -292,10 +929,11 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
     def _get_available_cell_indices(self,
                                     playing_grid: np.ndarray,
                                     search_depth: int,
-                                    last_played_index: np.ndarray = None) -> List[np.ndarray]:
+                                    last_played_index: np.ndarray = None,
+                                    neighbourhood: np.ndarray = None) -> List[np.ndarray]:
         """
         Method that looks at where the cells on the playing_grid are unmarked and returns a list of the index of each
-        empty cell. This is the iterator for the minimax method.
+        empty cell near a mark on the board. This is the iterator for the minimax method.
         If the game has already started, the list is prioritised according to proximity to the previous move.
         A max branching factor is introduced, which is used to slice the head off the list of available cells and
         return the closest 'max_branching_factor' cells to the last_played_index.
@@ -305,36 +943,30 @@ class NoughtsAndCrossesMinimax(NoughtsAndCrosses):
         search_depth: the depth we are searching at (which the max branch factor depends on)
         last_played_index: where the previous mark was made. Note that this serves the purpose of prioritising which
         available cells to search first - those closest to the player's move
+        neighbourhood: the flat mask of the cells near a mark on the playing_grid (calculated from scratch if None).
+        Every empty cell is available if there is no previous move, i.e. on the first move of the game.
 
         Returns: List of the indexes which are available, as numpy arrays, up to the max branching factor.
 
-        Notes: I have tested the speed of different key functions in the call to sorted() below using different options,
-        including a lambda (no need for a separately defined function), an inner function, and different variants.
-        The cached partial function currently implemented was the fastest of those tested. A partial function is used
-        because the key function must be callable. An alternative is to use an inner wrapper in the
-        _available_cell_prioritiser, and then return this, but this was also slower.
-        """
-        max_branch_factor = IterativeDeepening.get_max_branch_factor(search_depth=search_depth)
-        available_cell_index_list = [index for index in
-                                     np.argwhere(playing_grid == BoardMarking.EMPTY.value)]
-        shuffle(available_cell_index_list)
-        if self.previous_mark_index is None:  # This is the first move of the game
-            return available_cell_index_list[:max_branch_factor]
-        elif last_played_index is None:  # This is a primary call to minimax
-            prioritised_list = sorted(available_cell_index_list,
-                                      key=functools.partial(self._available_cell_prioritiser, self.previous_mark_index))
-            return prioritised_list[:max_branch_factor]
-        else:  # Order the list so that we search in order of distance from the last played index
-            prioritised_list = sorted(available_cell_index_list,
-                                      key=functools.partial(self._available_cell_prioritiser, last_played_index))
-            return prioritised_list[:max_branch_factor]
-
-    @staticmethod
-    @lru_cache_hashable(maxsize=1000)  # Can be infinite but specified to avoid memory blow up
-    def _available_cell_prioritiser(last_played_index: np.ndarray, available_index: np.ndarray) -> float:
-        """
-        Method to define an order that can be used to sort a list of available empty cells in order of which
-        should be searched first.
-        This is important as minimax is now against the clock.
+        Notes: The cells are put in order by filtering the cells in order of distance from the last played index, which
+        are precomputed for each shape of board (with ties broken by the move_ordering_seed), rather than sorted.
         """
-        return np.linalg.norm(last_played_index - available_index)
+        max_branch_factor = self.branch_factor_policy.get_max_branch_factor(search_depth=search_depth)
+        if neighbourhood is None:
+            neighbourhood = get_position_neighbourhood(
+                playing_grid=playing_grid, radius=MoveGeneration.neighbourhood_radius.value)
+        empty_cells = playing_grid.ravel() == BoardMarking.EMPTY.value
+        candidate_cells = empty_cells & neighbourhood
+
+        if last_played_index is None:  # This is a primary call to minimax
+            last_played_index = self.previous_mark_index
+        if last_played_index is None:  # This is the first move of the game, so any empty cell is as good as any other
+            candidate_cells = np.flatnonzero(empty_cells)
+            shuffle(candidate_cells)
+        else:  # Keep the cells in order of distance from the last played index
+            distance_ordering = get_distance_orderings(self.game_rows_m, self.game_cols_n, self.move_ordering_seed)[
+                last_played_index[0] * self.game_cols_n + last_played_index[1]]
+            candidate_cells = distance_ordering[candidate_cells[distance_ordering]]
+
+        candidate_cells = candidate_cells[:max_branch_factor]
+        return list(np.column_stack(np.divmod(candidate_cells, self.game_cols_n)))
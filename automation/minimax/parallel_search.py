@@ -0,0 +1,422 @@
+"""
+Module defining how the minimax search can be spread across multiple processes. Two approaches are implemented:
+
+1) Root splitting - the moves available at the root of the search (search depth 0) are split across a pool of worker
+processes, which each search the game tree below their root move. The best score found so far (alpha) is shared between
+the workers in shared memory, so that the root moves can be pruned against it as it improves (including those already
+being searched, since each worker re-reads it as it searches).
+
+2) Lazy SMP - each worker process runs the same iterative deepening search from the root, but with its own random move
+order (from the tie-breaks of its move ordering tables). The workers share a single transposition table in shared
+memory, so each benefits from the positions the others have already searched, and the main process takes the result of
+the deepest completed iteration. This suits large boards where the game tree is too irregular to split statically.
+
+In both cases, the workers' search timers share a multiprocessing Event, which the main process sets if its own search
+is stopped (e.g. by cancelling an AsyncMinimaxSearch), since the workers cannot see the main process's threading Event.
+The workers of a lazy SMP search also send each iteration they complete back to the main process, so that each depth
+can be published (via the search's iteration callback) as soon as the first worker completes it.
+
+Note that each worker builds its own NoughtsAndCrossesMinimax instance from the essential parameters of the game, so
+that the calling instance (which may for example be part of the tkinter GUI) never needs to be pickled.
+"""
+
+# Standard library imports
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+import math
+import multiprocessing
+from multiprocessing.queues import SimpleQueue
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event
+import random
+import time
+from typing import Callable, List, Tuple, TYPE_CHECKING
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.constants.iterative_deepening_constants import ParallelSearch
+from automation.minimax.constants.transposition_table_constants import TranspositionTableParameters
+from automation.minimax.evaluator import Evaluator
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+from automation.minimax.search_results import IterationResult, SearchStats
+from automation.minimax.transposition_table import TranspositionTable
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+
+if TYPE_CHECKING:
+    from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+
+# The objects shared between the main process and the worker processes, set by the pool initializer in each worker
+_shared_root_alpha: Synchronized | None = None  # The best root score so far, shared by the root search workers
+_worker_stop_event: Event | None = None  # Set by the main process to stop the workers' searches
+_completed_iteration_results: SimpleQueue | None = None  # The iterations completed by the lazy SMP workers
+
+
+@dataclass(frozen=True)
+class RootMoveSearchTask:
+    """
+    Dataclass storing everything a worker process needs to search the game tree below a single root move.
+
+    Attributes:
+    __________
+    setup_parameters: The essential parameters of the game being played
+    starting_player_value: The BoardMarking value of the player who started the active game
+    playing_grid: The playing grid at the root of the search
+    previous_mark_index: The last move made on the root playing grid
+    root_move: The move at search depth 0 that this task searches below
+    max_search_depth: The maximum depth of the active iteration of the iterative deepening
+    search_limits: The limits the worker's search is subject to
+    move_deadline: The time.time() by which the move must be made (None for no wall time limit). An absolute time is
+    used since the task may not start until some time after it has been created.
+    branch_factor_policy: The branch factor policy of the search in the main process, so that the worker narrows and
+    reduces its search exactly as the main process would have done
+    evaluator: The engine's evaluator (None for the default evaluation)
+    """
+    setup_parameters: NoughtsAndCrossesEssentialParameters
+    starting_player_value: int
+    playing_grid: np.ndarray
+    previous_mark_index: np.ndarray | None
+    root_move: np.ndarray
+    max_search_depth: int
+    search_limits: SearchLimits
+    move_deadline: float | None
+    branch_factor_policy: BranchFactorPolicy
+    evaluator: Evaluator = None
+
+
+def _initialise_root_search_worker(shared_root_alpha: Synchronized, worker_stop_event: Event) -> None:
+    """
+    Function called once in each worker process when the pool starts, to make the shared alpha and stop event available.
+    """
+    global _shared_root_alpha, _worker_stop_event
+    _shared_root_alpha = shared_root_alpha
+    _worker_stop_event = worker_stop_event
+
+
+def _wait_for_workers(futures: List[Future],
+                      search_timer: SearchTimer,
+                      worker_stop_event: Event,
+                      collect_worker_messages: Callable[[], None] | None = None) -> None:
+    """
+    Function to wait in the main process for the tasks given to the worker processes to finish. While waiting, a stop
+    request on the main process's search timer is passed on to the workers, and any messages sent by the workers are
+    collected (including after the last task has finished, since the workers send them before finishing).
+    """
+    while True:
+        _, unfinished_futures = wait(futures, timeout=ParallelSearch.worker_poll_interval_seconds.value)
+        if search_timer.stop_requested():
+            worker_stop_event.set()
+        if collect_worker_messages is not None:
+            collect_worker_messages()
+        if len(unfinished_futures) == 0:
+            return
+
+
+def _search_below_root_move(task: RootMoveSearchTask) -> Tuple[float, float, SearchStats]:
+    """
+    Function run in a worker process to get the minimiser's score for the board following a single root move.
+    The subtree is searched against the alpha shared by all workers, which the worker's search timer re-reads at each
+    deadline check, so that the search tightens its alpha as other workers complete better root moves. The alpha is
+    always lowered to the next representable float, so that any root move that ties with the best score is still scored
+    exactly (rather than being pruned at a bound equal to the best score). Since every alpha used is below the highest
+    shared alpha read, a score at least as high as that alpha is exact, and the best root move is always scored
+    exactly. This is what allows the results to be combined deterministically.
+
+    Returns:
+    __________
+    float - the score of the root move (only exact if it is not lower than the alpha used)
+    float - the highest shared alpha the subtree was searched against
+    SearchStats - the statistics of the worker's search
+    """
+    # Imported here since the minimax module imports this module
+    from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+
+    worker_engine = NoughtsAndCrossesMinimax(setup_parameters=task.setup_parameters,
+                                             search_limits=task.search_limits, evaluator=task.evaluator)
+    worker_engine.branch_factor_policy = task.branch_factor_policy
+    worker_engine.starting_player_value = task.starting_player_value
+    worker_engine.playing_grid = task.playing_grid
+    worker_engine.previous_mark_index = task.previous_mark_index
+
+    playing_grid_copy = task.playing_grid.copy()
+    worker_engine.mark_board(marking_index=task.root_move, playing_grid=playing_grid_copy)
+    move_budget_seconds = None if task.move_deadline is None else max(task.move_deadline - time.time(), 0)
+    search_timer = SearchTimer(search_limits=task.search_limits, move_budget_seconds=move_budget_seconds,
+                               stop_event=_worker_stop_event, shared_root_alpha=_shared_root_alpha)
+    score, _ = worker_engine.get_minimax_move_at_max_search_depth(
+        max_search_depth=task.max_search_depth, search_timer=search_timer, last_played_index=task.root_move,
+        playing_grid=playing_grid_copy, search_depth=1, maximisers_move=False,
+        alpha=search_timer.root_alpha_floor, beta=math.inf)
+
+    with _shared_root_alpha.get_lock():
+        if score > _shared_root_alpha.value:
+            _shared_root_alpha.value = score
+    return score, search_timer.root_alpha, search_timer.get_search_stats()
+
+
+class ParallelRootSearch:
+    """
+    Context manager owning the process pool and shared alpha used to search the root moves of a minimax search in
+    parallel. One instance is used for all iterations of the iterative deepening for a single move, so that the pool
+    is only started once per move.
+
+    Instance attributes:
+    __________
+    number_of_processes: The number of worker processes the root moves are split across
+    """
+
+    def __init__(self, number_of_processes: int):
+        self.number_of_processes = number_of_processes
+        self._shared_root_alpha: Synchronized = multiprocessing.Value("d", -math.inf)
+        self._worker_stop_event: Event = multiprocessing.Event()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ParallelRootSearch":
+        self._executor = ProcessPoolExecutor(max_workers=self.number_of_processes,
+                                             initializer=_initialise_root_search_worker,
+                                             initargs=(self._shared_root_alpha, self._worker_stop_event))
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    def get_root_score_and_move(self,
+                                engine: "NoughtsAndCrossesMinimax",
+                                root_moves: List[np.ndarray],
+                                max_search_depth: int,
+                                search_timer: SearchTimer) -> Tuple[float, np.ndarray | None]:
+        """
+        Method to search each of the root moves in a worker process and combine the results.
+
+        Parameters:
+        __________
+        engine: The NoughtsAndCrossesMinimax instance the search is being made for, whose branch factor policy the
+        workers search with
+        root_moves: The moves available at search depth 0, in the order they should be searched
+        max_search_depth: The maximum depth of the active iteration of the iterative deepening
+        search_timer: The timer of the search in the main process, which the workers' statistics are added to, and
+        whose stop requests are passed on to the workers
+
+        Returns: As for get_minimax_move_at_max_search_depth. Of the root moves whose score is exact, the highest
+        scoring move is chosen, with ties going to the move that is first in root_moves.
+        """
+        self._shared_root_alpha.value = -math.inf
+        self._worker_stop_event.clear()
+        move_deadline = None if search_timer.move_budget_seconds is None else \
+            time.time() + search_timer.move_budget_seconds - search_timer.elapsed_seconds()
+        worker_search_limits = search_timer.search_limits
+        if worker_search_limits.max_nodes is not None:
+            remaining_nodes = max(worker_search_limits.max_nodes - search_timer.node_count, 1)
+            worker_search_limits = replace(worker_search_limits,
+                                           max_nodes=max(remaining_nodes // max(len(root_moves), 1), 1))
+        tasks = [RootMoveSearchTask(
+            setup_parameters=engine.get_essential_parameters(), starting_player_value=engine.starting_player_value,
+            playing_grid=engine.playing_grid, previous_mark_index=engine.previous_mark_index, root_move=root_move,
+            max_search_depth=max_search_depth, search_limits=worker_search_limits,
+            move_deadline=move_deadline, branch_factor_policy=engine.branch_factor_policy, evaluator=engine.evaluator)
+            for root_move in root_moves]
+
+        futures = [self._executor.submit(_search_below_root_move, task) for task in tasks]
+        _wait_for_workers(futures=futures, search_timer=search_timer, worker_stop_event=self._worker_stop_event)
+
+        max_score = -math.inf
+        best_move = None
+        fallback_score = -math.inf
+        fallback_move = None
+        for root_move, future in zip(root_moves, futures):
+            score, alpha_used, search_stats = future.result()
+            search_timer.register_search_made_elsewhere(search_stats=search_stats)
+            if score >= alpha_used and score > max_score:
+                max_score = score
+                best_move = root_move
+            if score > fallback_score:
+                fallback_score = score
+                fallback_move = root_move
+        if best_move is None:  # Only possible if no root move could be scored exactly
+            return fallback_score, fallback_move
+        return max_score, best_move
+
+
+@dataclass(frozen=True)
+class LazySMPSearchTask:
+    """
+    Dataclass storing everything a worker process needs to run its own iterative deepening search in a lazy SMP search.
+
+    Attributes:
+    __________
+    setup_parameters/starting_player_value/playing_grid/previous_mark_index/move_deadline/branch_factor_policy: As for
+    RootMoveSearchTask
+    search_limits: The limits the worker's search is subject to
+    shared_memory_name: The name of the shared memory block holding the shared transposition table
+    transposition_table_entries: The number of entries in the shared transposition table
+    random_seed: The seed for the worker's move order tie-breaks, which is what makes the workers' searches diverge
+    previous_iteration_results: Completed iterations of a search of the same position (e.g. made while pondering),
+    which the worker's iterative deepening continues on from
+    evaluator: As for RootMoveSearchTask
+    """
+    setup_parameters: NoughtsAndCrossesEssentialParameters
+    starting_player_value: int
+    playing_grid: np.ndarray
+    previous_mark_index: np.ndarray | None
+    search_limits: SearchLimits
+    move_deadline: float | None
+    shared_memory_name: str
+    transposition_table_entries: int
+    random_seed: int
+    previous_iteration_results: List[IterationResult]
+    branch_factor_policy: BranchFactorPolicy
+    evaluator: Evaluator = None
+
+
+def _initialise_lazy_smp_worker(worker_stop_event: Event, completed_iteration_results: SimpleQueue) -> None:
+    """
+    Function called once in each worker process when the pool starts, to make the stop event and the queue of completed
+    iterations available.
+    """
+    global _worker_stop_event, _completed_iteration_results
+    _worker_stop_event = worker_stop_event
+    _completed_iteration_results = completed_iteration_results
+
+
+def _send_completed_iteration_result(iteration_result: IterationResult) -> None:
+    """Function called in a lazy SMP worker as each iteration finishes, to send it to the main process if complete."""
+    if iteration_result.completed:
+        _completed_iteration_results.put(iteration_result)
+
+
+def _run_lazy_smp_worker_search(task: LazySMPSearchTask) -> Tuple[List[IterationResult], SearchStats]:
+    """
+    Function run in a worker process to carry out a full iterative deepening search, sharing the transposition table.
+
+    Returns:
+    __________
+    List[IterationResult] - the outcome of each iteration of the worker's iterative deepening
+    SearchStats - the statistics of the worker's search
+    """
+    # Imported here since the minimax module imports this module
+    from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+
+    random.seed(task.random_seed)
+    transposition_table = TranspositionTable.attach_shared(shared_memory_name=task.shared_memory_name,
+                                                           number_of_entries=task.transposition_table_entries)
+    worker_engine = NoughtsAndCrossesMinimax(setup_parameters=task.setup_parameters, search_limits=task.search_limits,
+                                             transposition_table=transposition_table,
+                                             move_ordering_seed=task.random_seed, evaluator=task.evaluator)
+    worker_engine.starting_player_value = task.starting_player_value
+    worker_engine.playing_grid = task.playing_grid
+    worker_engine.previous_mark_index = task.previous_mark_index
+
+    move_budget_seconds = None if task.move_deadline is None else max(task.move_deadline - time.time(), 0)
+    search_timer = SearchTimer(search_limits=task.search_limits, move_budget_seconds=move_budget_seconds,
+                               stop_event=_worker_stop_event)
+    try:
+        iteration_results = worker_engine.get_iteration_results(
+            search_timer=search_timer, previous_iteration_results=task.previous_iteration_results,
+            iteration_callback=_send_completed_iteration_result, branch_factor_policy=task.branch_factor_policy)
+    finally:
+        transposition_table.close()
+    return iteration_results, search_timer.get_search_stats()
+
+
+class LazySMPSearch:
+    """
+    Context manager owning the process pool and shared memory transposition table used to run a lazy SMP search for a
+    single move.
+
+    Instance attributes:
+    __________
+    number_of_processes: The number of worker processes that each run the iterative deepening search
+    transposition_table_entries: The number of entries in the shared transposition table
+    """
+
+    def __init__(self,
+                 number_of_processes: int,
+                 transposition_table_entries: int = TranspositionTableParameters.default_number_of_entries.value):
+        self.number_of_processes = number_of_processes
+        self.transposition_table_entries = transposition_table_entries
+        self._transposition_table: TranspositionTable | None = None
+        self._worker_stop_event: Event = multiprocessing.Event()
+        self._completed_iteration_results: SimpleQueue = multiprocessing.SimpleQueue()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "LazySMPSearch":
+        self._transposition_table = TranspositionTable.create_shared(
+            number_of_entries=self.transposition_table_entries)
+        self._executor = ProcessPoolExecutor(max_workers=self.number_of_processes,
+                                             initializer=_initialise_lazy_smp_worker,
+                                             initargs=(self._worker_stop_event, self._completed_iteration_results))
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._transposition_table.close()
+        self._transposition_table.unlink()
+        self._transposition_table = None
+
+    def get_deepest_iteration_result(self,
+                                     engine: "NoughtsAndCrossesMinimax",
+                                     search_timer: SearchTimer,
+                                     previous_iteration_results: List[IterationResult] | None = None,
+                                     iteration_callback: Callable[[IterationResult], None] | None = None
+                                     ) -> IterationResult | None:
+        """
+        Method to run the iterative deepening search in each of the worker processes and combine the results.
+
+        Parameters:
+        __________
+        engine: The NoughtsAndCrossesMinimax instance the search is being made for, whose branch factor policy the
+        workers search with (so it must already be set for this search)
+        search_timer: The timer of the search in the main process, which the workers' statistics are added to, and
+        whose stop requests are passed on to the workers
+        previous_iteration_results: Completed iterations of a search of the same position (e.g. made while pondering),
+        which every worker continues on from, rather than repeating them
+        iteration_callback: A function called (in the main process) with the first completed iteration at each new
+        depth, as soon as any worker has completed it
+
+        Returns: The deepest completed iteration across all workers (None if no worker completed an iteration). Where
+        several workers completed the same depth, the lowest numbered worker's result is used.
+        """
+        self._worker_stop_event.clear()
+        deepest_published_depth = -1
+
+        def publish_completed_iteration_results() -> None:
+            nonlocal deepest_published_depth
+            while not self._completed_iteration_results.empty():
+                iteration_result = self._completed_iteration_results.get()
+                if iteration_result.search_depth > deepest_published_depth:
+                    deepest_published_depth = iteration_result.search_depth
+                    if iteration_callback is not None:
+                        iteration_callback(iteration_result)
+
+        move_deadline = None if search_timer.move_budget_seconds is None else \
+            time.time() + search_timer.move_budget_seconds - search_timer.elapsed_seconds()
+        tasks = [LazySMPSearchTask(
+            setup_parameters=engine.get_essential_parameters(), starting_player_value=engine.starting_player_value,
+            playing_grid=engine.playing_grid, previous_mark_index=engine.previous_mark_index,
+            search_limits=search_timer.search_limits, move_deadline=move_deadline,
+            shared_memory_name=self._transposition_table.shared_memory.name,
+            transposition_table_entries=self._transposition_table.number_of_entries,
+            random_seed=TranspositionTableParameters.lazy_smp_seed.value + worker_number,
+            previous_iteration_results=list(previous_iteration_results or []),
+            branch_factor_policy=engine.branch_factor_policy, evaluator=engine.evaluator)
+            for worker_number in range(0, self.number_of_processes)]
+
+        futures = [self._executor.submit(_run_lazy_smp_worker_search, task) for task in tasks]
+        _wait_for_workers(futures=futures, search_timer=search_timer, worker_stop_event=self._worker_stop_event,
+                          collect_worker_messages=publish_completed_iteration_results)
+
+        deepest_result: IterationResult | None = None
+        for future in futures:
+            iteration_results, search_stats = future.result()
+            search_timer.register_search_made_elsewhere(search_stats=search_stats)
+            completed_results = [result for result in iteration_results if result.completed]
+            if len(completed_results) == 0:
+                continue
+            worker_deepest_result = completed_results[-1]
+            if deepest_result is None or worker_deepest_result.search_depth > deepest_result.search_depth:
+                deepest_result = worker_deepest_result
+        return deepest_result
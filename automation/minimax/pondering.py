@@ -0,0 +1,132 @@
+"""
+Module defining how the minimax search keeps searching during the opponent's turn (pondering).
+Once the engine has made its move, a background thread searches the positions that the opponent's plausible replies
+lead to, starting with the expected reply (the best move for the opponent found by the engine's own search). The
+iteration results of each pondered position are kept, and the positions searched are stored in the engine's
+transposition table, so that when the opponent's real move arrives the engine can pick up its iterative deepening from
+the deepest iteration already completed, rather than starting cold.
+
+Note that pondering uses a thread rather than a process so that the transposition table does not need to be in shared
+memory. The GIL means the pondering thread competes with the main thread for CPU, but the main thread is mostly idle
+while waiting for the opponent (e.g. a human player in the GUI).
+"""
+
+# Standard library imports
+from dataclasses import replace
+import threading
+from typing import Dict, List
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.evaluator import Evaluator
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+from automation.minimax.search_results import IterationResult
+from automation.minimax.transposition_table import TranspositionTable, get_zobrist_hash
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.constants.game_constants import BoardMarking
+
+
+class Ponderer:
+    """
+    Class owning the background thread that searches the opponent's plausible replies, and the results it finds.
+
+    Instance attributes:
+    __________
+    setup_parameters: The essential parameters of the game being played (including the starting player)
+    playing_grid: The playing grid after the engine's move, i.e. with the opponent to move
+    replies: The opponent's replies to search, in the order they are searched
+    search_limits: The limits of the engine's searches. The wall time, node and clock limits are removed for
+    pondering, which instead runs until it is stopped (or every reply has been searched to the max search depth).
+    move_search_limits: The limits of the engine's searches, as given. Each reply is searched with the branch factor
+    policy that the engine's search of the position will be given under these limits, so that the iterations reused by
+    that search were narrowed in the same way as the ones it goes on to make.
+    transposition_table: The engine's transposition table, which the pondering searches store their positions in
+    evaluator: The engine's evaluator (None for the default evaluation)
+    nodes_per_second: How fast the engine has been measured to search (None if it has not been measured yet)
+    """
+
+    def __init__(self,
+                 setup_parameters: NoughtsAndCrossesEssentialParameters,
+                 playing_grid: np.ndarray,
+                 replies: List[np.ndarray],
+                 search_limits: SearchLimits,
+                 transposition_table: TranspositionTable,
+                 evaluator: Evaluator = None,
+                 nodes_per_second: float | None = None):
+        self.setup_parameters = setup_parameters
+        self.playing_grid = playing_grid.copy()
+        self.replies = replies
+        self.search_limits = replace(search_limits, max_search_seconds=None, max_nodes=None,
+                                     remaining_clock_seconds=None)
+        self.move_search_limits = search_limits
+        self.transposition_table = transposition_table
+        self.evaluator = evaluator
+        self.nodes_per_second = nodes_per_second
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._ponder, daemon=True)
+        self._iteration_results: Dict[int, List[IterationResult]] = {}
+        self._iteration_results_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Method to start pondering in the background."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Method to stop pondering, which blocks until the search in progress has noticed it has been stopped."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def get_iteration_results(self, playing_grid: np.ndarray) -> List[IterationResult]:
+        """
+        Method to get the iterations completed while pondering the given playing grid.
+        Returns: The completed iteration results, which is an empty list if the playing grid was not pondered.
+        """
+        with self._iteration_results_lock:
+            return list(self._iteration_results.get(get_zobrist_hash(playing_grid=playing_grid), []))
+
+    def _ponder(self) -> None:
+        """
+        Method run in the pondering thread, which searches each of the replies in turn until it is stopped.
+        Only fully completed iterations are kept - since the iteration in progress when pondering is stopped is cut
+        short (and the first iteration always runs to the minimum search depth), the final iteration of a search that
+        was stopped is discarded.
+        """
+        # Imported here since the minimax module imports this module
+        from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+
+        for reply in self.replies:
+            if self._stop_event.is_set():
+                return
+            ponder_engine = NoughtsAndCrossesMinimax(setup_parameters=self.setup_parameters,
+                                                     search_limits=self.search_limits,
+                                                     transposition_table=self.transposition_table,
+                                                     evaluator=self.evaluator)
+            ponder_engine.playing_grid = self.playing_grid.copy()
+            ponder_engine.mark_board(marking_index=reply)
+
+            search_timer = SearchTimer(search_limits=self.search_limits, move_budget_seconds=None,
+                                       stop_event=self._stop_event)
+            iteration_results = ponder_engine.get_iteration_results(
+                search_timer=search_timer,
+                branch_factor_policy=self._get_branch_factor_policy(playing_grid=ponder_engine.playing_grid))
+            if self._stop_event.is_set():
+                iteration_results = iteration_results[:-1]
+            completed_results = [result for result in iteration_results if result.completed]
+            with self._iteration_results_lock:
+                self._iteration_results[get_zobrist_hash(playing_grid=ponder_engine.playing_grid)] = completed_results
+
+    def _get_branch_factor_policy(self, playing_grid: np.ndarray) -> BranchFactorPolicy:
+        """
+        Method to get the branch factor policy that the engine's search of the given playing grid is expected to have,
+        from the move budget it will be given and the engine's measured speed.
+        """
+        empty_cell_count = int(np.count_nonzero(playing_grid == BoardMarking.EMPTY.value))
+        return BranchFactorPolicy.for_search(
+            playing_grid=playing_grid, win_length_k=self.setup_parameters.win_length_k,
+            max_search_depth=self.move_search_limits.max_search_depth,
+            move_budget_seconds=self.move_search_limits.get_move_budget_seconds(empty_cell_count),
+            max_nodes=self.move_search_limits.max_nodes, nodes_per_second=self.nodes_per_second)
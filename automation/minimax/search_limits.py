@@ -0,0 +1,212 @@
+"""
+Module defining the limits that a single call to the minimax search is subject to, and the timer that enforces them.
+Limits are passed per call (or per game, via the minimax instance) rather than read from a module level enum, so that
+different games in the same process can be given different budgets.
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+import math
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event as MultiprocessingEvent
+import threading
+import time
+from typing import List
+
+# Local application imports
+from automation.minimax.constants.iterative_deepening_constants import IterativeDeepening, Quiescence, \
+    TimeManagement
+from automation.minimax.search_results import SearchStats, get_cache_hits_and_misses
+
+
+@dataclass(frozen=True)
+class SearchLimits:
+    """
+    Dataclass storing the limits on a minimax search for a single move.
+
+    Attributes:
+    __________
+    max_search_seconds: The wall time that may be spent on a single move (None for no wall time limit)
+    max_search_depth: The deepest iteration of the iterative deepening that will be started
+    minimum_search_depth: The depth that is always completed, regardless of the time and node limits
+    max_nodes: The maximum number of nodes that may be visited during a single move (None for no node limit)
+    remaining_clock_seconds: The time left on the game clock of the player to move (None if the game is not clocked)
+    clock_increment_seconds: The time added to the game clock after each move
+    deadline_check_interval_nodes: The number of nodes searched between each look at the clock
+    quiescence_plies: The number of forced block plies the search may be extended by at its horizon (0 to switch off
+    the quiescence extension)
+    """
+    max_search_seconds: float | None = IterativeDeepening.max_search_seconds.value
+    max_search_depth: int = IterativeDeepening.max_search_depth.value
+    minimum_search_depth: int = IterativeDeepening.minimum_search_depth.value
+    max_nodes: int | None = None
+    remaining_clock_seconds: float | None = None
+    clock_increment_seconds: float = 0
+    deadline_check_interval_nodes: int = IterativeDeepening.deadline_check_interval_nodes.value
+    quiescence_plies: int = Quiescence.max_extension_plies.value
+
+    def get_move_budget_seconds(self, empty_cell_count: int) -> float | None:
+        """
+        Method to determine how long may be spent searching for the next move.
+        When there is a game clock, the remaining time is shared between the moves the player still has to make (at
+        most half of the empty cells), plus most of the increment, and is capped by max_search_seconds.
+
+        Parameters: empty_cell_count - the number of empty cells on the board the search is starting from
+
+        Returns: The number of seconds that may be spent on the move, or None if the search is not limited by time.
+        """
+        if self.remaining_clock_seconds is None:
+            return self.max_search_seconds
+
+        moves_to_go = max((empty_cell_count + 1) // 2, TimeManagement.minimum_moves_to_go.value)
+        usable_clock = max(self.remaining_clock_seconds - TimeManagement.clock_safety_margin_seconds.value, 0)
+        clock_budget = usable_clock / moves_to_go + \
+            self.clock_increment_seconds * TimeManagement.increment_fraction_used.value
+        clock_budget = min(clock_budget, usable_clock)
+        if self.max_search_seconds is None:
+            return clock_budget
+        else:
+            return min(clock_budget, self.max_search_seconds)
+
+
+class SearchTimer:
+    """
+    Class tracking the nodes visited and time elapsed during a single minimax search, against its SearchLimits.
+    The clock is only looked at every deadline_check_interval_nodes nodes, since time.perf_counter() is relatively
+    expensive compared to the work done at most nodes. In between checks, the outcome of the previous check is reused.
+
+    Instance attributes:
+    __________
+    search_limits: The limits the search is subject to
+    move_budget_seconds: The wall time available for the move (None for no wall time limit)
+    start_time: The time at which the search started
+    node_count: The number of nodes visited so far
+    iteration_durations: The wall time taken by each completed iteration of the iterative deepening
+    stop_event: An event that ends the search (as if the budget were exhausted) when set from another thread, e.g. to
+    stop pondering once the opponent has moved, or from another process, e.g. to stop the workers of a parallel search.
+    None if the search can only be ended by its limits.
+    root_alpha: The highest root score (alpha) read from the shared alpha of a parallel root search, which is re-read
+    at every deadline check so that the search can prune against root moves completed by other workers since it
+    started. -inf if the search has no shared alpha.
+    root_alpha_floor: root_alpha lowered to the next representable float, which is the alpha the search may tighten
+    to, so that a move tying with the best root score is still scored exactly
+    search_stats: The statistics counted during the search (see get_search_stats for the complete statistics)
+    """
+
+    def __init__(self,
+                 search_limits: SearchLimits,
+                 move_budget_seconds: float | None,
+                 stop_event: threading.Event | MultiprocessingEvent | None = None,
+                 shared_root_alpha: Synchronized | None = None):
+        self.search_limits = search_limits
+        self.move_budget_seconds = move_budget_seconds
+        self.stop_event = stop_event
+        self.root_alpha = -math.inf
+        self.root_alpha_floor = -math.inf
+        self._shared_root_alpha = shared_root_alpha
+        if shared_root_alpha is not None:
+            self._read_shared_root_alpha()
+        self.start_time = time.perf_counter()
+        self.node_count = 0
+        self.iteration_durations: List[float] = []
+        self.search_stats = SearchStats()
+        self._cache_counts_at_start = get_cache_hits_and_misses()
+        self._deadline = None if move_budget_seconds is None else self.start_time + move_budget_seconds
+        self._nodes_until_deadline_check = search_limits.deadline_check_interval_nodes
+        self._search_limit_reached = False
+
+    def register_node(self) -> None:
+        """
+        Method called once at every node of the search, to count the node and periodically check the deadline.
+        """
+        self.node_count += 1
+        if self.search_limits.max_nodes is not None and self.node_count >= self.search_limits.max_nodes:
+            self._search_limit_reached = True
+        self._nodes_until_deadline_check -= 1
+        if self._nodes_until_deadline_check <= 0:
+            self._nodes_until_deadline_check = self.search_limits.deadline_check_interval_nodes
+            self._check_deadline()
+            if self._shared_root_alpha is not None:
+                self._read_shared_root_alpha()
+
+    def register_search_made_elsewhere(self, search_stats: SearchStats) -> None:
+        """
+        Method to add the statistics of a search made on behalf of this search (e.g. by a worker process) to this
+        search's statistics, including adding its nodes to the node count. The deadline is also checked, since this
+        search visits no nodes of its own while the other search is being made.
+        """
+        self.node_count += search_stats.nodes_visited
+        self.search_stats.add_counts(search_stats)
+        if self.search_limits.max_nodes is not None and self.node_count >= self.search_limits.max_nodes:
+            self._search_limit_reached = True
+        self._check_deadline()
+
+    def get_search_stats(self) -> SearchStats:
+        """
+        Method to complete the statistics of the search so far, with the node count, timings and the cache lookups
+        made in this process since the search started.
+        """
+        cache_counts = get_cache_hits_and_misses()
+        self.search_stats.nodes_visited = self.node_count
+        self.search_stats.iteration_durations = list(self.iteration_durations)
+        self.search_stats.search_seconds = self.elapsed_seconds()
+        self.search_stats.evaluation_cache_hits += cache_counts[0] - self._cache_counts_at_start[0]
+        self.search_stats.evaluation_cache_misses += cache_counts[1] - self._cache_counts_at_start[1]
+        self.search_stats.win_check_cache_hits += cache_counts[2] - self._cache_counts_at_start[2]
+        self.search_stats.win_check_cache_misses += cache_counts[3] - self._cache_counts_at_start[3]
+        self._cache_counts_at_start = cache_counts  # So that calling this method again does not double count
+        return self.search_stats
+
+    def stop_requested(self) -> bool:
+        """Method returning whether the search has been stopped by its stop event (rather than by its limits)."""
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def search_limit_reached(self) -> bool:
+        """Method returning whether the time or node budget was exhausted, as of the last check."""
+        return self._search_limit_reached
+
+    def elapsed_seconds(self) -> float:
+        """Method returning the wall time elapsed since the search started."""
+        return time.perf_counter() - self.start_time
+
+    def record_completed_iteration(self, iteration_start_time: float) -> None:
+        """
+        Method to record the duration of an iteration of the iterative deepening, which is used to predict how long
+        the next iteration will take. The deadline is also checked, since the end of an iteration is a natural point.
+        """
+        self.iteration_durations.append(time.perf_counter() - iteration_start_time)
+        self._check_deadline()
+
+    def next_iteration_predicted_to_overrun(self) -> bool:
+        """
+        Method to predict whether starting another (deeper) iteration would overrun the budget. The next iteration is
+        predicted to take as much longer than the last iteration, as the last did than the one before it.
+
+        Returns: True if the next iteration should not be started.
+        """
+        if self._search_limit_reached:
+            return True
+        elif self._deadline is None or len(self.iteration_durations) == 0:
+            return False
+
+        last_duration = self.iteration_durations[-1]
+        if len(self.iteration_durations) >= 2 and self.iteration_durations[-2] > 0:
+            growth_factor = max(last_duration / self.iteration_durations[-2], 1)
+        else:
+            growth_factor = TimeManagement.default_iteration_growth_factor.value
+        predicted_finish_time = time.perf_counter() + last_duration * growth_factor
+        return predicted_finish_time > self._deadline
+
+    def _check_deadline(self) -> None:
+        """Method to look at the clock (and stop event) and record whether the search must end."""
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            self._search_limit_reached = True
+        elif self.stop_event is not None and self.stop_event.is_set():
+            self._search_limit_reached = True
+
+    def _read_shared_root_alpha(self) -> None:
+        """Method to read the shared root alpha, which only ever tightens the alpha the search prunes against."""
+        shared_root_alpha = self._shared_root_alpha.value
+        if shared_root_alpha > self.root_alpha:
+            self.root_alpha = shared_root_alpha
+            self.root_alpha_floor = math.nextafter(shared_root_alpha, -math.inf)
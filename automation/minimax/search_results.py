@@ -0,0 +1,149 @@
+"""Module defining the structures that the results of a minimax search are returned in."""
+
+# Standard library imports
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.iterative_deepening_constants import SearchStopReason
+from automation.minimax.evaluate_non_terminal_board import get_evaluation_cache_info
+from game.app.win_check_location_search import win_check_and_location_search
+
+
+@dataclass(frozen=True)
+class IterationResult:
+    """
+    Dataclass storing the outcome of a single iteration of the iterative deepening.
+
+    Attributes:
+    __________
+    search_depth: The maximum search depth of the iteration
+    score: The score of the best move found in the iteration, from the maximising player's perspective
+    move: The best move found in the iteration
+    completed: False if the iteration was cut short by the search limits, so its result is only partial
+    duration_seconds: The wall time the iteration took
+    """
+    search_depth: int
+    score: int | float
+    move: np.ndarray | None
+    completed: bool
+    duration_seconds: float
+
+
+@dataclass
+class SearchStats:
+    """
+    Dataclass storing statistics on a single search for a move, which are used to tune the search parameters (e.g. the
+    IterativeDeepening values and branch factors).
+
+    Attributes:
+    __________
+    nodes_visited: The number of nodes visited (including those visited by any worker processes)
+    leaves_evaluated: The number of non-terminal boards that were statically evaluated
+    quiescence_nodes: The number of boards at or beyond the search horizon checked for immediate wins and forced blocks
+    terminal_hits: The number of won or drawn boards reached
+    cutoffs_per_depth: The number of alpha-beta cut offs made at each search depth
+    depth_completed: The max search depth of the deepest completed iteration
+    iteration_durations: The wall time taken by each iteration of the iterative deepening
+    search_seconds: The wall time taken by the whole search
+    stop_reason: Why the iterative deepening stopped
+    transposition_probes/transposition_hits: How often the transposition table was looked in, and held the position
+    transposition_cut_offs: How often a transposition table entry was used in place of searching a position
+    evaluation_cache_hits/evaluation_cache_misses: Lookups of the evaluate_non_terminal_board cache
+    win_check_cache_hits/win_check_cache_misses: Lookups of the win_check_and_location_search cache
+    solver_nodes/solver_seconds: The nodes expanded and wall time spent by the proof-number search trying to solve the
+    position (these nodes are not included in nodes_visited)
+    """
+    nodes_visited: int = 0
+    leaves_evaluated: int = 0
+    quiescence_nodes: int = 0
+    terminal_hits: int = 0
+    cutoffs_per_depth: Dict[int, int] = field(default_factory=dict)
+    depth_completed: int = 0
+    iteration_durations: List[float] = field(default_factory=list)
+    search_seconds: float = 0
+    stop_reason: SearchStopReason | None = None
+    transposition_probes: int = 0
+    transposition_hits: int = 0
+    transposition_cut_offs: int = 0
+    evaluation_cache_hits: int = 0
+    evaluation_cache_misses: int = 0
+    win_check_cache_hits: int = 0
+    win_check_cache_misses: int = 0
+    solver_nodes: int = 0
+    solver_seconds: float = 0
+
+    # Counts that are summed when combining the statistics of searches made elsewhere (e.g. in worker processes)
+    _summed_counts = ("leaves_evaluated", "quiescence_nodes", "terminal_hits", "transposition_probes", "transposition_hits",
+                      "transposition_cut_offs", "evaluation_cache_hits", "evaluation_cache_misses",
+                      "win_check_cache_hits", "win_check_cache_misses", "solver_nodes", "solver_seconds")
+
+    def record_cutoff(self, search_depth: int) -> None:
+        """Method to count an alpha-beta cut off at the given search depth."""
+        self.cutoffs_per_depth[search_depth] = self.cutoffs_per_depth.get(search_depth, 0) + 1
+
+    def add_counts(self, other: "SearchStats") -> None:
+        """
+        Method to add the counts of a search made on behalf of this search (e.g. by a worker process) to this search's
+        counts. Note that the node count is not included, since it is tracked by the SearchTimer.
+        """
+        for count_name in self._summed_counts:
+            setattr(self, count_name, getattr(self, count_name) + getattr(other, count_name))
+        for search_depth, cutoff_count in other.cutoffs_per_depth.items():
+            self.cutoffs_per_depth[search_depth] = self.cutoffs_per_depth.get(search_depth, 0) + cutoff_count
+        if self.stop_reason is None:
+            self.stop_reason = other.stop_reason
+
+    @property
+    def effective_branching_factor(self) -> float:
+        """The branching factor of a uniform tree with the same number of nodes, to the depth completed"""
+        if self.depth_completed <= 0 or self.nodes_visited <= 1:
+            return 0
+        return self.nodes_visited ** (1 / self.depth_completed)
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes_visited / self.search_seconds if self.search_seconds > 0 else 0
+
+    @property
+    def transposition_hit_rate(self) -> float:
+        return self.transposition_hits / self.transposition_probes if self.transposition_probes > 0 else 0
+
+    @property
+    def evaluation_cache_hit_rate(self) -> float:
+        lookups = self.evaluation_cache_hits + self.evaluation_cache_misses
+        return self.evaluation_cache_hits / lookups if lookups > 0 else 0
+
+    @property
+    def win_check_cache_hit_rate(self) -> float:
+        lookups = self.win_check_cache_hits + self.win_check_cache_misses
+        return self.win_check_cache_hits / lookups if lookups > 0 else 0
+
+    def to_dict(self) -> Dict[str, int | float | str | None]:
+        """
+        Method to flatten the statistics into a dictionary of scalars (e.g. to form one row of a DataFrame), including
+        the derived rates. The cut offs are reported as a total, and the iteration durations as a count.
+        """
+        stats_dict = {stats_field.name: getattr(self, stats_field.name) for stats_field in fields(self)}
+        stats_dict["cutoffs"] = sum(stats_dict.pop("cutoffs_per_depth").values())
+        stats_dict["iterations"] = len(stats_dict.pop("iteration_durations"))
+        stats_dict["stop_reason"] = None if self.stop_reason is None else self.stop_reason.name
+        stats_dict["effective_branching_factor"] = self.effective_branching_factor
+        stats_dict["nodes_per_second"] = self.nodes_per_second
+        stats_dict["transposition_hit_rate"] = self.transposition_hit_rate
+        stats_dict["evaluation_cache_hit_rate"] = self.evaluation_cache_hit_rate
+        stats_dict["win_check_cache_hit_rate"] = self.win_check_cache_hit_rate
+        return stats_dict
+
+
+def get_cache_hits_and_misses() -> Tuple[int, int, int, int]:
+    """
+    Function to get the cumulative hits and misses of the caches used during the search, in the current process.
+    Returns: evaluation cache hits, evaluation cache misses, win check cache hits, win check cache misses
+    """
+    evaluation_cache_info = get_evaluation_cache_info()
+    return evaluation_cache_info.hits, evaluation_cache_info.misses, \
+        win_check_and_location_search.hits, win_check_and_location_search.misses
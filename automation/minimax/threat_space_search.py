@@ -0,0 +1,223 @@
+"""
+Module defining the threat-space search, which looks for a forced win for the player to move (the attacker) before the
+main minimax search is made. This is only worthwhile for larger win lengths (e.g. k=5 on a 10x10 board), where forced
+wins can be many plies long but the main search is limited to a small branch factor beyond search depth 1.
+
+The search only considers the attacker's forcing moves:
+- Fours (victory by continuous fours, VCF), which leave a cell the attacker wins on next turn, so the defender has
+exactly one move - the block (unless the defender can win first).
+- Threes (victory by continuous threats, VCT), which leave a cell that would give the attacker two winning cells at
+once. The defender has more options here, so every move that could stop the follow-up is searched - the empty cells of
+the windows involved, and any fours of the defender's own.
+Since the branching factor of these sequences is tiny, they can be searched far deeper than the main tree. A win is
+only reported if it is proven against every defence, so the move found can be played without any further search.
+"""
+
+# Standard library imports
+import time
+from typing import Dict, List, Set, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.threat_space_search_constants import ThreatSpaceSearchParameters
+from automation.minimax.search_limits import SearchTimer
+from game.app.board_windows import get_window_indices
+from game.constants.game_constants import BoardMarking
+
+
+class _SearchBudgetExhausted(Exception):
+    """Raised to abandon the threat-space search once its node budget (or the search limits) have been used up"""
+    pass
+
+
+class ThreatSpaceSearch:
+    """
+    Class to search for a forced win on a single playing grid, for the player to move.
+
+    Instance attributes:
+    __________
+    playing_grid: The playing grid the attacker is about to move on
+    win_length_k: The length of streak needed to win
+    attacker_mark_value: The BoardMarking value of the player to move
+    search_timer: The timer of the search for the move, which the threat-space search's nodes count towards
+    max_nodes: The node budget of the threat-space search
+    Note that the threat-space search is also limited to a fraction of the move's time budget, so that most of the
+    time is left for the main search when no forced win is found.
+    """
+
+    def __init__(self,
+                 playing_grid: np.ndarray,
+                 win_length_k: int,
+                 attacker_mark_value: int,
+                 search_timer: SearchTimer,
+                 max_nodes: int = ThreatSpaceSearchParameters.max_nodes.value):
+        self.playing_grid = playing_grid
+        self.win_length_k = win_length_k
+        self.attacker_mark_value = attacker_mark_value
+        self.search_timer = search_timer
+        self.max_nodes = max_nodes
+        self._window_indices = get_window_indices(*playing_grid.shape, win_length_k)
+        self._node_count = 0
+        if search_timer.move_budget_seconds is None:
+            self._deadline = None
+        else:
+            self._deadline = time.perf_counter() + search_timer.move_budget_seconds * \
+                ThreatSpaceSearchParameters.max_fraction_of_move_budget.value
+        self._refuted_positions: Set[Tuple[bytes, int, int]] = set()
+
+    def find_winning_move(self) -> Tuple[np.ndarray, int] | None:
+        """
+        Method to search for a forced win, first using fours only, and then also allowing threes.
+
+        Returns: The first move of the forced win and the number of plies until the attacker wins (including the
+        first move), or None if no forced win was found within the budget.
+        """
+        flat_grid = self.playing_grid.ravel().copy()
+        try:
+            for max_three_moves in (0, ThreatSpaceSearchParameters.max_three_moves.value):
+                plies_to_win, flat_move = self._search_attacker_move(
+                    flat_grid=flat_grid, three_moves_left=max_three_moves,
+                    attacker_moves_left=ThreatSpaceSearchParameters.max_attacker_moves.value)
+                if flat_move is not None:
+                    return np.array(np.unravel_index(flat_move, self.playing_grid.shape)), plies_to_win
+        except _SearchBudgetExhausted:
+            pass
+        return None
+
+    def _search_attacker_move(self, flat_grid: np.ndarray, three_moves_left: int,
+                              attacker_moves_left: int) -> Tuple[int, int | None]:
+        """
+        Method to search the attacker's forcing moves on the given (flat) grid, with the attacker to move.
+        Returns: The number of plies until the attacker wins and the winning move, or (0, None) if there is no win.
+        """
+        self._register_node()
+        attacker_wins = self._get_winning_cells(flat_grid=flat_grid, mark_value=self.attacker_mark_value)
+        if len(attacker_wins) > 0:
+            return 1, attacker_wins[0]
+        defender_wins = self._get_winning_cells(flat_grid=flat_grid, mark_value=-self.attacker_mark_value)
+        if len(defender_wins) >= 2 or attacker_moves_left == 0:
+            return 0, None
+        position_key = (flat_grid.tobytes(), three_moves_left, attacker_moves_left)
+        if position_key in self._refuted_positions:
+            return 0, None
+
+        four_moves = self._get_cells_completing_windows(
+            flat_grid=flat_grid, mark_value=self.attacker_mark_value, mark_count=self.win_length_k - 2)
+        if len(defender_wins) == 1:  # The attacker has to block, which only continues the attack if it is a threat
+            candidate_moves = list(defender_wins)
+        elif three_moves_left > 0:
+            three_moves = self._get_cells_completing_windows(
+                flat_grid=flat_grid, mark_value=self.attacker_mark_value, mark_count=self.win_length_k - 3)
+            candidate_moves = four_moves + [move for move in three_moves if move not in four_moves]
+        else:
+            candidate_moves = four_moves
+
+        for move in candidate_moves:
+            next_three_moves_left = three_moves_left if move in four_moves else three_moves_left - 1
+            if next_three_moves_left < 0:
+                continue
+            flat_grid[move] = self.attacker_mark_value
+            plies_to_win = self._search_defender_replies(flat_grid=flat_grid, three_moves_left=next_three_moves_left,
+                                                         attacker_moves_left=attacker_moves_left - 1)
+            flat_grid[move] = BoardMarking.EMPTY.value
+            if plies_to_win > 0:
+                return plies_to_win + 1, move
+        self._refuted_positions.add(position_key)
+        return 0, None
+
+    def _search_defender_replies(self, flat_grid: np.ndarray, three_moves_left: int, attacker_moves_left: int) -> int:
+        """
+        Method to search every defence that could stop the attacker's threat, with the defender to move.
+        Returns: The number of plies until the attacker wins against the best defence, or 0 if there is a defence.
+        """
+        self._register_node()
+        if len(self._get_winning_cells(flat_grid=flat_grid, mark_value=-self.attacker_mark_value)) > 0:
+            return 0  # The defender wins first
+        attacker_wins = self._get_winning_cells(flat_grid=flat_grid, mark_value=self.attacker_mark_value)
+        if len(attacker_wins) >= 2:
+            return 2  # The defender can only block one of the wins
+        elif len(attacker_wins) == 1:
+            defender_replies = list(attacker_wins)
+        else:
+            defender_replies = self._get_defences_to_double_threats(flat_grid=flat_grid)
+            if len(defender_replies) == 0:
+                return 0  # The attacker made no threat, so the defender has a free move
+            defender_fours = self._get_cells_completing_windows(
+                flat_grid=flat_grid, mark_value=-self.attacker_mark_value, mark_count=self.win_length_k - 2)
+            defender_replies += [move for move in defender_fours if move not in defender_replies]
+
+        longest_plies_to_win = 0
+        for reply in defender_replies:
+            flat_grid[reply] = -self.attacker_mark_value
+            plies_to_win, _ = self._search_attacker_move(flat_grid=flat_grid, three_moves_left=three_moves_left,
+                                                         attacker_moves_left=attacker_moves_left)
+            flat_grid[reply] = BoardMarking.EMPTY.value
+            if plies_to_win == 0:
+                return 0
+            longest_plies_to_win = max(longest_plies_to_win, plies_to_win)
+        return longest_plies_to_win + 1
+
+    # Methods looking up the windows of the board
+    def _get_window_counts(self, flat_grid: np.ndarray, mark_value: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Method to count the marks in each window.
+        Returns: The window values, the count of the given player's marks, and the count of their opponent's marks.
+        """
+        window_values = flat_grid[self._window_indices]
+        own_counts = np.count_nonzero(window_values == mark_value, axis=1)
+        opponent_counts = np.count_nonzero(window_values == -mark_value, axis=1)
+        return window_values, own_counts, opponent_counts
+
+    def _get_winning_cells(self, flat_grid: np.ndarray, mark_value: int) -> List[int]:
+        """Method to get the flat indices of the cells the given player would win on immediately"""
+        return self._get_cells_completing_windows(flat_grid=flat_grid, mark_value=mark_value,
+                                                  mark_count=self.win_length_k - 1)
+
+    def _get_cells_completing_windows(self, flat_grid: np.ndarray, mark_value: int, mark_count: int) -> List[int]:
+        """
+        Method to get the empty cells of the windows that hold mark_count of the given player's marks and none of
+        their opponent's, i.e. the cells that take the player one mark closer to completing a window.
+        Returns: The flat indices of the cells, most frequently occurring (i.e. most promising) first.
+        """
+        window_values, own_counts, opponent_counts = self._get_window_counts(flat_grid=flat_grid, mark_value=mark_value)
+        open_windows = (own_counts == mark_count) & (opponent_counts == 0)
+        open_window_indices = self._window_indices[open_windows]
+        empty_cells = open_window_indices[window_values[open_windows] == BoardMarking.EMPTY.value]
+        cells, cell_counts = np.unique(empty_cells, return_counts=True)
+        return [int(cell) for cell in cells[np.argsort(-cell_counts, kind="stable")]]
+
+    def _get_defences_to_double_threats(self, flat_grid: np.ndarray) -> List[int]:
+        """
+        Method to find the attacker's double threats - the cells that would give the attacker two different winning
+        cells at once - and return every cell the defender could play to stop them, which are the empty cells of the
+        windows making up the double threats.
+        Returns: The flat indices of the defending cells (an empty list if the attacker has no double threat).
+        """
+        window_values, own_counts, opponent_counts = self._get_window_counts(
+            flat_grid=flat_grid, mark_value=self.attacker_mark_value)
+        open_windows = (own_counts == self.win_length_k - 2) & (opponent_counts == 0)
+        winning_cells_given_move: Dict[int, Set[int]] = {}
+        windows_given_move: Dict[int, List[np.ndarray]] = {}
+        for window_indices, window_values_row in zip(self._window_indices[open_windows], window_values[open_windows]):
+            empty_cells = window_indices[window_values_row == BoardMarking.EMPTY.value]
+            for cell, other_cell in ((empty_cells[0], empty_cells[1]), (empty_cells[1], empty_cells[0])):
+                winning_cells_given_move.setdefault(int(cell), set()).add(int(other_cell))
+                windows_given_move.setdefault(int(cell), []).append(empty_cells)
+
+        defences: List[int] = []
+        for cell, winning_cells in winning_cells_given_move.items():
+            if len(winning_cells) >= 2:
+                for empty_cells in windows_given_move[cell]:
+                    defences += [int(empty_cell) for empty_cell in empty_cells if int(empty_cell) not in defences]
+        return defences
+
+    def _register_node(self) -> None:
+        """Method to count a node of the search, and abandon the search if the budget has been used up"""
+        self._node_count += 1
+        self.search_timer.register_node()
+        if self._node_count > self.max_nodes or self.search_timer.search_limit_reached():
+            raise _SearchBudgetExhausted
+        elif self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchBudgetExhausted
@@ -0,0 +1,187 @@
+"""
+Module defining the transposition table used by the minimax search, and the zobrist hashing used to key it.
+
+The table is a fixed size numpy array of (check, data) uint64 pairs. The data of an entry is packed into a single
+uint64 and the check is the position's zobrist key XOR'd with the data. This means that the table can be written to by
+several processes at once without any locking: an entry that has been torn by two simultaneous writes fails the check
+and is simply treated as a miss. The array can be backed by shared memory, so that the same table can be used by all
+the worker processes of a lazy SMP search.
+
+Note that in a game of noughts and crosses, every path to a given position from the root of the search has the same
+length (one mark is made per move). The scores stored are only reused at the same search depth and for the same
+maximising player they were stored for, which means the depth penalties in the board scores are always consistent.
+"""
+
+# Standard library imports
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.transposition_table_constants import TranspositionEntryFlag, \
+    TranspositionTableParameters
+from game.constants.game_constants import BoardMarking
+
+# Bit layout of the packed entry data
+_SCORE_BITS = 32
+_SCORE_OFFSET = 2 ** 31
+_MOVE_SHIFT = 32
+_NO_MOVE = 0xFFF
+_SEARCH_DEPTH_SHIFT = 44
+_REMAINING_DEPTH_SHIFT = 51
+_DEPTH_MASK = 0x7F
+_FLAG_SHIFT = 58
+_MAXIMISER_IS_X_SHIFT = 60
+_OCCUPIED_SHIFT = 61
+
+
+class TranspositionEntry(NamedTuple):
+    """The unpacked contents of a single transposition table entry"""
+    score: int
+    best_move_index: int | None  # The flat index of the best move found at the position
+    search_depth: int  # The depth from the root of the search at which the entry was stored
+    remaining_depth: int  # The number of plies that were searched below the position
+    flag: TranspositionEntryFlag
+    maximiser_mark_value: int  # The BoardMarking value of the maximising player when the entry was stored
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(game_rows_m: int, game_cols_n: int) -> np.ndarray:
+    """
+    Function to get the zobrist keys for a board of the given shape, as a (2, m * n) uint64 array - row 0 holds the key
+    for an X in each (flat) cell and row 1 the key for an O. A fixed seed is used, so that every process derives the
+    same keys, which is what allows the transposition table to be shared.
+    """
+    random_generator = np.random.default_rng(TranspositionTableParameters.zobrist_seed.value)
+    return random_generator.integers(low=1, high=2 ** 63, size=(2, game_rows_m * game_cols_n), dtype=np.uint64)
+
+
+def get_zobrist_hash(playing_grid: np.ndarray) -> int:
+    """
+    Function to get the zobrist hash of a playing grid - the XOR of the keys of all the marked cells.
+    Note that this is a two-dimensional function.
+    """
+    zobrist_keys = get_zobrist_keys(*playing_grid.shape)
+    flat_grid = playing_grid.ravel()
+    x_hash = np.bitwise_xor.reduce(zobrist_keys[0][flat_grid == BoardMarking.X.value])
+    o_hash = np.bitwise_xor.reduce(zobrist_keys[1][flat_grid == BoardMarking.O.value])
+    return int(x_hash) ^ int(o_hash)
+
+
+class TranspositionTable:
+    """
+    Class for a fixed size transposition table, optionally backed by shared memory.
+
+    Instance attributes:
+    __________
+    number_of_entries: The number of entries in the table (a power of 2)
+    shared_memory: The shared memory block backing the table, or None if the table is local to the process
+    """
+
+    def __init__(self,
+                 number_of_entries: int = TranspositionTableParameters.default_number_of_entries.value,
+                 shared_memory: SharedMemory | None = None):
+        self.number_of_entries = 1 << max(int(number_of_entries) - 1, 1).bit_length()
+        self.shared_memory = shared_memory
+        if shared_memory is None:
+            self._table = np.zeros(shape=(self.number_of_entries, 2), dtype=np.uint64)
+        else:
+            self._table = np.ndarray(shape=(self.number_of_entries, 2), dtype=np.uint64, buffer=shared_memory.buf)
+        self._index_mask = self.number_of_entries - 1
+
+    @classmethod
+    def create_shared(cls, number_of_entries: int = TranspositionTableParameters.default_number_of_entries.value
+                      ) -> "TranspositionTable":
+        """Method to create a new, empty table in a new shared memory block (which the creator must unlink)."""
+        rounded_number_of_entries = 1 << max(int(number_of_entries) - 1, 1).bit_length()
+        shared_memory = SharedMemory(create=True, size=rounded_number_of_entries * 16)
+        table = cls(number_of_entries=rounded_number_of_entries, shared_memory=shared_memory)
+        table._table[:] = 0
+        return table
+
+    @classmethod
+    def attach_shared(cls, shared_memory_name: str, number_of_entries: int) -> "TranspositionTable":
+        """Method to attach to a table that has already been created in shared memory (e.g. by another process)."""
+        return cls(number_of_entries=number_of_entries, shared_memory=SharedMemory(name=shared_memory_name))
+
+    def close(self) -> None:
+        """Method to close this process's access to the shared memory backing the table (if any)."""
+        if self.shared_memory is not None:
+            self._table = None
+            self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """Method to free the shared memory backing the table - only to be called by the process that created it."""
+        if self.shared_memory is not None:
+            self.shared_memory.unlink()
+
+    def clear(self) -> None:
+        """Method to empty the table."""
+        self._table[:] = 0
+
+    def probe(self, position_hash: int) -> TranspositionEntry | None:
+        """
+        Method to look up the entry stored for the position with the given zobrist hash.
+        Returns: The entry, or None if there is no (intact) entry for the position.
+        """
+        table_index = position_hash & self._index_mask
+        check = int(self._table[table_index, 0])
+        data = int(self._table[table_index, 1])
+        if check ^ data != position_hash or not (data >> _OCCUPIED_SHIFT) & 1:
+            return None
+        return self._unpack_data(data=data)
+
+    def store(self,
+              position_hash: int,
+              score: int | float,
+              best_move_index: int | None,
+              search_depth: int,
+              remaining_depth: int,
+              flag: TranspositionEntryFlag,
+              maximiser_mark_value: int) -> None:
+        """
+        Method to store the outcome of searching a position. An existing entry for the same position is only replaced
+        if the new entry was searched at least as deeply, whereas an entry for a different position is always replaced.
+        """
+        table_index = position_hash & self._index_mask
+        existing_check = int(self._table[table_index, 0])
+        existing_data = int(self._table[table_index, 1])
+        if existing_check ^ existing_data == position_hash and \
+                ((existing_data >> _REMAINING_DEPTH_SHIFT) & _DEPTH_MASK) > remaining_depth:
+            return
+
+        data = self._pack_data(score=score, best_move_index=best_move_index, search_depth=search_depth,
+                               remaining_depth=remaining_depth, flag=flag, maximiser_mark_value=maximiser_mark_value)
+        self._table[table_index, 1] = data
+        self._table[table_index, 0] = position_hash ^ data
+
+    @staticmethod
+    def _pack_data(score: int | float, best_move_index: int | None, search_depth: int, remaining_depth: int,
+                   flag: TranspositionEntryFlag, maximiser_mark_value: int) -> int:
+        """Method to pack the data of an entry into a single 64 bit integer."""
+        move_bits = _NO_MOVE if best_move_index is None else best_move_index
+        maximiser_is_x = 1 if maximiser_mark_value == BoardMarking.X.value else 0
+        return (int(score) + _SCORE_OFFSET) | \
+            (move_bits << _MOVE_SHIFT) | \
+            (min(search_depth, _DEPTH_MASK) << _SEARCH_DEPTH_SHIFT) | \
+            (min(remaining_depth, _DEPTH_MASK) << _REMAINING_DEPTH_SHIFT) | \
+            (flag.value << _FLAG_SHIFT) | \
+            (maximiser_is_x << _MAXIMISER_IS_X_SHIFT) | \
+            (1 << _OCCUPIED_SHIFT)
+
+    @staticmethod
+    def _unpack_data(data: int) -> TranspositionEntry:
+        """Method to unpack the 64 bit data of an entry."""
+        move_bits = (data >> _MOVE_SHIFT) & 0xFFF
+        maximiser_is_x = (data >> _MAXIMISER_IS_X_SHIFT) & 1
+        return TranspositionEntry(
+            score=(data & ((1 << _SCORE_BITS) - 1)) - _SCORE_OFFSET,
+            best_move_index=None if move_bits == _NO_MOVE else move_bits,
+            search_depth=(data >> _SEARCH_DEPTH_SHIFT) & _DEPTH_MASK,
+            remaining_depth=(data >> _REMAINING_DEPTH_SHIFT) & _DEPTH_MASK,
+            flag=TranspositionEntryFlag((data >> _FLAG_SHIFT) & 0b11),
+            maximiser_mark_value=BoardMarking.X.value if maximiser_is_x else BoardMarking.O.value
+        )
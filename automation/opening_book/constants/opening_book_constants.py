@@ -0,0 +1,10 @@
+"""Module to define the constants used to build and probe the opening books."""
+
+# Standard library imports
+from enum import Enum
+
+
+class OpeningBookParameters(Enum):
+    """Enum defining the default parameters of an opening book."""
+    max_plies = 4  # The book holds the positions before each of the first max_plies moves of a game
+    min_games = 5  # The number of simulated games a move must have been played in for it to be considered
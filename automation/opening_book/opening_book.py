@@ -0,0 +1,112 @@
+"""
+Module defining the opening books - tables of the best known move in each of the early positions of a game, which the
+minimax engine plays instead of searching. Early moves on a large board are where a search budget buys the least,
+since the evaluation of a near empty board says little about who is winning.
+
+Positions are stored as their canonical variant (see board_symmetries), as if X had started the game, so that a single
+entry covers every symmetric variant of a position and either starting player. Moves are stored as flat indices into
+the canonical variant, and mapped back onto the board they are looked up for.
+
+On disk, a book is a compressed numpy archive holding one row per position - its canonical marks, book move, score
+and the number of games the score is based on.
+"""
+
+# Standard library imports
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_symmetries import get_canonical_marks, get_x_started_marks
+from game.constants.game_constants import BoardMarking
+from root_directory import ROOT_PATH
+
+DEFAULT_OPENING_BOOK_DIRECTORY = ROOT_PATH / "automation" / "opening_book" / "opening_book_files"
+
+
+class OpeningBookEntry(NamedTuple):
+    """The book move of a position, and how good it is known to be"""
+    move_index: int  # The flat index of the move, in the canonical variant of the position
+    score: float  # The score of the move for the player to move, on the same scale as the minimax scores
+    games: int  # The number of simulated games the score is based on (0 if it comes from a search)
+
+
+def get_opening_book_path(game_rows_m: int, game_cols_n: int, win_length_k: int,
+                          opening_book_directory: Path = DEFAULT_OPENING_BOOK_DIRECTORY) -> Path:
+    """Function to get the path of the opening book file of the given game"""
+    return opening_book_directory / f"{game_rows_m}_{game_cols_n}_{win_length_k}_opening_book.npz"
+
+
+class OpeningBook:
+    """
+    Class for an opening book of a game.
+
+    Instance attributes:
+    __________
+    game_rows_m/game_cols_n/win_length_k: The structure of the game the book is for
+    max_plies: The book is only probed for the positions before each of the first max_plies moves of a game
+    entries: The book entries, keyed by the bytes of the canonical marks of each position
+    """
+
+    def __init__(self, game_rows_m: int, game_cols_n: int, win_length_k: int, max_plies: int,
+                 entries: Dict[bytes, OpeningBookEntry]):
+        self.game_rows_m = game_rows_m
+        self.game_cols_n = game_cols_n
+        self.win_length_k = win_length_k
+        self.max_plies = max_plies
+        self.entries = entries
+        self._board_shape = (game_rows_m, game_cols_n)
+
+    def probe(self, playing_grid: np.ndarray, player_to_move_value: int) -> OpeningBookEntry | None:
+        """
+        Method to look up the book move of a position.
+        Returns: The book entry of the position, with the move index mapped back onto the playing grid, or None if the
+        position is not in the book (or is beyond the plies the book covers).
+        """
+        if np.count_nonzero(playing_grid != BoardMarking.EMPTY.value) >= self.max_plies:
+            return None
+        marks = get_x_started_marks(playing_grid=playing_grid, player_to_move_value=player_to_move_value)
+        canonical_marks, permutation = get_canonical_marks(flat_marks=marks, board_shape=self._board_shape)
+        entry = self.entries.get(canonical_marks.tobytes())
+        if entry is None:
+            return None
+        return entry._replace(move_index=int(permutation[entry.move_index]))
+
+    def save(self, opening_book_path: Path) -> None:
+        """Method to save the book to file, as a compressed numpy archive."""
+        opening_book_path.parent.mkdir(parents=True, exist_ok=True)
+        positions = np.array([np.frombuffer(key, dtype=np.int8) for key in self.entries], dtype=np.int8).reshape(
+            len(self.entries), self.game_rows_m * self.game_cols_n)
+        np.savez_compressed(
+            opening_book_path,
+            game_structure=np.array([self.game_rows_m, self.game_cols_n, self.win_length_k, self.max_plies]),
+            positions=positions,
+            move_indices=np.array([entry.move_index for entry in self.entries.values()], dtype=np.int16),
+            scores=np.array([entry.score for entry in self.entries.values()], dtype=np.float64),
+            games=np.array([entry.games for entry in self.entries.values()], dtype=np.int32))
+
+    @classmethod
+    def load(cls, opening_book_path: Path) -> "OpeningBook":
+        """Method to load a book that has been saved to file."""
+        with np.load(opening_book_path) as book_arrays:
+            game_rows_m, game_cols_n, win_length_k, max_plies = (int(value) for value in book_arrays["game_structure"])
+            entries = {position.tobytes(): OpeningBookEntry(move_index=int(move_index), score=float(score),
+                                                            games=int(games))
+                       for position, move_index, score, games in zip(
+                    book_arrays["positions"], book_arrays["move_indices"], book_arrays["scores"],
+                    book_arrays["games"])}
+        return cls(game_rows_m=game_rows_m, game_cols_n=game_cols_n, win_length_k=win_length_k, max_plies=max_plies,
+                   entries=entries)
+
+    @classmethod
+    def load_if_generated(cls, game_rows_m: int, game_cols_n: int, win_length_k: int,
+                          opening_book_directory: Path = DEFAULT_OPENING_BOOK_DIRECTORY) -> "OpeningBook | None":
+        """Method to load the opening book of the given game, or get None if it has not been built."""
+        opening_book_path = get_opening_book_path(game_rows_m=game_rows_m, game_cols_n=game_cols_n,
+                                                  win_length_k=win_length_k,
+                                                  opening_book_directory=opening_book_directory)
+        if not opening_book_path.is_file():
+            return None
+        return cls.load(opening_book_path=opening_book_path)
@@ -0,0 +1,154 @@
+"""
+Module defining how an opening book is built, from the games played out by a GameSimulator and/or from the moves found
+by deep offline searches.
+
+Simulated games are replayed move by move, and every move made in the first max_plies plies of a game is credited
+with the outcome of the game, from the perspective of the player who made it (1 for a win, 0.5 for a draw and 0 for a
+loss). Moves that lead to symmetric variants of the same position are credited together. The book move of a position
+is then the move with the best average outcome, out of the moves played in at least min_games games. A move found by
+an offline search is taken as authoritative, and replaces whatever the simulated games suggested.
+"""
+
+# Standard library imports
+import ast
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+# Local application imports
+from automation.game_simulation.game_simulation_constants import SimulationColumnName
+from automation.minimax.constants.terminal_board_scores import BoardScore
+from automation.opening_book.constants.opening_book_constants import OpeningBookParameters
+from automation.opening_book.opening_book import OpeningBook, OpeningBookEntry
+from game.app.board_symmetries import get_canonical_key, get_canonical_marks, get_x_started_marks
+from game.constants.game_constants import BoardMarking, StartingPlayer
+
+_DRAW_OUTCOME = "DRAW"
+
+
+@dataclass
+class _MoveRecord:
+    """The outcomes of the simulated games in which a move was made, from the perspective of the player who made it"""
+    move_index: int  # The flat index of the move, in the canonical variant of the position it was made from
+    games: int = 0
+    points: float = 0
+
+    def get_score(self) -> float:
+        """Method to put the average outcome of the move on the same scale as the minimax scores."""
+        return (2 * self.points / self.games - 1) * BoardScore.EXPECTED_MAX_WIN.value
+
+
+class OpeningBookBuilder:
+    """
+    Class for accumulating the moves made in the opening positions of a game, and building them into an OpeningBook.
+
+    Instance attributes:
+    __________
+    game_rows_m/game_cols_n/win_length_k: The structure of the game the book is for
+    max_plies: Moves are only recorded for the positions before each of the first max_plies moves of a game
+    min_games: The number of simulated games a move must have been made in to become a book move
+    """
+
+    def __init__(self, game_rows_m: int, game_cols_n: int, win_length_k: int,
+                 max_plies: int = OpeningBookParameters.max_plies.value,
+                 min_games: int = OpeningBookParameters.min_games.value):
+        self.game_rows_m = game_rows_m
+        self.game_cols_n = game_cols_n
+        self.win_length_k = win_length_k
+        self.max_plies = max_plies
+        self.min_games = min_games
+        self._board_shape = (game_rows_m, game_cols_n)
+        # Canonical position -> canonical child position -> outcomes of the move to the child
+        self._simulated_moves: Dict[bytes, Dict[bytes, _MoveRecord]] = {}
+        self._searched_moves: Dict[bytes, OpeningBookEntry] = {}
+
+    def add_simulated_games(self, simulation_dataframe: pd.DataFrame, player_x_name: str, player_o_name: str) -> None:
+        """
+        Method to record the opening moves of every game in the output of a GameSimulator.
+
+        Parameters:
+        __________
+        simulation_dataframe: The simulation dataframe of a GameSimulator, or the same data read back from its csv file
+        player_x_name/player_o_name: The names of the players, as recorded as the winning player of a game
+        """
+        winning_player_values = {player_x_name: BoardMarking.X.value, player_o_name: BoardMarking.O.value,
+                                 _DRAW_OUTCOME: 0}
+        cell_count = self.game_rows_m * self.game_cols_n
+        for _, game in simulation_dataframe.iterrows():
+            starting_player_value = StartingPlayer[game[SimulationColumnName.STARTING_PLAYER.name]].value
+            winning_player_value = winning_player_values[game[SimulationColumnName.WINNING_PLAYER.name]]
+            # Games are replayed as if X started them, so the marks are relative to the starting player
+            winner_relative_to_starter = winning_player_value * starting_player_value
+            marks = np.zeros(cell_count, dtype=np.int8)
+            for ply in range(min(self.max_plies, cell_count)):
+                move = self._parse_move(move=game[f"{SimulationColumnName.MOVE.name}_{ply + 1}"])
+                if move is None:  # The game was over before this ply
+                    break
+                mover_value = BoardMarking.X.value if ply % 2 == 0 else BoardMarking.O.value
+                outcome = 0.5 if winner_relative_to_starter == 0 else float(winner_relative_to_starter == mover_value)
+                move_index = int(np.ravel_multi_index(move, self._board_shape))
+                self._record_simulated_move(marks=marks, move_index=move_index, mover_value=mover_value,
+                                            outcome=outcome)
+                marks[move_index] = mover_value
+
+    def add_searched_move(self, playing_grid: np.ndarray, player_to_move_value: int, move: np.ndarray,
+                          score: float) -> None:
+        """
+        Method to record the move found by a (deep) search of a position, which takes precedence over any simulated
+        games in the position.
+
+        Parameters:
+        __________
+        playing_grid/player_to_move_value: The position that was searched
+        move: The index of the move found by the search
+        score: The score the search gave the move, for the player to move
+        """
+        marks = get_x_started_marks(playing_grid=playing_grid, player_to_move_value=player_to_move_value)
+        canonical_marks, permutation = get_canonical_marks(flat_marks=marks, board_shape=self._board_shape)
+        move_index = int(np.ravel_multi_index(tuple(move), self._board_shape))
+        self._searched_moves[canonical_marks.tobytes()] = OpeningBookEntry(
+            move_index=int(np.flatnonzero(permutation == move_index)[0]), score=float(score), games=0)
+
+    def build(self) -> OpeningBook:
+        """Method to build the book from every game and search recorded so far."""
+        entries: Dict[bytes, OpeningBookEntry] = {}
+        for position_key, move_records in self._simulated_moves.items():
+            eligible_records = [record for record in move_records.values() if record.games >= self.min_games]
+            if len(eligible_records) == 0:
+                continue
+            best_record = max(eligible_records, key=lambda record: (record.points / record.games, record.games))
+            entries[position_key] = OpeningBookEntry(move_index=best_record.move_index, score=best_record.get_score(),
+                                                     games=best_record.games)
+        entries.update(self._searched_moves)
+        return OpeningBook(game_rows_m=self.game_rows_m, game_cols_n=self.game_cols_n, win_length_k=self.win_length_k,
+                           max_plies=self.max_plies, entries=entries)
+
+    def _record_simulated_move(self, marks: np.ndarray, move_index: int, mover_value: int, outcome: float) -> None:
+        """Method to credit the outcome of a game to a move made in it, from the (X started) marks before the move."""
+        canonical_marks, permutation = get_canonical_marks(flat_marks=marks, board_shape=self._board_shape)
+        child_marks = marks.copy()
+        child_marks[move_index] = mover_value
+        child_key = get_canonical_key(flat_marks=child_marks, board_shape=self._board_shape)
+        move_records = self._simulated_moves.setdefault(canonical_marks.tobytes(), {})
+        if child_key not in move_records:
+            move_records[child_key] = _MoveRecord(move_index=int(np.flatnonzero(permutation == move_index)[0]))
+        move_records[child_key].games += 1
+        move_records[child_key].points += outcome
+
+    @staticmethod
+    def _parse_move(move: Tuple[int, int] | str | float) -> Tuple[int, int] | None:
+        """
+        Method to read a move recorded by a GameSimulator - a tuple in memory, or its string once saved to csv. Moves
+        after the end of a game are missing (NaN in memory, and "GAME_WON" in the csv file).
+        """
+        if isinstance(move, str):
+            try:
+                move = ast.literal_eval(move)
+            except (ValueError, SyntaxError):
+                return None
+        if not isinstance(move, tuple):
+            return None
+        return tuple(int(index) for index in move)
@@ -0,0 +1,18 @@
+"""Module to define the constants used by the exact solvers of noughts and crosses positions."""
+
+# Standard library imports
+from enum import Enum
+
+
+class GameTheoreticValue(Enum):
+    """Enum of the outcome of a position under perfect play, from the perspective of the player to move"""
+    WIN = 1
+    DRAW = 0
+    LOSS = -1
+
+
+class ProofNumberSearchParameters(Enum):
+    """Enum defining the default limits of the proof-number search, and the proof number representing infinity."""
+    max_search_seconds = 10  # The wall time a single call to solve may take
+    max_table_entries = 2_000_000  # Roughly 250 bytes are used per entry, so this is ~500MB
+    infinity = 10 ** 12
@@ -0,0 +1,326 @@
+"""
+Module defining an exact solver for noughts and crosses positions, using depth-first proof-number search (df-pn).
+
+Proof-number search proves or disproves a single goal (e.g. 'the player to move wins'), by always expanding the most
+proving node - the node whose outcome would most cheaply settle the goal. Each node has a proof number (phi), the
+minimum number of leaves that need to be proven for the player to move at the node to achieve the goal, and a
+disproof number (delta), the minimum number that need to be proven to stop them. df-pn explores the same nodes in a
+depth-first manner, with thresholds that say when to back up to the parent, and keeps the numbers in a transposition
+table rather than in an explicit tree.
+
+A position has one of three values, so up to two searches are made: the first tries to prove that the player to move
+wins (treating a draw as a failure), and if that is disproven, the second tries to prove that they do not lose
+(treating a draw as a success).
+
+The transposition table is keyed by the canonical variant of each position, so that symmetric positions are only
+searched once. Immediate wins and forced blocks also prune the tree - a player who can win immediately has won, and a
+player facing an immediate win can only consider blocking it.
+"""
+
+# Standard library imports
+import math
+import threading
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.solver.constants.solver_constants import GameTheoreticValue, ProofNumberSearchParameters
+from game.app.board_symmetries import get_canonical_key, get_canonical_marks
+from game.app.board_windows import get_window_indices
+from game.constants.game_constants import BoardMarking
+
+INFINITY = ProofNumberSearchParameters.infinity.value
+
+
+class SolvedPosition(NamedTuple):
+    """The value of a position under perfect play, and a move for the player to move that achieves it"""
+    value: GameTheoreticValue
+    move: np.ndarray
+
+
+class _SolverLimitReached(Exception):
+    """Raised inside the search to unwind it once the time or memory limit has been reached"""
+    pass
+
+
+class ProofNumberSearch:
+    """
+    Class for solving the positions of a game with a given (m, n, k). Solved positions are remembered, so that
+    solving the same position (or a symmetric variant of it) again costs nothing.
+
+    Instance attributes:
+    __________
+    game_rows_m/game_cols_n/win_length_k: The structure of the game whose positions are solved
+    max_search_seconds: The wall time a single call to solve may take (None for no time limit)
+    max_table_entries: The size the transposition table may grow to. When it is full, the entries of unsolved nodes
+    are discarded, and if it is still full the search gives up.
+    nodes_searched: The number of nodes expanded by the searches made so far
+
+    Positions that could not be solved are also remembered, along with the most time and nodes they were given, so that
+    they are not searched again unless more time or nodes are available (or, if the table filled up, at all).
+    """
+
+    def __init__(self,
+                 game_rows_m: int,
+                 game_cols_n: int,
+                 win_length_k: int,
+                 max_search_seconds: float | None = ProofNumberSearchParameters.max_search_seconds.value,
+                 max_table_entries: int = ProofNumberSearchParameters.max_table_entries.value):
+        self.game_rows_m = game_rows_m
+        self.game_cols_n = game_cols_n
+        self.win_length_k = win_length_k
+        self.max_search_seconds = max_search_seconds
+        self.max_table_entries = max_table_entries
+        self.nodes_searched = 0
+        self._board_shape = (game_rows_m, game_cols_n)
+        self._window_indices = get_window_indices(game_rows_m, game_cols_n, win_length_k)
+        self._solved_positions: Dict[Tuple[int, bytes], Tuple[GameTheoreticValue, int]] = {}
+        self._unsolved_positions: Dict[Tuple[int, bytes], Tuple[float, float]] = {}
+        self._table: Dict[bytes, Tuple[int, int]] = {}
+        self._draw_success_player_value: int = BoardMarking.X.value
+        self._deadline: float | None = None
+        self._node_limit: int | None = None
+        self._stop_event: threading.Event | None = None
+        self._table_full = False
+
+    def solve(self,
+              playing_grid: np.ndarray,
+              player_to_move_value: int,
+              deadline: float | None = None,
+              max_nodes: int | None = None,
+              stop_event: threading.Event | None = None) -> SolvedPosition | None:
+        """
+        Method to solve a position.
+
+        Parameters:
+        __________
+        playing_grid: The position to solve, which must not already be won or drawn
+        player_to_move_value: The BoardMarking value of the player to move
+        deadline: The time.perf_counter() time by which the search must give up, e.g. to leave time for a main search
+        to follow it. The earlier of this and the solver's own max_search_seconds applies.
+        max_nodes: The number of nodes the search may expand before giving up (None for no node limit)
+        stop_event: An event that makes the search give up when set from another thread (None if it can only be ended
+        by its limits)
+
+        Returns: SolvedPosition | None
+        __________
+        The value of the position for the player to move and a move achieving it, or None if the time, node or memory
+        limit was reached (or the search was stopped) before the position was solved. In a lost position, the move is a block
+        of an immediate win if there is one, since the opponent may still go wrong.
+        """
+        marks = self._get_marks(playing_grid=playing_grid)
+        canonical_marks, permutation = get_canonical_marks(flat_marks=marks, board_shape=self._board_shape)
+        solved_key = (player_to_move_value, canonical_marks.tobytes())
+        if solved_key in self._solved_positions:
+            value, canonical_move_index = self._solved_positions[solved_key]
+            return SolvedPosition(value=value, move=self._get_move(flat_index=permutation[canonical_move_index]))
+        if self._is_game_over(marks=marks):
+            raise ValueError("Attempted to solve a position in which the game is already over.")
+
+        self._deadline = self._get_deadline(deadline=deadline)
+        available_seconds = math.inf if self._deadline is None else self._deadline - time.perf_counter()
+        available_nodes = math.inf if max_nodes is None else max_nodes
+        unsolved_seconds, unsolved_nodes = self._unsolved_positions.get(solved_key, (-math.inf, -math.inf))
+        if available_seconds <= unsolved_seconds and available_nodes <= unsolved_nodes:
+            return None  # The position has already failed to be solved with at least as much time and as many nodes
+
+        self._node_limit = None if max_nodes is None else self.nodes_searched + max_nodes
+        self._stop_event = stop_event
+        self._table_full = False
+        try:
+            if self._prove(marks=marks, player_to_move_value=player_to_move_value,
+                           draw_success_player_value=-player_to_move_value):
+                value = GameTheoreticValue.WIN
+            elif self._prove(marks=marks, player_to_move_value=player_to_move_value,
+                             draw_success_player_value=player_to_move_value):
+                value = GameTheoreticValue.DRAW
+            else:
+                value = GameTheoreticValue.LOSS
+        except _SolverLimitReached:
+            if stop_event is None or not stop_event.is_set():  # A stopped search may yet succeed with the same time
+                self._unsolved_positions[solved_key] = (math.inf, math.inf) if self._table_full else \
+                    (available_seconds, available_nodes)
+            return None
+        finally:
+            self._deadline = None
+            self._node_limit = None
+            self._stop_event = None
+
+        move_index = self._get_proof_move_index(marks=marks, player_to_move_value=player_to_move_value)
+        canonical_move_index = int(np.flatnonzero(permutation == move_index)[0])
+        self._solved_positions[solved_key] = (value, canonical_move_index)
+        return SolvedPosition(value=value, move=self._get_move(flat_index=move_index))
+
+    # Methods implementing the df-pn search
+    def _prove(self, marks: np.ndarray, player_to_move_value: int, draw_success_player_value: int) -> bool:
+        """
+        Method to run df-pn from the root position, until the goal has been proven or disproven. The table is left
+        holding the proof and disproof numbers of the search, so that the proof move can be read from it.
+        Returns: True if the player to move achieves the goal, False if they do not.
+        """
+        self._table = {}
+        self._draw_success_player_value = draw_success_player_value
+        self._multiple_iterative_deepening(marks=marks, player_to_move_value=player_to_move_value,
+                                           phi_threshold=INFINITY, delta_threshold=INFINITY)
+        root_phi, _ = self._table[self._get_key(marks=marks)]
+        return root_phi == 0
+
+    def _multiple_iterative_deepening(self, marks: np.ndarray, player_to_move_value: int,
+                                      phi_threshold: int, delta_threshold: int) -> None:
+        """
+        Method to search below a node until either its proof number reaches phi_threshold or its disproof number
+        reaches delta_threshold, storing its final numbers in the table.
+        The numbers are in negamax form - each node's numbers are for the player to move at that node, so a node's
+        proof number is the smallest disproof number of its children and its disproof number is the sum of its
+        children's proof numbers. Note that the marks are changed in place while searching, but restored before
+        returning.
+        """
+        self._check_limits()
+        self.nodes_searched += 1
+        key = self._get_key(marks=marks)
+        winning_move_index, move_indices = self._get_moves(marks=marks, player_to_move_value=player_to_move_value)
+        if winning_move_index is not None:
+            self._store(key=key, phi=0, delta=INFINITY)
+            return
+
+        child_keys: List[bytes] = []
+        child_settled_numbers: List[Tuple[int, int] | None] = []
+        for move_index in move_indices:
+            marks[move_index] = player_to_move_value
+            child_settled_numbers.append(self._get_settled_numbers(
+                marks=marks, player_to_move_value=-player_to_move_value))
+            child_keys.append(self._get_key(marks=marks))
+            marks[move_index] = 0
+
+        while True:
+            child_numbers = [settled_numbers if settled_numbers is not None else self._table.get(child_key, (1, 1))
+                             for child_key, settled_numbers in zip(child_keys, child_settled_numbers)]
+            phi = min(child_delta for _, child_delta in child_numbers)
+            delta = min(sum(child_phi for child_phi, _ in child_numbers), INFINITY)
+            if phi >= phi_threshold or delta >= delta_threshold:
+                self._store(key=key, phi=phi, delta=delta)
+                return
+
+            child_deltas = [child_delta for _, child_delta in child_numbers]
+            best_child = int(np.argmin(child_deltas))
+            second_best_delta = min(child_deltas[:best_child] + child_deltas[best_child + 1:], default=INFINITY)
+            best_child_phi, _ = child_numbers[best_child]
+
+            move_index = move_indices[best_child]
+            marks[move_index] = player_to_move_value
+            self._multiple_iterative_deepening(
+                marks=marks, player_to_move_value=-player_to_move_value,
+                phi_threshold=min(delta_threshold - delta + best_child_phi, INFINITY),
+                delta_threshold=min(phi_threshold, second_best_delta + 1))
+            marks[move_index] = 0
+
+    def _get_moves(self, marks: np.ndarray, player_to_move_value: int) -> Tuple[int | None, np.ndarray]:
+        """
+        Method to get the moves worth considering for the player to move.
+        Returns: The flat index of a cell the player to move wins on immediately (or None if there isn't one), and the
+        flat indices of the moves to search - the blocks of the opponent's immediate wins if they have any, otherwise
+        every empty cell.
+        """
+        window_marks = marks[self._window_indices]
+        window_sums = window_marks.sum(axis=1)
+        # A window summing to (k - 1) times a player's value must hold k - 1 of their marks and one empty cell
+        winning_windows = window_sums == (self.win_length_k - 1) * player_to_move_value
+        if np.any(winning_windows):
+            winning_window = np.flatnonzero(winning_windows)[0]
+            return int(self._window_indices[winning_window][window_marks[winning_window] == 0][0]), np.array([])
+
+        threatening_windows = window_sums == -(self.win_length_k - 1) * player_to_move_value
+        if np.any(threatening_windows):
+            return None, np.unique(self._window_indices[threatening_windows][window_marks[threatening_windows] == 0])
+        return None, np.flatnonzero(marks == 0)
+
+    def _get_settled_numbers(self, marks: np.ndarray, player_to_move_value: int) -> Tuple[int, int] | None:
+        """
+        Method to get the proof and disproof numbers of a node reached by a move, if its outcome can be read straight
+        off the board. This is the case if:
+        - The player that needs a win (rather than a draw) has no window left that is free of their opponent's marks,
+        which includes a full board (a move that wins is caught as an immediate win before it is made)
+        - The player to move can win immediately
+        - The player to move cannot win immediately, but their opponent can win on two or more cells
+        """
+        window_marks = marks[self._window_indices]
+        win_needed_player_value = -self._draw_success_player_value
+        if not np.any(np.all(window_marks != -win_needed_player_value, axis=1)):
+            return (0, INFINITY) if player_to_move_value == self._draw_success_player_value else (INFINITY, 0)
+
+        window_sums = window_marks.sum(axis=1)
+        # A window summing to (k - 1) times a player's value must hold k - 1 of their marks and one empty cell
+        if np.any(window_sums == (self.win_length_k - 1) * player_to_move_value):
+            return 0, INFINITY
+        threatening_windows = window_sums == -(self.win_length_k - 1) * player_to_move_value
+        if np.count_nonzero(threatening_windows) >= 2 and len(np.unique(
+                self._window_indices[threatening_windows][window_marks[threatening_windows] == 0])) >= 2:
+            return INFINITY, 0
+        return None
+
+    def _get_proof_move_index(self, marks: np.ndarray, player_to_move_value: int) -> int:
+        """
+        Method to read the best move at the root from the table of the last search - a move to a child whose player to
+        move has been disproven if the goal was proven, otherwise the first of the moves searched.
+        """
+        winning_move_index, move_indices = self._get_moves(marks=marks, player_to_move_value=player_to_move_value)
+        if winning_move_index is not None:
+            return winning_move_index
+
+        best_move_index, best_child_delta = int(move_indices[0]), INFINITY + 1
+        for move_index in move_indices:
+            marks[move_index] = player_to_move_value
+            child_numbers = self._get_settled_numbers(marks=marks, player_to_move_value=-player_to_move_value)
+            if child_numbers is None:
+                child_numbers = self._table.get(self._get_key(marks=marks), (1, 1))
+            marks[move_index] = 0
+            if child_numbers[1] < best_child_delta:
+                best_move_index, best_child_delta = int(move_index), child_numbers[1]
+        return best_move_index
+
+    # Helper methods
+    def _store(self, key: bytes, phi: int, delta: int) -> None:
+        """
+        Method to store the proof and disproof numbers of a node. If the table is full, the entries of unsolved nodes
+        are discarded first - they can be recalculated, whereas solved nodes cannot be recalculated cheaply.
+        """
+        if len(self._table) >= self.max_table_entries and key not in self._table:
+            self._table = {table_key: numbers for table_key, numbers in self._table.items() if 0 in numbers}
+            if len(self._table) >= self.max_table_entries:
+                self._table_full = True
+                raise _SolverLimitReached
+        self._table[key] = (phi, delta)
+
+    def _check_limits(self) -> None:
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise _SolverLimitReached
+        elif self._node_limit is not None and self.nodes_searched >= self._node_limit:
+            raise _SolverLimitReached
+        elif self._stop_event is not None and self._stop_event.is_set():
+            raise _SolverLimitReached
+
+    def _get_deadline(self, deadline: float | None) -> float | None:
+        """Method to get the time a call to solve must give up by, from its own deadline and max_search_seconds."""
+        own_deadline = None if self.max_search_seconds is None else time.perf_counter() + self.max_search_seconds
+        if own_deadline is None or deadline is None:
+            return deadline if own_deadline is None else own_deadline
+        return min(own_deadline, deadline)
+
+    def _get_key(self, marks: np.ndarray) -> bytes:
+        return get_canonical_key(flat_marks=marks, board_shape=self._board_shape)
+
+    def _is_game_over(self, marks: np.ndarray) -> bool:
+        window_sums = marks[self._window_indices].sum(axis=1)
+        return bool(np.any(np.abs(window_sums) == self.win_length_k)) or not np.any(marks == 0)
+
+    def _get_move(self, flat_index: int) -> np.ndarray:
+        return np.array(np.unravel_index(flat_index, self._board_shape))
+
+    @staticmethod
+    def _get_marks(playing_grid: np.ndarray) -> np.ndarray:
+        """Method to flatten a playing grid into 1 for X, -1 for O and 0 for an empty cell, as the search uses."""
+        flat_grid = playing_grid.ravel()
+        return np.where(flat_grid == BoardMarking.EMPTY.value, 0, flat_grid.real).astype(np.int8)
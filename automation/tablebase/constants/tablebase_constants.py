@@ -0,0 +1,13 @@
+"""Module to define the constants used to generate and read the endgame tablebases."""
+
+# Standard library imports
+from enum import Enum
+
+
+class TablebaseParameters(Enum):
+    """
+    Enum defining the parameters of the endgame tablebases.
+    A tablebase file has one byte for every board encoding (3 ** (m * n) of them), so only small boards are supported.
+    """
+    max_cells = 16  # A 4x4 tablebase is 3 ** 16 bytes (~43MB), whereas the next size up (e.g. 4x5) would be ~3.5GB
+    generation_chunk_size = 100_000  # The positions whose children are generated together, limiting peak memory
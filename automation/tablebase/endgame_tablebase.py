@@ -0,0 +1,163 @@
+"""
+Module defining the endgame tablebases - files holding the game-theoretic value of every reachable position of a small
+(m, n, k) game, which the minimax engine reads instead of searching.
+
+Each position is encoded as a base 3 number, with one digit per cell (0 for an empty cell, 1 for X and 2 for O), and
+the file holds one byte per encoding, so that a position is looked up by indexing the file directly. The file is
+memory mapped, so only the pages holding the positions actually looked up get read from disk. Only the canonical
+variant of each position (the symmetric variant with the smallest encoding) is stored, with the bytes of every other
+encoding left as zero.
+
+The stored byte packs the value of the position for the player to move (in the lowest 2 bits) with its distance to the
+end of the game under perfect play (in the remaining bits). Positions are always stored as if X made the first move -
+a position from a game that O started is looked up with the X and O marks swapped.
+"""
+
+# Standard library imports
+from pathlib import Path
+from typing import NamedTuple, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from game.app.board_symmetries import get_symmetry_permutations, get_x_started_marks
+from game.constants.game_constants import BoardMarking
+from root_directory import ROOT_PATH
+
+DEFAULT_TABLEBASE_DIRECTORY = ROOT_PATH / "automation" / "tablebase" / "tablebase_files"
+
+# Layout of a packed entry, where a byte of 0 means that the position is not in the tablebase
+_VALUE_BITS = 2
+_VALUE_MASK = 0b11
+_UNPACKED_VALUES = {value.value + 2: value for value in GameTheoreticValue}
+
+
+class TablebaseEntry(NamedTuple):
+    """The value of a position for the player to move, and the number of plies left in the game under perfect play"""
+    value: GameTheoreticValue
+    plies_to_end: int
+
+
+def get_tablebase_path(game_rows_m: int, game_cols_n: int, win_length_k: int,
+                       tablebase_directory: Path = DEFAULT_TABLEBASE_DIRECTORY) -> Path:
+    """Function to get the path of the tablebase file of the given game"""
+    return tablebase_directory / f"{game_rows_m}_{game_cols_n}_{win_length_k}_tablebase.bin"
+
+
+def pack_entries(values: np.ndarray, plies_to_end: np.ndarray) -> np.ndarray:
+    """
+    Function to pack arrays of position values (as GameTheoreticValue values, i.e. -1, 0 or 1) and distances to the
+    end of the game into the bytes stored in a tablebase file.
+    """
+    return ((values + 2) | (plies_to_end << _VALUE_BITS)).astype(np.uint8)
+
+
+def get_position_codes(boards: np.ndarray) -> np.ndarray:
+    """
+    Function to encode boards as base 3 numbers.
+    Parameters: boards - a (number of boards, m * n) array of flat boards, as 1 for X, -1 for O and 0 for empty cells
+    Returns: A (number of boards,) int64 array of the encodings
+    """
+    digits = np.where(boards == BoardMarking.O.value, 2, boards).astype(np.int64)
+    return digits @ (3 ** np.arange(boards.shape[-1], dtype=np.int64))
+
+
+def decode_position_codes(codes: np.ndarray, cell_count: int) -> np.ndarray:
+    """Function to decode base 3 encodings back into flat boards (the inverse of get_position_codes)."""
+    digits = (codes[:, np.newaxis] // (3 ** np.arange(cell_count, dtype=np.int64))) % 3
+    return np.where(digits == 2, BoardMarking.O.value, digits).astype(np.int8)
+
+
+def get_canonical_position_codes(boards: np.ndarray, board_shape: Tuple[int, int]) -> np.ndarray:
+    """Function to get the encodings of the canonical variants of boards - the smallest encoding of any variant."""
+    symmetry_permutations = get_symmetry_permutations(*board_shape)
+    return np.min([get_position_codes(boards[:, permutation]) for permutation in symmetry_permutations], axis=0)
+
+
+class EndgameTablebase:
+    """
+    Class for reading the tablebase of a game, which is memory mapped from its file.
+
+    Instance attributes:
+    __________
+    game_rows_m/game_cols_n/win_length_k: The structure of the game the tablebase is for
+    tablebase_path: The path of the tablebase file
+    """
+
+    def __init__(self, game_rows_m: int, game_cols_n: int, win_length_k: int, tablebase_path: Path):
+        self.game_rows_m = game_rows_m
+        self.game_cols_n = game_cols_n
+        self.win_length_k = win_length_k
+        self.tablebase_path = tablebase_path
+        self._board_shape = (game_rows_m, game_cols_n)
+        self._entries = np.memmap(tablebase_path, dtype=np.uint8, mode="r")
+        if len(self._entries) != 3 ** (game_rows_m * game_cols_n):
+            raise ValueError(f"The tablebase at {tablebase_path} does not have an entry for every position of a "
+                             f"{game_rows_m}x{game_cols_n} board.")
+
+    @classmethod
+    def load_if_generated(cls, game_rows_m: int, game_cols_n: int, win_length_k: int,
+                          tablebase_directory: Path = DEFAULT_TABLEBASE_DIRECTORY) -> "EndgameTablebase | None":
+        """Method to open the tablebase of the given game, or get None if it has not been generated."""
+        tablebase_path = get_tablebase_path(game_rows_m=game_rows_m, game_cols_n=game_cols_n,
+                                            win_length_k=win_length_k, tablebase_directory=tablebase_directory)
+        if not tablebase_path.is_file():
+            return None
+        return cls(game_rows_m=game_rows_m, game_cols_n=game_cols_n, win_length_k=win_length_k,
+                   tablebase_path=tablebase_path)
+
+    def probe(self, playing_grid: np.ndarray, player_to_move_value: int) -> TablebaseEntry | None:
+        """
+        Method to look up a position.
+        Returns: The value of the position for the player to move, and its distance to the end of the game, or None if
+        the position is not in the tablebase (e.g. because it could not be reached in a real game).
+        """
+        marks = get_x_started_marks(playing_grid=playing_grid, player_to_move_value=player_to_move_value)
+        boards = marks[np.newaxis, :]
+        return self._unpack_entry(packed_entry=self._entries[get_canonical_position_codes(
+            boards=boards, board_shape=self._board_shape)[0]])
+
+    def get_best_move(self, playing_grid: np.ndarray,
+                      player_to_move_value: int) -> Tuple[TablebaseEntry, np.ndarray] | None:
+        """
+        Method to find a move that keeps the value of the position for the player to move - the quickest win from a won
+        position, or the slowest loss from a lost position.
+        Returns: The entry of the position and the best move, or None if the position is not in the tablebase.
+        """
+        entry = self.probe(playing_grid=playing_grid, player_to_move_value=player_to_move_value)
+        if entry is None:
+            return None
+
+        marks = get_x_started_marks(playing_grid=playing_grid, player_to_move_value=player_to_move_value)
+        boards = marks[np.newaxis, :]
+        empty_cells = np.flatnonzero(boards[0] == 0)
+        marks_made = len(boards[0]) - len(empty_cells)
+        child_boards = np.repeat(boards, len(empty_cells), axis=0)
+        # As stored, X is to move after an even number of marks
+        child_boards[np.arange(len(empty_cells)), empty_cells] = \
+            BoardMarking.X.value if marks_made % 2 == 0 else BoardMarking.O.value
+        child_codes = get_canonical_position_codes(boards=child_boards, board_shape=self._board_shape)
+
+        best_move_index, best_move_rank = None, None
+        for move_index, child_code in zip(empty_cells, child_codes):
+            child_entry = self._unpack_entry(packed_entry=self._entries[child_code])
+            if child_entry is None:
+                continue
+            move_value = -child_entry.value.value
+            # Win as quickly as possible, and lose as slowly as possible
+            move_rank = (move_value, -child_entry.plies_to_end if move_value > 0 else child_entry.plies_to_end)
+            if best_move_rank is None or move_rank > best_move_rank:
+                best_move_index, best_move_rank = move_index, move_rank
+        if best_move_index is None:
+            return None
+        return entry, np.array(np.unravel_index(best_move_index, self._board_shape))
+
+    @staticmethod
+    def _unpack_entry(packed_entry: int) -> TablebaseEntry | None:
+        packed_entry = int(packed_entry)
+        if packed_entry == 0:
+            return None
+        return TablebaseEntry(value=_UNPACKED_VALUES[packed_entry & _VALUE_MASK],
+                              plies_to_end=packed_entry >> _VALUE_BITS)
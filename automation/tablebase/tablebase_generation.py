@@ -0,0 +1,143 @@
+"""
+Module defining how the endgame tablebase of a small game is generated, by retrograde analysis.
+
+The generation makes two passes over the reachable positions, which are grouped into layers by the number of marks
+on the board. The forward pass finds the canonical positions in each layer, by making every move from every
+position in the layer before that was not already won. The retrograde pass then works back from the full boards to the
+empty board, valuing each position from the values of its children in the layer after it (which have already been
+valued) - a won position is a loss for the player to move, a full board is a draw, and any other position takes the
+best value of any move for the player to move.
+
+Every position in a layer has the same number of empty cells, so each pass works on whole layers (or chunks of them)
+at a time as numpy arrays, rather than position by position.
+"""
+
+# Standard library imports
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from automation.tablebase.constants.tablebase_constants import TablebaseParameters
+from automation.tablebase.endgame_tablebase import DEFAULT_TABLEBASE_DIRECTORY, decode_position_codes, \
+    get_canonical_position_codes, get_tablebase_path, pack_entries
+from game.app.board_windows import get_window_indices
+from game.constants.game_constants import BoardMarking
+
+WIN = GameTheoreticValue.WIN.value
+DRAW = GameTheoreticValue.DRAW.value
+LOSS = GameTheoreticValue.LOSS.value
+
+
+def generate_endgame_tablebase(game_rows_m: int, game_cols_n: int, win_length_k: int,
+                               tablebase_directory: Path = DEFAULT_TABLEBASE_DIRECTORY) -> Path:
+    """
+    Function to generate the tablebase of a game and save it to file.
+    Returns: The path of the tablebase file
+    """
+    cell_count = game_rows_m * game_cols_n
+    if cell_count > TablebaseParameters.max_cells.value:
+        raise ValueError(f"Tablebases can only be generated for boards of up to {TablebaseParameters.max_cells.value} "
+                         f"cells, not for a {game_rows_m}x{game_cols_n} board.")
+    board_shape = (game_rows_m, game_cols_n)
+    window_indices = get_window_indices(game_rows_m, game_cols_n, win_length_k)
+
+    # Forward pass - find the canonical positions reachable with each number of marks on the board
+    layers: List[np.ndarray] = [np.zeros(1, dtype=np.int64)]
+    for marks_made in range(0, cell_count):
+        boards = decode_position_codes(codes=layers[marks_made], cell_count=cell_count)
+        boards = boards[~_get_won_boards(boards=boards, window_indices=window_indices, win_length_k=win_length_k)]
+        child_codes = _get_canonical_child_codes(boards=boards, board_shape=board_shape,
+                                                 player_to_move_value=_get_player_to_move_value(marks_made))
+        layers.append(np.unique(child_codes))
+        logging.info(f"Found {len(layers[-1])} canonical positions with {marks_made + 1} marks made.")
+
+    # Retrograde pass - value each layer from the values of the layer after it
+    tablebase_path = get_tablebase_path(game_rows_m=game_rows_m, game_cols_n=game_cols_n, win_length_k=win_length_k,
+                                        tablebase_directory=tablebase_directory)
+    tablebase_path.parent.mkdir(parents=True, exist_ok=True)
+    entries = np.memmap(tablebase_path, dtype=np.uint8, mode="w+", shape=(3 ** cell_count,))
+    entries[:] = 0
+    child_values, child_plies_to_end = np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int64)
+    for marks_made in range(cell_count, -1, -1):
+        values, plies_to_end = _get_layer_values(
+            codes=layers[marks_made], marks_made=marks_made, board_shape=board_shape, window_indices=window_indices,
+            win_length_k=win_length_k, child_layer_codes=layers[marks_made + 1] if marks_made < cell_count else None,
+            child_values=child_values, child_plies_to_end=child_plies_to_end)
+        entries[layers[marks_made]] = pack_entries(values=values, plies_to_end=plies_to_end)
+        child_values, child_plies_to_end = values, plies_to_end
+    entries.flush()
+    del entries
+    return tablebase_path
+
+
+def _get_layer_values(codes: np.ndarray, marks_made: int, board_shape: Tuple[int, int], window_indices: np.ndarray,
+                      win_length_k: int, child_layer_codes: np.ndarray | None, child_values: np.ndarray,
+                      child_plies_to_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function to value every position in a layer, for the player to move, given the values of the next layer.
+    Returns: The values (as GameTheoreticValue values) and distances to the end of the game of the positions
+    """
+    cell_count = board_shape[0] * board_shape[1]
+    values = np.full(len(codes), DRAW, dtype=np.int8)
+    plies_to_end = np.zeros(len(codes), dtype=np.int64)
+    chunk_size = TablebaseParameters.generation_chunk_size.value
+    for chunk_start in range(0, len(codes), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        boards = decode_position_codes(codes=codes[chunk], cell_count=cell_count)
+        won_boards = _get_won_boards(boards=boards, window_indices=window_indices, win_length_k=win_length_k)
+        chunk_values = np.where(won_boards, LOSS, DRAW).astype(np.int8)
+        chunk_plies_to_end = np.zeros(len(boards), dtype=np.int64)
+        if child_layer_codes is not None and np.any(~won_boards):
+            child_codes = _get_canonical_child_codes(boards=boards[~won_boards], board_shape=board_shape,
+                                                     player_to_move_value=_get_player_to_move_value(marks_made))
+            child_indices = np.searchsorted(child_layer_codes, child_codes)
+            # Values of the moves for the player to move, who plays the best of them
+            move_values = -child_values[child_indices]
+            move_plies_to_end = child_plies_to_end[child_indices] + 1
+            best_values = move_values.max(axis=1)
+            quickest_wins = np.where(move_values == WIN, move_plies_to_end, cell_count + 1).min(axis=1)
+            slowest_losses = move_plies_to_end.max(axis=1)
+            chunk_values[~won_boards] = best_values
+            chunk_plies_to_end[~won_boards] = np.select(
+                [best_values == WIN, best_values == LOSS], [quickest_wins, slowest_losses],
+                default=cell_count - marks_made)  # A drawn game is played out until the board is full
+        values[chunk] = chunk_values
+        plies_to_end[chunk] = chunk_plies_to_end
+    return values, plies_to_end
+
+
+def _get_canonical_child_codes(boards: np.ndarray, board_shape: Tuple[int, int],
+                               player_to_move_value: int) -> np.ndarray:
+    """
+    Function to make every move from each of the boards, which all have the same number of empty cells.
+    Returns: A (number of boards, number of empty cells) array of the canonical encodings of the children
+    """
+    if len(boards) == 0:
+        return np.zeros((0, 0), dtype=np.int64)
+    empty_cell_count = np.count_nonzero(boards[0] == 0)
+    empty_cells = np.nonzero(boards == 0)[1].reshape(len(boards), empty_cell_count)
+    child_codes = np.empty((len(boards), empty_cell_count), dtype=np.int64)
+    chunk_size = max(TablebaseParameters.generation_chunk_size.value // max(empty_cell_count, 1), 1)
+    for chunk_start in range(0, len(boards), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        child_boards = np.repeat(boards[chunk], empty_cell_count, axis=0)
+        child_boards[np.arange(len(child_boards)), empty_cells[chunk].ravel()] = player_to_move_value
+        child_codes[chunk] = get_canonical_position_codes(
+            boards=child_boards, board_shape=board_shape).reshape(-1, empty_cell_count)
+    return child_codes
+
+
+def _get_won_boards(boards: np.ndarray, window_indices: np.ndarray, win_length_k: int) -> np.ndarray:
+    """Function to determine which of the boards have a completed window (for either player)."""
+    window_sums = boards[:, window_indices].sum(axis=2)
+    return np.any(np.abs(window_sums) == win_length_k, axis=1)
+
+
+def _get_player_to_move_value(marks_made: int) -> int:
+    """Function to get the player to move after the given number of marks, in a game that X started."""
+    return BoardMarking.X.value if marks_made % 2 == 0 else BoardMarking.O.value
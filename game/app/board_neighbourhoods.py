@@ -0,0 +1,71 @@
+"""
+Module defining the neighbourhoods of the cells of a playing grid - the cells within a given number of rows and
+columns of each cell. Moves far from every mark on the board are almost never worth searching, so the candidate moves of
+a position are the empty cells in the neighbourhood of any mark.
+Like the windows of a board, the neighbourhoods only depend on the shape of the board, so are calculated once and
+cached, as a boolean table indexed by flat cell index. The neighbourhood of a whole position is then the union of the
+rows of its marked cells, and can be maintained move by move by adding the row of each move made. The cells of the
+board in order of distance from each cell are precomputed in the same way, so that candidate moves can be put in order
+of distance from the last move without sorting them.
+"""
+
+# Standard library imports
+from functools import lru_cache
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.constants.game_constants import BoardMarking
+
+
+@lru_cache(maxsize=None)
+def get_neighbourhood_masks(game_rows_m: int, game_cols_n: int, radius: int) -> np.ndarray:
+    """
+    Function to get the neighbourhood of every cell of a board with the given shape.
+
+    Returns: A (m * n, m * n) boolean array, where row i is True at the flat index of every cell within radius rows and
+    columns of cell i (including cell i itself). The array is read only, since it is shared between all callers.
+    """
+    row_indices, col_indices = np.divmod(np.arange(game_rows_m * game_cols_n), game_cols_n)
+    neighbourhood_masks = (np.abs(row_indices[:, np.newaxis] - row_indices[np.newaxis, :]) <= radius) & \
+                          (np.abs(col_indices[:, np.newaxis] - col_indices[np.newaxis, :]) <= radius)
+    neighbourhood_masks.flags.writeable = False
+    return neighbourhood_masks
+
+
+@lru_cache(maxsize=None)
+def get_distance_orderings(game_rows_m: int, game_cols_n: int, tie_break_seed: int | None = None) -> np.ndarray:
+    """
+    Function to get, for every cell of a board with the given shape, every cell of the board in order of (euclidean)
+    distance from it, so that the moves near a cell can be put in order by filtering its row, without any sorting.
+
+    Parameters:
+    __________
+    game_rows_m/game_cols_n: The shape of the board
+    tie_break_seed: The seed of the random order that cells at the same distance are put in. With the default of None,
+    cells at the same distance are kept in the order of their flat indices.
+
+    Returns: A read only (m * n, m * n) array, where row i holds the flat indices of every cell, closest to cell i first
+    (so starting with cell i itself)
+    """
+    cell_count = game_rows_m * game_cols_n
+    row_indices, col_indices = np.divmod(np.arange(cell_count), game_cols_n)
+    squared_distances = (row_indices[:, np.newaxis] - row_indices[np.newaxis, :]) ** 2 + \
+                        (col_indices[:, np.newaxis] - col_indices[np.newaxis, :]) ** 2
+    tie_breaks = np.arange(cell_count) if tie_break_seed is None else \
+        np.random.default_rng(tie_break_seed).permutation(cell_count)
+    distance_orderings = np.lexsort(
+        (np.broadcast_to(tie_breaks, squared_distances.shape), squared_distances), axis=-1).astype(np.int32)
+    distance_orderings.flags.writeable = False
+    return distance_orderings
+
+
+def get_position_neighbourhood(playing_grid: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Function to get the neighbourhood of a whole position, from scratch.
+    Returns: A flat boolean mask of the cells within radius rows and columns of any marked cell
+    """
+    neighbourhood_masks = get_neighbourhood_masks(*playing_grid.shape, radius)
+    marked_cells = np.flatnonzero(playing_grid.ravel() != BoardMarking.EMPTY.value)
+    return neighbourhood_masks[marked_cells].any(axis=0)
@@ -0,0 +1,89 @@
+"""
+Module defining the symmetries of a playing grid - the rotations and reflections that map the board onto itself, and
+so map any position onto an equivalent position (with the same game-theoretic value). Swapping the X and O marks is
+also a symmetry, as long as the player to move is swapped too, which is used to store positions as if X had started.
+Like the windows of a board, the symmetries only depend on the shape of the board, so are calculated once and cached,
+as arrays of flat indices. This means that every symmetric variant of a position can be looked up with a single numpy
+indexing operation, and one of them chosen as the canonical position that represents all of them.
+"""
+
+# Standard library imports
+from functools import lru_cache
+from typing import Tuple
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.constants.game_constants import BoardMarking
+
+
+@lru_cache(maxsize=None)
+def get_symmetry_permutations(game_rows_m: int, game_cols_n: int) -> np.ndarray:
+    """
+    Function to get the symmetries of a board with the given shape, as permutations of its flat indices.
+    A rectangular board has 4 symmetries (the identity, two reflections and the half turn), and a square board 8.
+
+    Returns: A (number of symmetries, m * n) array, where row s holds the flat index of the cell of the original board
+    that each cell of the transformed board is taken from - i.e. the transformed flat board is flat_board[row]. The
+    first row is always the identity, and the array is read only, since it is shared between all callers.
+    """
+    flat_index_grid = np.arange(game_rows_m * game_cols_n).reshape(game_rows_m, game_cols_n)
+    transformed_grids = [flat_index_grid, np.flipud(flat_index_grid), np.fliplr(flat_index_grid),
+                         np.rot90(flat_index_grid, k=2)]
+    if game_rows_m == game_cols_n:
+        transformed_grids += [np.transpose(flat_index_grid), np.transpose(np.rot90(flat_index_grid, k=2)),
+                              np.rot90(flat_index_grid), np.rot90(flat_index_grid, k=3)]
+
+    permutations = []  # Boards with a single row or column have fewer distinct symmetries
+    for transformed_grid in transformed_grids:
+        permutation = transformed_grid.ravel()
+        if not any(np.array_equal(permutation, existing) for existing in permutations):
+            permutations.append(permutation)
+    symmetry_permutations = np.array(permutations, dtype=np.intp)
+    symmetry_permutations.flags.writeable = False
+    return symmetry_permutations
+
+
+def get_canonical_marks(flat_marks: np.ndarray, board_shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function to get the canonical variant of a position - the symmetric variant whose bytes are the smallest.
+
+    Parameters:
+    __________
+    flat_marks: The flattened playing grid (of any dtype, as long as it is the same for every position compared)
+    board_shape: The shape (m, n) of the playing grid
+
+    Returns:
+    __________
+    canonical_marks: The flattened canonical variant of the position
+    permutation: The symmetry permutation that gives the canonical variant, i.e. canonical_marks is
+    flat_marks[permutation]. A move at flat index i of the canonical variant is at permutation[i] on the original board.
+    """
+    symmetry_permutations = get_symmetry_permutations(*board_shape)
+    variants = flat_marks[symmetry_permutations]
+    variant_bytes = [variant.tobytes() for variant in variants]
+    canonical_index = min(range(len(variant_bytes)), key=variant_bytes.__getitem__)
+    return variants[canonical_index], symmetry_permutations[canonical_index]
+
+
+def get_canonical_key(flat_marks: np.ndarray, board_shape: Tuple[int, int]) -> bytes:
+    """Function to get a key that is the same for every symmetric variant of a position, and differs otherwise."""
+    canonical_marks, _ = get_canonical_marks(flat_marks=flat_marks, board_shape=board_shape)
+    return canonical_marks.tobytes()
+
+
+def get_x_started_marks(playing_grid: np.ndarray, player_to_move_value: int) -> np.ndarray:
+    """
+    Function to flatten a playing grid into 1 for X, -1 for O and 0 for an empty cell, swapping the X and O marks if
+    the game was started by O. The player who started is the player to move if both have made the same number of
+    moves, otherwise the player who has made the extra move.
+
+    Returns: The flat marks of the position, as it would be in an equivalent game that X started
+    """
+    flat_grid = playing_grid.ravel()
+    marks = np.where(flat_grid == BoardMarking.EMPTY.value, 0, flat_grid.real).astype(np.int8)
+    x_count = np.count_nonzero(marks == BoardMarking.X.value)
+    o_count = np.count_nonzero(marks == BoardMarking.O.value)
+    x_started = x_count > o_count or (x_count == o_count and player_to_move_value == BoardMarking.X.value)
+    return marks if x_started else -marks
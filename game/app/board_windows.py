@@ -0,0 +1,65 @@
+"""
+Module defining the windows of a playing grid - every line of win_length_k consecutive cells (along a row, column,
+diagonal or anti-diagonal) that a player could win on.
+The windows only depend on the shape of the board and the win length, so are calculated once and cached. They are
+represented as an array of flat indices into the playing grid, so that the contents of every window on a board can be
+looked up with a single numpy indexing operation, rather than by searching outwards from a cell.
+"""
+
+# Standard library imports
+from functools import lru_cache
+from typing import Tuple
+
+# Third party imports
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def get_window_indices(game_rows_m: int, game_cols_n: int, win_length_k: int) -> np.ndarray:
+    """
+    Function to get the flat indices of the cells in each window of a board with the given shape.
+
+    Returns: A (number of windows, win_length_k) array, where each row holds the flat indices of one window's cells,
+    in order along the window. The array is read only, since it is shared between all callers.
+    """
+    flat_index_grid = np.arange(game_rows_m * game_cols_n).reshape(game_rows_m, game_cols_n)
+    steps = np.arange(win_length_k)
+    windows = []
+    for row_step, col_step in ((0, 1), (1, 0), (1, 1), (1, -1)):  # Row, column, diagonal and anti-diagonal windows
+        for row_index in range(0, game_rows_m):
+            for col_index in range(0, game_cols_n):
+                end_row = row_index + row_step * (win_length_k - 1)
+                end_col = col_index + col_step * (win_length_k - 1)
+                if 0 <= end_row < game_rows_m and 0 <= end_col < game_cols_n:
+                    windows.append(flat_index_grid[row_index + row_step * steps, col_index + col_step * steps])
+    window_indices = np.array(windows, dtype=np.intp).reshape(-1, win_length_k)
+    window_indices.flags.writeable = False
+    return window_indices
+
+
+def get_window_values(playing_grid: np.ndarray, win_length_k: int) -> np.ndarray:
+    """
+    Function to get the markings in every window of the playing grid.
+    Returns: A (number of windows, win_length_k) array of BoardMarking values, with rows as for get_window_indices.
+    """
+    window_indices = get_window_indices(*playing_grid.shape, win_length_k)
+    return playing_grid.ravel()[window_indices]
+
+
+@lru_cache(maxsize=None)
+def get_cell_window_indices(game_rows_m: int, game_cols_n: int, win_length_k: int) -> Tuple[np.ndarray, ...]:
+    """
+    Function to get the windows that pass through each cell of a board with the given shape, i.e. the windows whose
+    contents change when the cell is marked.
+
+    Returns: A tuple holding, for each flat cell index, a read only array of the indices (into the rows of
+    get_window_indices) of the windows containing the cell
+    """
+    window_indices = get_window_indices(game_rows_m, game_cols_n, win_length_k)
+    window_numbers = np.repeat(np.arange(len(window_indices)), win_length_k)
+    cell_order = np.argsort(window_indices.ravel(), kind="stable")
+    windows_by_cell = np.split(window_numbers[cell_order], np.cumsum(
+        np.bincount(window_indices.ravel(), minlength=game_rows_m * game_cols_n))[:-1])
+    for cell_windows in windows_by_cell:
+        cell_windows.flags.writeable = False
+    return tuple(windows_by_cell)
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 import numpy as np
 
 # Local application imports
+from game.app.live_windows import LiveWindows, neither_player_can_win
 from game.app.player_base_class import Player
 from game.constants.game_constants import BoardMarking, StartingPlayer
 from game.app.win_check_location_search import win_check_and_location_search
@@ -43,6 +44,9 @@ class NoughtsAndCrosses:
             game_rows_m=self.game_rows_m, game_cols_n=self.game_cols_n, win_length_k=self.win_length_k)
         self.search_directions: List[np.ndarray] = self._get_search_directions(playing_grid=self.playing_grid)
         self.previous_mark_index: None | np.ndarray = None
+        # The live windows of the game, and the playing_grid they are kept in step with (see get_live_windows)
+        self._live_windows: LiveWindows | None = None
+        self._live_windows_playing_grid: np.ndarray | None = None
 
     ##########
     # Methods that are a part of the core game play flow
@@ -100,7 +104,8 @@ class NoughtsAndCrosses:
         Outcomes:
         If the cell is empty, a mark is made with value corresponding to the player due to go next,
         else if a non-empty marking_index is passed, a value error is raised.
-        The previous marking is then stored as the self.previous_mark_index attribute
+        The previous marking is then stored as the self.previous_mark_index attribute, and the live windows of the
+        game are updated.
         """
         if playing_grid is None:
             playing_grid = self.playing_grid
@@ -110,6 +115,8 @@ class NoughtsAndCrosses:
         if playing_grid[marking_index_tuple] == BoardMarking.EMPTY.value:
             marking = self.get_player_turn(playing_grid=playing_grid)
             playing_grid[marking_index_tuple] = marking
+            if playing_grid is self._live_windows_playing_grid:
+                self._live_windows.make_move(marking_index=marking_index, mark_value=marking)
         else:
             raise ValueError(f"mark_board attempted to mark non-empty cell at {marking_index}.")
 
@@ -154,17 +161,28 @@ class NoughtsAndCrosses:
 
     def check_for_draw(self, playing_grid: np.ndarray = None) -> bool:
         """
-        Method that checks whether or not the playing_grid has reached a stalemate. This is somewhat naive
-        in that it just checks for a full playing_grid - a draw may in fact have been guaranteed sooner than the
-        playing_grid being full, however this implementation is probably the fastest due to its simplicity.
+        Method that checks whether or not the playing_grid has reached a stalemate, i.e. whether neither player can
+        complete any window - which is the case well before the playing_grid is full in most larger games. This
+        assumes the playing_grid has been checked for a win first (a won board can have no live windows left).
+        The check for the game's own playing_grid uses the live windows kept in step with the game, so is immediate,
+        whereas any other playing_grid is checked from scratch.
 
         Returns: bool - T/F depending on whether the board has reached a draw
         """
-        if playing_grid is None:
-            playing_grid = self.playing_grid
+        if playing_grid is None or playing_grid is self.playing_grid:
+            return self.get_live_windows().neither_player_can_win()
+        return neither_player_can_win(playing_grid=playing_grid, win_length_k=self.win_length_k)
 
-        draw = np.all(playing_grid != BoardMarking.EMPTY.value)
-        return draw
+    def get_live_windows(self) -> LiveWindows:
+        """
+        Method to get the live windows of the game's playing_grid, which are kept in step with the moves made through
+        mark_board. They are only counted from scratch when the playing_grid has been replaced since they were counted
+        (e.g. when the game board is reset, or a position is set up directly).
+        """
+        if self._live_windows_playing_grid is not self.playing_grid:
+            self._live_windows = LiveWindows(playing_grid=self.playing_grid, win_length_k=self.win_length_k)
+            self._live_windows_playing_grid = self.playing_grid
+        return self._live_windows
 
     def reset_game_board(self) -> None:
         """
@@ -175,6 +193,20 @@ class NoughtsAndCrosses:
         self.playing_grid = self._get_playing_grid(game_rows_m=self.game_rows_m, game_cols_n=self.game_cols_n,
                                                    win_length_k=self.win_length_k)
 
+    def get_essential_parameters(self) -> NoughtsAndCrossesEssentialParameters:
+        """
+        Method to get the essential parameters defining the active game, for example so that an equivalent game can be
+        created in another process.
+        """
+        return NoughtsAndCrossesEssentialParameters(
+            game_rows_m=self.game_rows_m,
+            game_cols_n=self.game_cols_n,
+            win_length_k=self.win_length_k,
+            player_x=self.player_x,
+            player_o=self.player_o,
+            starting_player_value=self.starting_player_value
+        )
+
     # Lower level methods
     @staticmethod
     def _get_playing_grid(game_rows_m: int, game_cols_n: int, win_length_k: int) -> np.ndarray:
@@ -0,0 +1,105 @@
+"""
+Module defining the live windows of a playing grid - the windows (see board_windows) that a player can still complete,
+i.e. those holding none of the opponent's marks.
+
+Once neither player has a live window left, the game is a dead draw, however many cells are still empty - every
+remaining move is filler. Checking for this from scratch means looking at every window, so the number of each player's
+marks in every window, and the number of live windows of each player, are kept in step with the moves made instead. A
+move only changes the windows through its cell (at most 4 * win_length_k of them), so checking for a dead draw costs
+nothing beyond the update made with each move. The mark counts also say which windows a player can win in on their next
+move (those holding win_length_k - 1 of their marks and none of the opponent's), without looking at the board.
+"""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_windows import get_cell_window_indices, get_window_indices, get_window_values
+from game.constants.game_constants import BoardMarking
+
+
+class LiveWindows:
+    """
+    Class keeping the number of windows each player can still complete in step with the moves made and unmade on a
+    playing grid.
+
+    Instance attributes:
+    __________
+    win_length_k: The length of streak needed to win
+    game_cols_n: The number of columns of the playing grid (to convert move indices to flat cell indices)
+    x_counts/o_counts: The number of X/O marks in each window, in the order of the windows in get_window_indices
+    x_live_count/o_live_count: The number of windows X/O can still complete (those holding no marks of the opponent)
+    """
+
+    def __init__(self, playing_grid: np.ndarray, win_length_k: int):
+        self.win_length_k = win_length_k
+        self.game_cols_n = playing_grid.shape[1]
+        window_values = get_window_values(playing_grid=playing_grid, win_length_k=win_length_k)
+        self.x_counts = np.count_nonzero(window_values == BoardMarking.X.value, axis=1)
+        self.o_counts = np.count_nonzero(window_values == BoardMarking.O.value, axis=1)
+        self.x_live_count = int(np.count_nonzero(self.o_counts == 0))
+        self.o_live_count = int(np.count_nonzero(self.x_counts == 0))
+        self._window_indices = get_window_indices(*playing_grid.shape, win_length_k)
+        self._cell_window_indices = get_cell_window_indices(*playing_grid.shape, win_length_k)
+
+    def make_move(self, marking_index: np.ndarray, mark_value: int) -> None:
+        """Method to update the window counts for the given mark being made on the playing grid."""
+        self._update_windows(window_indices=self._get_cell_windows(marking_index=marking_index),
+                             mark_value=mark_value, mark_change=1)
+
+    def unmake_move(self, marking_index: np.ndarray, mark_value: int) -> None:
+        """Method to reverse the update of make_move, once the given mark has been removed from the playing grid."""
+        self._update_windows(window_indices=self._get_cell_windows(marking_index=marking_index),
+                             mark_value=mark_value, mark_change=-1)
+
+    def neither_player_can_win(self) -> bool:
+        """Method to check whether the game is a dead draw, since every window holds marks of both players."""
+        return self.x_live_count == 0 and self.o_live_count == 0
+
+    def get_immediate_winning_cells(self, playing_grid: np.ndarray, player_mark_value: int) -> np.ndarray:
+        """
+        Method to find every empty cell that would win the game for the given player if they marked it next, from the
+        mark counts of the windows, so that only the cells of windows the player can win in are looked at.
+
+        Parameters: playing_grid - the playing grid the counts are in step with, player_mark_value - the BoardMarking
+        value of the player
+
+        Returns: As for forced_moves.get_immediate_winning_cells
+        """
+        own_counts, opponent_counts = (self.x_counts, self.o_counts) if player_mark_value == BoardMarking.X.value \
+            else (self.o_counts, self.x_counts)
+        winning_windows = np.flatnonzero((own_counts == self.win_length_k - 1) & (opponent_counts == 0))
+        if len(winning_windows) == 0:
+            return np.empty(shape=(0, 2), dtype=np.int64)
+        window_cells = self._window_indices[winning_windows]
+        winning_flat_indices = np.unique(window_cells[playing_grid.ravel()[window_cells] == BoardMarking.EMPTY.value])
+        return np.column_stack(np.divmod(winning_flat_indices, self.game_cols_n))
+
+    def _get_cell_windows(self, marking_index: np.ndarray) -> np.ndarray:
+        """Method to get the indices of the windows passing through the cell at the marking index."""
+        return self._cell_window_indices[marking_index[0] * self.game_cols_n + marking_index[1]]
+
+    def _update_windows(self, window_indices: np.ndarray, mark_value: int, mark_change: int) -> None:
+        """
+        Method to add (or remove) a mark to the counts of the given windows. The windows in which the marking player
+        goes from having no marks to one (or back) are the ones that stop (or start) being live for the opponent.
+        """
+        mark_counts = self.x_counts if mark_value == BoardMarking.X.value else self.o_counts
+        previously_unmarked = np.count_nonzero(mark_counts[window_indices] == 0)
+        mark_counts[window_indices] += mark_change
+        opponent_live_count_change = np.count_nonzero(mark_counts[window_indices] == 0) - previously_unmarked
+        if mark_value == BoardMarking.X.value:
+            self.o_live_count += opponent_live_count_change
+        else:
+            self.x_live_count += opponent_live_count_change
+
+
+def neither_player_can_win(playing_grid: np.ndarray, win_length_k: int) -> bool:
+    """
+    Function to check from scratch whether the game on the playing grid is a dead draw, for when there is no LiveWindows
+    kept in step with it.
+    """
+    window_values = get_window_values(playing_grid=playing_grid, win_length_k=win_length_k)
+    holds_x = np.any(window_values == BoardMarking.X.value, axis=1)
+    holds_o = np.any(window_values == BoardMarking.O.value, axis=1)
+    return bool(np.all(holds_x & holds_o))
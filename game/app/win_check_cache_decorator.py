@@ -6,6 +6,7 @@ Module to define the decorator that is used for caching the win search.
 from collections import OrderedDict
 from enum import Enum
 from functools import update_wrapper
+import threading
 from typing import Tuple, List, Callable, Set, Union
 
 # Third party imports
@@ -35,6 +36,9 @@ class LRUCacheWinSearch:
     to infinity in effect)
     use_symmetry: True means that each time the win search is called, we also cache it's symmetric equivalence class,
     (OPTIONAL, defaults to False)
+
+    Note that the cache is accessed under a lock, since the win search may be called from a pondering thread at the
+    same time as from the main thread, and an OrderedDict is not safe to reorder from two threads at once.
     """
 
     def __init__(self,
@@ -44,6 +48,9 @@ class LRUCacheWinSearch:
         self.use_symmetry = use_symmetry
         self.win_search_func: Union[None, Callable] = None  # PyCharm linter doesn't like None | Callable
         self.cache: OrderedDict = OrderedDict({})
+        self.cache_lock = threading.Lock()
+        self.hits = 0  # The number of calls answered from the cache (a statistic, not used by the cache itself)
+        self.misses = 0
 
     def __call__(self, win_search_func: Callable = None, *args, **kwargs):
         """
@@ -78,19 +85,24 @@ class LRUCacheWinSearch:
         Parameters/Returns: As for the win_check_and_location_search method
         """
         hash_key = self._create_hash_key_from_kwargs(*args, **kwargs)
-        if hash_key in self.cache:
-            self.cache.move_to_end(hash_key)  # Now the most recently used
-            return self.cache[hash_key]
-        else:  # Must directly call function and cache
-            search_return_value = self.win_search_func(*args, **kwargs)
-            if self.use_symmetry and not kwargs[WinSearchKwarg.GET_WIN_LOCATION.value]:
-                # note the not kwargs["get_win_location"] is to avoid symmetry returning the wrong win location
-                hash_key_list = self._create_hash_key_list_for_symmetry_set_from_kwargs(*args, **kwargs)
-                for symm_hash_key in hash_key_list:
-                    self._cache_return_value(hash_key=symm_hash_key, return_value=search_return_value)
-            else:
-                self._cache_return_value(hash_key=hash_key, return_value=search_return_value)
-            return search_return_value
+        with self.cache_lock:
+            if hash_key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(hash_key)  # Now the most recently used
+                return self.cache[hash_key]
+            self.misses += 1
+
+        # Must directly call function and cache
+        search_return_value = self.win_search_func(*args, **kwargs)
+        if self.use_symmetry and not kwargs[WinSearchKwarg.GET_WIN_LOCATION.value]:
+            # note the not kwargs["get_win_location"] is to avoid symmetry returning the wrong win location
+            hash_key_list = self._create_hash_key_list_for_symmetry_set_from_kwargs(*args, **kwargs)
+        else:
+            hash_key_list = [hash_key]
+        with self.cache_lock:
+            for cache_hash_key in hash_key_list:
+                self._cache_return_value(hash_key=cache_hash_key, return_value=search_return_value)
+        return search_return_value
 
     def _cache_return_value(self, hash_key: Tuple[Tuple, bool], return_value: (bool, List[Tuple[int]])) -> None:
         """
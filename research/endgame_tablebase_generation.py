@@ -0,0 +1,31 @@
+"""
+Module to generate the endgame tablebase of a small game, by retrograde analysis of every reachable position.
+Once generated, the tablebase is picked up automatically by the game simulations and the GUI for games with the same
+structure, so that minimax plays those games perfectly without searching.
+Note that only boards of up to 16 cells are supported - a 4x4 tablebase is ~43MB, and takes a few seconds to generate.
+"""
+
+# Standard library imports
+import logging
+
+# Local application imports
+from automation.tablebase.endgame_tablebase import DEFAULT_TABLEBASE_DIRECTORY
+from automation.tablebase.tablebase_generation import generate_endgame_tablebase
+
+####################
+# TABLEBASE GENERATION parameters
+####################
+# Game structure parameters
+rows = 3
+columns = 3
+win_length = 3
+
+# Output parameters
+tablebase_directory = DEFAULT_TABLEBASE_DIRECTORY
+####################
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    tablebase_path = generate_endgame_tablebase(
+        game_rows_m=rows, game_cols_n=columns, win_length_k=win_length, tablebase_directory=tablebase_directory)
+    print(f"Tablebase saved to: {tablebase_path}")
@@ -0,0 +1,48 @@
+"""
+Module to benchmark evaluators of non-terminal boards against the reference evaluator, evaluate_non_terminal_board.
+Each evaluator is timed on a fixed corpus of positions, and its scores compared with the reference scores, so that a
+faster evaluator can be shown to leave the engine's play unchanged before it is passed to NoughtsAndCrossesMinimax.
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+# Local application imports
+from automation.minimax.evaluator import REFERENCE_EVALUATOR
+from automation.minimax.evaluator_benchmark import benchmark_evaluators, get_benchmark_positions
+from automation.minimax.incremental_evaluation import IncrementalEvaluation
+
+
+def evaluate_incrementally_from_scratch(playing_grid: np.ndarray, win_length_k: int, search_depth: int,
+                                        maximiser_mark_value: int, maximiser_has_next_turn: bool) -> float:
+    """The incremental evaluation used by the search, built from scratch for each board rather than move by move."""
+    incremental_evaluation = IncrementalEvaluation(playing_grid=playing_grid, win_length_k=win_length_k)
+    return incremental_evaluation.evaluate(search_depth=search_depth, maximiser_mark_value=maximiser_mark_value,
+                                           maximiser_has_next_turn=maximiser_has_next_turn)
+
+
+####################
+# EVALUATOR BENCHMARKING parameters
+####################
+# Game structure parameters
+rows = 10
+columns = 10
+win_length = 5
+
+# Corpus parameters
+number_of_positions = 2000
+corpus_seed = 0
+
+# Evaluators to benchmark, keyed by the name they are reported under
+evaluators = {
+    "reference": REFERENCE_EVALUATOR,
+    "incremental_from_scratch": evaluate_incrementally_from_scratch,
+}
+####################
+
+if __name__ == "__main__":
+    positions = get_benchmark_positions(game_rows_m=rows, game_cols_n=columns, win_length_k=win_length,
+                                        number_of_positions=number_of_positions, random_seed=corpus_seed)
+    benchmark_results = benchmark_evaluators(evaluators=evaluators, positions=positions)
+    print(pd.DataFrame(benchmark_results).to_string(index=False))
@@ -110,6 +110,7 @@ class GameProfiler:
         report = self._clean_profile_data(report=report)
         print(self.simulation_definition.get_string_detailing_simulation_parameters())
         report.print_stats(self.print_entries)
+        print(self.simulation_definition.get_search_stats_summary_text())
 
     def _save_report_to_file(self, profile: cProfile.Profile) -> None:
         """
@@ -131,6 +132,7 @@ class GameProfiler:
             report.print_stats()  # Saves the entire log to file
         with open(temporary_file_path, "r") as temporary_file, open(saved_file_path, "w") as saved_file:
             saved_file.write(self.simulation_definition.get_string_detailing_simulation_parameters())
+            saved_file.write(self.simulation_definition.get_search_stats_summary_text() + "\n\n")
             old_content = temporary_file.readlines()
             saved_file.writelines(old_content)
         temporary_file_path.unlink()  # Delete the temporary file
@@ -26,11 +26,14 @@ win_length = 3
 number_of_complete_games_to_simulate = 3
 player_x_simulated_as = PlayerOptions.MINIMAX
 player_o_simulated_as = PlayerOptions.RANDOM
+worker_processes = 1
+random_seed = None  # Set to replay the same games (when the searches are not limited by wall time)
 
 # Reporting parameters
 print_game_outcomes = True
 save_game_outcome_summary = True
 save_all_game_data = False
+record_board_statuses = False  # Note the moves are always recorded, and the boards can be replayed from them
 data_file_suffix = "_my_simulation"  # Note 'suffix' because simulation metadata auto included. Extension too.
 data_file_path = ROOT_PATH / "research" / "game_simulation_data"
 ####################
@@ -53,5 +56,8 @@ if __name__ == "__main__":
         save_all_game_data=save_all_game_data,
         output_data_path=data_file_path,
         output_data_file_suffix=data_file_suffix,
+        record_board_statuses=record_board_statuses,
+        workers=worker_processes,
+        random_seed=random_seed,
     )
     game_simulator.run_simulations()
@@ -0,0 +1,67 @@
+"""
+Module to build the opening book of a game, from the games played out between two simulated players.
+Once built, the book is picked up automatically by the game simulations and the GUI for games with the same structure,
+so that minimax plays the first few moves of those games from the book without searching.
+Note that the simulated players should not both be minimax, since minimax vs minimax games all follow the same line.
+"""
+
+# Local application imports
+from automation.game_simulation.game_simulation_base_class import GameSimulator
+from automation.game_simulation.game_simulation_constants import PlayerOptions
+from automation.mcts.mcts_limits import MCTSLimits
+from automation.opening_book.opening_book import DEFAULT_OPENING_BOOK_DIRECTORY, get_opening_book_path
+from automation.opening_book.opening_book_builder import OpeningBookBuilder
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.player_base_class import Player
+from game.constants.game_constants import BoardMarking
+
+####################
+# OPENING BOOK GENERATION parameters
+####################
+# Game structure parameters
+rows = 5
+columns = 5
+win_length = 4
+
+# Simulation parameters
+number_of_complete_games_to_simulate = 200
+player_x_simulated_as = PlayerOptions.MCTS
+player_o_simulated_as = PlayerOptions.MCTS
+mcts_limits = MCTSLimits(max_search_seconds=0.2)
+
+# Book parameters
+max_plies = 4
+min_games = 5
+opening_book_directory = DEFAULT_OPENING_BOOK_DIRECTORY
+####################
+
+if __name__ == "__main__":
+    setup_parameters = NoughtsAndCrossesEssentialParameters(
+        game_rows_m=rows,
+        game_cols_n=columns,
+        win_length_k=win_length,
+        player_x=Player(name="PLAYER_X", marking=BoardMarking.X),
+        player_o=Player(name="PLAYER_O", marking=BoardMarking.O)
+    )
+    game_simulator = GameSimulator(
+        setup_parameters=setup_parameters,
+        number_of_simulations=number_of_complete_games_to_simulate,
+        player_x_as=player_x_simulated_as,
+        player_o_as=player_o_simulated_as,
+        print_game_outcomes=True,
+        save_game_outcome_summary=False,
+        save_all_game_data=False,
+        mcts_limits=mcts_limits,
+    )
+    game_simulator.run_simulations()
+
+    opening_book_builder = OpeningBookBuilder(game_rows_m=rows, game_cols_n=columns, win_length_k=win_length,
+                                              max_plies=max_plies, min_games=min_games)
+    opening_book_builder.add_simulated_games(simulation_dataframe=game_simulator.get_simulation_dataframe(),
+                                             player_x_name=setup_parameters.player_x.name,
+                                             player_o_name=setup_parameters.player_o.name)
+    opening_book = opening_book_builder.build()
+    opening_book_path = get_opening_book_path(game_rows_m=rows, game_cols_n=columns, win_length_k=win_length,
+                                              opening_book_directory=opening_book_directory)
+    opening_book.save(opening_book_path=opening_book_path)
+    print(f"Opening book of {len(opening_book.entries)} positions saved to: {opening_book_path}")
@@ -0,0 +1,36 @@
+"""Tests for the neighbourhoods of the cells of a playing grid."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_neighbourhoods import get_distance_orderings, get_neighbourhood_masks, get_position_neighbourhood
+from game.constants.game_constants import BoardMarking
+
+
+class TestBoardNeighbourhoods:
+    def test_neighbourhood_of_corner_cell(self):
+        neighbourhood_masks = get_neighbourhood_masks(game_rows_m=4, game_cols_n=5, radius=1)
+        assert neighbourhood_masks.shape == (20, 20)
+        assert np.array_equal(np.flatnonzero(neighbourhood_masks[0]), [0, 1, 5, 6])
+
+    def test_position_neighbourhood_is_union_of_marked_cells(self):
+        playing_grid = np.full((5, 5), BoardMarking.EMPTY.value)
+        assert not get_position_neighbourhood(playing_grid=playing_grid, radius=1).any()
+        playing_grid[0, 0] = BoardMarking.X.value
+        playing_grid[4, 4] = BoardMarking.O.value
+        expected_neighbourhood = np.zeros((5, 5), dtype=bool)
+        expected_neighbourhood[:2, :2] = expected_neighbourhood[3:, 3:] = True
+        assert np.array_equal(get_position_neighbourhood(playing_grid=playing_grid, radius=1),
+                              expected_neighbourhood.ravel())
+
+    def test_distance_orderings(self):
+        distance_orderings = get_distance_orderings(game_rows_m=3, game_cols_n=3)
+        assert np.array_equal(distance_orderings[0], [0, 1, 3, 4, 2, 6, 5, 7, 8])  # Ties in flat index order
+        assert np.array_equal(distance_orderings[4], [4, 1, 3, 5, 7, 0, 2, 6, 8])
+
+    def test_seeded_distance_orderings_only_reorder_ties(self):
+        seeded_orderings = get_distance_orderings(game_rows_m=3, game_cols_n=3, tie_break_seed=1)
+        assert seeded_orderings[4, 0] == 4
+        assert set(seeded_orderings[4, 1:5]) == {1, 3, 5, 7}
+        assert set(seeded_orderings[4, 5:]) == {0, 2, 6, 8}
@@ -0,0 +1,42 @@
+"""Tests for the symmetries (rotations and reflections) of a playing grid."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_symmetries import get_canonical_key, get_canonical_marks, get_symmetry_permutations
+from utils import get_symmetry_set_of_tuples_from_array
+
+
+class TestBoardSymmetries:
+    def test_number_of_symmetries(self):
+        assert get_symmetry_permutations(game_rows_m=3, game_cols_n=3).shape == (8, 9)
+        assert get_symmetry_permutations(game_rows_m=3, game_cols_n=4).shape == (4, 12)
+        assert get_symmetry_permutations(game_rows_m=1, game_cols_n=4).shape == (2, 4)
+
+    def test_symmetric_variants_match_symmetry_set(self):
+        """The permutations give the same variants as the symmetry set used by the win check cache"""
+        playing_grid = np.arange(12).reshape(3, 4)
+        variants = playing_grid.ravel()[get_symmetry_permutations(3, 4)]
+        assert {tuple(variant) for variant in variants} == \
+            {tuple(np.array(variant).ravel()) for variant in get_symmetry_set_of_tuples_from_array(playing_grid)}
+
+    def test_symmetric_positions_share_canonical_key(self):
+        playing_grid = np.array([
+            [1, 0, 0],
+            [0, -1, 0],
+            [0, 0, 0]
+        ], dtype=np.int8)
+        keys = {get_canonical_key(flat_marks=np.rot90(playing_grid, k=rotations).ravel(), board_shape=(3, 3))
+                for rotations in range(4)}
+        assert len(keys) == 1
+        different_grid = playing_grid.copy()
+        different_grid[0, 1], different_grid[0, 0] = 1, 0
+        assert get_canonical_key(flat_marks=different_grid.ravel(), board_shape=(3, 3)) not in keys
+
+    def test_canonical_permutation_maps_moves_back(self):
+        flat_marks = np.array([0, 0, 1, 0, 0, 0, 0, 0, 0], dtype=np.int8)
+        canonical_marks, permutation = get_canonical_marks(flat_marks=flat_marks, board_shape=(3, 3))
+        assert np.array_equal(canonical_marks, flat_marks[permutation])
+        canonical_move = int(np.flatnonzero(canonical_marks == 1)[0])
+        assert permutation[canonical_move] == 2
@@ -0,0 +1,31 @@
+"""Tests for the windows (lines of win_length_k cells) of a playing grid."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.board_windows import get_cell_window_indices, get_window_indices, get_window_values
+
+
+class TestBoardWindows:
+    def test_number_of_windows(self):
+        """A 4x5 board with k=3 has 4*3 row, 2*5 column and 2*3 windows along each diagonal direction"""
+        assert get_window_indices(game_rows_m=4, game_cols_n=5, win_length_k=3).shape == (4 * 3 + 2 * 5 + 2 * 2 * 3, 3)
+
+    def test_three_three_windows(self):
+        window_indices = get_window_indices(game_rows_m=3, game_cols_n=3, win_length_k=3)
+        expected_windows = {(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)}
+        assert {tuple(window) for window in window_indices} == expected_windows
+
+    def test_window_values(self):
+        playing_grid = np.arange(9).reshape(3, 3)
+        window_values = get_window_values(playing_grid=playing_grid, win_length_k=3)
+        assert np.array_equal(window_values, get_window_indices(3, 3, 3))
+
+    def test_cell_window_indices(self):
+        """The centre of a 3x3 board is in 4 windows (middle row, middle column and both diagonals), a corner in 3"""
+        window_indices = get_window_indices(game_rows_m=3, game_cols_n=3, win_length_k=3)
+        cell_window_indices = get_cell_window_indices(game_rows_m=3, game_cols_n=3, win_length_k=3)
+        assert len(cell_window_indices[4]) == 4 and len(cell_window_indices[0]) == 3
+        for cell_index, cell_windows in enumerate(cell_window_indices):
+            assert np.array_equal(cell_windows, np.flatnonzero((window_indices == cell_index).any(axis=1)))
@@ -193,6 +193,16 @@ class TestNoughtsAndCrossesMethodsNotSearches:
         draw = three_three_game.check_for_draw()
         assert not draw
 
+    def test_check_for_draw_dead_draw_before_board_full(self, three_three_game):
+        """Test that a draw is found as soon as neither player can win, with the live windows kept in step"""
+        three_three_game.starting_player_value = BoardMarking.X.value
+        for marking_index in ([0, 0], [0, 1], [0, 2], [1, 1], [1, 0], [2, 0], [2, 1], [1, 2]):
+            assert not three_three_game.check_for_draw()
+            three_three_game.mark_board(marking_index=np.array(marking_index))
+        assert three_three_game.playing_grid[2, 2] == BoardMarking.EMPTY.value
+        assert three_three_game.check_for_draw()
+        assert three_three_game.check_for_draw(playing_grid=three_three_game.playing_grid.copy())
+
     # reset_game_board test
     def test_reset_game_board(self, three_three_game):
         """Test that the reset_game_board method correctly clears the game board"""
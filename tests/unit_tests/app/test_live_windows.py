@@ -0,0 +1,52 @@
+"""Tests for the live windows of a playing grid, which must always agree with a count from scratch."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from game.app.live_windows import LiveWindows, neither_player_can_win
+from game.constants.game_constants import BoardMarking
+
+
+class TestLiveWindows:
+    def test_live_counts_kept_in_step_with_moves_made_and_unmade(self):
+        """Fill a 6x7 board with k=4 at random, comparing the live counts with a count from scratch after every move"""
+        rng = np.random.default_rng(seed=0)
+        playing_grid = np.full(shape=(6, 7), fill_value=BoardMarking.EMPTY.value)
+        live_windows = LiveWindows(playing_grid=playing_grid, win_length_k=4)
+        mark_value = BoardMarking.X.value
+        marking_indices = [np.array(np.divmod(cell_index, 7)) for cell_index in rng.permutation(42)]
+        for marking_index in marking_indices:
+            playing_grid[tuple(marking_index)] = mark_value
+            live_windows.make_move(marking_index=marking_index, mark_value=mark_value)
+            mark_value = -mark_value
+            recounted_live_windows = LiveWindows(playing_grid=playing_grid, win_length_k=4)
+            assert live_windows.x_live_count == recounted_live_windows.x_live_count
+            assert live_windows.o_live_count == recounted_live_windows.o_live_count
+
+        for marking_index in reversed(marking_indices):
+            mark_value = -mark_value
+            playing_grid[tuple(marking_index)] = BoardMarking.EMPTY.value
+            live_windows.unmake_move(marking_index=marking_index, mark_value=mark_value)
+        assert live_windows.x_live_count == live_windows.o_live_count == 69  # Every window on the empty 6x7 board
+
+    def test_dead_draw_before_board_is_full(self):
+        playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.X.value],
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.O.value],
+            [BoardMarking.O.value, BoardMarking.X.value, BoardMarking.EMPTY.value]
+        ])
+        assert LiveWindows(playing_grid=playing_grid, win_length_k=3).neither_player_can_win()
+        assert neither_player_can_win(playing_grid=playing_grid, win_length_k=3)
+
+    def test_not_dead_draw_with_a_live_window(self):
+        playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.X.value],
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.X.value, BoardMarking.EMPTY.value]
+        ])
+        live_windows = LiveWindows(playing_grid=playing_grid, win_length_k=3)
+        assert live_windows.x_live_count == 1  # The right hand column
+        assert live_windows.o_live_count == 0
+        assert not live_windows.neither_player_can_win()
+        assert not neither_player_can_win(playing_grid=playing_grid, win_length_k=3)
@@ -11,6 +11,7 @@ import numpy as np
 # Local application imports
 from automation.game_simulation.game_simulation_base_class import GameSimulator
 from automation.game_simulation.game_simulation_constants import PlayerOptions, SimulationColumnName
+from automation.mcts.mcts_limits import MCTSLimits
 from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
 from game.app.player_base_class import Player
 from game.constants.game_constants import StartingPlayer, BoardMarking
@@ -44,8 +45,13 @@ def three_three_game_simulator(three_three_game_parameters):
 
 
 class TestGameSimulationBaseClass:
-    def test_construct_empty_simulation_dataframe(self, three_three_game_simulator):
-        """Tests that the dataframe construction method produces the correct columns for a 3 x 3 game."""
+    def test_simulation_dataframe_columns(self, three_three_game_parameters):
+        """Tests that the simulation dataframe has the correct columns for a 3 x 3 game, with boards recorded."""
+        game_simulator = GameSimulator(
+            setup_parameters=three_three_game_parameters, number_of_simulations=2,
+            player_x_as=PlayerOptions.RANDOM, player_o_as=PlayerOptions.RANDOM,
+            print_game_outcomes=False, save_game_outcome_summary=True, save_all_game_data=False,
+            record_board_statuses=True)
         move = SimulationColumnName.MOVE.name
         board_status = SimulationColumnName.BOARD_STATUS.name
         expected_columns = [SimulationColumnName.STARTING_PLAYER.name, SimulationColumnName.WINNING_PLAYER.name] + \
@@ -54,46 +60,68 @@ class TestGameSimulationBaseClass:
                             f"{board_status}_6", f"{board_status}_7", f"{board_status}_8", f"{board_status}_9"] + \
                            [f"{move}_1", f"{move}_2", f"{move}_3", f"{move}_4", f"{move}_5", f"{move}_6", f"{move}_7",
                             f"{move}_8", f"{move}_9"]
-        actual_columns = three_three_game_simulator._construct_empty_simulation_dataframe().columns
+        actual_columns = game_simulator.get_simulation_dataframe().columns
         assert all(expected_columns == actual_columns)
 
-    def test_add_board_status_to_simulation_dataframe(self, three_three_game_simulator):
-        """Test that the board status and last move get added to the simulation dataframe in correct place."""
-        # Give the game status information to the add_board_status... method
-        last_move = np.array([0, 0])
+    def test_simulation_dataframe_without_boards_has_only_moves(self, three_three_game_simulator):
+        """Tests that the boards are left out of the simulation dataframe when they are not recorded."""
+        actual_columns = three_three_game_simulator.get_simulation_dataframe().columns
+        assert not any(column.startswith(SimulationColumnName.BOARD_STATUS.name) for column in actual_columns)
+        assert len(actual_columns) == 2 + 9
+
+    def test_record_move_in_simulation_records(self, three_three_game_parameters):
+        """Test that the board status and last move get recorded in the correct place, and laid out as tuples."""
+        game_simulator = GameSimulator(
+            setup_parameters=three_three_game_parameters, number_of_simulations=3,
+            player_x_as=PlayerOptions.RANDOM, player_o_as=PlayerOptions.RANDOM,
+            print_game_outcomes=False, save_game_outcome_summary=True, save_all_game_data=False,
+            record_board_statuses=True)
+        simulation_records = game_simulator.simulation_records
+        simulation_number = 2
+        simulation_records.starting_player_values[simulation_number] = BoardMarking.O.value
+        playing_grid = np.array([[1j, 1j, 1j], [-1, 1j, 1j], [1j, 1j, 1j]])
+        simulation_records.record_move(game_number=simulation_number, marking_index=np.array([1, 0]),
+                                       playing_grid=playing_grid)
+        playing_grid[0, 0] = 1
+        simulation_records.record_move(game_number=simulation_number, marking_index=np.array([0, 0]),
+                                       playing_grid=playing_grid)
+
+        # Check that the game status has been correctly recorded
+        assert simulation_records.move_counts[simulation_number] == 2
+        assert np.all(simulation_records.moves[simulation_number, :2] == [3, 0])
+        assert np.all(simulation_records.board_statuses[simulation_number, 1] == [1, 0, 0, -1, 0, 0, 0, 0, 0])
+
+        simulation_dataframe = game_simulator.get_simulation_dataframe()
         moves_made = 2
-        simulation_number = 10
-        three_three_game_simulator.playing_grid = np.array([[1, 1j, 1j], [-1, 1j, 1j], [1j, 1j, 1j]])
-        three_three_game_simulator._add_board_status_to_simulation_dataframe(
-            last_move=last_move, moves_made=moves_made, simulation_number=simulation_number
-        )
-
-        # Check that the game status has been correctly added
         move_str = SimulationColumnName.MOVE.name
-        actual_last_move_df = three_three_game_simulator.simulation_dataframe.loc[
-            simulation_number, f"{move_str}_{moves_made}"]
-        expected_last_move_df = (0, 0)
-        assert actual_last_move_df == expected_last_move_df
-
+        assert simulation_dataframe.loc[simulation_number, f"{move_str}_{moves_made}"] == (0, 0)
         board_status_str = SimulationColumnName.BOARD_STATUS.name
-        actual_board_status_df = three_three_game_simulator.simulation_dataframe.loc[
-            simulation_number, f"{board_status_str}_{moves_made}"]
+        actual_board_status_df = simulation_dataframe.loc[simulation_number, f"{board_status_str}_{moves_made}"]
         expected_board_status_df = ((1, 1j, 1j), (-1, 1j, 1j), (1j, 1j, 1j))
         assert actual_board_status_df == expected_board_status_df
-
-    def test_add_winning_player_to_simulation_dataframe(self, three_three_game_simulator):
-        """Test that the correct winning player gets added to the simulation dataframe in correct place."""
-        # Give the game status information to the add_winning_player... method
-        simulation_number = 10
-        three_three_game_simulator.playing_grid = np.array([[1, 1, 1], [-1, -1, 1j], [1j, 1j, 1j]])
-        three_three_game_simulator._add_winning_player_to_simulation_dataframe(simulation_number=simulation_number)
-
-        # Check that the game status has been correctly added
-        winning_player_column_name = SimulationColumnName.WINNING_PLAYER.name
-        actual_winner = three_three_game_simulator.simulation_dataframe.loc[
-            simulation_number, winning_player_column_name]
-        expected_winner = three_three_game_simulator.player_x.name
-        assert actual_winner == expected_winner
+        assert simulation_dataframe.loc[simulation_number, SimulationColumnName.STARTING_PLAYER.name] == "PLAYER_O"
+
+        # The boards replayed from the moves are the boards recorded
+        simulation_records.board_statuses = None
+        replayed_board_statuses = simulation_records.get_board_statuses(game_number=simulation_number)
+        assert np.all(replayed_board_statuses == [[0, 0, 0, -1, 0, 0, 0, 0, 0], [1, 0, 0, -1, 0, 0, 0, 0, 0]])
+
+    def test_winning_players_recorded(self, three_three_game_simulator):
+        """Test that the winning player of each game is laid out in the simulation dataframe."""
+        three_three_game_simulator.run_simulations()
+        simulation_records = three_three_game_simulator.simulation_records
+        winning_players = three_three_game_simulator.get_simulation_dataframe()[
+            SimulationColumnName.WINNING_PLAYER.name]
+        expected_winning_players = {BoardMarking.X.value: three_three_game_simulator.player_x.name,
+                                    BoardMarking.O.value: three_three_game_simulator.player_o.name, 0: "DRAW"}
+        for simulation_number in range(10):
+            assert winning_players[simulation_number] == expected_winning_players[
+                simulation_records.winning_player_values[simulation_number]]
+        date = datetime.now().strftime("%Y_%m_%d")
+        for file_name in ("3_3_3_RANDOM_RANDOM_TEST.csv", "3_3_3_RANDOM_RANDOM_TEST_SUMMARY.txt"):
+            Path.unlink(three_three_game_simulator.output_data_path / date / file_name)
+        Path.rmdir(three_three_game_simulator.output_data_path / date)
+        Path.rmdir(three_three_game_simulator.output_data_path)
 
     def test_save_simulation_dataframe_to_file(self, three_three_game_simulator):
         """Test that the simulation dataframe is written to file appropriately"""
@@ -116,3 +144,45 @@ class TestGameSimulationBaseClass:
         Path.unlink(expected_file_path)
         Path.rmdir(three_three_game_simulator.output_data_path / date)
         Path.rmdir(three_three_game_simulator.output_data_path)
+
+    def test_mcts_player_simulated_to_completion(self, three_three_game_parameters):
+        """Test that a game against an MCTS player is simulated to completion, with every move legal"""
+        game_simulator = GameSimulator(
+            setup_parameters=three_three_game_parameters, number_of_simulations=1,
+            player_x_as=PlayerOptions.MCTS, player_o_as=PlayerOptions.RANDOM,
+            print_game_outcomes=False, save_game_outcome_summary=False, save_all_game_data=False,
+            mcts_limits=MCTSLimits(max_search_seconds=None, max_playouts=256))
+        game_simulator.run_simulations()
+        assert np.all(game_simulator.playing_grid == BoardMarking.EMPTY.value)  # The board is reset after the game
+
+    def test_get_position_scores(self, three_three_game_parameters):
+        """Test that every position reached in the simulated games gets scored"""
+        game_simulator = GameSimulator(
+            setup_parameters=three_three_game_parameters, number_of_simulations=3,
+            player_x_as=PlayerOptions.RANDOM, player_o_as=PlayerOptions.RANDOM,
+            print_game_outcomes=True, save_game_outcome_summary=False, save_all_game_data=False)
+        game_simulator.run_simulations()
+        position_scores = game_simulator.get_position_scores()
+
+        assert len(position_scores) == game_simulator.simulation_records.move_counts.sum()
+        assert set(position_scores["simulation_number"]) == {0, 1, 2}
+        assert np.all(position_scores.loc[position_scores["moves_made"] == 1, "score"] != 0)  # X or O has a streak
+
+    def test_games_shared_between_workers_are_reproducible(self, three_three_game_parameters):
+        """Test that every game is simulated by the worker processes, and that the same seed gives the same games"""
+        worker_simulation_records = []
+        for _ in range(2):
+            game_simulator = GameSimulator(
+                setup_parameters=three_three_game_parameters, number_of_simulations=5,
+                player_x_as=PlayerOptions.RANDOM, player_o_as=PlayerOptions.RANDOM,
+                print_game_outcomes=False, save_game_outcome_summary=True, save_all_game_data=False,
+                workers=2, random_seed=0)
+            game_simulator._play_simulations_in_worker_processes()
+            worker_simulation_records.append(game_simulator.simulation_records)
+
+        first_records, second_records = worker_simulation_records
+        assert len(first_records.move_counts) == 5
+        assert np.all(first_records.move_counts >= 5)  # The earliest a 3 x 3 game can be won
+        assert np.all(first_records.moves == second_records.moves)
+        assert np.all(first_records.starting_player_values == second_records.starting_player_values)
+        assert np.all(first_records.winning_player_values == second_records.winning_player_values)
@@ -0,0 +1,90 @@
+"""Tests for the Monte Carlo tree search engine."""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.mcts.mcts_ai import NoughtsAndCrossesMCTS
+from automation.mcts.mcts_limits import MCTSLimits
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.player_base_class import Player
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+E = BoardMarking.EMPTY.value
+
+
+@pytest.fixture(scope="module")
+def three_three_game_parameters():
+    return NoughtsAndCrossesEssentialParameters(
+        game_rows_m=3, game_cols_n=3, win_length_k=3,
+        player_x=Player(name="X", marking=BoardMarking.X), player_o=Player(name="O", marking=BoardMarking.O),
+        starting_player_value=X)
+
+
+@pytest.fixture(scope="function")
+def three_three_mcts(three_three_game_parameters):
+    return NoughtsAndCrossesMCTS(setup_parameters=three_three_game_parameters,
+                                 mcts_limits=MCTSLimits(max_search_seconds=None, max_playouts=8000),
+                                 check_forced_moves=False, random_seed=0)
+
+
+class TestNoughtsAndCrossesMCTSThreeThreeThree:
+    def test_search_finds_immediate_win(self, three_three_mcts):
+        three_three_mcts.playing_grid = np.array([
+            [X, X, E],
+            [O, O, E],
+            [E, E, E]
+        ])
+        win_rate, move = three_three_mcts.get_mcts_move()
+        assert np.array_equal(move, np.array([0, 2]))
+        assert win_rate > 0.9
+
+    def test_search_finds_block(self, three_three_mcts):
+        three_three_mcts.playing_grid = np.array([
+            [X, X, E],
+            [O, E, E],
+            [E, E, E]
+        ])  # O to move
+        _, move = three_three_mcts.get_mcts_move()
+        assert np.array_equal(move, np.array([0, 2]))
+
+    def test_search_takes_centre_on_empty_board(self, three_three_mcts):
+        _, move = three_three_mcts.get_mcts_move()
+        assert np.array_equal(move, np.array([1, 1]))
+
+    def test_forced_win_played_without_search(self, three_three_game_parameters):
+        mcts = NoughtsAndCrossesMCTS(setup_parameters=three_three_game_parameters)
+        mcts.playing_grid = np.array([
+            [X, E, E],
+            [O, X, E],
+            [O, E, E]
+        ])
+        win_rate, move = mcts.get_mcts_move()
+        assert win_rate == 1
+        assert np.array_equal(move, np.array([2, 2]))
+
+    def test_playout_budget_is_respected(self, three_three_mcts):
+        limits = MCTSLimits(max_search_seconds=None, max_playouts=320, playouts_per_expansion=32)
+        root = three_three_mcts.search_tree(marks=np.zeros(9, dtype=np.int8), player_to_move_value=X,
+                                            mcts_limits=limits)
+        assert root.visits == 320
+        assert len(root.children) == 9  # Each of the 10 iterations after the first expands a new root move
+
+    def test_parallel_search_finds_immediate_win(self, three_three_game_parameters):
+        mcts = NoughtsAndCrossesMCTS(setup_parameters=three_three_game_parameters,
+                                     mcts_limits=MCTSLimits(max_search_seconds=None, max_playouts=4000),
+                                     parallel_processes=2, check_forced_moves=False, random_seed=0)
+        mcts.playing_grid = np.array([
+            [X, X, E],
+            [O, O, E],
+            [E, E, E]
+        ])
+        _, move = mcts.get_mcts_move()
+        assert np.array_equal(move, np.array([0, 2]))
+
+    def test_limits_must_be_bounded(self):
+        with pytest.raises(ValueError):
+            MCTSLimits(max_search_seconds=None, max_playouts=None)
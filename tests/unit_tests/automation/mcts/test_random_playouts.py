@@ -0,0 +1,43 @@
+"""Tests for the vectorised random playouts used by the Monte Carlo tree search."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.mcts.random_playouts import get_random_playout_winners
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+
+
+class TestGetRandomPlayoutWinners:
+    def test_single_empty_cell_is_won_by_player_to_move(self):
+        """Filling the last cell completes X's row, so every playout is won by X"""
+        marks = np.array([X, X, 0,
+                          O, O, X,
+                          X, O, O], dtype=np.int8)
+        winners = get_random_playout_winners(marks=marks, board_shape=(3, 3), win_length_k=3, player_to_move_value=X,
+                                             number_of_playouts=10, random_generator=np.random.default_rng(0))
+        assert np.all(winners == X)
+
+    def test_single_empty_cell_drawn(self):
+        marks = np.array([X, O, X,
+                          X, O, O,
+                          O, X, 0], dtype=np.int8)
+        winners = get_random_playout_winners(marks=marks, board_shape=(3, 3), win_length_k=3, player_to_move_value=X,
+                                             number_of_playouts=10, random_generator=np.random.default_rng(0))
+        assert np.all(winners == 0)
+
+    def test_winner_depends_on_fill_order(self):
+        """
+        X wins by filling (0, 2) first, otherwise O blocks X's row with their anti-diagonal - so half of the playouts
+        are won by each player.
+        """
+        marks = np.array([X, X, 0,
+                          O, O, 0,
+                          O, X, X], dtype=np.int8)
+        winners = get_random_playout_winners(marks=marks, board_shape=(3, 3), win_length_k=3, player_to_move_value=X,
+                                             number_of_playouts=500, random_generator=np.random.default_rng(0))
+        assert set(np.unique(winners)) == {X, O}
+        assert 0.4 < np.mean(winners == X) < 0.6
@@ -0,0 +1,105 @@
+"""Tests for the asyncio interface to the minimax search."""
+
+# Standard library imports
+import asyncio
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.minimax.async_search import AsyncMinimaxSearch, get_minimax_move_async
+from automation.minimax.constants.iterative_deepening_constants import SearchStopReason
+from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+from automation.minimax.search_limits import SearchLimits
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.player_base_class import Player
+from game.constants.game_constants import BoardMarking, StartingPlayer
+
+
+def get_engine(game_rows_m: int, game_cols_n: int, win_length_k: int,
+               search_limits: SearchLimits) -> NoughtsAndCrossesMinimax:
+    return NoughtsAndCrossesMinimax(setup_parameters=NoughtsAndCrossesEssentialParameters(
+        game_rows_m=game_rows_m, game_cols_n=game_cols_n, win_length_k=win_length_k,
+        player_x=Player(name="X", marking=BoardMarking.X), player_o=Player(name="O", marking=BoardMarking.O),
+        starting_player_value=StartingPlayer.PLAYER_X.value), search_limits=search_limits, check_forced_moves=False)
+
+
+class TestAsyncMinimaxSearch:
+    def test_iteration_results_are_published_as_they_finish(self):
+        engine = get_engine(game_rows_m=3, game_cols_n=3, win_length_k=3, search_limits=SearchLimits(
+            max_search_seconds=None, max_search_depth=4))
+        engine.mark_board(marking_index=np.array([0, 0]))
+
+        async def search():
+            async_search = AsyncMinimaxSearch(engine=engine)
+            published_depths = [iteration_result.search_depth async for iteration_result in
+                                async_search.iteration_results()]
+            return published_depths, await async_search.result()
+
+        published_depths, (score, move, search_stats) = asyncio.run(search())
+        assert published_depths == [2, 3, 4]
+        synchronous_score, synchronous_move = engine.get_minimax_move_iterative_deepening()
+        assert score == synchronous_score
+        assert np.array_equal(move, synchronous_move)
+        assert search_stats.stop_reason == SearchStopReason.MAX_SEARCH_DEPTH_REACHED
+
+    def test_cancelled_search_returns_best_move_so_far(self):
+        engine = get_engine(game_rows_m=10, game_cols_n=10, win_length_k=5, search_limits=SearchLimits(
+            max_search_seconds=None, max_search_depth=10))
+        engine.mark_board(marking_index=np.array([4, 4]))
+
+        async def search():
+            async_search = AsyncMinimaxSearch(engine=engine)
+            async for _ in async_search.iteration_results():
+                async_search.cancel()  # Cancel as soon as the first iteration is in
+            return await async_search.result()
+
+        _, move, search_stats = asyncio.run(search())
+        assert move is not None
+        assert search_stats.stop_reason == SearchStopReason.SEARCH_CANCELLED
+
+    def test_lazy_smp_search_publishes_iterations_and_can_be_cancelled(self):
+        engine = get_engine(game_rows_m=10, game_cols_n=10, win_length_k=5, search_limits=SearchLimits(
+            max_search_seconds=None, max_search_depth=10))
+        engine.lazy_smp_processes = 2
+        engine.mark_board(marking_index=np.array([4, 4]))
+
+        async def search():
+            async_search = AsyncMinimaxSearch(engine=engine)
+            published_depths = []
+            async for iteration_result in async_search.iteration_results():
+                published_depths.append(iteration_result.search_depth)
+                async_search.cancel()
+            return published_depths, await async_search.result()
+
+        published_depths, (_, move, search_stats) = asyncio.run(search())
+        assert published_depths[0] == 2
+        assert move is not None
+        assert search_stats.stop_reason == SearchStopReason.SEARCH_CANCELLED
+
+    def test_concurrent_searches_share_an_event_loop(self):
+        engines = [get_engine(game_rows_m=3, game_cols_n=3, win_length_k=3, search_limits=SearchLimits(
+            max_search_seconds=None, max_search_depth=3)) for _ in range(3)]
+
+        async def search_all():
+            return await asyncio.gather(*[get_minimax_move_async(engine=engine) for engine in engines])
+
+        results = asyncio.run(search_all())
+        assert all(move is not None for _, move, _ in results)
+
+    def test_cancelling_the_awaiting_task_stops_the_search(self):
+        engine = get_engine(game_rows_m=10, game_cols_n=10, win_length_k=5, search_limits=SearchLimits(
+            max_search_seconds=None, max_search_depth=10))
+        engine.mark_board(marking_index=np.array([4, 4]))
+        async_search = AsyncMinimaxSearch(engine=engine)
+
+        async def search():
+            search_task = asyncio.create_task(async_search.result())
+            await asyncio.sleep(0.1)
+            search_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await search_task
+
+        asyncio.run(search())
+        assert async_search._stop_event.is_set()
@@ -0,0 +1,49 @@
+"""Tests for the branch factor policy, which sets the branch limits and late move reductions of a search."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.constants.iterative_deepening_constants import BranchFactor
+from game.constants.game_constants import BoardMarking
+
+
+def get_policy(playing_grid: np.ndarray, win_length_k: int, move_budget_seconds: float,
+               nodes_per_second: float = 1000) -> BranchFactorPolicy:
+    return BranchFactorPolicy.for_search(playing_grid=playing_grid, win_length_k=win_length_k, max_search_depth=10,
+                                         move_budget_seconds=move_budget_seconds, max_nodes=None,
+                                         nodes_per_second=nodes_per_second)
+
+
+class TestBranchFactorPolicy:
+    def test_small_board_is_not_truncated(self):
+        """The game ends within the untruncated depths, so every move is searched"""
+        playing_grid = np.full((3, 3), BoardMarking.X.value, dtype=complex)
+        playing_grid[0, :2] = BoardMarking.EMPTY.value
+        policy = get_policy(playing_grid=playing_grid, win_length_k=3, move_budget_seconds=0.01)
+        assert policy.get_max_branch_factor(search_depth=5) == 2
+
+    def test_branch_limit_grows_with_budget(self):
+        playing_grid = np.full((10, 10), BoardMarking.EMPTY.value)
+        playing_grid[4, 4] = BoardMarking.X.value
+        tight_policy = get_policy(playing_grid=playing_grid, win_length_k=5, move_budget_seconds=1)
+        generous_policy = get_policy(playing_grid=playing_grid, win_length_k=5, move_budget_seconds=10 ** 6)
+        assert tight_policy.get_max_branch_factor(search_depth=0) == 99
+        assert tight_policy.get_max_branch_factor(search_depth=2) == BranchFactor.minimum_branch_factor.value
+        assert generous_policy.get_max_branch_factor(search_depth=9) > BranchFactor.minimum_branch_factor.value
+
+    def test_late_move_reductions(self):
+        policy = BranchFactorPolicy(branch_limits=(20, 20, 10), full_depth_moves=2, max_reduction=3)
+        assert policy.get_reduction(search_depth=0, move_number=10, remaining_depth=6) == 0  # Root moves
+        assert policy.get_reduction(search_depth=2, move_number=1, remaining_depth=6) == 0
+        assert policy.get_reduction(search_depth=2, move_number=3, remaining_depth=6) == 1
+        assert policy.get_reduction(search_depth=2, move_number=4, remaining_depth=6) == 3
+        assert policy.get_reduction(search_depth=2, move_number=4, remaining_depth=2) == 1  # The move is still searched
+
+    def test_threats_add_full_depth_moves(self):
+        playing_grid = np.full((7, 7), BoardMarking.EMPTY.value)
+        quiet_policy = get_policy(playing_grid=playing_grid, win_length_k=5, move_budget_seconds=1)
+        playing_grid[3, 1:4] = BoardMarking.O.value  # A three, in two of the windows along the row
+        forcing_policy = get_policy(playing_grid=playing_grid, win_length_k=5, move_budget_seconds=1)
+        assert forcing_policy.full_depth_moves == quiet_policy.full_depth_moves + 2
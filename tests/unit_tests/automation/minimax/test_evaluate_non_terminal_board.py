@@ -4,7 +4,8 @@
 import numpy as np
 
 # Local application imports
-from automation.minimax.evaluate_non_terminal_board import _get_convolved_array, evaluate_non_terminal_board, \
+from automation.minimax.evaluate_non_terminal_board import _get_relevant_streaks, _get_window_counts, \
+    evaluate_boards, evaluate_non_terminal_board, get_evaluation_cache_info, get_window_score_table, \
     _score_individual_streak
 from automation.minimax.constants.terminal_board_scores import BoardScore
 from game.constants.game_constants import BoardMarking
@@ -57,6 +58,63 @@ class TestEvaluateNonTerminalBoard:
         )
         assert actual_score >= BoardScore.EXPECTED_MAX_WIN.value
 
+    def test_empty_board_scored_as_draw(self):
+        playing_grid = np.full(shape=(3, 3), fill_value=BoardMarking.EMPTY.value)
+        actual_score = evaluate_non_terminal_board(
+            playing_grid=playing_grid, win_length_k=3,
+            search_depth=0, maximiser_mark_value=BoardMarking.X.value, maximiser_has_next_turn=True,
+        )
+        assert actual_score == 0
+
+
+    def test_same_board_at_different_search_depths_shares_cache_entry(self):
+        playing_grid = np.array([[BoardMarking.X.value, BoardMarking.X.value, BoardMarking.EMPTY.value],
+                                 [BoardMarking.O.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+                                 [BoardMarking.O.value, BoardMarking.EMPTY.value, BoardMarking.X.value]])
+        cache_info_before = get_evaluation_cache_info()
+        shallow_score = evaluate_non_terminal_board(
+            playing_grid=playing_grid, win_length_k=3,
+            search_depth=1, maximiser_mark_value=BoardMarking.X.value, maximiser_has_next_turn=True)
+        deep_score = evaluate_non_terminal_board(
+            playing_grid=playing_grid, win_length_k=3,
+            search_depth=3, maximiser_mark_value=BoardMarking.X.value, maximiser_has_next_turn=True)
+        cache_info_after = get_evaluation_cache_info()
+
+        assert shallow_score - deep_score == 2  # The depth penalty is still applied to each
+        assert cache_info_after.misses - cache_info_before.misses <= 1
+        assert cache_info_after.hits - cache_info_before.hits >= 1
+
+
+class TestEvaluateBoards:
+    """Class for testing the evaluate_boards method, which must agree with evaluate_non_terminal_board"""
+
+    def test_scores_match_evaluate_non_terminal_board(self):
+        rng = np.random.default_rng(seed=0)
+        playing_grids = rng.choice(np.array([BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value,
+                                             BoardMarking.EMPTY.value]), size=(100, 6, 7))
+        maximiser_mark_values = rng.choice([BoardMarking.X.value, BoardMarking.O.value], size=100)
+        maximiser_has_next_turn_flags = rng.random(size=100) < 0.5
+        search_depths = rng.integers(low=0, high=5, size=100)
+
+        actual_scores = evaluate_boards(
+            playing_grids=playing_grids, win_length_k=4, maximiser_mark_values=maximiser_mark_values,
+            maximiser_has_next_turn_flags=maximiser_has_next_turn_flags, search_depths=search_depths)
+
+        expected_scores = [evaluate_non_terminal_board(
+            playing_grid=playing_grid, win_length_k=4, search_depth=int(search_depth),
+            maximiser_mark_value=int(maximiser_mark_value), maximiser_has_next_turn=bool(maximiser_has_next_turn))
+            for playing_grid, maximiser_mark_value, maximiser_has_next_turn, search_depth in
+            zip(playing_grids, maximiser_mark_values, maximiser_has_next_turn_flags, search_depths)]
+        assert np.array_equal(actual_scores, expected_scores)
+
+    def test_empty_board_in_stack_scored_as_draw(self):
+        playing_grids = np.full(shape=(2, 3, 3), fill_value=BoardMarking.EMPTY.value)
+        playing_grids[1, 0, :2] = BoardMarking.X.value
+        actual_scores = evaluate_boards(playing_grids=playing_grids, win_length_k=3,
+                                        maximiser_mark_values=BoardMarking.X.value, maximiser_has_next_turn_flags=True)
+        assert actual_scores[0] == 0
+        assert actual_scores[1] >= BoardScore.EXPECTED_MAX_WIN.value
+
 
 class TestScoreIndividualStreak:
     """
@@ -98,84 +156,70 @@ class TestScoreIndividualStreak:
         assert score == expected_score
 
 
-class TestGetConvolvedArray:
-    """Class for testing the _get_convolved_array function"""
-
-    def test_get_convolved_array_empty_row(self):
-        win_length_k = 5
-        maximiser_mark_value = BoardMarking.X.value
-        board_row = np.array([BoardMarking.EMPTY.value] * 6)
-
-        expected_convolution = np.array([5j, 5j])
-        actual_convolution = _get_convolved_array(array=board_row, win_length_k=win_length_k,
-                                                  maximiser_mark_value=maximiser_mark_value)
-
-        assert np.all(expected_convolution == actual_convolution)
-
-    def test_get_convolved_array_streaks_positive_for_maximiser_x(self):
-        """
-        Test that the real part of the streaks in the convolved arrays is positive when the streak belongs
-        to the maximiser, when the maximiser is playing as x.
-        (Note that the streaks are not winnable so would get filtered out anyway)
-        """
-        win_length_k = 5
-        maximiser_mark_value = BoardMarking.X.value
-        board_row = np.array([BoardMarking.X.value, BoardMarking.X.value, BoardMarking.X.value, BoardMarking.O.value,
-                              BoardMarking.EMPTY.value, BoardMarking.X.value])
-
-        expected_convolution = np.array([2 + 1j, 2 + 1j])
-        actual_convolution = _get_convolved_array(array=board_row, win_length_k=win_length_k,
-                                                  maximiser_mark_value=maximiser_mark_value)
-
-        assert np.all(expected_convolution == actual_convolution)
-
-    def test_get_convolved_array_streaks_positive_for_maximiser_o(self):
-        """
-        Test that the real part of the streaks in the convolved arrays is positive when the streaks belong
-        to the maximiser, when the maximiser is playing as x.
-        (Note that the streaks are not winnable so would get filtered out anyway)
-        """
-        win_length_k = 5
-        maximiser_mark_value = BoardMarking.O.value
-        board_row = np.array([BoardMarking.O.value, BoardMarking.O.value, BoardMarking.O.value, BoardMarking.X.value,
-                              BoardMarking.EMPTY.value, BoardMarking.O.value])
-
-        expected_convolution = np.array([2 - 1j, 2 - 1j])
-        actual_convolution = _get_convolved_array(array=board_row, win_length_k=win_length_k,
-                                                  maximiser_mark_value=maximiser_mark_value)
-
-        assert np.all(expected_convolution == actual_convolution)
-
-    def test_get_convolved_array_streaks_negative_for_maximiser_x(self):
-        """
-        Test that the real part of the streaks in the convolved arrays is negative when the streaks belong
-        to the minimiser, when the maximiser is playing as x.
-        (Note that the streaks are not winnable so would get filtered out anyway)
-        """
-        win_length_k = 5
-        maximiser_mark_value = BoardMarking.X.value
-        board_row = np.array([BoardMarking.O.value, BoardMarking.O.value, BoardMarking.O.value, BoardMarking.X.value,
-                              BoardMarking.EMPTY.value, BoardMarking.O.value])
-
-        expected_convolution = np.array([-2 + 1j, -2 + 1j])
-        actual_convolution = _get_convolved_array(array=board_row, win_length_k=win_length_k,
-                                                  maximiser_mark_value=maximiser_mark_value)
-
-        assert np.all(expected_convolution == actual_convolution)
-
-    def test_get_convolved_array_streaks_negative_for_maximiser_o(self):
-        """
-        Test that the real part of the streaks in the convolved arrays is negative when the streaks belong
-        to the minimiser, when the maximiser is playing as o.
-        (Note that the streaks are not winnable so would get filtered out anyway)
-        """
-        win_length_k = 5
-        maximiser_mark_value = BoardMarking.O.value
-        board_row = np.array([BoardMarking.X.value, BoardMarking.X.value, BoardMarking.X.value, BoardMarking.O.value,
-                              BoardMarking.EMPTY.value, BoardMarking.X.value])
-
-        expected_convolution = np.array([-2 - 1j, -2 - 1j])
-        actual_convolution = _get_convolved_array(array=board_row, win_length_k=win_length_k,
-                                                  maximiser_mark_value=maximiser_mark_value)
-
-        assert np.all(expected_convolution == actual_convolution)
+class TestGetWindowScoreTable:
+    """Class for testing the get_window_score_table function, which the windows of a board are scored from"""
+
+    def test_unwinnable_windows_score_zero(self):
+        window_scores = get_window_score_table(win_length_k=4, maximiser_has_next_turn=True, leading_player_sign=1)
+        assert window_scores[0, 0] == 0
+        assert np.all(window_scores[1:, 1:] == 0)
+
+    def test_window_scores_match_individual_streak_scores(self):
+        for maximiser_has_next_turn in (True, False):
+            for leading_player_sign in (-1, 0, 1):
+                window_scores = get_window_score_table(win_length_k=4, maximiser_has_next_turn=maximiser_has_next_turn,
+                                                       leading_player_sign=leading_player_sign)
+                for count in range(1, 5):
+                    for streak in (count, -count):
+                        expected_score = _score_individual_streak(
+                            streak=complex(streak, 4 - count), win_length_k=4,
+                            maximiser_has_next_turn=maximiser_has_next_turn,
+                            leading_player_indicator=leading_player_sign)
+                        assert window_scores[max(streak, 0), max(-streak, 0)] == expected_score
+
+
+class TestGetRelevantStreaks:
+    """Class for testing the _get_relevant_streaks function, on boards with a single row of length 6 and k=5"""
+
+    def test_get_relevant_streaks_empty_row(self):
+        """Test that entirely empty windows are not relevant"""
+        board_row = np.array([[BoardMarking.EMPTY.value] * 6])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.X.value))
+        assert len(actual_streaks) == 0
+
+    def test_get_relevant_streaks_blocked_windows_filtered_out(self):
+        """Test that windows containing marks of both players (so which can't be won) are not relevant"""
+        board_row = np.array([[BoardMarking.X.value, BoardMarking.X.value, BoardMarking.X.value, BoardMarking.O.value,
+                               BoardMarking.EMPTY.value, BoardMarking.X.value]])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.X.value))
+        assert len(actual_streaks) == 0
+
+    def test_get_relevant_streaks_positive_for_maximiser_x(self):
+        board_row = np.array([[BoardMarking.X.value, BoardMarking.X.value, BoardMarking.X.value,
+                               BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.X.value))
+        assert np.all(actual_streaks == np.array([3, 2]))
+
+    def test_get_relevant_streaks_positive_for_maximiser_o(self):
+        board_row = np.array([[BoardMarking.O.value, BoardMarking.O.value, BoardMarking.O.value,
+                               BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.O.value))
+        assert np.all(actual_streaks == np.array([3, 2]))
+
+    def test_get_relevant_streaks_negative_for_maximiser_x(self):
+        board_row = np.array([[BoardMarking.O.value, BoardMarking.O.value, BoardMarking.O.value,
+                               BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.X.value))
+        assert np.all(actual_streaks == np.array([-3, -2]))
+
+    def test_get_relevant_streaks_negative_for_maximiser_o(self):
+        board_row = np.array([[BoardMarking.X.value, BoardMarking.X.value, BoardMarking.X.value,
+                               BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]])
+        actual_streaks = _get_relevant_streaks(*_get_window_counts(
+            playing_grid=board_row, win_length_k=5, maximiser_mark_value=BoardMarking.O.value))
+        assert np.all(actual_streaks == np.array([-3, -2]))
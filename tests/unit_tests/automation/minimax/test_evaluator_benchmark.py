@@ -0,0 +1,37 @@
+"""Tests for the benchmarking of evaluators against the reference evaluator."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.evaluate_non_terminal_board import evaluate_non_terminal_board
+from automation.minimax.evaluator_benchmark import benchmark_evaluators, get_benchmark_positions
+from game.app.board_windows import get_window_values
+
+
+class TestEvaluatorBenchmark:
+    def test_benchmark_positions_are_fixed_and_non_terminal(self):
+        positions = get_benchmark_positions(game_rows_m=6, game_cols_n=7, win_length_k=4, number_of_positions=50)
+        repeat_positions = get_benchmark_positions(game_rows_m=6, game_cols_n=7, win_length_k=4,
+                                                   number_of_positions=50)
+        assert len(positions) == 50
+        for position, repeat_position in zip(positions, repeat_positions):
+            assert np.all(position.playing_grid == repeat_position.playing_grid)
+            window_sums = get_window_values(playing_grid=position.playing_grid, win_length_k=4).sum(axis=1)
+            assert np.all(np.abs(window_sums) < 4)
+
+    def test_reference_agrees_and_different_evaluator_disagrees(self):
+        """The reference evaluator always agrees with itself, whereas an evaluator ignoring the board does not"""
+        def draw_evaluator(playing_grid, win_length_k, search_depth, maximiser_mark_value, maximiser_has_next_turn):
+            return 0
+
+        positions = get_benchmark_positions(game_rows_m=6, game_cols_n=7, win_length_k=4, number_of_positions=50)
+        reference_result, draw_result = benchmark_evaluators(
+            evaluators={"reference": evaluate_non_terminal_board, "draw": draw_evaluator}, positions=positions,
+            number_of_passes=1)
+        assert reference_result.name == "reference"
+        assert reference_result.agreement_rate == 1
+        assert reference_result.max_score_difference == 0
+        assert reference_result.ns_per_evaluation > 0
+        assert draw_result.agreement_rate < 1
+        assert draw_result.max_score_difference > 0
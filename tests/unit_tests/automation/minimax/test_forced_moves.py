@@ -0,0 +1,104 @@
+"""Tests for the forced move check made before the minimax search."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.forced_move_constants import ForcedMoveType
+from automation.minimax.forced_moves import get_forced_move, get_immediate_winning_cells
+from automation.minimax.incremental_evaluation import IncrementalEvaluation
+from game.app.live_windows import LiveWindows
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+E = BoardMarking.EMPTY.value
+
+
+class TestGetImmediateWinningCells:
+    """Class for testing the identification of the cells a player can win on next turn"""
+
+    def test_winning_cells_in_row_column_and_diagonal(self):
+        playing_grid = np.array([
+            [X, X, E, E],
+            [E, O, E, E],
+            [X, E, O, E],
+            [E, E, E, E]
+        ])
+        winning_cells = get_immediate_winning_cells(playing_grid=playing_grid, win_length_k=3, player_mark_value=X)
+        assert np.array_equal(winning_cells, np.array([[0, 2], [1, 0]]))
+        o_winning_cells = get_immediate_winning_cells(playing_grid=playing_grid, win_length_k=3, player_mark_value=O)
+        assert np.array_equal(o_winning_cells, np.array([[3, 3]]))
+
+    def test_blocked_window_is_not_a_winning_cell(self):
+        playing_grid = np.array([
+            [X, X, O],
+            [E, E, E],
+            [E, E, E]
+        ])
+        winning_cells = get_immediate_winning_cells(playing_grid=playing_grid, win_length_k=3, player_mark_value=X)
+        assert len(winning_cells) == 0
+
+
+class TestGetForcedMove:
+    """Class for testing which kind of forced move (if any) the player to move has"""
+
+    def test_win_takes_priority_over_block(self):
+        playing_grid = np.array([
+            [X, X, E],
+            [O, O, E],
+            [E, E, E]
+        ])
+        forced_move = get_forced_move(playing_grid=playing_grid, win_length_k=3, player_mark_value=O)
+        assert forced_move.forced_move_type == ForcedMoveType.WIN
+        assert np.array_equal(forced_move.move, np.array([1, 2]))
+
+    def test_single_block(self):
+        playing_grid = np.array([
+            [X, X, E],
+            [O, E, E],
+            [E, E, E]
+        ])
+        forced_move = get_forced_move(playing_grid=playing_grid, win_length_k=3, player_mark_value=O)
+        assert forced_move.forced_move_type == ForcedMoveType.BLOCK
+        assert np.array_equal(forced_move.move, np.array([0, 2]))
+
+    def test_two_threats_sharing_a_cell_is_a_single_block(self):
+        playing_grid = np.array([
+            [X, X, E],
+            [O, O, X],
+            [E, O, X]
+        ])
+        forced_move = get_forced_move(playing_grid=playing_grid, win_length_k=3, player_mark_value=O)
+        assert forced_move.forced_move_type == ForcedMoveType.BLOCK
+
+    def test_no_forced_move(self):
+        playing_grid = np.full(shape=(3, 3), fill_value=E)
+        playing_grid[1, 1] = X
+        assert get_forced_move(playing_grid=playing_grid, win_length_k=3, player_mark_value=O) is None
+
+    def test_forced_move_from_window_counts_agrees_with_full_scan(self):
+        """Fill a 7x7 board with k=4 at random, checking both players' forced moves from the counts after every move"""
+        rng = np.random.default_rng(seed=0)
+        playing_grid = np.full(shape=(7, 7), fill_value=E)
+        live_windows = LiveWindows(playing_grid=playing_grid, win_length_k=4)
+        incremental_evaluation = IncrementalEvaluation(playing_grid=playing_grid, win_length_k=4)
+        mark_value = X
+        for cell_index in rng.permutation(49):
+            marking_index = np.array(np.divmod(cell_index, 7))
+            playing_grid[tuple(marking_index)] = mark_value
+            live_windows.make_move(marking_index=marking_index, mark_value=mark_value)
+            incremental_evaluation.make_move(marking_index=marking_index, mark_value=mark_value)
+            mark_value = -mark_value
+            for player_mark_value in (X, O):
+                forced_move = get_forced_move(playing_grid=playing_grid, win_length_k=4,
+                                              player_mark_value=player_mark_value)
+                for window_counts in (live_windows, incremental_evaluation):
+                    counted_forced_move = get_forced_move(playing_grid=playing_grid, win_length_k=4,
+                                                          player_mark_value=player_mark_value,
+                                                          live_windows=window_counts)
+                    if forced_move is None:
+                        assert counted_forced_move is None
+                    else:
+                        assert counted_forced_move.forced_move_type == forced_move.forced_move_type
+                        assert np.array_equal(counted_forced_move.move, forced_move.move)
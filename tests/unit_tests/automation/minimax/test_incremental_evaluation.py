@@ -0,0 +1,52 @@
+"""Tests for the incremental evaluation of boards, which must always agree with evaluate_non_terminal_board."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.evaluate_non_terminal_board import evaluate_non_terminal_board
+from automation.minimax.incremental_evaluation import IncrementalEvaluation
+from game.constants.game_constants import BoardMarking
+
+
+class TestIncrementalEvaluation:
+    def test_empty_board_scored_as_draw(self):
+        playing_grid = np.full(shape=(3, 3), fill_value=BoardMarking.EMPTY.value)
+        incremental_evaluation = IncrementalEvaluation(playing_grid=playing_grid, win_length_k=3)
+        assert incremental_evaluation.evaluate(
+            search_depth=1, maximiser_mark_value=BoardMarking.X.value, maximiser_has_next_turn=True) == 0
+
+    def test_scores_match_evaluate_non_terminal_board_as_moves_are_made(self):
+        """Play a random game on a 6x7 board with k=4, checking the score after every move, for both players"""
+        rng = np.random.default_rng(seed=0)
+        playing_grid = np.full(shape=(6, 7), fill_value=BoardMarking.EMPTY.value)
+        incremental_evaluation = IncrementalEvaluation(playing_grid=playing_grid, win_length_k=4)
+        mark_value = BoardMarking.X.value
+        for cell_index in rng.permutation(42)[:30]:
+            marking_index = np.array(np.divmod(cell_index, 7))
+            playing_grid[tuple(marking_index)] = mark_value
+            incremental_evaluation.make_move(marking_index=marking_index, mark_value=mark_value)
+            mark_value = -mark_value
+            for maximiser_mark_value in (BoardMarking.X.value, BoardMarking.O.value):
+                for maximiser_has_next_turn in (True, False):
+                    expected_score = evaluate_non_terminal_board(
+                        playing_grid=playing_grid, win_length_k=4, search_depth=2,
+                        maximiser_mark_value=maximiser_mark_value, maximiser_has_next_turn=maximiser_has_next_turn)
+                    assert incremental_evaluation.evaluate(
+                        search_depth=2, maximiser_mark_value=maximiser_mark_value,
+                        maximiser_has_next_turn=maximiser_has_next_turn) == expected_score
+
+    def test_unmake_move_restores_window_streaks(self):
+        playing_grid = np.full(shape=(4, 4), fill_value=BoardMarking.EMPTY.value)
+        playing_grid[1, 1] = BoardMarking.X.value
+        playing_grid[2, 2] = BoardMarking.O.value
+        incremental_evaluation = IncrementalEvaluation(playing_grid=playing_grid, win_length_k=3)
+        streak_counts_before = incremental_evaluation.streak_counts.copy()
+        window_streak_indices_before = incremental_evaluation.window_streak_indices.copy()
+
+        incremental_evaluation.make_move(marking_index=np.array([1, 2]), mark_value=BoardMarking.X.value)
+        assert not np.array_equal(incremental_evaluation.streak_counts, streak_counts_before)
+        incremental_evaluation.unmake_move(marking_index=np.array([1, 2]), mark_value=BoardMarking.X.value)
+
+        assert np.array_equal(incremental_evaluation.streak_counts, streak_counts_before)
+        assert np.array_equal(incremental_evaluation.window_streak_indices, window_streak_indices_before)
@@ -8,9 +8,20 @@ from typing import List
 import numpy as np
 
 # Local application imports
+from automation.minimax.evaluator import REFERENCE_EVALUATOR
+from automation.minimax.incremental_evaluation import IncrementalEvaluation
 from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
 from automation.minimax.constants.terminal_board_scores import BoardScore
+from automation.minimax.constants.iterative_deepening_constants import IterativeDeepening, SearchStopReason
+from automation.minimax.search_limits import SearchLimits
+from automation.minimax.transposition_table import TranspositionTable
+from automation.opening_book.opening_book_builder import OpeningBookBuilder
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from automation.solver.proof_number_search import ProofNumberSearch
+from automation.tablebase.endgame_tablebase import EndgameTablebase
+from automation.tablebase.tablebase_generation import generate_endgame_tablebase
 from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.live_windows import LiveWindows
 from game.app.player_base_class import Player
 from game.constants.game_constants import BoardMarking, StartingPlayer
 
@@ -175,6 +186,27 @@ class TestMinimaxAncillaryMethodsThreeThree:
         )
         assert score > 0
 
+    def test_evaluate_non_terminal_board_with_custom_evaluator(self, three_three_game_parameters):
+        """Test that an evaluator given to the engine is used to score the boards at the horizon of its searches"""
+        evaluated_boards = []
+
+        def count_marks_evaluator(playing_grid, win_length_k, search_depth, maximiser_mark_value,
+                                  maximiser_has_next_turn):
+            evaluated_boards.append(playing_grid.copy())
+            return float(np.sum(playing_grid != BoardMarking.EMPTY.value))
+
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=three_three_game_parameters, evaluator=count_marks_evaluator, check_forced_moves=False,
+            search_limits=SearchLimits(max_search_seconds=None, max_search_depth=2, minimum_search_depth=2))
+        minimax.mark_board(marking_index=np.array([1, 1]))
+        score = minimax._evaluate_non_terminal_board_to_maximising_player(
+            playing_grid=minimax.playing_grid, search_depth=0, maximiser_has_next_turn=False)
+        assert score == 1
+        _, minimax_move = minimax.get_minimax_move_iterative_deepening()
+        assert minimax_move is not None
+        assert len(evaluated_boards) > 1
+        assert all(np.sum(board != BoardMarking.EMPTY.value) >= 2 for board in evaluated_boards[1:])
+
     # Tests for the _get_available_cell_indices
     def test_get_available_cell_indices_ordering(self, three_three_game_with_minimax_player):
         """Test that _get_available_cell_indices gets the correct order of cells to search in."""
@@ -210,9 +242,315 @@ class TestMinimaxAncillaryMethodsThreeThree:
                 validity += np.all(expected_cell == actual_cell)
             assert validity
 
-    def test_available_cell_prioritiser(self):
-        """Test that the available_cell_prioritiser is working."""
-        actual_absolute = NoughtsAndCrossesMinimax._available_cell_prioritiser(
-            last_played_index=np.array([0, 1]), available_index=np.array([1, 0]))
-        expected_absolute = np.sqrt(2)
-        assert actual_absolute == pytest.approx(expected_absolute) == actual_absolute
+    def test_get_available_cell_indices_only_near_marks(self, human_player, minimax_player):
+        """On a larger board, only the cells within the neighbourhood radius of a mark are searched"""
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=NoughtsAndCrossesEssentialParameters(
+            game_rows_m=9, game_cols_n=9, win_length_k=5, player_x=human_player, player_o=minimax_player,
+            starting_player_value=StartingPlayer.PLAYER_X.value))
+        assert len(minimax._get_available_cell_indices(playing_grid=minimax.playing_grid, search_depth=0)) == 81
+        minimax.mark_board(marking_index=np.array([0, 0]))
+        available_cells = minimax._get_available_cell_indices(playing_grid=minimax.playing_grid, search_depth=0)
+        assert {tuple(cell) for cell in available_cells} == \
+            {(row, col) for row in range(3) for col in range(3)} - {(0, 0)}
+
+
+class TestMinimaxParallelRootSearchThreeThreeThree:
+    """
+    Class to test that splitting the root moves across a process pool gives the same moves as a serial search.
+    The forced move check is switched off, since otherwise these moves would be played without searching.
+    """
+
+    def test_parallel_root_search_gets_winning_move(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters, root_search_processes=2,
+                                           check_forced_moves=False)
+        minimax.starting_player_value = StartingPlayer.PLAYER_O.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        score, minimax_move = minimax.get_minimax_move_iterative_deepening()
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 1
+        assert np.all(minimax_move == np.array([2, 2]))
+
+    def test_parallel_root_search_makes_blocking_move(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters, root_search_processes=2,
+                                           check_forced_moves=False)
+        minimax.starting_player_value = StartingPlayer.PLAYER_X.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.O.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        _, minimax_move = minimax.get_minimax_move_iterative_deepening()
+        assert np.all(minimax_move == np.array([1, 0]))
+
+
+class TestMinimaxTranspositionTableAndLazySMPThreeThreeThree:
+    """
+    Class to test that the transposition table and lazy SMP search still find the forced moves (with the forced move
+    check switched off, so that they are found by searching)
+    """
+
+    def test_search_with_transposition_table_makes_blocking_move(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters,
+                                           transposition_table=TranspositionTable(number_of_entries=1024),
+                                           check_forced_moves=False)
+        minimax.starting_player_value = StartingPlayer.PLAYER_X.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.O.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        _, minimax_move = minimax.get_minimax_move_iterative_deepening()
+        assert np.all(minimax_move == np.array([1, 0]))
+
+    def test_lazy_smp_search_gets_winning_move(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters, lazy_smp_processes=2,
+                                           check_forced_moves=False)
+        minimax.starting_player_value = StartingPlayer.PLAYER_O.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        score, minimax_move = minimax.get_minimax_move_iterative_deepening()
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 1
+        assert np.all(minimax_move == np.array([2, 2]))
+
+
+class TestMinimaxSearchStatsThreeThreeThree:
+    """Class to test the statistics returned alongside the minimax move"""
+
+    def test_search_stats_of_winning_move(self, three_three_game_with_minimax_player):
+        three_three_game_with_minimax_player.check_forced_moves = False  # So that the win is found by searching
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_O.value
+        three_three_game_with_minimax_player.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        _, minimax_move, search_stats = three_three_game_with_minimax_player.get_minimax_move_and_search_stats()
+        assert np.all(minimax_move == np.array([2, 2]))
+        assert search_stats.stop_reason == SearchStopReason.SEARCH_CUT_OFF_SCORE_EXCEEDED
+        assert search_stats.depth_completed == IterativeDeepening.minimum_search_depth.value
+        assert search_stats.terminal_hits > 0
+        assert search_stats.nodes_visited > search_stats.leaves_evaluated + search_stats.terminal_hits
+        assert len(search_stats.iteration_durations) == 1
+
+
+class TestMinimaxDeadDrawFourFourFour:
+    """Class to test that the search stops as soon as neither player can win"""
+
+    @pytest.mark.parametrize("evaluator", [None, REFERENCE_EVALUATOR])
+    def test_dead_draw_still_gets_a_move_without_searching_the_filler(self, human_player, minimax_player, evaluator):
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=NoughtsAndCrossesEssentialParameters(
+            game_rows_m=4, game_cols_n=4, win_length_k=4, player_x=human_player, player_o=minimax_player,
+            starting_player_value=StartingPlayer.PLAYER_X.value), evaluator=evaluator)
+        minimax.playing_grid = np.array([
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.X.value, BoardMarking.O.value],
+            [BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.X.value, BoardMarking.O.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.X.value]
+        ])
+        assert minimax.check_for_draw()
+        score, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert minimax.playing_grid[tuple(minimax_move)] == BoardMarking.EMPTY.value
+        assert score == BoardScore.DRAW.value - 1
+        assert search_stats.leaves_evaluated == 0  # Every move leads straight to a drawn board
+
+    def test_live_windows_kept_by_search_with_custom_evaluator(self, three_three_game_parameters):
+        """With its own evaluator, the search still keeps the window counts, but not the streaks it does not need"""
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters, evaluator=REFERENCE_EVALUATOR)
+        live_windows = minimax._get_live_windows_for_search(playing_grid=minimax.playing_grid)
+        assert type(live_windows) is LiveWindows
+        minimax.evaluator = None
+        assert isinstance(minimax._get_live_windows_for_search(playing_grid=minimax.playing_grid), IncrementalEvaluation)
+
+
+class TestMinimaxForcedMovesThreeThreeThree:
+    """Class to test that forced moves are played without searching"""
+
+    def test_immediate_win_is_played_without_search(self, three_three_game_with_minimax_player):
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_O.value
+        three_three_game_with_minimax_player.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        score, minimax_move, search_stats = three_three_game_with_minimax_player.get_minimax_move_and_search_stats()
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 1
+        assert np.all(minimax_move == np.array([2, 2]))
+        assert search_stats.stop_reason == SearchStopReason.FORCED_MOVE
+        assert search_stats.nodes_visited == 0
+
+    def test_double_threat_is_a_proven_loss(self, three_three_game_with_minimax_player):
+        """X has two immediate wins, at (0, 1) and (1, 0), so O can only block one of them"""
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_X.value
+        three_three_game_with_minimax_player.playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.O.value, BoardMarking.EMPTY.value],
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.O.value]
+        ])
+        score, minimax_move, search_stats = three_three_game_with_minimax_player.get_minimax_move_and_search_stats()
+        assert score == BoardScore.GUARANTEED_MAX_LOSS.value + 2
+        assert search_stats.stop_reason == SearchStopReason.FORCED_MOVE
+
+
+class TestMinimaxThreatSpaceSearchTenTenFive:
+    """Class to test that the threat-space search is used to find forced wins on larger boards"""
+
+    def test_open_three_is_converted_without_main_search(self, human_player, minimax_player):
+        setup_parameters = NoughtsAndCrossesEssentialParameters(
+            game_rows_m=10, game_cols_n=10, win_length_k=5, player_x=human_player, player_o=minimax_player,
+            starting_player_value=StartingPlayer.PLAYER_O.value)
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=setup_parameters)
+        minimax.playing_grid[5, 3:6] = BoardMarking.O.value
+        minimax.playing_grid[0, 0] = minimax.playing_grid[9, 9] = minimax.playing_grid[0, 9] = BoardMarking.X.value
+        score, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert search_stats.stop_reason == SearchStopReason.THREAT_SPACE_WIN
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 3
+        assert minimax_move[0] == 5 and minimax_move[1] in (2, 6)
+
+
+class TestMinimaxQuiescenceThreeThreeThree:
+    """Class to test the resolution of immediate wins and forced blocks at the search horizon"""
+
+    def test_horizon_win_for_player_to_move(self, three_three_game_with_minimax_player):
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_O.value
+        playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        three_three_game_with_minimax_player.playing_grid = playing_grid
+        search_timer = three_three_game_with_minimax_player._get_search_timer()
+        maximiser_score = three_three_game_with_minimax_player._get_quiescence_score(
+            playing_grid=playing_grid, search_depth=2, maximisers_move=True, search_timer=search_timer,
+            quiescence_plies_left=2)
+        assert maximiser_score == BoardScore.GUARANTEED_MAX_WIN.value - 3
+
+    def test_horizon_forced_block_is_played_out(self, three_three_game_with_minimax_player):
+        """X (the minimiser) must block O's row at (0, 2), which then leaves O facing X's double threat"""
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_O.value
+        playing_grid = np.array([
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.X.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.O.value, BoardMarking.X.value]
+        ])  # The game's own (empty) playing grid makes O the maximiser, so this node is the minimiser's (X's) move
+        search_timer = three_three_game_with_minimax_player._get_search_timer()
+        score = three_three_game_with_minimax_player._get_quiescence_score(
+            playing_grid=playing_grid, search_depth=4, maximisers_move=False, search_timer=search_timer,
+            quiescence_plies_left=2)
+        assert score == BoardScore.GUARANTEED_MAX_LOSS.value + 7  # X blocks at depth 4 and wins at depth 6
+
+    def test_no_extension_when_switched_off(self, three_three_game_with_minimax_player):
+        three_three_game_with_minimax_player.starting_player_value = StartingPlayer.PLAYER_O.value
+        playing_grid = np.array([
+            [BoardMarking.X.value, BoardMarking.EMPTY.value, BoardMarking.X.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.O.value, BoardMarking.O.value, BoardMarking.EMPTY.value]
+        ])
+        search_timer = three_three_game_with_minimax_player._get_search_timer()
+        score = three_three_game_with_minimax_player._get_quiescence_score(
+            playing_grid=playing_grid, search_depth=2, maximisers_move=True, search_timer=search_timer,
+            quiescence_plies_left=0)
+        assert abs(score) < BoardScore.SEARCH_CUT_OFF_SCORE.value
+        assert search_timer.search_stats.leaves_evaluated == 1
+
+
+class TestMinimaxProofNumberSearchThreeThreeThree:
+    """Class to test that positions the proof-number search can solve are played without searching"""
+
+    def test_solved_position_is_played_without_search(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=three_three_game_parameters,
+            proof_number_search=ProofNumberSearch(game_rows_m=3, game_cols_n=3, win_length_k=3))
+        minimax.starting_player_value = StartingPlayer.PLAYER_X.value
+        minimax.playing_grid[0, 0] = BoardMarking.X.value  # O must take the centre to avoid losing
+        score, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert score == BoardScore.DRAW.value
+        assert np.all(minimax_move == np.array([1, 1]))
+        assert search_stats.stop_reason == SearchStopReason.POSITION_SOLVED
+        assert search_stats.nodes_visited == 0
+        assert search_stats.solver_nodes > 0
+
+    def test_unsolved_position_is_searched_within_move_budget(self):
+        proof_number_search = ProofNumberSearch(game_rows_m=4, game_cols_n=4, win_length_k=4, max_search_seconds=None)
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=NoughtsAndCrossesEssentialParameters(game_rows_m=4, game_cols_n=4, win_length_k=4),
+            search_limits=SearchLimits(max_search_seconds=0.2), proof_number_search=proof_number_search)
+        minimax.starting_player_value = StartingPlayer.PLAYER_X.value
+        _, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert minimax_move is not None
+        assert search_stats.stop_reason != SearchStopReason.POSITION_SOLVED
+        assert search_stats.solver_nodes > 0
+        assert 0 < search_stats.solver_seconds < 0.2
+
+    def test_unsolved_position_is_searched_within_node_budget(self):
+        proof_number_search = ProofNumberSearch(game_rows_m=4, game_cols_n=4, win_length_k=4, max_search_seconds=None)
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=NoughtsAndCrossesEssentialParameters(game_rows_m=4, game_cols_n=4, win_length_k=4),
+            search_limits=SearchLimits(max_search_seconds=None, max_nodes=1000), proof_number_search=proof_number_search)
+        minimax.starting_player_value = StartingPlayer.PLAYER_X.value
+        _, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert minimax_move is not None
+        assert search_stats.stop_reason != SearchStopReason.POSITION_SOLVED
+        assert 0 < search_stats.solver_nodes <= 500
+
+    def test_solved_win_scores_above_cut_off(self, three_three_game_parameters):
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=three_three_game_parameters,
+            proof_number_search=ProofNumberSearch(game_rows_m=3, game_cols_n=3, win_length_k=3))
+        minimax.starting_player_value = StartingPlayer.PLAYER_O.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.O.value, BoardMarking.X.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]
+        ])  # O wins against an X edge next to their corner
+        score, _, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 7
+        assert search_stats.stop_reason == SearchStopReason.POSITION_SOLVED
+
+
+class TestMinimaxEndgameTablebaseThreeThreeThree:
+    """Class to test that positions in the endgame tablebase are played without searching"""
+
+    def test_tablebase_position_is_played_without_search(self, three_three_game_parameters, tmp_path):
+        generate_endgame_tablebase(game_rows_m=3, game_cols_n=3, win_length_k=3, tablebase_directory=tmp_path)
+        minimax = NoughtsAndCrossesMinimax(
+            setup_parameters=three_three_game_parameters,
+            endgame_tablebase=EndgameTablebase.load_if_generated(
+                game_rows_m=3, game_cols_n=3, win_length_k=3, tablebase_directory=tmp_path))
+        minimax.starting_player_value = StartingPlayer.PLAYER_O.value
+        minimax.playing_grid = np.array([
+            [BoardMarking.O.value, BoardMarking.X.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value],
+            [BoardMarking.EMPTY.value, BoardMarking.EMPTY.value, BoardMarking.EMPTY.value]
+        ])  # O wins against an X edge next to their corner, in 5 more plies
+        score, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert score == BoardScore.GUARANTEED_MAX_WIN.value - 5
+        assert search_stats.stop_reason == SearchStopReason.TABLEBASE_HIT
+        assert search_stats.nodes_visited == 0
+        minimax.mark_board(marking_index=minimax_move)
+        assert minimax.endgame_tablebase.probe(
+            playing_grid=minimax.playing_grid, player_to_move_value=BoardMarking.X.value).value == \
+            GameTheoreticValue.LOSS
+
+
+class TestMinimaxOpeningBookThreeThreeThree:
+    """Class to test that positions in the opening book are played without searching"""
+
+    def test_book_position_is_played_without_search(self, three_three_game_parameters):
+        opening_book_builder = OpeningBookBuilder(game_rows_m=3, game_cols_n=3, win_length_k=3)
+        opening_book_builder.add_searched_move(
+            playing_grid=np.full((3, 3), BoardMarking.EMPTY.value), player_to_move_value=BoardMarking.X.value,
+            move=np.array([0, 0]), score=BoardScore.DRAW.value)
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=three_three_game_parameters,
+                                           opening_book=opening_book_builder.build())
+        minimax.starting_player_value = StartingPlayer.PLAYER_O.value
+        score, minimax_move, search_stats = minimax.get_minimax_move_and_search_stats()
+        assert score == BoardScore.DRAW.value
+        assert tuple(minimax_move) in {(0, 0), (0, 2), (2, 0), (2, 2)}  # The book corner, up to symmetry
+        assert search_stats.stop_reason == SearchStopReason.OPENING_BOOK_HIT
+        assert search_stats.nodes_visited == 0
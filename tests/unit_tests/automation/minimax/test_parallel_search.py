@@ -0,0 +1,113 @@
+"""Tests that the worker processes of the parallel searches can be stopped, and that lazy SMP publishes each depth."""
+
+# Standard library imports
+import threading
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.constants.iterative_deepening_constants import IterativeDeepening, SearchStopReason
+from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+from automation.minimax.parallel_search import LazySMPSearch, ParallelRootSearch
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.player_base_class import Player
+from game.constants.game_constants import BoardMarking, StartingPlayer
+
+
+def get_engine(game_rows_m: int, game_cols_n: int, win_length_k: int,
+               search_limits: SearchLimits) -> NoughtsAndCrossesMinimax:
+    return NoughtsAndCrossesMinimax(setup_parameters=NoughtsAndCrossesEssentialParameters(
+        game_rows_m=game_rows_m, game_cols_n=game_cols_n, win_length_k=win_length_k,
+        player_x=Player(name="X", marking=BoardMarking.X), player_o=Player(name="O", marking=BoardMarking.O),
+        starting_player_value=StartingPlayer.PLAYER_X.value), search_limits=search_limits, check_forced_moves=False)
+
+
+@pytest.fixture(scope="function")
+def ten_ten_five_engine():
+    """An engine part way through a 10x10 game, with search limits that would take far too long to exhaust"""
+    engine = get_engine(game_rows_m=10, game_cols_n=10, win_length_k=5,
+                        search_limits=SearchLimits(max_search_seconds=None, max_search_depth=8))
+    engine.mark_board(marking_index=np.array([4, 4]))
+    return engine
+
+
+def get_stopped_search_timer(search_limits: SearchLimits) -> SearchTimer:
+    stop_event = threading.Event()
+    stop_event.set()
+    return SearchTimer(search_limits=search_limits, move_budget_seconds=None, stop_event=stop_event)
+
+
+class TestParallelRootSearch:
+    def test_stop_request_is_passed_on_to_workers(self, ten_ten_five_engine):
+        """The workers only complete the minimum search depth below their root move, rather than the full depth"""
+        search_timer = get_stopped_search_timer(search_limits=ten_ten_five_engine.search_limits)
+        root_moves = ten_ten_five_engine._get_available_cell_indices(
+            playing_grid=ten_ten_five_engine.playing_grid, search_depth=0)
+        with ParallelRootSearch(number_of_processes=2) as parallel_root_search:
+            _, best_move = parallel_root_search.get_root_score_and_move(
+                engine=ten_ten_five_engine, root_moves=root_moves, max_search_depth=8, search_timer=search_timer)
+        assert best_move is not None
+        assert search_timer.search_limit_reached()
+        assert search_timer.node_count < 100 * len(root_moves)
+
+    def test_workers_search_with_the_policy_of_the_main_process(self):
+        """A narrow policy (which gives different scores to the default policy) must give the same scores in parallel"""
+        narrow_branch_factor_policy = BranchFactorPolicy(branch_limits=(59, 3), full_depth_moves=1)
+        iteration_results = []
+        for root_search_processes in (1, 2):
+            engine = get_engine(game_rows_m=8, game_cols_n=8, win_length_k=5,
+                                search_limits=SearchLimits(max_search_seconds=None, max_search_depth=4))
+            engine.root_search_processes = root_search_processes
+            for marking_index in ([3, 3], [3, 4], [4, 4], [2, 2], [4, 3]):
+                engine.mark_board(marking_index=np.array(marking_index))
+            search_timer = SearchTimer(search_limits=engine.search_limits, move_budget_seconds=None)
+            iteration_results.append(engine.get_iteration_results(
+                search_timer=search_timer, branch_factor_policy=narrow_branch_factor_policy))
+            assert engine.branch_factor_policy == narrow_branch_factor_policy
+
+        serial_results, parallel_results = iteration_results
+        assert [result.score for result in serial_results] == [result.score for result in parallel_results]
+        assert all(np.array_equal(serial_result.move, parallel_result.move)
+                   for serial_result, parallel_result in zip(serial_results, parallel_results))
+
+
+class TestLazySMPSearch:
+    def test_stop_request_is_passed_on_to_workers(self, ten_ten_five_engine):
+        search_timer = get_stopped_search_timer(search_limits=ten_ten_five_engine.search_limits)
+        with LazySMPSearch(number_of_processes=2) as lazy_smp_search:
+            deepest_result = lazy_smp_search.get_deepest_iteration_result(
+                engine=ten_ten_five_engine, search_timer=search_timer)
+        assert deepest_result.search_depth == IterativeDeepening.minimum_search_depth.value
+        assert search_timer.search_stats.stop_reason == SearchStopReason.SEARCH_CANCELLED
+
+    def test_each_depth_is_published_once(self):
+        engine = get_engine(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                            search_limits=SearchLimits(max_search_seconds=None, max_search_depth=4))
+        engine.mark_board(marking_index=np.array([0, 0]))
+        search_timer = SearchTimer(search_limits=engine.search_limits, move_budget_seconds=None)
+        published_depths = []
+        with LazySMPSearch(number_of_processes=2) as lazy_smp_search:
+            deepest_result = lazy_smp_search.get_deepest_iteration_result(
+                engine=engine, search_timer=search_timer,
+                iteration_callback=lambda iteration_result: published_depths.append(iteration_result.search_depth))
+        assert published_depths == [2, 3, 4]
+        assert deepest_result.search_depth == 4
+
+    def test_workers_continue_on_from_previous_iterations(self):
+        engine = get_engine(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                            search_limits=SearchLimits(max_search_seconds=None, max_search_depth=4))
+        engine.mark_board(marking_index=np.array([0, 0]))
+        previous_iteration_results = engine.get_iteration_results(search_timer=SearchTimer(
+            search_limits=SearchLimits(max_search_seconds=None, max_search_depth=3), move_budget_seconds=None))
+        search_timer = SearchTimer(search_limits=engine.search_limits, move_budget_seconds=None)
+        published_depths = []
+        with LazySMPSearch(number_of_processes=2) as lazy_smp_search:
+            deepest_result = lazy_smp_search.get_deepest_iteration_result(
+                engine=engine, search_timer=search_timer, previous_iteration_results=previous_iteration_results,
+                iteration_callback=lambda iteration_result: published_depths.append(iteration_result.search_depth))
+        assert published_depths == [4]
+        assert deepest_result.search_depth == 4
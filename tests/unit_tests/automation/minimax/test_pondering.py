@@ -0,0 +1,77 @@
+"""Tests for the minimax search pondering (searching in the background during the opponent's turn)."""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.minimax.branch_factor_policy import BranchFactorPolicy
+from automation.minimax.minimax_ai import NoughtsAndCrossesMinimax
+from automation.minimax.search_limits import SearchLimits
+from automation.minimax.search_results import IterationResult
+from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
+from game.app.player_base_class import Player
+from game.constants.game_constants import BoardMarking, StartingPlayer
+
+
+@pytest.fixture(scope="function")
+def three_three_minimax_after_its_move():
+    """A game in which minimax (playing X) has just played in the centre, with O to move"""
+    setup_parameters = NoughtsAndCrossesEssentialParameters(
+        game_rows_m=3, game_cols_n=3, win_length_k=3,
+        player_x=Player(name="Minimax", marking=BoardMarking.X), player_o=Player(name="Human", marking=BoardMarking.O),
+        starting_player_value=StartingPlayer.PLAYER_X.value)
+    minimax = NoughtsAndCrossesMinimax(setup_parameters=setup_parameters,
+                                       search_limits=SearchLimits(max_search_seconds=None, max_search_depth=4))
+    minimax.mark_board(marking_index=np.array([1, 1]))
+    return minimax
+
+
+class TestPondering:
+    """Class for testing that the results found while pondering are picked up by the next search"""
+
+    def test_pondered_iterations_are_reused(self, three_three_minimax_after_its_move):
+        minimax = three_three_minimax_after_its_move
+        minimax.start_pondering()
+        minimax._ponderer._thread.join(timeout=30)  # Wait for every reply to be searched to depth 4
+        minimax.mark_board(marking_index=np.array([0, 0]))
+
+        pondered_results = minimax._get_pondered_iteration_results()
+        assert [result.search_depth for result in pondered_results] == [2, 3, 4]
+
+    def test_search_continues_from_pondered_iterations(self, three_three_minimax_after_its_move):
+        minimax = three_three_minimax_after_its_move
+        minimax.mark_board(marking_index=np.array([0, 0]))
+        pondered_result = IterationResult(search_depth=4, score=0, move=np.array([0, 1]), completed=True,
+                                          duration_seconds=0)
+
+        search_timer = minimax._get_search_timer()
+        iteration_results = minimax.get_iteration_results(search_timer=search_timer,
+                                                          previous_iteration_results=[pondered_result])
+        assert iteration_results == [pondered_result]  # max_search_depth is 4, so there is nothing left to search
+
+    def test_replies_are_pondered_with_the_policy_of_the_search_that_reuses_them(self):
+        setup_parameters = NoughtsAndCrossesEssentialParameters(
+            game_rows_m=8, game_cols_n=8, win_length_k=5,
+            player_x=Player(name="Minimax", marking=BoardMarking.X), player_o=Player(name="Human", marking=BoardMarking.O),
+            starting_player_value=StartingPlayer.PLAYER_X.value)
+        minimax = NoughtsAndCrossesMinimax(setup_parameters=setup_parameters,
+                                           search_limits=SearchLimits(max_search_seconds=10, max_search_depth=6))
+        minimax.mark_board(marking_index=np.array([3, 3]))
+        minimax._nodes_per_second = 50000
+        minimax.start_pondering()
+        minimax.stop_pondering()
+        minimax.mark_board(marking_index=np.array([3, 4]))
+
+        pondered_policy = minimax._ponderer._get_branch_factor_policy(playing_grid=minimax.playing_grid)
+        assert pondered_policy == minimax._get_branch_factor_policy(search_timer=minimax._get_search_timer())
+        unbudgeted_policy = BranchFactorPolicy.for_search(
+            playing_grid=minimax.playing_grid, win_length_k=5, max_search_depth=6, move_budget_seconds=None,
+            max_nodes=None, nodes_per_second=None)
+        assert pondered_policy != unbudgeted_policy
+
+    def test_reset_game_board_discards_pondering(self, three_three_minimax_after_its_move):
+        minimax = three_three_minimax_after_its_move
+        minimax.start_pondering()
+        minimax.reset_game_board()
+        assert minimax._get_pondered_iteration_results() == []
@@ -0,0 +1,100 @@
+"""Tests for the SearchLimits dataclass and SearchTimer class used to bound each minimax search."""
+
+# Standard library imports
+import math
+import multiprocessing
+import pytest
+import threading
+
+# Local application imports
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+
+
+class TestSearchLimits:
+    """Class for testing how a per-move time budget is derived from the search limits"""
+
+    def test_move_budget_without_clock_is_max_search_seconds(self):
+        search_limits = SearchLimits(max_search_seconds=1.5)
+        assert search_limits.get_move_budget_seconds(empty_cell_count=9) == 1.5
+
+    def test_move_budget_shares_clock_between_remaining_moves(self):
+        """100 empty cells means the player to move has 50 moves left, so gets roughly 1/50th of the clock"""
+        search_limits = SearchLimits(max_search_seconds=None, remaining_clock_seconds=50.05)
+        assert search_limits.get_move_budget_seconds(empty_cell_count=100) == pytest.approx(1)
+
+    def test_move_budget_includes_increment_but_is_capped_by_max_search_seconds(self):
+        search_limits = SearchLimits(max_search_seconds=2, remaining_clock_seconds=10, clock_increment_seconds=5)
+        assert search_limits.get_move_budget_seconds(empty_cell_count=100) == 2
+
+    def test_move_budget_never_exceeds_remaining_clock(self):
+        search_limits = SearchLimits(max_search_seconds=None, remaining_clock_seconds=0.5, clock_increment_seconds=10)
+        assert search_limits.get_move_budget_seconds(empty_cell_count=100) < 0.5
+
+
+class TestSearchTimer:
+    """Class for testing that the search timer enforces the node and time limits"""
+
+    def test_node_limit_reached(self):
+        search_timer = SearchTimer(search_limits=SearchLimits(max_nodes=3), move_budget_seconds=None)
+        for _ in range(0, 2):
+            search_timer.register_node()
+        assert not search_timer.search_limit_reached()
+        search_timer.register_node()
+        assert search_timer.search_limit_reached()
+
+    def test_deadline_only_checked_every_interval(self):
+        """A zero second budget has passed immediately, but this is only noticed once the interval is reached"""
+        search_limits = SearchLimits(deadline_check_interval_nodes=4)
+        search_timer = SearchTimer(search_limits=search_limits, move_budget_seconds=0)
+        for _ in range(0, 3):
+            search_timer.register_node()
+        assert not search_timer.search_limit_reached()
+        search_timer.register_node()
+        assert search_timer.search_limit_reached()
+
+    def test_stop_event_ends_search_at_next_check(self):
+        stop_event = threading.Event()
+        search_timer = SearchTimer(search_limits=SearchLimits(deadline_check_interval_nodes=1),
+                                   move_budget_seconds=None, stop_event=stop_event)
+        search_timer.register_node()
+        assert not search_timer.search_limit_reached()
+        stop_event.set()
+        search_timer.register_node()
+        assert search_timer.search_limit_reached()
+
+    def test_shared_root_alpha_only_tightens_at_each_check(self):
+        shared_root_alpha = multiprocessing.Value("d", 5)
+        search_timer = SearchTimer(search_limits=SearchLimits(deadline_check_interval_nodes=2),
+                                   move_budget_seconds=None, shared_root_alpha=shared_root_alpha)
+        assert search_timer.root_alpha == 5
+        assert search_timer.root_alpha_floor == math.nextafter(5, -math.inf)
+        shared_root_alpha.value = 7
+        search_timer.register_node()
+        assert search_timer.root_alpha == 5
+        search_timer.register_node()
+        assert search_timer.root_alpha == 7
+        shared_root_alpha.value = 6  # e.g. reset for the next iteration, which must not loosen this search's alpha
+        search_timer.register_node()
+        search_timer.register_node()
+        assert search_timer.root_alpha == 7
+        assert search_timer.root_alpha_floor == math.nextafter(7, -math.inf)
+
+    def test_no_shared_root_alpha_never_tightens(self):
+        search_timer = SearchTimer(search_limits=SearchLimits(deadline_check_interval_nodes=1), move_budget_seconds=None)
+        search_timer.register_node()
+        assert search_timer.root_alpha_floor == -math.inf
+
+    def test_next_iteration_predicted_to_overrun(self):
+        search_timer = SearchTimer(search_limits=SearchLimits(), move_budget_seconds=1)
+        search_timer.iteration_durations = [0.1, 0.4]  # Growth factor of 4, so next iteration predicted at 1.6s
+        assert search_timer.next_iteration_predicted_to_overrun()
+
+    def test_next_iteration_not_predicted_to_overrun(self):
+        search_timer = SearchTimer(search_limits=SearchLimits(), move_budget_seconds=10)
+        search_timer.iteration_durations = [0.1, 0.2]
+        assert not search_timer.next_iteration_predicted_to_overrun()
+
+    def test_no_time_budget_never_predicts_overrun(self):
+        search_timer = SearchTimer(search_limits=SearchLimits(max_search_seconds=None), move_budget_seconds=None)
+        search_timer.iteration_durations = [1, 100]
+        assert not search_timer.next_iteration_predicted_to_overrun()
@@ -0,0 +1,47 @@
+"""Tests for the structures the results and statistics of a minimax search are returned in."""
+
+# Standard library imports
+import pytest
+
+# Local application imports
+from automation.minimax.constants.iterative_deepening_constants import SearchStopReason
+from automation.minimax.search_results import SearchStats
+
+
+class TestSearchStats:
+    """Class for testing the counting, combining and derived values of the search statistics"""
+
+    def test_record_cutoff_counts_per_depth(self):
+        search_stats = SearchStats()
+        search_stats.record_cutoff(search_depth=1)
+        search_stats.record_cutoff(search_depth=1)
+        search_stats.record_cutoff(search_depth=3)
+        assert search_stats.cutoffs_per_depth == {1: 2, 3: 1}
+
+    def test_add_counts_sums_counts_but_not_nodes(self):
+        """The nodes are added via the SearchTimer, so must not be double counted by add_counts"""
+        search_stats = SearchStats(leaves_evaluated=5, cutoffs_per_depth={1: 1})
+        worker_stats = SearchStats(nodes_visited=100, leaves_evaluated=7, cutoffs_per_depth={1: 2, 2: 1},
+                                   stop_reason=SearchStopReason.SEARCH_LIMIT_REACHED)
+        search_stats.add_counts(worker_stats)
+        assert search_stats.nodes_visited == 0
+        assert search_stats.leaves_evaluated == 12
+        assert search_stats.cutoffs_per_depth == {1: 3, 2: 1}
+        assert search_stats.stop_reason == SearchStopReason.SEARCH_LIMIT_REACHED
+
+    def test_derived_rates(self):
+        search_stats = SearchStats(nodes_visited=1000, depth_completed=3, search_seconds=2,
+                                   evaluation_cache_hits=1, evaluation_cache_misses=3)
+        assert search_stats.effective_branching_factor == pytest.approx(10)
+        assert search_stats.nodes_per_second == 500
+        assert search_stats.evaluation_cache_hit_rate == 0.25
+        assert search_stats.transposition_hit_rate == 0
+
+    def test_to_dict_is_flat(self):
+        search_stats = SearchStats(cutoffs_per_depth={1: 2, 2: 3}, iteration_durations=[0.1, 0.2],
+                                   stop_reason=SearchStopReason.MAX_SEARCH_DEPTH_REACHED)
+        stats_dict = search_stats.to_dict()
+        assert stats_dict["cutoffs"] == 5
+        assert stats_dict["iterations"] == 2
+        assert stats_dict["stop_reason"] == "MAX_SEARCH_DEPTH_REACHED"
+        assert "cutoffs_per_depth" not in stats_dict
@@ -0,0 +1,62 @@
+"""Tests for the threat-space search for forced wins on larger boards."""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.minimax.search_limits import SearchLimits, SearchTimer
+from automation.minimax.threat_space_search import ThreatSpaceSearch
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+
+
+@pytest.fixture(scope="function")
+def empty_ten_ten_grid():
+    return np.full(shape=(10, 10), fill_value=BoardMarking.EMPTY.value)
+
+
+def find_winning_move(playing_grid: np.ndarray, win_length_k: int):
+    search_timer = SearchTimer(search_limits=SearchLimits(), move_budget_seconds=None)
+    return ThreatSpaceSearch(playing_grid=playing_grid, win_length_k=win_length_k, attacker_mark_value=X,
+                             search_timer=search_timer).find_winning_move()
+
+
+class TestThreatSpaceSearch:
+    def test_open_three_becomes_open_four(self, empty_ten_ten_grid):
+        """Extending an open three to an open four leaves two winning cells, so wins 3 plies later"""
+        empty_ten_ten_grid[5, 3:6] = X
+        empty_ten_ten_grid[0, 0] = empty_ten_ten_grid[9, 9] = empty_ten_ten_grid[0, 9] = O
+        winning_move, plies_to_win = find_winning_move(playing_grid=empty_ten_ten_grid, win_length_k=5)
+        assert winning_move[0] == 5 and winning_move[1] in (2, 6)
+        assert plies_to_win == 3
+
+    def test_continuous_fours_win(self, empty_ten_ten_grid):
+        """
+        X has two broken threes which are each blocked at one end, so each can only make a four which O must block.
+        Making the four at (2, 5) also makes the second four along column 5, which wins.
+        """
+        empty_ten_ten_grid[2, 2:5] = X
+        empty_ten_ten_grid[2, 1] = O
+        empty_ten_ten_grid[3:6, 5] = X
+        empty_ten_ten_grid[6, 5] = O
+        empty_ten_ten_grid[9, 0] = empty_ten_ten_grid[9, 9] = O
+        winning_move, plies_to_win = find_winning_move(playing_grid=empty_ten_ten_grid, win_length_k=5)
+        assert np.array_equal(winning_move, np.array([2, 5]))
+        assert plies_to_win == 3
+
+    def test_closed_threes_are_not_a_win(self, empty_ten_ten_grid):
+        empty_ten_ten_grid[5, 3:6] = X
+        empty_ten_ten_grid[5, 2] = empty_ten_ten_grid[5, 6] = O
+        assert find_winning_move(playing_grid=empty_ten_ten_grid, win_length_k=5) is None
+
+    def test_defender_four_refutes_attack(self, empty_ten_ten_grid):
+        """O already threatens to win at (0, 4), so X has to block instead of extending the open three"""
+        empty_ten_ten_grid[5, 3:6] = X
+        empty_ten_ten_grid[0, 0:4] = O
+        assert find_winning_move(playing_grid=empty_ten_ten_grid, win_length_k=5) is None
+
+    def test_no_threats_on_empty_board(self, empty_ten_ten_grid):
+        assert find_winning_move(playing_grid=empty_ten_ten_grid, win_length_k=5) is None
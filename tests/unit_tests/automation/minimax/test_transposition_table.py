@@ -0,0 +1,91 @@
+"""Tests for the zobrist hashing and the transposition table used by the minimax search."""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from automation.minimax.constants.transposition_table_constants import TranspositionEntryFlag
+from automation.minimax.transposition_table import TranspositionTable, get_zobrist_hash
+from game.constants.game_constants import BoardMarking
+
+
+class TestZobristHash:
+    """Class for testing the zobrist hash of a playing grid"""
+
+    def test_empty_grid_has_zero_hash(self):
+        assert get_zobrist_hash(playing_grid=np.full(shape=(3, 3), fill_value=BoardMarking.EMPTY.value)) == 0
+
+    def test_hash_depends_on_mark_and_position(self):
+        playing_grid = np.full(shape=(3, 3), fill_value=BoardMarking.EMPTY.value)
+        playing_grid[0, 0] = BoardMarking.X.value
+        x_corner_hash = get_zobrist_hash(playing_grid=playing_grid)
+        playing_grid[0, 0] = BoardMarking.O.value
+        o_corner_hash = get_zobrist_hash(playing_grid=playing_grid)
+        playing_grid[0, 0] = BoardMarking.EMPTY.value
+        playing_grid[1, 1] = BoardMarking.X.value
+        x_centre_hash = get_zobrist_hash(playing_grid=playing_grid)
+        assert len({x_corner_hash, o_corner_hash, x_centre_hash}) == 3
+
+    def test_hash_is_independent_of_move_order(self):
+        """The hash is an XOR of the marked cells, so the same position reached by any route has the same hash"""
+        playing_grid = np.full(shape=(4, 4), fill_value=BoardMarking.EMPTY.value)
+        playing_grid[0, 1] = BoardMarking.X.value
+        playing_grid[2, 3] = BoardMarking.O.value
+        other_playing_grid = np.full(shape=(4, 4), fill_value=BoardMarking.EMPTY.value)
+        other_playing_grid[2, 3] = BoardMarking.O.value
+        other_playing_grid[0, 1] = BoardMarking.X.value
+        assert get_zobrist_hash(playing_grid=playing_grid) == get_zobrist_hash(playing_grid=other_playing_grid)
+
+
+class TestTranspositionTable:
+    """Class for testing storing and probing entries in the transposition table"""
+
+    def test_probe_of_empty_table_is_a_miss(self):
+        transposition_table = TranspositionTable(number_of_entries=16)
+        assert transposition_table.probe(position_hash=12345) is None
+
+    def test_number_of_entries_rounded_up_to_power_of_two(self):
+        assert TranspositionTable(number_of_entries=100).number_of_entries == 128
+
+    def test_stored_entry_is_unpacked_unchanged(self):
+        transposition_table = TranspositionTable(number_of_entries=16)
+        transposition_table.store(position_hash=12345, score=-179995, best_move_index=7, search_depth=3,
+                                  remaining_depth=5, flag=TranspositionEntryFlag.LOWER_BOUND,
+                                  maximiser_mark_value=BoardMarking.O.value)
+        entry = transposition_table.probe(position_hash=12345)
+        assert entry.score == -179995
+        assert entry.best_move_index == 7
+        assert entry.search_depth == 3
+        assert entry.remaining_depth == 5
+        assert entry.flag == TranspositionEntryFlag.LOWER_BOUND
+        assert entry.maximiser_mark_value == BoardMarking.O.value
+
+    def test_entry_for_colliding_position_is_a_miss(self):
+        """Two hashes sharing a table index must not be confused with each other"""
+        transposition_table = TranspositionTable(number_of_entries=16)
+        transposition_table.store(position_hash=1, score=10, best_move_index=None, search_depth=0,
+                                  remaining_depth=1, flag=TranspositionEntryFlag.EXACT,
+                                  maximiser_mark_value=BoardMarking.X.value)
+        assert transposition_table.probe(position_hash=17) is None
+        assert transposition_table.probe(position_hash=1).best_move_index is None
+
+    def test_shallower_entry_does_not_replace_deeper_entry_for_same_position(self):
+        transposition_table = TranspositionTable(number_of_entries=16)
+        transposition_table.store(position_hash=5, score=10, best_move_index=1, search_depth=0, remaining_depth=4,
+                                  flag=TranspositionEntryFlag.EXACT, maximiser_mark_value=BoardMarking.X.value)
+        transposition_table.store(position_hash=5, score=20, best_move_index=2, search_depth=0, remaining_depth=2,
+                                  flag=TranspositionEntryFlag.EXACT, maximiser_mark_value=BoardMarking.X.value)
+        assert transposition_table.probe(position_hash=5).score == 10
+
+    def test_shared_table_is_visible_to_attached_table(self):
+        transposition_table = TranspositionTable.create_shared(number_of_entries=16)
+        attached_table = TranspositionTable.attach_shared(
+            shared_memory_name=transposition_table.shared_memory.name, number_of_entries=16)
+        try:
+            transposition_table.store(position_hash=3, score=4, best_move_index=5, search_depth=1, remaining_depth=1,
+                                      flag=TranspositionEntryFlag.UPPER_BOUND, maximiser_mark_value=BoardMarking.X.value)
+            assert attached_table.probe(position_hash=3).score == 4
+        finally:
+            attached_table.close()
+            transposition_table.close()
+            transposition_table.unlink()
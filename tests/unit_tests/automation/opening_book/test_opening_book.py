@@ -0,0 +1,99 @@
+"""Tests for the building, saving and probing of the opening books."""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+# Local application imports
+from automation.minimax.constants.terminal_board_scores import BoardScore
+from automation.opening_book.opening_book import OpeningBook, get_opening_book_path
+from automation.opening_book.opening_book_builder import OpeningBookBuilder
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+E = BoardMarking.EMPTY.value
+
+
+def get_simulation_dataframe(games) -> pd.DataFrame:
+    """Function to lay out (starting player, winning player, moves) games as a GameSimulator would record them"""
+    rows = []
+    for starting_player, winning_player, moves in games:
+        row = {"STARTING_PLAYER": starting_player, "WINNING_PLAYER": winning_player}
+        row.update({f"MOVE_{move_number + 1}": move for move_number, move in enumerate(moves)})
+        rows.append(row)
+    return pd.DataFrame(rows, columns=["STARTING_PLAYER", "WINNING_PLAYER"] + [f"MOVE_{move_number + 1}" for
+                                                                              move_number in range(9)])
+
+
+def get_builder(max_plies: int = 2, min_games: int = 2) -> OpeningBookBuilder:
+    return OpeningBookBuilder(game_rows_m=3, game_cols_n=3, win_length_k=3, max_plies=max_plies, min_games=min_games)
+
+
+class TestOpeningBookBuilder:
+    def test_symmetric_moves_are_credited_together(self):
+        """Two games opening in opposite corners, which X wins, beat three opening in the centre, which X draws"""
+        games = [("PLAYER_X", "X_NAME", [(0, 0)]), ("PLAYER_X", "X_NAME", [(2, 2)])] + \
+            [("PLAYER_X", "DRAW", [(1, 1)])] * 3
+        builder = get_builder()
+        builder.add_simulated_games(simulation_dataframe=get_simulation_dataframe(games), player_x_name="X_NAME",
+                                    player_o_name="O_NAME")
+        book_entry = builder.build().probe(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert book_entry.move_index in (0, 2, 6, 8)
+        assert book_entry.games == 2
+        assert book_entry.score == BoardScore.EXPECTED_MAX_WIN.value
+
+    def test_moves_in_too_few_games_are_left_out(self):
+        games = [("PLAYER_X", "X_NAME", [(0, 0)])] + [("PLAYER_X", "O_NAME", [(1, 1)])] * 2
+        builder = get_builder()
+        builder.add_simulated_games(simulation_dataframe=get_simulation_dataframe(games), player_x_name="X_NAME",
+                                    player_o_name="O_NAME")
+        book_entry = builder.build().probe(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert book_entry.move_index == 4
+        assert book_entry.score == BoardScore.EXPECTED_MAX_LOSS.value
+
+    def test_games_started_by_o_read_back_from_csv(self, tmp_path):
+        """O starts in the centre and X replies on an edge, which O goes on to win - read as strings from csv"""
+        games = [("PLAYER_O", "O_NAME", [(1, 1), (0, 1), (0, 0), "GAME_WON"])] * 2
+        csv_path = tmp_path / "simulation.csv"
+        get_simulation_dataframe(games).to_csv(csv_path, index=False)
+        builder = get_builder(max_plies=4)
+        builder.add_simulated_games(simulation_dataframe=pd.read_csv(csv_path), player_x_name="X_NAME",
+                                    player_o_name="O_NAME")
+        opening_book = builder.build()
+
+        playing_grid = np.array([
+            [E, E, E],
+            [X, O, E],
+            [E, E, E]
+        ])  # The same position as X starting in the centre and O replying on an edge (rotated)
+        book_entry = opening_book.probe(playing_grid=playing_grid, player_to_move_value=O)
+        assert book_entry.move_index in (0, 6)  # A corner next to the edge
+        assert book_entry.score == BoardScore.EXPECTED_MAX_WIN.value
+
+        playing_grid[0, 0] = O
+        playing_grid[2, 2] = X
+        assert opening_book.probe(playing_grid=playing_grid, player_to_move_value=O) is None  # Beyond max_plies
+
+
+class TestOpeningBook:
+    def test_searched_moves_take_precedence_and_survive_saving(self, tmp_path):
+        games = [("PLAYER_X", "X_NAME", [(0, 1)])] * 3
+        builder = get_builder()
+        builder.add_simulated_games(simulation_dataframe=get_simulation_dataframe(games), player_x_name="X_NAME",
+                                    player_o_name="O_NAME")
+        builder.add_searched_move(playing_grid=np.full((3, 3), E), player_to_move_value=O, move=np.array([1, 1]),
+                                  score=BoardScore.DRAW.value)
+        opening_book_path = get_opening_book_path(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                                                  opening_book_directory=tmp_path)
+        builder.build().save(opening_book_path=opening_book_path)
+
+        opening_book = OpeningBook.load_if_generated(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                                                     opening_book_directory=tmp_path)
+        assert opening_book.max_plies == 2
+        book_entry = opening_book.probe(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert book_entry == (4, BoardScore.DRAW.value, 0)
+
+    def test_load_if_generated_without_a_book(self, tmp_path):
+        assert OpeningBook.load_if_generated(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                                             opening_book_directory=tmp_path) is None
@@ -0,0 +1,113 @@
+"""Tests for the proof-number search solver."""
+
+# Standard library imports
+import threading
+import time
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from automation.solver.proof_number_search import ProofNumberSearch
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+E = BoardMarking.EMPTY.value
+
+
+@pytest.fixture(scope="function")
+def three_three_solver():
+    return ProofNumberSearch(game_rows_m=3, game_cols_n=3, win_length_k=3)
+
+
+class TestProofNumberSearch:
+    def test_empty_three_three_board_is_a_draw(self, three_three_solver):
+        solved_position = three_three_solver.solve(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert solved_position.value == GameTheoreticValue.DRAW
+
+    def test_empty_three_four_board_is_a_first_player_win(self):
+        solver = ProofNumberSearch(game_rows_m=3, game_cols_n=4, win_length_k=3)
+        solved_position = solver.solve(playing_grid=np.full((3, 4), E), player_to_move_value=X)
+        assert solved_position.value == GameTheoreticValue.WIN
+
+    def test_opposite_corners(self, three_three_solver):
+        """Against opposite corners, O must play an edge to stop X making two threats at once"""
+        playing_grid = np.array([
+            [X, E, E],
+            [E, O, E],
+            [E, E, X]
+        ])
+        solved_position = three_three_solver.solve(playing_grid=playing_grid, player_to_move_value=O)
+        assert solved_position.value == GameTheoreticValue.DRAW
+        assert solved_position.move[0] == 1 or solved_position.move[1] == 1
+
+        playing_grid[1, 1], playing_grid[0, 1] = E, O  # O has played an edge instead of the centre
+        solved_position = three_three_solver.solve(playing_grid=playing_grid, player_to_move_value=X)
+        assert solved_position.value == GameTheoreticValue.WIN
+
+    def test_lost_position(self, three_three_solver):
+        playing_grid = np.array([
+            [X, E, X],
+            [E, O, E],
+            [E, E, X]
+        ])  # X threatens both (0, 1) and (1, 2)
+        solved_position = three_three_solver.solve(playing_grid=playing_grid, player_to_move_value=O)
+        assert solved_position.value == GameTheoreticValue.LOSS
+
+    def test_symmetric_position_is_not_searched_again(self, three_three_solver):
+        playing_grid = np.array([
+            [X, E, E],
+            [E, E, E],
+            [E, E, E]
+        ])
+        three_three_solver.solve(playing_grid=playing_grid, player_to_move_value=O)
+        nodes_searched = three_three_solver.nodes_searched
+        solved_position = three_three_solver.solve(playing_grid=np.rot90(playing_grid), player_to_move_value=O)
+        assert three_three_solver.nodes_searched == nodes_searched
+        assert np.array_equal(solved_position.move, np.array([1, 1]))  # The only move that does not lose to a corner
+
+    def test_time_limit_gives_up(self):
+        solver = ProofNumberSearch(game_rows_m=4, game_cols_n=4, win_length_k=4, max_search_seconds=0)
+        assert solver.solve(playing_grid=np.full((4, 4), E), player_to_move_value=X) is None
+
+    def test_passed_deadline_gives_up(self, three_three_solver):
+        solved_position = three_three_solver.solve(
+            playing_grid=np.full((3, 3), E), player_to_move_value=X, deadline=time.perf_counter())
+        assert solved_position is None
+
+    def test_node_limit_gives_up(self):
+        solver = ProofNumberSearch(game_rows_m=4, game_cols_n=4, win_length_k=4, max_search_seconds=None)
+        assert solver.solve(playing_grid=np.full((4, 4), E), player_to_move_value=X, max_nodes=100) is None
+        assert solver.nodes_searched <= 100
+        assert solver.solve(playing_grid=np.full((4, 4), E), player_to_move_value=X, max_nodes=50) is None
+        assert solver.nodes_searched <= 100  # Since the position has already failed to be solved with more nodes
+
+    def test_unsolved_position_is_not_searched_again_with_less_time(self):
+        solver = ProofNumberSearch(game_rows_m=4, game_cols_n=4, win_length_k=4, max_search_seconds=None)
+        playing_grid = np.full((4, 4), E)
+        assert solver.solve(playing_grid=playing_grid, player_to_move_value=X,
+                            deadline=time.perf_counter() + 0.05) is None
+        nodes_searched = solver.nodes_searched
+        assert solver.solve(playing_grid=playing_grid, player_to_move_value=X,
+                            deadline=time.perf_counter() + 0.01) is None
+        assert solver.nodes_searched == nodes_searched
+
+    def test_stopped_search_gives_up_and_is_tried_again(self, three_three_solver):
+        stop_event = threading.Event()
+        stop_event.set()
+        assert three_three_solver.solve(
+            playing_grid=np.full((3, 3), E), player_to_move_value=X, stop_event=stop_event) is None
+        solved_position = three_three_solver.solve(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert solved_position.value == GameTheoreticValue.DRAW
+
+    def test_finished_game_raises(self, three_three_solver):
+        playing_grid = np.array([
+            [X, X, X],
+            [O, O, E],
+            [E, E, E]
+        ])
+        with pytest.raises(ValueError):
+            three_three_solver.solve(playing_grid=playing_grid, player_to_move_value=O)
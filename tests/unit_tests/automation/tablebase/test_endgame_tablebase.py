@@ -0,0 +1,73 @@
+"""Tests for the generation and reading of the endgame tablebases."""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from automation.solver.constants.solver_constants import GameTheoreticValue
+from automation.tablebase.endgame_tablebase import EndgameTablebase, decode_position_codes, get_position_codes
+from automation.tablebase.tablebase_generation import generate_endgame_tablebase
+from game.constants.game_constants import BoardMarking
+
+X = BoardMarking.X.value
+O = BoardMarking.O.value
+E = BoardMarking.EMPTY.value
+
+
+@pytest.fixture(scope="module")
+def three_three_tablebase(tmp_path_factory):
+    tablebase_directory = tmp_path_factory.mktemp("tablebases")
+    generate_endgame_tablebase(game_rows_m=3, game_cols_n=3, win_length_k=3, tablebase_directory=tablebase_directory)
+    return EndgameTablebase.load_if_generated(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                                              tablebase_directory=tablebase_directory)
+
+
+class TestPositionCodes:
+    def test_codes_round_trip(self):
+        boards = np.array([[X, O, 0, 0, X, 0, 0, 0, O], [0] * 9], dtype=np.int8)
+        codes = get_position_codes(boards=boards)
+        assert codes[0] == 1 + 2 * 3 + 1 * 3 ** 4 + 2 * 3 ** 8
+        assert codes[1] == 0
+        assert np.array_equal(decode_position_codes(codes=codes, cell_count=9), boards)
+
+
+class TestEndgameTablebase:
+    def test_empty_board_is_a_draw(self, three_three_tablebase):
+        entry = three_three_tablebase.probe(playing_grid=np.full((3, 3), E), player_to_move_value=X)
+        assert entry.value == GameTheoreticValue.DRAW
+        assert entry.plies_to_end == 9
+
+    def test_positions_from_either_starting_player(self, three_three_tablebase):
+        """X threatens both (0, 1) and (1, 2), so O loses unless they have a win of their own"""
+        playing_grid = np.array([
+            [X, E, X],
+            [E, O, E],
+            [O, E, X]
+        ])
+        entry = three_three_tablebase.probe(playing_grid=playing_grid, player_to_move_value=O)
+        assert entry.value == GameTheoreticValue.LOSS
+        assert entry.plies_to_end == 2
+
+        o_started_grid = playing_grid.copy()
+        o_started_grid[0, 1] = O  # Now O has made as many moves as X and is to move, so must have started
+        entry = three_three_tablebase.probe(playing_grid=o_started_grid, player_to_move_value=O)
+        assert entry == (GameTheoreticValue.WIN, 1)  # O wins immediately at (2, 1)
+
+    def test_best_move_is_quickest_win(self, three_three_tablebase):
+        playing_grid = np.array([
+            [X, X, E],
+            [O, O, E],
+            [E, E, E]
+        ])
+        entry, move = three_three_tablebase.get_best_move(playing_grid=playing_grid, player_to_move_value=X)
+        assert entry == (GameTheoreticValue.WIN, 1)
+        assert np.array_equal(move, np.array([0, 2]))
+
+    def test_tablebase_not_generated(self, tmp_path):
+        assert EndgameTablebase.load_if_generated(game_rows_m=3, game_cols_n=3, win_length_k=3,
+                                                  tablebase_directory=tmp_path) is None
+
+    def test_generation_of_large_board_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            generate_endgame_tablebase(game_rows_m=5, game_cols_n=5, win_length_k=4, tablebase_directory=tmp_path)
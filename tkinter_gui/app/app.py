@@ -3,6 +3,9 @@ Module to define the controller that links the different windows together in an
 the complete GUI of the application.
 """
 
+# Local application imports
+from automation.game_simulation.game_simulation_constants import PlayerOptions
+
 # Local application GUI imports
 from tkinter_gui.app.main_game_window.main_game_window import PlayingWindow
 from tkinter_gui.app.game_setup_window.game_setup_window import SetupWindow
@@ -10,7 +13,14 @@ from tkinter_gui.app.game_continuation_window.game_continuation_window import Ga
 
 
 class NoughtsAndCrossesApp:
-    def __init__(self):
+    def __init__(self, automated_player_as: PlayerOptions = PlayerOptions.MINIMAX):
+        """
+        Parameters:
+        ----------
+        automated_player_as: The engine that plays for whichever player is selected as the computer player in the setup
+        window - either PlayerOptions.MINIMAX or PlayerOptions.MCTS
+        """
+        self.automated_player_as = automated_player_as
         self.setup_window = SetupWindow()
         self.playing_window = None
         self.game_continuation_top_level = GameContinuationPopUp()
@@ -42,7 +52,8 @@ class NoughtsAndCrossesApp:
         self.playing_window = PlayingWindow(
             setup_parameters=self.setup_window.setup_parameters,
             player_x_is_minimax=self.setup_window.player_x_is_minimax,
-            player_o_is_minimax=self.setup_window.player_o_is_minimax)
+            player_o_is_minimax=self.setup_window.player_o_is_minimax,
+            automated_player_as=self.automated_player_as)
 
     def keep_launching_new_games(self):
         """
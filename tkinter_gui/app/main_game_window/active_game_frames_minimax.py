@@ -6,6 +6,10 @@ import tkinter as tk
 from typing import Tuple
 
 # Local application imports
+from automation.game_simulation.game_simulation_constants import PlayerOptions
+from automation.mcts.mcts_ai import NoughtsAndCrossesMCTS
+from automation.opening_book.opening_book import OpeningBook
+from automation.tablebase.endgame_tablebase import EndgameTablebase
 from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
 from game.constants.game_constants import BoardMarking
 
@@ -22,7 +26,9 @@ class ActiveGameFramesMinimax(ActiveGameFrames):
                  active_unconfirmed_cell: Tuple[int, int] = None,
                  widget_manager=MainWindowWidgetManager(),
                  player_x_is_minimax: bool = False,
-                 player_o_is_minimax: bool = False):
+                 player_o_is_minimax: bool = False,
+                 ponder: bool = True,
+                 automated_player_as: PlayerOptions = PlayerOptions.MINIMAX):
         """
         Parameters:
         ----------
@@ -32,10 +38,22 @@ class ActiveGameFramesMinimax(ActiveGameFrames):
         main_game_window_widget_manager: Global widget storage object
         player_x_is_minimax / player_o_is_minimax: T/F depending on whether either player is controlled by the minimax
         algorithm. Either one or neither of the players can be the minimax algorithm.
+        ponder: T/F depending on whether the minimax algorithm keeps searching while the human player is deciding on
+        their move, so that it can reuse that search once the human's move has been confirmed.
+        automated_player_as: The engine that plays the automated player's moves - either PlayerOptions.MINIMAX or
+        PlayerOptions.MCTS. Only minimax ponders.
         """
         super().__init__(setup_parameters, draw_count, active_unconfirmed_cell, widget_manager)
         self.player_x_is_minimax = player_x_is_minimax
         self.player_o_is_minimax = player_o_is_minimax
+        self.ponder = ponder
+        self.automated_player_as = automated_player_as
+        self.endgame_tablebase = EndgameTablebase.load_if_generated(
+            game_rows_m=self.game_rows_m, game_cols_n=self.game_cols_n, win_length_k=self.win_length_k)
+        self.opening_book = OpeningBook.load_if_generated(
+            game_rows_m=self.game_rows_m, game_cols_n=self.game_cols_n, win_length_k=self.win_length_k)
+        self.mcts_engine = NoughtsAndCrossesMCTS(setup_parameters=setup_parameters) \
+            if automated_player_as == PlayerOptions.MCTS else None
 
     def _confirmation_buttons_command(self) -> None:
         """
@@ -49,6 +67,7 @@ class ActiveGameFramesMinimax(ActiveGameFrames):
         """
         super()._confirmation_buttons_command()  # First do everything the super class version does
         if self.whole_board_search() or self.check_for_draw():
+            self.stop_pondering()
             return
         elif (self.get_player_turn() == BoardMarking.O.value) and self.player_o_is_minimax:
             self._minimax_player_makes_next_move()
@@ -56,6 +75,9 @@ class ActiveGameFramesMinimax(ActiveGameFrames):
             self._minimax_player_makes_next_move()
         else:  # Minimax's turn is over, so witch buttons back on
             self._switch_back_on_available_cell_buttons_after_minimax_turn()
+            if self.ponder and self.automated_player_as == PlayerOptions.MINIMAX and \
+                    (self.player_x_is_minimax or self.player_o_is_minimax):
+                self.start_pondering()  # Think on the human player's time
 
     def check_if_minimax_goes_first(self):
         """Method to check whether the ai player goes first - otherwise we'll be stuck with nothing happening"""
@@ -76,7 +98,11 @@ class ActiveGameFramesMinimax(ActiveGameFrames):
         AI makes the next move and all relevant updates are made.
         """
         self._switch_off_all_available_cell_buttons()
-        _, move = super().get_minimax_move_iterative_deepening()
+        if self.automated_player_as == PlayerOptions.MCTS:
+            self.mcts_engine.sync_game_state(game=self)
+            _, move = self.mcts_engine.get_mcts_move()
+        else:
+            _, move = super().get_minimax_move_iterative_deepening()
         sleep(PauseDuration.computer_turn.value)
         super()._available_cell_button_command(row_index=move[0], col_index=move[1])  # simulate cell selection
         self._confirmation_buttons_command()  # Confirm ai player's choice on the game board
@@ -6,6 +6,7 @@ import sys
 import tkinter as tk
 
 # Local application imports
+from automation.game_simulation.game_simulation_constants import PlayerOptions
 from game.app.game_base_class import NoughtsAndCrossesEssentialParameters
 
 # Local application GUI imports
@@ -22,12 +23,14 @@ class PlayingWindow:
                  setup_parameters=NoughtsAndCrossesEssentialParameters(),
                  widget_manager=MainWindowWidgetManager(),
                  player_x_is_minimax: bool = False,
-                 player_o_is_minimax: bool = False):
+                 player_o_is_minimax: bool = False,
+                 automated_player_as: PlayerOptions = PlayerOptions.MINIMAX):
         self.setup_parameters = setup_parameters
         self.widget_manager = widget_manager
         self.active_game_frames = ActiveGameFramesMinimax(
             widget_manager=self.widget_manager, setup_parameters=self.setup_parameters,
-            player_x_is_minimax=player_x_is_minimax, player_o_is_minimax=player_o_is_minimax)
+            player_x_is_minimax=player_x_is_minimax, player_o_is_minimax=player_o_is_minimax,
+            automated_player_as=automated_player_as)
         self.historic_info_frame = HistoricInfoFrame(
             widget_manager=self.widget_manager, setup_parameters=self.setup_parameters)
 